@@ -0,0 +1,154 @@
+"""Track fetched date ranges as coverage intervals
+
+Replaces the per-day no-data marker rows in market_data and exchange_rates
+with compact [start_date, end_date] intervals per asset / FX pair and
+provider.
+
+Tables:
+    - asset_coverage: Fetched date intervals per (asset, provider)
+    - exchange_rate_coverage: Fetched date intervals per (FX pair, provider)
+
+Data migration:
+    Existing provider rows (real prices and no-data markers) are collapsed
+    into intervals, treating dates separated only by a weekend as
+    contiguous. Synthetic (backcast) prices are not provider data and are
+    left out; their date ranges are re-requested once on the next sync.
+    The marker rows are then deleted.
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# A row starts a new island unless the previous date is the day before,
+# or only Saturday/Sunday lie in between.
+_ISLAND_START = """
+    CASE
+        WHEN prev_date IS NULL THEN 1
+        WHEN date - prev_date = 1 THEN 0
+        WHEN date - prev_date = 2 AND EXTRACT(ISODOW FROM prev_date + 1) IN (6, 7) THEN 0
+        WHEN date - prev_date = 3 AND EXTRACT(ISODOW FROM prev_date + 1) = 6 THEN 0
+        ELSE 1
+    END
+"""
+
+
+def upgrade() -> None:
+    # ==========================================================================
+    # ASSET COVERAGE
+    # ==========================================================================
+    op.create_table(
+        'asset_coverage',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('asset_id', sa.Integer(), sa.ForeignKey('assets.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('provider', sa.String(50), nullable=False),
+        sa.Column('start_date', sa.Date(), nullable=False),
+        sa.Column('end_date', sa.Date(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+    )
+    op.create_index(
+        'ix_asset_coverage_asset_provider_start',
+        'asset_coverage',
+        ['asset_id', 'provider', 'start_date'],
+    )
+
+    # ==========================================================================
+    # EXCHANGE RATE COVERAGE
+    # ==========================================================================
+    op.create_table(
+        'exchange_rate_coverage',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('base_currency', sa.String(3), nullable=False),
+        sa.Column('quote_currency', sa.String(3), nullable=False),
+        sa.Column('provider', sa.String(50), nullable=False),
+        sa.Column('start_date', sa.Date(), nullable=False),
+        sa.Column('end_date', sa.Date(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+    )
+    op.create_index(
+        'ix_exchange_rate_coverage_pair_provider_start',
+        'exchange_rate_coverage',
+        ['base_currency', 'quote_currency', 'provider', 'start_date'],
+    )
+
+    # ==========================================================================
+    # COLLAPSE EXISTING ROWS INTO INTERVALS
+    # ==========================================================================
+    op.execute(f"""
+        WITH ordered AS (
+            SELECT asset_id, provider, date,
+                   LAG(date) OVER (PARTITION BY asset_id, provider ORDER BY date) AS prev_date
+            FROM market_data
+            WHERE is_synthetic = false
+        ),
+        flagged AS (
+            SELECT asset_id, provider, date, {_ISLAND_START} AS is_start
+            FROM ordered
+        ),
+        islands AS (
+            SELECT asset_id, provider, date,
+                   SUM(is_start) OVER (PARTITION BY asset_id, provider ORDER BY date) AS island
+            FROM flagged
+        )
+        INSERT INTO asset_coverage (asset_id, provider, start_date, end_date, updated_at)
+        SELECT asset_id, provider, MIN(date), MAX(date), now()
+        FROM islands
+        GROUP BY asset_id, provider, island
+    """)
+
+    op.execute(f"""
+        WITH ordered AS (
+            SELECT base_currency, quote_currency, provider, date,
+                   LAG(date) OVER (
+                       PARTITION BY base_currency, quote_currency, provider ORDER BY date
+                   ) AS prev_date
+            FROM exchange_rates
+        ),
+        flagged AS (
+            SELECT base_currency, quote_currency, provider, date, {_ISLAND_START} AS is_start
+            FROM ordered
+        ),
+        islands AS (
+            SELECT base_currency, quote_currency, provider, date,
+                   SUM(is_start) OVER (
+                       PARTITION BY base_currency, quote_currency, provider ORDER BY date
+                   ) AS island
+            FROM flagged
+        )
+        INSERT INTO exchange_rate_coverage
+            (base_currency, quote_currency, provider, start_date, end_date, updated_at)
+        SELECT base_currency, quote_currency, provider, MIN(date), MAX(date), now()
+        FROM islands
+        GROUP BY base_currency, quote_currency, provider, island
+    """)
+
+    # ==========================================================================
+    # REMOVE NO-DATA MARKERS
+    # ==========================================================================
+    # Databases created from 001 alone never had the marker column
+    inspector = sa.inspect(op.get_bind())
+    for table_name in ('market_data', 'exchange_rates'):
+        columns = {c['name'] for c in inspector.get_columns(table_name)}
+        if 'no_data_available' in columns:
+            op.execute(f"DELETE FROM {table_name} WHERE no_data_available = true")
+
+
+def downgrade() -> None:
+    # Deleted no-data markers are not recreated; older code simply
+    # re-requests those dates once and writes new markers.
+    op.drop_index('ix_exchange_rate_coverage_pair_provider_start', table_name='exchange_rate_coverage')
+    op.drop_table('exchange_rate_coverage')
+    op.drop_index('ix_asset_coverage_asset_provider_start', table_name='asset_coverage')
+    op.drop_table('asset_coverage')
@@ -0,0 +1,65 @@
+"""Durable sync job queue
+
+Sync endpoints now enqueue a job and return 202; worker processes
+(python -m app.worker) claim jobs with FOR UPDATE SKIP LOCKED.
+
+Tables:
+    - sync_jobs: Queued / running / finished portfolio sync jobs
+
+Indexes:
+    - ix_sync_jobs_status_created: Claim query (oldest queued job first)
+    - uq_sync_jobs_portfolio_queued: At most one QUEUED job per portfolio
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'sync_jobs',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('portfolio_id', sa.Integer(), sa.ForeignKey('portfolios.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('job_type', sa.Enum('SYNC', 'FULL_RESYNC', name='syncjobtype'), nullable=False, server_default='SYNC'),
+        sa.Column('status', sa.Enum('QUEUED', 'RUNNING', 'SUCCEEDED', 'FAILED', name='syncjobstatus'), nullable=False, server_default='QUEUED'),
+        sa.Column('force', sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('worker_id', sa.String(100), nullable=True),
+        sa.Column('result', sa.JSON(), nullable=True),
+        sa.Column('error', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index('ix_sync_jobs_portfolio_id', 'sync_jobs', ['portfolio_id'])
+    op.create_index('ix_sync_jobs_status_created', 'sync_jobs', ['status', 'created_at'])
+    op.create_index(
+        'uq_sync_jobs_portfolio_queued',
+        'sync_jobs',
+        ['portfolio_id'],
+        unique=True,
+        postgresql_where=sa.text("status = 'QUEUED'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_sync_jobs_portfolio_queued', table_name='sync_jobs')
+    op.drop_index('ix_sync_jobs_status_created', table_name='sync_jobs')
+    op.drop_index('ix_sync_jobs_portfolio_id', table_name='sync_jobs')
+    op.drop_table('sync_jobs')
+
+    # Drop enums
+    op.execute('DROP TYPE IF EXISTS syncjobstatus')
+    op.execute('DROP TYPE IF EXISTS syncjobtype')
@@ -0,0 +1,67 @@
+"""Covering partial indexes for price and FX reads
+
+Valuation and history reads now select only the columns they use, as
+plain tuples. These indexes contain every selected column, so PostgreSQL
+can answer those reads with index-only scans and skip the heap.
+
+Indexes:
+    - ix_market_data_asset_date_covering:
+        (asset_id, date) INCLUDE (close_price, is_synthetic, proxy_source_id)
+        WHERE no_data_available = false
+    - ix_exchange_rate_quote_base_date_covering:
+        (quote_currency, base_currency, date) INCLUDE (rate)
+        WHERE no_data_available = false
+
+Columns:
+    - no_data_available is added to market_data / exchange_rates when
+      missing (the models and queries filter on it, but 001 did not
+      create it)
+
+Index-only scans need an up-to-date visibility map, so the tables are
+vacuumed by autovacuum as usual; run VACUUM (ANALYZE) after a large
+backfill to benefit immediately.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    for table_name in ('market_data', 'exchange_rates'):
+        op.execute(
+            f"ALTER TABLE {table_name} "
+            f"ADD COLUMN IF NOT EXISTS no_data_available BOOLEAN NOT NULL DEFAULT false"
+        )
+
+    op.create_index(
+        'ix_market_data_asset_date_covering',
+        'market_data',
+        ['asset_id', 'date'],
+        postgresql_include=['close_price', 'is_synthetic', 'proxy_source_id'],
+        postgresql_where=sa.text('no_data_available = false'),
+    )
+    op.create_index(
+        'ix_exchange_rate_quote_base_date_covering',
+        'exchange_rates',
+        ['quote_currency', 'base_currency', 'date'],
+        postgresql_include=['rate'],
+        postgresql_where=sa.text('no_data_available = false'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_exchange_rate_quote_base_date_covering', table_name='exchange_rates')
+    op.drop_index('ix_market_data_asset_date_covering', table_name='market_data')
+    # no_data_available is kept: the models still map it
@@ -0,0 +1,222 @@
+"""Partition market_data and exchange_rates by year with BRIN date indexes
+
+Both tables are rebuilt as PostgreSQL declaratively partitioned tables,
+PARTITION BY RANGE (date), one partition per calendar year plus a
+historic partition for older rows. Price and FX reads filter on a date
+window, so the planner prunes every partition outside it.
+
+The rebuild DDL (rename, create parent and partitions, copy, drop) is a
+frozen copy kept in this file, so later changes to
+app/utils/partitioning.py, which only maintains future partitions at
+runtime, cannot change what this revision does.
+
+Keys:
+    - Primary keys become (id, date): a partitioned table's unique
+      constraints must include the partition key. id stays unique through
+      its sequence, so the ORM keeps mapping id alone.
+    - uq_asset_date (asset_id, date) and uq_exchange_rate_pair_date
+      (base_currency, quote_currency, date) are unchanged, so ON CONFLICT
+      upserts keep working.
+
+Indexes:
+    - ix_market_data_date_brin / ix_exchange_rates_date_brin: BRIN on date
+      in each partition, replacing the btree date indexes (rows arrive in
+      roughly date order, so a BRIN index is a few pages per partition)
+    - All other indexes from 001 / 004 are recreated on the new parents
+
+Partitions are created from 2000 (or the first year with data, if
+earlier) through the current year + 2. The worker creates later ones at
+startup (`python -m scripts.create_partitions` does the same by hand).
+
+SQLite (tests, local development) has no partitioning; the migration is
+a no-op there.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-18
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Yearly partitions start no later than this year
+PARTITION_FIRST_YEAR = 2000
+
+# Partitions created beyond the current year
+PARTITION_YEARS_AHEAD = 2
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    # ==========================================================================
+    # MARKET DATA
+    # ==========================================================================
+    _convert_to_partitioned(bind, 'market_data')
+
+    op.create_primary_key('market_data_pkey', 'market_data', ['id', 'date'])
+    op.create_unique_constraint('uq_asset_date', 'market_data', ['asset_id', 'date'])
+    op.create_foreign_key(
+        'market_data_asset_id_fkey', 'market_data', 'assets',
+        ['asset_id'], ['id'], ondelete='CASCADE',
+    )
+    op.create_foreign_key(
+        'market_data_proxy_source_id_fkey', 'market_data', 'assets',
+        ['proxy_source_id'], ['id'], ondelete='SET NULL',
+    )
+    _create_market_data_indexes()
+    op.create_index(
+        'ix_market_data_date_brin', 'market_data', ['date'], postgresql_using='brin',
+    )
+
+    # ==========================================================================
+    # EXCHANGE RATES
+    # ==========================================================================
+    _convert_to_partitioned(bind, 'exchange_rates')
+
+    op.create_primary_key('exchange_rates_pkey', 'exchange_rates', ['id', 'date'])
+    op.create_unique_constraint(
+        'uq_exchange_rate_pair_date', 'exchange_rates',
+        ['base_currency', 'quote_currency', 'date'],
+    )
+    _create_exchange_rate_indexes()
+    op.create_index(
+        'ix_exchange_rates_date_brin', 'exchange_rates', ['date'], postgresql_using='brin',
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    _convert_to_plain(bind, 'exchange_rates')
+
+    op.create_primary_key('exchange_rates_pkey', 'exchange_rates', ['id'])
+    op.create_unique_constraint(
+        'uq_exchange_rate_pair_date', 'exchange_rates',
+        ['base_currency', 'quote_currency', 'date'],
+    )
+    _create_exchange_rate_indexes()
+    op.create_index('ix_exchange_rates_id', 'exchange_rates', ['id'])
+    op.create_index('ix_exchange_rates_date', 'exchange_rates', ['date'])
+
+    _convert_to_plain(bind, 'market_data')
+
+    op.create_primary_key('market_data_pkey', 'market_data', ['id'])
+    op.create_unique_constraint('uq_asset_date', 'market_data', ['asset_id', 'date'])
+    op.create_foreign_key(
+        'market_data_asset_id_fkey', 'market_data', 'assets',
+        ['asset_id'], ['id'], ondelete='CASCADE',
+    )
+    op.create_foreign_key(
+        'market_data_proxy_source_id_fkey', 'market_data', 'assets',
+        ['proxy_source_id'], ['id'], ondelete='SET NULL',
+    )
+    _create_market_data_indexes()
+    op.create_index('ix_market_data_id', 'market_data', ['id'])
+    op.create_index('ix_market_data_date', 'market_data', ['date'])
+
+
+def _create_market_data_indexes() -> None:
+    """Indexes shared by the partitioned and plain layouts."""
+    op.create_index('ix_market_data_asset_id', 'market_data', ['asset_id'])
+    op.create_index('ix_market_data_proxy_source_id', 'market_data', ['proxy_source_id'])
+    op.create_index(
+        'ix_market_data_asset_synthetic_date', 'market_data',
+        ['asset_id', 'is_synthetic', 'date'],
+    )
+    op.create_index(
+        'ix_market_data_asset_date_covering',
+        'market_data',
+        ['asset_id', 'date'],
+        postgresql_include=['close_price', 'is_synthetic', 'proxy_source_id'],
+        postgresql_where=sa.text('no_data_available = false'),
+    )
+
+
+def _create_exchange_rate_indexes() -> None:
+    """Indexes shared by the partitioned and plain layouts."""
+    op.create_index('ix_exchange_rates_base_currency', 'exchange_rates', ['base_currency'])
+    op.create_index('ix_exchange_rates_quote_currency', 'exchange_rates', ['quote_currency'])
+    op.create_index(
+        'ix_exchange_rate_quote_base_date', 'exchange_rates',
+        ['quote_currency', 'base_currency', 'date'],
+    )
+    op.create_index(
+        'ix_exchange_rate_quote_base_date_covering',
+        'exchange_rates',
+        ['quote_currency', 'base_currency', 'date'],
+        postgresql_include=['rate'],
+        postgresql_where=sa.text('no_data_available = false'),
+    )
+
+
+def _convert_to_partitioned(conn: sa.Connection, table_name: str) -> None:
+    """
+    Rebuild table_name as a table partitioned by RANGE (date), keeping its rows.
+
+    Creates the parent with the same columns and defaults (the id sequence
+    is carried over), a historic partition for everything before the first
+    yearly one, yearly partitions through the current year plus
+    PARTITION_YEARS_AHEAD, then copies the rows and drops the old table.
+    Constraints, indexes and foreign keys are left to the caller.
+    """
+    old_name = f'{table_name}_unpartitioned'
+    current_year = date.today().year
+
+    first_date = conn.execute(sa.text(f'SELECT min(date) FROM {table_name}')).scalar()
+    first_year = min(first_date.year, PARTITION_FIRST_YEAR) if first_date else PARTITION_FIRST_YEAR
+
+    conn.execute(sa.text(f'ALTER TABLE {table_name} RENAME TO {old_name}'))
+    conn.execute(sa.text(
+        f'CREATE TABLE {table_name} (LIKE {old_name} INCLUDING DEFAULTS) '
+        f'PARTITION BY RANGE (date)'
+    ))
+    _move_id_sequence(conn, old_name, table_name)
+
+    conn.execute(sa.text(
+        f'CREATE TABLE {table_name}_historic PARTITION OF {table_name} '
+        f"FOR VALUES FROM (MINVALUE) TO ('{date(first_year, 1, 1)}')"
+    ))
+    for year in range(first_year, current_year + PARTITION_YEARS_AHEAD + 1):
+        conn.execute(sa.text(
+            f'CREATE TABLE IF NOT EXISTS {table_name}_y{year} PARTITION OF {table_name} '
+            f"FOR VALUES FROM ('{date(year, 1, 1)}') TO ('{date(year + 1, 1, 1)}')"
+        ))
+
+    conn.execute(sa.text(f'INSERT INTO {table_name} SELECT * FROM {old_name}'))
+    conn.execute(sa.text(f'DROP TABLE {old_name}'))
+
+
+def _convert_to_plain(conn: sa.Connection, table_name: str) -> None:
+    """Rebuild a partitioned table_name as an ordinary table, keeping its rows."""
+    old_name = f'{table_name}_partitioned'
+
+    conn.execute(sa.text(f'ALTER TABLE {table_name} RENAME TO {old_name}'))
+    conn.execute(sa.text(f'CREATE TABLE {table_name} (LIKE {old_name} INCLUDING DEFAULTS)'))
+    _move_id_sequence(conn, old_name, table_name)
+
+    conn.execute(sa.text(f'INSERT INTO {table_name} SELECT * FROM {old_name}'))
+    conn.execute(sa.text(f'DROP TABLE {old_name} CASCADE'))
+
+
+def _move_id_sequence(conn: sa.Connection, from_table: str, to_table: str) -> None:
+    """Hand the serial id sequence to to_table so dropping from_table keeps it."""
+    sequence = conn.execute(
+        sa.text("SELECT pg_get_serial_sequence(:table_name, 'id')"),
+        {'table_name': from_table},
+    ).scalar()
+    if sequence is not None:
+        conn.execute(sa.text(f'ALTER SEQUENCE {sequence} OWNED BY {to_table}.id'))
@@ -0,0 +1,37 @@
+"""Add assets.price_version for the shared price series cache
+
+Application processes cache each asset's close price series in memory
+(app/services/market_data/price_cache.py). price_version is the cache
+key's version stamp: every write to an asset's market_data rows
+increments it in the same transaction, so any process holding an older
+series reloads it on its next read.
+
+Columns:
+    - assets.price_version: INTEGER NOT NULL DEFAULT 0
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'assets',
+        sa.Column('price_version', sa.Integer(), nullable=False, server_default='0'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('assets', 'price_version')
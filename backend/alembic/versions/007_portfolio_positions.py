@@ -0,0 +1,91 @@
+"""Add the portfolio_positions ledger
+
+One row per (portfolio, asset) with the running BUY/SELL totals of its
+transactions, maintained by the application on every transaction write
+(app/services/position_ledger.py). SELL validation reads the current
+quantity from it instead of summing the asset's whole history, and
+today's valuation builds holdings from it.
+
+Tables:
+    - portfolio_positions: quantity, bought/sold quantities, cost and
+      proceeds aggregates per (portfolio_id, asset_id)
+
+Indexes:
+    - ix_transaction_portfolio_type: transactions(portfolio_id, transaction_type),
+      so "does this portfolio track cash?" is an index probe
+
+Data migration:
+    Rows are computed from existing BUY/SELL transactions with the same
+    formulas as HoldingsCalculator (cost = qty × price + fee, proceeds =
+    qty × price - fee, divided by the broker exchange rate).
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'portfolio_positions',
+        sa.Column('portfolio_id', sa.Integer(), sa.ForeignKey('portfolios.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('asset_id', sa.Integer(), sa.ForeignKey('assets.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('quantity', sa.Numeric(28, 8), nullable=False, server_default='0'),
+        sa.Column('total_bought_qty', sa.Numeric(28, 8), nullable=False, server_default='0'),
+        sa.Column('total_sold_qty', sa.Numeric(28, 8), nullable=False, server_default='0'),
+        sa.Column('total_bought_cost_local', sa.Numeric(38, 18), nullable=False, server_default='0'),
+        sa.Column('total_bought_cost_portfolio', sa.Numeric(38, 18), nullable=False, server_default='0'),
+        sa.Column('total_sold_proceeds_portfolio', sa.Numeric(38, 18), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+    )
+    op.create_index(
+        'ix_transaction_portfolio_type',
+        'transactions',
+        ['portfolio_id', 'transaction_type'],
+    )
+
+    # ==========================================================================
+    # BACKFILL FROM EXISTING TRANSACTIONS
+    # ==========================================================================
+    op.execute("""
+        INSERT INTO portfolio_positions (
+            portfolio_id, asset_id, quantity, total_bought_qty, total_sold_qty,
+            total_bought_cost_local, total_bought_cost_portfolio, total_sold_proceeds_portfolio
+        )
+        SELECT
+            portfolio_id,
+            asset_id,
+            SUM(CASE WHEN transaction_type = 'BUY' THEN quantity ELSE -quantity END),
+            SUM(CASE WHEN transaction_type = 'BUY' THEN quantity ELSE 0 END),
+            SUM(CASE WHEN transaction_type = 'SELL' THEN quantity ELSE 0 END),
+            SUM(CASE WHEN transaction_type = 'BUY'
+                     THEN quantity * price_per_share + COALESCE(fee, 0) ELSE 0 END),
+            SUM(CASE WHEN transaction_type = 'BUY'
+                     THEN (quantity * price_per_share + COALESCE(fee, 0))
+                          / COALESCE(NULLIF(exchange_rate, 0), 1)
+                     ELSE 0 END),
+            SUM(CASE WHEN transaction_type = 'SELL'
+                     THEN (quantity * price_per_share - COALESCE(fee, 0))
+                          / COALESCE(NULLIF(exchange_rate, 0), 1)
+                     ELSE 0 END)
+        FROM transactions
+        WHERE asset_id IS NOT NULL
+          AND transaction_type IN ('BUY', 'SELL')
+        GROUP BY portfolio_id, asset_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_transaction_portfolio_type', table_name='transactions')
+    op.drop_table('portfolio_positions')
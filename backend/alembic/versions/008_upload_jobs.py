@@ -0,0 +1,65 @@
+"""Background upload job queue
+
+POST /upload/transactions/jobs stores the file and returns 202; worker
+processes (python -m app.worker) claim jobs with FOR UPDATE SKIP LOCKED
+and record progress while the file is processed.
+
+Tables:
+    - upload_jobs: Queued / running / finished uploads with their file,
+      progress counters, errors and created transaction ids
+
+Indexes:
+    - ix_upload_jobs_status_created: Claim query (oldest queued job first)
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'upload_jobs',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('portfolio_id', sa.Integer(), sa.ForeignKey('portfolios.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('status', sa.Enum('QUEUED', 'RUNNING', 'SUCCEEDED', 'FAILED', name='uploadjobstatus'), nullable=False, server_default='QUEUED'),
+        sa.Column('filename', sa.String(255), nullable=False),
+        sa.Column('content_type', sa.String(100), nullable=True),
+        sa.Column('date_format', sa.String(10), nullable=False),
+        sa.Column('content', sa.LargeBinary(), nullable=True),
+        sa.Column('stage', sa.String(30), nullable=True),
+        sa.Column('total_rows', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('rows_validated', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('rows_resolved', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('rows_inserted', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('error_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('errors', sa.JSON(), nullable=True),
+        sa.Column('warnings', sa.JSON(), nullable=True),
+        sa.Column('created_transaction_ids', sa.JSON(), nullable=True),
+        sa.Column('error', sa.String(), nullable=True),
+        sa.Column('worker_id', sa.String(100), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index('ix_upload_jobs_portfolio_id', 'upload_jobs', ['portfolio_id'])
+    op.create_index('ix_upload_jobs_status_created', 'upload_jobs', ['status', 'created_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_upload_jobs_status_created', table_name='upload_jobs')
+    op.drop_index('ix_upload_jobs_portfolio_id', table_name='upload_jobs')
+    op.drop_table('upload_jobs')
+
+    op.execute('DROP TYPE IF EXISTS uploadjobstatus')
@@ -0,0 +1,117 @@
+"""Add transaction fingerprints for duplicate-free re-uploads
+
+Uploads and batch creates skip rows whose content hash is already
+recorded for the portfolio, so re-uploading a full broker export only
+adds new transactions.
+
+Columns:
+    - transactions.fingerprint: SHA-256 of portfolio, asset, type, date,
+      quantity, price and fee (indexed)
+    - upload_jobs.rows_skipped: Rows a background upload skipped as
+      already recorded
+
+Data migration:
+    Fingerprints of existing transactions are computed in batches with
+    _fingerprint(), a frozen copy of the application's
+    transaction_fingerprint() as of this revision, so they match what new
+    uploads compute. The copy keeps this migration independent of later
+    changes to the application code; a change to the fingerprint format
+    needs its own backfill migration.
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-18
+
+"""
+import hashlib
+from datetime import timezone
+from decimal import Decimal
+from typing import Any, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_ROWS = 5000
+
+_AMOUNT_QUANTUM = Decimal('1e-8')
+
+
+def _amount_text(value: Decimal | None) -> str:
+    """Canonical text of an amount: 8 decimal places, trailing zeros stripped."""
+    amount = Decimal(value or 0).quantize(_AMOUNT_QUANTUM).normalize()
+    return format(amount or Decimal(0), 'f')
+
+
+def _fingerprint(row: Any) -> str:
+    """SHA-256 of portfolio, asset, type, UTC date, quantity, price and fee."""
+    txn_date = row['date']
+    if txn_date.tzinfo is not None:
+        txn_date = txn_date.astimezone(timezone.utc).replace(tzinfo=None)
+
+    parts = (
+        str(row['portfolio_id']),
+        str(row['asset_id']),
+        row['transaction_type'],
+        txn_date.isoformat(),
+        _amount_text(row['quantity']),
+        _amount_text(row['price_per_share']),
+        _amount_text(row['fee']),
+    )
+    return hashlib.sha256('|'.join(parts).encode('utf-8')).hexdigest()
+
+
+def upgrade() -> None:
+    op.add_column('transactions', sa.Column('fingerprint', sa.String(64), nullable=True))
+    op.add_column('upload_jobs', sa.Column('rows_skipped', sa.Integer(), nullable=False, server_default='0'))
+
+    # ==========================================================================
+    # BACKFILL FROM EXISTING TRANSACTIONS
+    # ==========================================================================
+    transactions = sa.table(
+        'transactions',
+        sa.column('id', sa.Integer),
+        sa.column('portfolio_id', sa.Integer),
+        sa.column('asset_id', sa.Integer),
+        sa.column('transaction_type', sa.String),
+        sa.column('date', sa.DateTime),
+        sa.column('quantity', sa.Numeric(18, 8)),
+        sa.column('price_per_share', sa.Numeric(18, 8)),
+        sa.column('fee', sa.Numeric(18, 8)),
+        sa.column('fingerprint', sa.String),
+    )
+    bind = op.get_bind()
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(transactions)
+            .where(transactions.c.id > last_id)
+            .order_by(transactions.c.id)
+            .limit(BACKFILL_BATCH_ROWS)
+        ).mappings().all()
+        if not rows:
+            break
+
+        bind.execute(
+            transactions.update()
+            .where(transactions.c.id == sa.bindparam('txn_id'))
+            .values(fingerprint=sa.bindparam('txn_fingerprint')),
+            [
+                {'txn_id': row['id'], 'txn_fingerprint': _fingerprint(row)}
+                for row in rows
+            ],
+        )
+        last_id = rows[-1]['id']
+
+    op.create_index('ix_transactions_fingerprint', 'transactions', ['fingerprint'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_transactions_fingerprint', table_name='transactions')
+    op.drop_column('upload_jobs', 'rows_skipped')
+    op.drop_column('transactions', 'fingerprint')
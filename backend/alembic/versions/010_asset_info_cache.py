@@ -0,0 +1,44 @@
+"""Persistent cache of provider asset lookups
+
+Asset resolution keeps provider responses in memory; this table shares
+them across restarts and worker processes, including "not found"
+answers (with a shorter expiry), so unknown symbols are not sent to the
+provider again by every process.
+
+Tables:
+    - asset_info_cache: AssetInfo fields (or NULL for not found) per
+      provider, ticker and exchange, with an expiry time
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '010'
+down_revision: Union[str, None] = '009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'asset_info_cache',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('provider', sa.String(50), nullable=False),
+        sa.Column('ticker', sa.String(), nullable=False),
+        sa.Column('exchange', sa.String(), nullable=False),
+        sa.Column('info', sa.JSON(), nullable=True),
+        sa.Column('fetched_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.UniqueConstraint('provider', 'ticker', 'exchange', name='uq_asset_info_cache_key'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('asset_info_cache')
@@ -0,0 +1,50 @@
+"""Trigram indexes for asset search
+
+GET /assets/search and the ILIKE '%x%' ticker / name filters of the asset
+and transaction lists could not use the btree indexes on assets and
+scanned the whole table. pg_trgm GIN indexes serve substring, prefix and
+similarity matches on these columns.
+
+Extensions:
+    - pg_trgm
+
+Indexes:
+    - ix_assets_ticker_trgm: GIN (ticker gin_trgm_ops)
+    - ix_assets_name_trgm: GIN (name gin_trgm_ops)
+    - ix_assets_isin_trgm: GIN (isin gin_trgm_ops)
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRIGRAM_COLUMNS = ('ticker', 'name', 'isin')
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    for column in TRIGRAM_COLUMNS:
+        op.create_index(
+            f'ix_assets_{column}_trgm',
+            'assets',
+            [column],
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'},
+        )
+
+
+def downgrade() -> None:
+    for column in reversed(TRIGRAM_COLUMNS):
+        op.drop_index(f'ix_assets_{column}_trgm', table_name='assets')
+    # pg_trgm is kept: other objects may depend on it
@@ -0,0 +1,36 @@
+"""Add sync_jobs.heartbeat_at for stale job recovery
+
+Workers recovered RUNNING sync jobs by their started_at, so a sync that
+legitimately ran longer than sync_job_stale_after_minutes was requeued
+and ran twice. The running worker now refreshes heartbeat_at
+periodically, and recovery is judged on it instead.
+
+Columns:
+    - sync_jobs.heartbeat_at: TIMESTAMPTZ NULL
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '012'
+down_revision: Union[str, None] = '011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'sync_jobs',
+        sa.Column('heartbeat_at', sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('sync_jobs', 'heartbeat_at')
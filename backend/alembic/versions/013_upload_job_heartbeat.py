@@ -0,0 +1,47 @@
+"""Add upload_jobs.heartbeat_at and portfolios.data_version
+
+Upload jobs were failed as orphaned by their started_at, so a large file
+that legitimately took longer than upload_job_stale_after_minutes was
+failed while still importing. Every progress report now refreshes
+heartbeat_at, and stale-job recovery is judged on it instead.
+
+Analytics caches in API processes were invalidated only when a client
+polled a finished upload job. The upload worker now increments
+portfolios.data_version when it commits transactions, and the cache
+includes it in the data version it checks on every lookup.
+
+Columns:
+    - upload_jobs.heartbeat_at: TIMESTAMPTZ NULL
+    - portfolios.data_version: INTEGER NOT NULL DEFAULT 0
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '013'
+down_revision: Union[str, None] = '012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'upload_jobs',
+        sa.Column('heartbeat_at', sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        'portfolios',
+        sa.Column('data_version', sa.Integer(), nullable=False, server_default='0'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('portfolios', 'data_version')
+    op.drop_column('upload_jobs', 'heartbeat_at')
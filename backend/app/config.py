@@ -8,7 +8,7 @@ Loads configuration from environment variables with validation:
 - DB_POOL_*: Connection pool settings for PostgreSQL
 
 Environment-specific behavior:
-- test: Allows SQLite in-memory database for fast isolated tests
+- test: Allows SQLite in-memory database and cheap bcrypt hashes for fast isolated tests
 - development: Requires DATABASE_URL, warns if using SQLite
 - production: Requires PostgreSQL, enforces strict validation
 
@@ -123,6 +123,22 @@ class Settings(BaseSettings):
         description="Refresh token expiration in days"
     )
 
+    # =========================================================================
+    # PASSWORD HASHING
+    # =========================================================================
+    bcrypt_rounds: int | None = Field(
+        default=None,
+        ge=4,
+        le=16,
+        description="bcrypt cost factor for new hashes (default: 12, or 4 in test)"
+    )
+    password_hash_workers: int = Field(
+        default=2,
+        ge=1,
+        le=32,
+        description="Threads dedicated to password hashing and verification"
+    )
+
     # =========================================================================
     # GOOGLE OAUTH
     # =========================================================================
@@ -187,6 +203,55 @@ class Settings(BaseSettings):
         description="Frontend URL for email links"
     )
 
+    # =========================================================================
+    # MARKET DATA PROVIDERS
+    # =========================================================================
+    market_data_replay_dir: str | None = Field(
+        default=None,
+        description="Directory of recorded prices used as a fallback behind Yahoo Finance (unset = Yahoo only)"
+    )
+    market_data_hedging_enabled: bool = Field(
+        default=True,
+        description="Send a hedged request to the fallback provider when Yahoo is slower than its p95 latency"
+    )
+
+    # =========================================================================
+    # PRICE STORE
+    # =========================================================================
+    price_store_dir: str | None = Field(
+        default=None,
+        description="Directory for the memory-mapped columnar price store read by history and analytics (unset = read prices from the database)"
+    )
+    price_cache_max_mb: int = Field(
+        default=0,
+        ge=0,
+        description="Memory budget (MB) of the in-process price series cache shared by all requests (0 = disabled)"
+    )
+
+    # =========================================================================
+    # SYNC WORKER
+    # =========================================================================
+    sync_worker_poll_interval_seconds: float = Field(
+        default=2.0,
+        ge=0.1,
+        description="Seconds an idle sync worker waits before polling the job queue again"
+    )
+    sync_job_max_attempts: int = Field(
+        default=3,
+        ge=1,
+        description="Attempts before a failing sync job is marked FAILED"
+    )
+    sync_job_stale_after_minutes: int = Field(
+        default=30,
+        ge=1,
+        description="RUNNING jobs without a heartbeat for this long are assumed orphaned by a dead worker and requeued"
+    )
+    upload_job_stale_after_minutes: int = Field(
+        default=30,
+        ge=1,
+        description="RUNNING upload jobs without a progress report for this long are assumed orphaned by a dead worker and failed"
+    )
+
     # =========================================================================
     # PROXY SETTINGS
     # =========================================================================
@@ -226,6 +291,13 @@ class Settings(BaseSettings):
         extra="ignore",  # Allow extra vars (e.g., POSTGRES_* for Docker Compose)
     )
 
+    @model_validator(mode="after")
+    def resolve_bcrypt_rounds(self) -> "Settings":
+        """Default the bcrypt cost factor per environment (cheap hashes in test)."""
+        if self.bcrypt_rounds is None:
+            object.__setattr__(self, "bcrypt_rounds", 4 if self.environment == "test" else 12)
+        return self
+
     @model_validator(mode="after")
     def validate_database_config(self) -> "Settings":
         """
@@ -33,15 +33,26 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.database import get_db
 from app.models import User, Portfolio
 from app.services.asset_resolution import AssetResolutionService
+from app.services.asset_search import AssetSearchService
 from app.services.analytics.service import AnalyticsService
+from app.services.export_service import ExportService
 from app.services.market_data.sync_service import MarketDataSyncService
+from app.services.market_data.base import MarketDataProvider
+from app.services.market_data.composite import CompositeMarketDataProvider
+from app.services.market_data.job_queue import SyncJobQueue
+from app.services.upload.job_queue import UploadJobQueue
+from app.services.market_data.price_cache import PriceSeriesCache
+from app.services.market_data.price_store import ColumnarPriceStore
+from app.services.market_data.replay import ReplayMarketDataProvider
 from app.services.market_data.yahoo import YahooFinanceProvider
+from app.services.portfolio_context import PortfolioDataContext
 from app.services.valuation.service import ValuationService
 from app.services.fx_rate_service import FXRateService
-from app.services.auth import AuthService, EmailService
+from app.services.auth import AuthCache, AuthService, EmailService, PasswordHashingPool
 from app.services.auth.jwt_handler import JWTHandler
 from app.services.exceptions import (
     TokenExpiredError,
@@ -65,23 +76,72 @@ _bearer_scheme_optional = HTTPBearer(auto_error=False)
 #
 # Order matters: define dependencies before dependents
 # 1. get_market_data_provider (no deps)
-# 2. get_fx_rate_service (depends on provider)
-# 3. get_asset_resolution_service (depends on provider)
-# 4. get_valuation_service (depends on fx_service)
-# 5. get_analytics_service (depends on valuation_service)
-# 6. get_sync_service (depends on provider, fx_service)
+# 2. get_price_store (no deps)
+# 3. get_price_cache (no deps)
+# 4. get_fx_rate_service (depends on provider)
+# 5. get_asset_resolution_service (depends on provider)
+# 6. get_valuation_service (depends on fx_service, price_store, price_cache)
+# 7. get_analytics_service (depends on valuation_service, price_store, price_cache)
+# 8. get_export_service (depends on valuation_service)
+# 9. get_sync_service (depends on provider, fx_service, price_store)
+# 10. get_sync_job_queue (no deps)
+# 11. get_upload_job_queue (no deps)
+# 12. get_asset_search_service (no deps)
+# 13. get_auth_cache (no deps)
 
 
 @lru_cache(maxsize=1)
-def get_market_data_provider() -> YahooFinanceProvider:
+def get_market_data_provider() -> MarketDataProvider:
     """
     Get the singleton market data provider instance.
 
     Shares the provider (and its circuit breaker) across all services,
     ensuring rate limits are respected globally.
+
+    When MARKET_DATA_REPLAY_DIR is set, Yahoo Finance is wrapped in a
+    CompositeMarketDataProvider that falls back to (and hedges slow
+    requests with) the recorded snapshot in that directory.
+    """
+    if not settings.market_data_replay_dir:
+        logger.debug("Initializing singleton YahooFinanceProvider")
+        return YahooFinanceProvider()
+
+    logger.debug("Initializing singleton CompositeMarketDataProvider")
+    return CompositeMarketDataProvider(
+        [
+            YahooFinanceProvider(),
+            ReplayMarketDataProvider(settings.market_data_replay_dir),
+        ],
+        hedging=settings.market_data_hedging_enabled,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_price_store() -> ColumnarPriceStore | None:
     """
-    logger.debug("Initializing singleton YahooFinanceProvider")
-    return YahooFinanceProvider()
+    Get the singleton ColumnarPriceStore, or None when not configured.
+
+    Enabled by PRICE_STORE_DIR. Every worker process maps the same files,
+    so they share the prices through the OS page cache.
+    """
+    if not settings.price_store_dir:
+        return None
+    logger.debug(f"Initializing ColumnarPriceStore at {settings.price_store_dir}")
+    return ColumnarPriceStore(settings.price_store_dir)
+
+
+@lru_cache(maxsize=1)
+def get_price_cache() -> PriceSeriesCache | None:
+    """
+    Get the singleton PriceSeriesCache, or None when disabled.
+
+    Enabled by PRICE_CACHE_MAX_MB > 0. One cache per worker process,
+    kept consistent across processes by assets.price_version.
+    """
+    if settings.price_cache_max_mb <= 0:
+        return None
+    logger.debug(f"Initializing PriceSeriesCache ({settings.price_cache_max_mb} MB)")
+    return PriceSeriesCache(max_bytes=settings.price_cache_max_mb * 1024 * 1024)
 
 
 @lru_cache(maxsize=1)
@@ -117,7 +177,11 @@ def get_valuation_service() -> ValuationService:
     Uses the shared FX service to ensure circuit breaker state is consistent.
     """
     logger.debug("Initializing singleton ValuationService")
-    return ValuationService(fx_service=get_fx_rate_service())
+    return ValuationService(
+        fx_service=get_fx_rate_service(),
+        price_store=get_price_store(),
+        price_cache=get_price_cache(),
+    )
 
 
 @lru_cache(maxsize=1)
@@ -129,7 +193,22 @@ def get_analytics_service() -> AnalyticsService:
     works correctly and avoiding redundant computations.
     """
     logger.debug("Initializing singleton AnalyticsService")
-    return AnalyticsService(valuation_service=get_valuation_service())
+    return AnalyticsService(
+        valuation_service=get_valuation_service(),
+        price_store=get_price_store(),
+        price_cache=get_price_cache(),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_export_service() -> ExportService:
+    """
+    Get the singleton ExportService instance.
+
+    Uses the shared ValuationService for holdings and history exports.
+    """
+    logger.debug("Initializing singleton ExportService")
+    return ExportService(valuation_service=get_valuation_service())
 
 
 @lru_cache(maxsize=1)
@@ -145,9 +224,46 @@ def get_sync_service() -> MarketDataSyncService:
     return MarketDataSyncService(
         provider=get_market_data_provider(),
         fx_service=get_fx_rate_service(),
+        price_store=get_price_store(),
     )
 
 
+@lru_cache(maxsize=1)
+def get_sync_job_queue() -> SyncJobQueue:
+    """
+    Get the singleton SyncJobQueue instance.
+
+    Used by the sync endpoints to enqueue jobs and by app.worker to
+    claim and run them.
+    """
+    logger.debug("Initializing singleton SyncJobQueue")
+    return SyncJobQueue()
+
+
+@lru_cache(maxsize=1)
+def get_upload_job_queue() -> UploadJobQueue:
+    """
+    Get the singleton UploadJobQueue instance.
+
+    Used by the background upload endpoints to enqueue jobs and by
+    app.worker to claim and run them.
+    """
+    logger.debug("Initializing singleton UploadJobQueue")
+    return UploadJobQueue()
+
+
+@lru_cache(maxsize=1)
+def get_asset_search_service() -> AssetSearchService:
+    """
+    Get the singleton AssetSearchService instance.
+
+    Shares the in-process prefix index (used when not on PostgreSQL)
+    across all requests, so it is built once per process.
+    """
+    logger.debug("Initializing singleton AssetSearchService")
+    return AssetSearchService()
+
+
 # =============================================================================
 # AUTHENTICATION SERVICES
 # =============================================================================
@@ -164,6 +280,18 @@ def get_email_service() -> EmailService:
     return EmailService()
 
 
+@lru_cache(maxsize=1)
+def get_password_hashing_pool() -> PasswordHashingPool:
+    """
+    Get the singleton PasswordHashingPool instance.
+
+    All bcrypt work from request handlers shares this pool, which caps it
+    at settings.password_hash_workers threads per process.
+    """
+    logger.debug("Initializing singleton PasswordHashingPool")
+    return PasswordHashingPool(max_workers=settings.password_hash_workers)
+
+
 @lru_cache(maxsize=1)
 def get_auth_service() -> AuthService:
     """
@@ -172,7 +300,22 @@ def get_auth_service() -> AuthService:
     Handles user registration, authentication, and token management.
     """
     logger.debug("Initializing singleton AuthService")
-    return AuthService(email_service=get_email_service())
+    return AuthService(
+        email_service=get_email_service(),
+        password_pool=get_password_hashing_pool(),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_auth_cache() -> AuthCache:
+    """
+    Get the singleton AuthCache instance.
+
+    Caches users and portfolio owners for the dependencies below, so most
+    authenticated requests skip both lookups.
+    """
+    logger.debug("Initializing singleton AuthCache")
+    return AuthCache()
 
 
 # =============================================================================
@@ -180,6 +323,17 @@ def get_auth_service() -> AuthService:
 # =============================================================================
 
 
+def _load_user(db: Session, user_id: int) -> User | None:
+    """Load a user through the auth cache."""
+    cache = get_auth_cache()
+    user = cache.get_user(db, user_id)
+    if user is None:
+        user = db.get(User, user_id)
+        if user is not None:
+            cache.put_user(user)
+    return user
+
+
 def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(_bearer_scheme)],
     db: Annotated[Session, Depends(get_db)],
@@ -213,7 +367,7 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user = db.get(User, user_id)
+    user = _load_user(db, user_id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -247,7 +401,7 @@ def get_optional_current_user(
     try:
         payload = JWTHandler.validate_access_token(credentials.credentials)
         user_id = int(payload["sub"])
-        user = db.get(User, user_id)
+        user = _load_user(db, user_id)
         if user is None or not user.is_active:
             return None
         return user
@@ -274,7 +428,12 @@ def get_portfolio_with_owner_check(
         HTTPException 404: If portfolio not found
         HTTPException 403: If user doesn't own the portfolio
     """
-    portfolio = db.get(Portfolio, portfolio_id)
+    cache = get_auth_cache()
+    portfolio = cache.get_portfolio(db, portfolio_id)
+    if portfolio is None:
+        portfolio = db.get(Portfolio, portfolio_id)
+        if portfolio is not None:
+            cache.put_portfolio(portfolio)
 
     if portfolio is None:
         raise HTTPException(
@@ -291,6 +450,36 @@ def get_portfolio_with_owner_check(
     return portfolio
 
 
+def get_portfolio_data_context(
+    portfolio: Annotated[Portfolio, Depends(get_portfolio_with_owner_check)],
+    db: Annotated[Session, Depends(get_db)],
+) -> PortfolioDataContext:
+    """
+    Dependency that provides one PortfolioDataContext per request.
+
+    FastAPI caches dependency results per request, so every parameter that
+    depends on this gets the same context: transactions, assets and
+    price/FX windows loaded by one service call are reused by the next.
+
+    Usage:
+        @router.get("/{portfolio_id}/valuation")
+        def get_valuation(
+            context: PortfolioDataContext = Depends(get_portfolio_data_context),
+        ):
+            service.get_valuation(db, context.portfolio_id, context=context)
+
+    Raises:
+        HTTPException 404/403: From get_portfolio_with_owner_check
+    """
+    return PortfolioDataContext(
+        db,
+        portfolio.id,
+        portfolio=portfolio,
+        price_store=get_price_store(),
+        price_cache=get_price_cache(),
+    )
+
+
 # =============================================================================
 # CACHE MANAGEMENT
 # =============================================================================
@@ -303,11 +492,19 @@ def clear_service_caches() -> None:
     """
     # Clear the LRU caches (this will cause new instances to be created on next call)
     get_market_data_provider.cache_clear()
+    get_price_store.cache_clear()
+    get_price_cache.cache_clear()
     get_fx_rate_service.cache_clear()
     get_asset_resolution_service.cache_clear()
     get_valuation_service.cache_clear()
     get_analytics_service.cache_clear()
+    get_export_service.cache_clear()
     get_sync_service.cache_clear()
+    get_sync_job_queue.cache_clear()
+    get_upload_job_queue.cache_clear()
+    get_asset_search_service.cache_clear()
     get_email_service.cache_clear()
+    get_password_hashing_pool.cache_clear()
     get_auth_service.cache_clear()
+    get_auth_cache.cache_clear()
     logger.info("Cleared all service singleton caches")
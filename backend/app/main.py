@@ -29,6 +29,7 @@ from app.routers import (
     sync_router,
     valuation_router,
     analytics_router,
+    export_router,
     users_router,
 )
 from app.routers.portfolio_settings import router as portfolio_settings_router
@@ -567,6 +568,7 @@ app.include_router(upload_router)  # /upload/*
 app.include_router(sync_router)  # /portfolios/{id}/sync/* (Phase 3)
 app.include_router(valuation_router)  # /portfolios/{id}/valuation/* (Phase 4)
 app.include_router(analytics_router)  # /portfolios/{id}/analytics/* (Phase 5)
+app.include_router(export_router)  # /portfolios/{id}/export/*
 app.include_router(portfolio_settings_router)  # /portfolios/{id}/settings
 app.include_router(users_router)  # /users/me/*
 
@@ -597,6 +599,8 @@ def health_check(request: Request, db: Session = Depends(get_db)):
     Returns detailed health status of all dependencies.
     Returns HTTP 503 if critical dependencies (database) are unhealthy.
     Returns HTTP 200 with degraded status if non-critical dependencies are unhealthy.
+    Also reports in-process metrics (auth cache hit rates, password hashing
+    queue depth) under "metrics".
 
     **Response Status Codes:**
     - 200: All systems healthy, or non-critical systems degraded
@@ -606,7 +610,7 @@ def health_check(request: Request, db: Session = Depends(get_db)):
     Configure your load balancer to use this endpoint for health checks.
     Instances returning 503 should be removed from the pool.
     """
-    from app.dependencies import get_market_data_provider
+    from app.dependencies import get_auth_cache, get_market_data_provider, get_password_hashing_pool
 
     checks = {}
     critical_healthy = True
@@ -662,9 +666,32 @@ def health_check(request: Request, db: Session = Depends(get_db)):
             "error": str(e),
         }
 
+    auth_cache_stats = get_auth_cache().stats
+    password_pool_stats = get_password_hashing_pool().stats
+    metrics = {
+        "auth_cache": {
+            "user_hits": auth_cache_stats.user_hits,
+            "user_misses": auth_cache_stats.user_misses,
+            "user_hit_rate": round(auth_cache_stats.user_hit_rate, 4),
+            "portfolio_hits": auth_cache_stats.portfolio_hits,
+            "portfolio_misses": auth_cache_stats.portfolio_misses,
+            "portfolio_hit_rate": round(auth_cache_stats.portfolio_hit_rate, 4),
+            "users_cached": auth_cache_stats.users_cached,
+            "portfolios_cached": auth_cache_stats.portfolios_cached,
+        },
+        "password_pool": {
+            "max_workers": password_pool_stats.max_workers,
+            "queued": password_pool_stats.queued,
+            "active": password_pool_stats.active,
+            "peak_queued": password_pool_stats.peak_queued,
+            "completed": password_pool_stats.completed,
+        },
+    }
+
     response_data = {
         "status": overall_status,
         "checks": checks,
+        "metrics": metrics,
     }
 
     # Return 503 if critical dependencies are unhealthy
@@ -7,15 +7,23 @@ Models:
 - Portfolio: Investment portfolios owned by users
 - Asset: Global asset registry (stocks, ETFs, bonds, crypto, etc.)
 - Transaction: Buy/sell transactions within portfolios
+- PortfolioPosition: Running per-asset totals of a portfolio's transactions
 - MarketData: Historical OHLCV price data cache
 - ExchangeRate: Historical FX rates for currency conversion
+- AssetCoverage / ExchangeRateCoverage: Date intervals already fetched per provider
+- AssetInfoCache: Provider asset metadata lookups (including not found) shared by all processes
 - SyncStatus: Market data synchronization tracking per portfolio
+- SyncJob: Durable queue of sync requests processed by worker processes
+- UploadJob: Durable queue of background file uploads processed by worker processes
 - PortfolioSettings: Per-portfolio user preferences
 
 Enums:
 - TransactionType: BUY, SELL (DEPOSIT, WITHDRAWAL, DIVIDEND planned)
 - AssetClass: STOCK, ETF, BOND, CRYPTO, INDEX, etc.
 - SyncStatusEnum: NEVER, IN_PROGRESS, COMPLETED, PARTIAL, FAILED
+- SyncJobType: SYNC, FULL_RESYNC
+- SyncJobStatus: QUEUED, RUNNING, SUCCEEDED, FAILED
+- UploadJobStatus: QUEUED, RUNNING, SUCCEEDED, FAILED
 
 Design Decisions:
 - All financial values use Decimal(18, 8) for precision (supports crypto)
@@ -26,16 +34,20 @@ Design Decisions:
 Relationships:
 - User 1:N Portfolio
 - Portfolio 1:N Transaction
+- Portfolio 1:N PortfolioPosition
 - Asset 1:N Transaction
 - Asset 1:N MarketData
+- Asset 1:N AssetCoverage
 - Portfolio 1:1 SyncStatus
+- Portfolio 1:N SyncJob
+- Portfolio 1:N UploadJob
 - Portfolio 1:1 PortfolioSettings
 """
 import enum
 from datetime import date, datetime, timezone
 from decimal import Decimal
 
-from sqlalchemy import String, Date, DateTime, ForeignKey, Enum, Numeric, UniqueConstraint, Boolean, JSON, BigInteger, Index
+from sqlalchemy import String, Date, DateTime, ForeignKey, Enum, Numeric, UniqueConstraint, Boolean, JSON, BigInteger, Index, LargeBinary, text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -85,7 +97,45 @@ class SyncStatusEnum(str, enum.Enum):
     COMPLETED = "COMPLETED"  # All assets synced successfully
     PARTIAL = "PARTIAL"  # Some assets synced, some failed
     FAILED = "FAILED"  # Sync failed completely
-    PENDING = "PENDING"  # Scheduled but not started (future use)
+    PENDING = "PENDING"  # Sync job queued, waiting for a worker
+
+
+class SyncJobType(str, enum.Enum):
+    """Kind of work requested by a queued sync job."""
+    SYNC = "SYNC"  # Incremental sync (optionally forced)
+    FULL_RESYNC = "FULL_RESYNC"  # Forced re-fetch, rate limited per portfolio
+
+
+class SyncJobStatus(str, enum.Enum):
+    """
+    Lifecycle of a queued sync job.
+
+    State transitions:
+        QUEUED → RUNNING → SUCCEEDED
+        QUEUED → RUNNING → FAILED
+        RUNNING → QUEUED (retry after an error or a crashed worker)
+    """
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+
+
+class UploadJobStatus(str, enum.Enum):
+    """
+    Lifecycle of a background upload job.
+
+    State transitions:
+        QUEUED → RUNNING → SUCCEEDED
+        QUEUED → RUNNING → FAILED
+
+    Jobs are never retried: a worker that died after committing the
+    transactions would otherwise import them twice.
+    """
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
 
 
 class User(Base):
@@ -223,6 +273,10 @@ class Portfolio(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
 
+    # Incremented when a background worker changes the portfolio's
+    # transactions; part of the analytics cache's data version
+    data_version: Mapped[int] = mapped_column(default=0)
+
     # Phase 3: Settings and Sync Status
     settings: Mapped["PortfolioSettings | None"] = relationship(
         back_populates="portfolio",
@@ -240,6 +294,10 @@ class Portfolio(Base):
         back_populates="portfolio",
         cascade="all, delete-orphan"
     )
+    positions: Mapped[list["PortfolioPosition"]] = relationship(
+        back_populates="portfolio",
+        cascade="all, delete-orphan"
+    )
 
 
 class Asset(Base):
@@ -252,6 +310,11 @@ class Asset(Base):
     __tablename__ = "assets"
     __table_args__ = (
         UniqueConstraint('ticker', 'exchange', name='uq_ticker_exchange'),
+        # pg_trgm GIN indexes for asset search and ILIKE '%x%' filters
+        # (migration 011); plain indexes on other databases
+        Index('ix_assets_ticker_trgm', 'ticker', postgresql_using='gin', postgresql_ops={'ticker': 'gin_trgm_ops'}),
+        Index('ix_assets_name_trgm', 'name', postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}),
+        Index('ix_assets_isin_trgm', 'isin', postgresql_using='gin', postgresql_ops={'isin': 'gin_trgm_ops'}),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
@@ -272,6 +335,10 @@ class Asset(Base):
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
 
+    # Incremented whenever this asset's market_data rows change; keys the
+    # process-wide price series cache (services/market_data/price_cache.py)
+    price_version: Mapped[int] = mapped_column(default=0)
+
     # =========================================================================
     # PROXY BACKCASTING (Phase 3)
     # =========================================================================
@@ -302,6 +369,9 @@ class Transaction(Base):
         # "Get all transactions for asset A in portfolio X"
         # Used by transaction listing and analytics
         Index('ix_transaction_portfolio_asset_date', 'portfolio_id', 'asset_id', 'date'),
+        # "Does portfolio X have DEPOSIT/WITHDRAWAL transactions?"
+        # Lets valuation decide on the position ledger fast path without a scan
+        Index('ix_transaction_portfolio_type', 'portfolio_id', 'transaction_type'),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
@@ -320,10 +390,47 @@ class Transaction(Base):
     fee_currency: Mapped[str] = mapped_column(String)  # If different from trade currency (e.g. EUR)
     exchange_rate: Mapped[Decimal | None] = mapped_column(Numeric(18, 8), default=Decimal(1))  # Conversion rate to Portfolio Base Currency at time of trade
 
+    # Content hash for duplicate detection on re-upload (see transaction_writer.transaction_fingerprint)
+    fingerprint: Mapped[str | None] = mapped_column(String(64), nullable=True, index=True)
+
     portfolio: Mapped["Portfolio"] = relationship(back_populates="transactions")
     asset: Mapped["Asset | None"] = relationship(back_populates="transactions")
 
 
+class PortfolioPosition(Base):
+    """
+    Running BUY/SELL totals for one asset in one portfolio (position ledger).
+
+    Maintained in the same database transaction as every transaction
+    insert, update and delete (app/services/position_ledger.py), so the
+    row always equals the aggregate over the portfolio's transactions.
+    Current-quantity checks and today's valuation read this row instead
+    of summing the asset's whole transaction history.
+
+    Columns mirror HoldingPosition; quantity = total_bought_qty - total_sold_qty.
+    Cost columns keep extra scale because they accumulate products and
+    broker-rate conversions.
+    """
+    __tablename__ = "portfolio_positions"
+
+    portfolio_id: Mapped[int] = mapped_column(ForeignKey("portfolios.id", ondelete="CASCADE"), primary_key=True)
+    asset_id: Mapped[int] = mapped_column(ForeignKey("assets.id", ondelete="CASCADE"), primary_key=True)
+
+    quantity: Mapped[Decimal] = mapped_column(Numeric(28, 8), default=Decimal(0))
+    total_bought_qty: Mapped[Decimal] = mapped_column(Numeric(28, 8), default=Decimal(0))
+    total_sold_qty: Mapped[Decimal] = mapped_column(Numeric(28, 8), default=Decimal(0))
+    total_bought_cost_local: Mapped[Decimal] = mapped_column(Numeric(38, 18), default=Decimal(0))
+    total_bought_cost_portfolio: Mapped[Decimal] = mapped_column(Numeric(38, 18), default=Decimal(0))
+    total_sold_proceeds_portfolio: Mapped[Decimal] = mapped_column(Numeric(38, 18), default=Decimal(0))
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+
+    portfolio: Mapped["Portfolio"] = relationship(back_populates="positions")
+
+
 class MarketData(Base):
     """
     Historical price data cache (OHLCV format).
@@ -346,11 +453,25 @@ class MarketData(Base):
         # "Get all non-synthetic prices for asset X in date range"
         # Used by proxy backcasting to detect price gaps
         Index('ix_market_data_asset_synthetic_date', 'asset_id', 'is_synthetic', 'date'),
-    )
-
+        # Covering index for valuation/history price reads, which select only
+        # (asset_id, date, close_price, is_synthetic, proxy_source_id):
+        # lets PostgreSQL answer them with an index-only scan
+        Index(
+            'ix_market_data_asset_date_covering',
+            'asset_id', 'date',
+            postgresql_include=['close_price', 'is_synthetic', 'proxy_source_id'],
+            postgresql_where=text('no_data_available = false'),
+            sqlite_where=text('no_data_available = 0'),
+        ),
+        # On PostgreSQL the table is partitioned by year on date (migration
+        # 005), so this is a small BRIN index per partition
+        Index('ix_market_data_date_brin', 'date', postgresql_using='brin'),
+    )
+
+    # PostgreSQL primary key is (id, date) since partitioning; id alone stays unique
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     asset_id: Mapped[int] = mapped_column(ForeignKey("assets.id", ondelete="CASCADE"), index=True)
-    date: Mapped[date] = mapped_column(Date, index=True)  # Daily data - no time component
+    date: Mapped[date] = mapped_column(Date)  # Daily data - no time component (partition key)
 
     # =========================================================================
     # OHLCV DATA (Open, High, Low, Close, Volume)
@@ -389,8 +510,9 @@ class MarketData(Base):
     # =========================================================================
     # FETCH STATUS TRACKING
     # =========================================================================
-    # Marks dates where we attempted to fetch data but none was available
-    # (e.g., holidays, weekends, delisted stocks). Prevents repeated API calls.
+    # Legacy per-day placeholder for dates where no data was available.
+    # Fetched ranges are now tracked in AssetCoverage; the column is kept
+    # so readers can keep filtering out rows written by older versions.
     no_data_available: Mapped[bool] = mapped_column(Boolean, default=False)
 
     # =========================================================================
@@ -425,16 +547,27 @@ class ExchangeRate(Base):
         # while base_currency varies (different asset currencies). Putting quote_currency
         # first allows PostgreSQL to use the index more efficiently.
         Index('ix_exchange_rate_quote_base_date', 'quote_currency', 'base_currency', 'date'),
-    )
-
+        # Same lookup, covering the rate for index-only scans
+        Index(
+            'ix_exchange_rate_quote_base_date_covering',
+            'quote_currency', 'base_currency', 'date',
+            postgresql_include=['rate'],
+            postgresql_where=text('no_data_available = false'),
+            sqlite_where=text('no_data_available = 0'),
+        ),
+        # Partitioned by year on date like market_data (migration 005)
+        Index('ix_exchange_rates_date_brin', 'date', postgresql_using='brin'),
+    )
+
+    # PostgreSQL primary key is (id, date) since partitioning; id alone stays unique
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
 
     # Currency pair (e.g., USD/EUR means 1 USD = X EUR)
     base_currency: Mapped[str] = mapped_column(String(3), index=True)  # e.g., "USD"
     quote_currency: Mapped[str] = mapped_column(String(3), index=True)  # e.g., "EUR"
 
-    # The date for this rate (daily data - no time component)
-    date: Mapped[date] = mapped_column(Date, index=True)
+    # The date for this rate (daily data - no time component, partition key)
+    date: Mapped[date] = mapped_column(Date)
 
     # The exchange rate (Decimal for precision)
     rate: Mapped[Decimal | None] = mapped_column(Numeric(18, 8), nullable=True)  # e.g., 0.92610000 (NULL if no_data_available=True)
@@ -450,6 +583,88 @@ class ExchangeRate(Base):
     no_data_available: Mapped[bool] = mapped_column(Boolean, default=False)
 
 
+class AssetCoverage(Base):
+    """
+    Date intervals already requested from a provider for an asset.
+
+    Each row records that [start_date, end_date] was fetched successfully
+    from `provider`, whether or not every business day in it returned a
+    price. Missing-range detection subtracts these intervals from the
+    requested range instead of scanning every stored price date, and
+    holidays no longer need per-day placeholder rows in market_data.
+
+    Intervals are merged on write, so an asset typically has one row
+    per provider.
+    """
+    __tablename__ = "asset_coverage"
+    __table_args__ = (
+        Index('ix_asset_coverage_asset_provider_start', 'asset_id', 'provider', 'start_date'),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    asset_id: Mapped[int] = mapped_column(ForeignKey("assets.id", ondelete="CASCADE"))
+    provider: Mapped[str] = mapped_column(String(50))
+    start_date: Mapped[date] = mapped_column(Date)
+    end_date: Mapped[date] = mapped_column(Date)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+
+
+class ExchangeRateCoverage(Base):
+    """
+    Date intervals already requested from a provider for an FX pair.
+
+    FX counterpart of AssetCoverage, keyed by (base_currency, quote_currency).
+    """
+    __tablename__ = "exchange_rate_coverage"
+    __table_args__ = (
+        Index('ix_exchange_rate_coverage_pair_provider_start',
+              'base_currency', 'quote_currency', 'provider', 'start_date'),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    base_currency: Mapped[str] = mapped_column(String(3))
+    quote_currency: Mapped[str] = mapped_column(String(3))
+    provider: Mapped[str] = mapped_column(String(50))
+    start_date: Mapped[date] = mapped_column(Date)
+    end_date: Mapped[date] = mapped_column(Date)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+
+
+class AssetInfoCache(Base):
+    """
+    Provider asset metadata lookups shared by all processes.
+
+    Backs AssetResolutionService's in-memory cache so restarts and other
+    workers don't ask the provider again for symbols it already answered.
+    `info` holds the AssetInfo fields, or NULL when the provider reported
+    the symbol as not found; such negative entries get a shorter
+    `expires_at` so newly listed tickers are picked up.
+    """
+    __tablename__ = "asset_info_cache"
+    __table_args__ = (
+        UniqueConstraint('provider', 'ticker', 'exchange', name='uq_asset_info_cache_key'),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    provider: Mapped[str] = mapped_column(String(50))
+    ticker: Mapped[str] = mapped_column(String)
+    exchange: Mapped[str] = mapped_column(String)
+    info: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    fetched_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+    )
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+
+
 class SyncStatus(Base):
     """
     Tracks market data synchronization status per portfolio.
@@ -513,6 +728,138 @@ class SyncStatus(Base):
     portfolio: Mapped["Portfolio"] = relationship(back_populates="sync_status")
 
 
+class SyncJob(Base):
+    """
+    Durable queue entry for a portfolio sync.
+
+    API requests only insert a QUEUED row; worker processes claim rows
+    with SELECT ... FOR UPDATE SKIP LOCKED, run the sync and store the
+    result. At most one QUEUED job exists per portfolio (enforced by a
+    partial unique index), so repeated clicks coalesce into one job.
+    """
+    __tablename__ = "sync_jobs"
+    __table_args__ = (
+        # Claim query: oldest queued job first
+        Index('ix_sync_jobs_status_created', 'status', 'created_at'),
+        # One waiting job per portfolio
+        Index(
+            'uq_sync_jobs_portfolio_queued',
+            'portfolio_id',
+            unique=True,
+            postgresql_where=text("status = 'QUEUED'"),
+            sqlite_where=text("status = 'QUEUED'"),
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    portfolio_id: Mapped[int] = mapped_column(
+        ForeignKey("portfolios.id", ondelete="CASCADE"),
+        index=True
+    )
+    job_type: Mapped[SyncJobType] = mapped_column(
+        Enum(SyncJobType),
+        default=SyncJobType.SYNC
+    )
+    status: Mapped[SyncJobStatus] = mapped_column(
+        Enum(SyncJobStatus),
+        default=SyncJobStatus.QUEUED
+    )
+    force: Mapped[bool] = mapped_column(Boolean, default=False)
+
+    # Execution tracking
+    attempts: Mapped[int] = mapped_column(default=0)
+    worker_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    result: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    error: Mapped[str | None] = mapped_column(String, nullable=True)
+
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc)
+    )
+    started_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True
+    )
+    # Refreshed by the running worker; stale-job recovery is judged on it
+    heartbeat_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True
+    )
+    finished_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True
+    )
+
+
+class UploadJob(Base):
+    """
+    Durable queue entry for a background file upload.
+
+    The API stores the uploaded file in `content` and returns; a worker
+    claims the job, runs UploadService.process_file on it and records
+    progress counters and errors as it goes, so clients can poll the job
+    while large files are processed. `content` is cleared once the job
+    finishes.
+    """
+    __tablename__ = "upload_jobs"
+    __table_args__ = (
+        # Claim query: oldest queued job first
+        Index('ix_upload_jobs_status_created', 'status', 'created_at'),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    portfolio_id: Mapped[int] = mapped_column(
+        ForeignKey("portfolios.id", ondelete="CASCADE"),
+        index=True
+    )
+    status: Mapped[UploadJobStatus] = mapped_column(
+        Enum(UploadJobStatus),
+        default=UploadJobStatus.QUEUED
+    )
+
+    # Uploaded file (loaded only when the worker processes it)
+    filename: Mapped[str] = mapped_column(String(255))
+    content_type: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    date_format: Mapped[str] = mapped_column(String(10))
+    content: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True, deferred=True)
+
+    # Progress (updated by the worker while the job runs)
+    stage: Mapped[str | None] = mapped_column(String(30), nullable=True)
+    total_rows: Mapped[int] = mapped_column(default=0)
+    rows_validated: Mapped[int] = mapped_column(default=0)
+    rows_resolved: Mapped[int] = mapped_column(default=0)
+    rows_skipped: Mapped[int] = mapped_column(default=0)
+    rows_inserted: Mapped[int] = mapped_column(default=0)
+    error_count: Mapped[int] = mapped_column(default=0)
+    errors: Mapped[list | None] = mapped_column(JSON, nullable=True)
+    warnings: Mapped[list | None] = mapped_column(JSON, nullable=True)
+
+    # Outcome
+    created_transaction_ids: Mapped[list | None] = mapped_column(JSON, nullable=True)
+    error: Mapped[str | None] = mapped_column(String, nullable=True)
+    worker_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
+
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc)
+    )
+    started_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True
+    )
+    # Refreshed with every progress report; stale-job recovery is judged on it
+    heartbeat_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True
+    )
+    finished_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True
+    )
+
+
 class PortfolioSettings(Base):
     """
     User preferences for a portfolio.
@@ -11,10 +11,12 @@ Each router handles a specific domain:
 - sync: Market data synchronization
 - valuation: Portfolio valuation and performance
 - analytics: Portfolio analytics (performance, risk, benchmark)
+- export: Streaming CSV / Parquet / Arrow downloads
 """
 
 from app.routers.analytics import router as analytics_router
 from app.routers.assets import router as assets_router
+from app.routers.export import router as export_router
 from app.routers.portfolio_settings import router as portfolio_settings_router
 from app.routers.portfolios import router as portfolios_router
 from app.routers.sync import router as sync_router
@@ -31,6 +33,7 @@ __all__ = [
     "sync_router",
     "valuation_router",
     "analytics_router",
+    "export_router",
     "users_router",
     "portfolio_settings_router",
 ]
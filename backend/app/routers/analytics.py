@@ -29,7 +29,7 @@ from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models import Portfolio, Transaction, User
 from app.middleware.rate_limit import limiter, RATE_LIMIT_ANALYTICS
-from app.dependencies import get_portfolio_with_owner_check
+from app.dependencies import get_portfolio_with_owner_check, get_portfolio_data_context
 from app.services.constants import MAX_HISTORY_DAYS
 from app.schemas.analytics import (
     PeriodInfo,
@@ -55,6 +55,7 @@ from app.services.analytics import (
     MeasurementPeriodInfo,
 )
 from app.dependencies import get_analytics_service
+from app.services.portfolio_context import PortfolioDataContext
 
 # =============================================================================
 # ROUTER SETUP
@@ -330,6 +331,7 @@ def get_portfolio_analytics(
         ),
         db: Session = Depends(get_db),
         service: AnalyticsService = Depends(get_analytics_service),
+        context: PortfolioDataContext = Depends(get_portfolio_data_context),
 ) -> AnalyticsResponse:
     """
     Get complete portfolio analytics for a date range.
@@ -373,6 +375,7 @@ def get_portfolio_analytics(
         benchmark_symbol=benchmark_symbol,
         risk_free_rate=risk_free_rate,
         scope=scope,
+        context=context,
     )
 
     # Map to response schema
@@ -414,6 +417,7 @@ def get_portfolio_performance(
         ),
         db: Session = Depends(get_db),
         service: AnalyticsService = Depends(get_analytics_service),
+        context: PortfolioDataContext = Depends(get_portfolio_data_context),
 ) -> PerformanceResponse:
     """
     Get performance metrics for a portfolio.
@@ -443,6 +447,7 @@ def get_portfolio_performance(
         portfolio_id=portfolio_id,
         start_date=from_date,
         end_date=to_date,
+        context=context,
     )
 
     # Build period info
@@ -491,6 +496,7 @@ def get_portfolio_risk(
         ),
         db: Session = Depends(get_db),
         service: AnalyticsService = Depends(get_analytics_service),
+        context: PortfolioDataContext = Depends(get_portfolio_data_context),
 ) -> RiskResponse:
     """
     Get risk metrics for a portfolio.
@@ -540,6 +546,7 @@ def get_portfolio_risk(
         end_date=to_date,
         risk_free_rate=risk_free_rate,
         scope=scope,
+        context=context,
     )
 
     # Build period info using measurement period if available
@@ -597,6 +604,7 @@ def get_portfolio_benchmark(
         ),
         db: Session = Depends(get_db),
         service: AnalyticsService = Depends(get_analytics_service),
+        context: PortfolioDataContext = Depends(get_portfolio_data_context),
 ) -> BenchmarkResponse:
     """
     Get benchmark comparison metrics for a portfolio.
@@ -636,6 +644,7 @@ def get_portfolio_benchmark(
         end_date=to_date,
         benchmark_symbol=benchmark_symbol,
         risk_free_rate=risk_free_rate,
+        context=context,
     )
 
     # Build period info
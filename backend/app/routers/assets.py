@@ -17,11 +17,13 @@ from sqlalchemy import select, and_, or_, func
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.dependencies import get_current_user
+from app.dependencies import get_asset_search_service, get_current_user
 from app.models import Asset, AssetClass, User
 from app.schemas.assets import AssetCreate, AssetUpdate, AssetResponse, AssetListResponse
 from app.schemas.pagination import PaginationMeta
 from app.schemas.validators import validate_currency_query, validate_exchange_query
+from app.services.asset_search import AssetSearchService
+from app.services.constants import ASSET_SEARCH_DEFAULT_LIMIT, ASSET_SEARCH_MAX_LIMIT
 from app.utils import escape_like_pattern
 
 # Validated query parameter types
@@ -248,6 +250,40 @@ def list_assets(
     )
 
 
+@router.get(
+    "/search",
+    response_model=list[AssetResponse],
+    summary="Search assets",
+    response_description="Matching active assets, best match first"
+)
+def search_assets(
+        q: str = Query(
+            min_length=1,
+            max_length=100,
+            description="Ticker, name or ISIN (or the start of one)"
+        ),
+        limit: int = Query(
+            default=ASSET_SEARCH_DEFAULT_LIMIT,
+            ge=1,
+            le=ASSET_SEARCH_MAX_LIMIT,
+            description="Maximum results to return"
+        ),
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_current_user),
+        search_service: AssetSearchService = Depends(get_asset_search_service),
+) -> list[Asset]:
+    """
+    Type-ahead search over active assets.
+
+    Results are ranked: exact ticker or ISIN match first, then ticker
+    prefix, ISIN prefix and finally name matches. Unlike the **search**
+    filter of the asset list, this returns only the best **limit** matches
+    and uses trigram indexes on PostgreSQL, so it stays fast on large
+    asset registries.
+    """
+    return search_service.search(db, q, limit)
+
+
 @router.get(
     "/{asset_id}",
     response_model=AssetResponse,
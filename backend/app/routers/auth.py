@@ -19,6 +19,8 @@ Security:
 - Refresh tokens are stored in httpOnly cookies to prevent XSS attacks
 - Access tokens are returned in the response body (short-lived, 15 min)
 - Token rotation on each refresh with replay attack detection
+- Password endpoints are async: bcrypt runs on a dedicated pool and
+  database work on the threadpool, leaving general-purpose workers free
 """
 
 from datetime import datetime, timezone
@@ -55,11 +57,11 @@ from app.schemas.auth import (
     MessageResponse,
     GoogleAuthUrlResponse,
 )
-from app.services.auth import AuthService, GoogleOAuthService
+from app.services.auth import AuthCache, AuthService, GoogleOAuthService
 from app.services.auth.service import TokenPair
 from app.services.auth.oauth_google import get_oauth_state_store
 from app.services.exceptions import InvalidCredentialsError
-from app.dependencies import get_auth_service, get_current_user
+from app.dependencies import get_auth_cache, get_auth_service, get_current_user
 from app.utils.cookies import (
     REFRESH_TOKEN_COOKIE,
     set_refresh_token_cookie,
@@ -132,14 +134,14 @@ def _get_client_info(request: Request) -> tuple[str | None, str | None]:
     description="Create a new user account with email and password. A verification email will be sent.",
 )
 @limiter.limit(RATE_LIMIT_AUTH_REGISTER)
-def register(
+async def register(
     request: Request,  # Required for rate limiter
     data: UserRegisterRequest,
     db: Annotated[Session, Depends(get_db)],
     auth_service: Annotated[AuthService, Depends(get_auth_service)],
 ) -> User:
     """Register a new user with email/password."""
-    user = auth_service.register(
+    user = await auth_service.register_async(
         db=db,
         email=data.email,
         password=data.password,
@@ -158,7 +160,7 @@ def register(
     ),
 )
 @limiter.limit(RATE_LIMIT_AUTH_LOGIN)
-def login(
+async def login(
     data: UserLoginRequest,
     request: Request,
     db: Annotated[Session, Depends(get_db)],
@@ -167,7 +169,7 @@ def login(
     """Login with email and password."""
     device_info, ip_address = _get_client_info(request)
 
-    tokens = auth_service.login(
+    tokens = await auth_service.login_async(
         db=db,
         email=data.email,
         password=data.password,
@@ -270,10 +272,13 @@ def logout(
 def logout_all(
     db: Annotated[Session, Depends(get_db)],
     auth_service: Annotated[AuthService, Depends(get_auth_service)],
+    auth_cache: Annotated[AuthCache, Depends(get_auth_cache)],
     current_user: Annotated[User, Depends(get_current_user)],
 ) -> JSONResponse:
     """Logout from all sessions."""
     count = auth_service.logout_all(db=db, user_id=current_user.id)
+    # No user row changes here, so the ORM listeners don't fire
+    auth_cache.invalidate_user(current_user.id)
 
     # Create response and clear the cookie
     response = JSONResponse(
@@ -357,14 +362,14 @@ def forgot_password(
     description="Reset password using the token from the reset email.",
 )
 @limiter.limit(RATE_LIMIT_AUTH_PASSWORD_RESET)
-def reset_password(
+async def reset_password(
     request: Request,  # Required for rate limiter
     data: ResetPasswordRequest,
     db: Annotated[Session, Depends(get_db)],
     auth_service: Annotated[AuthService, Depends(get_auth_service)],
 ) -> MessageResponse:
     """Reset password with token."""
-    auth_service.reset_password(db=db, token=data.token, new_password=data.new_password)
+    await auth_service.reset_password_async(db=db, token=data.token, new_password=data.new_password)
     return MessageResponse(message="Password reset successfully. Please login with your new password.")
 
 
@@ -0,0 +1,157 @@
+# backend/app/routers/export.py
+"""
+Streaming bulk export endpoints.
+
+Downloads a portfolio's data as a file instead of paging through the
+JSON endpoints:
+- GET /portfolios/{id}/export/transactions - Every transaction, oldest first
+- GET /portfolios/{id}/export/holdings - Holdings valued on a date
+- GET /portfolios/{id}/export/history - Valuation time series
+
+Formats (?format=): csv (default), parquet, arrow (Arrow IPC stream).
+Parquet and Arrow need pyarrow installed on the server.
+
+Responses are streamed: rows are read through server-side cursors and
+sent in batches as they are encoded, so large exports start downloading
+immediately and use constant server memory.
+"""
+
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.models import Portfolio
+from app.services.constants import MAX_HISTORY_DAYS
+from app.dependencies import (
+    get_export_service,
+    get_portfolio_data_context,
+    get_portfolio_with_owner_check,
+)
+from app.services.export_service import (
+    EXPORT_FILE_EXTENSIONS,
+    EXPORT_MEDIA_TYPES,
+    ExportFormat,
+    ExportService,
+)
+from app.services.portfolio_context import PortfolioDataContext
+
+# =============================================================================
+# ROUTER SETUP
+# =============================================================================
+
+router = APIRouter(
+    prefix="/portfolios",
+    tags=["Export"],
+)
+
+
+def _file_response(chunks, portfolio_id: int, name: str, export_format: ExportFormat) -> StreamingResponse:
+    """Wrap export chunks in a download response."""
+    filename = f"portfolio_{portfolio_id}_{name}.{EXPORT_FILE_EXTENSIONS[export_format]}"
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+# =============================================================================
+# ENDPOINTS
+# =============================================================================
+
+@router.get(
+    "/{portfolio_id}/export/transactions",
+    summary="Export transactions",
+    response_description="File with every transaction in the portfolio",
+)
+def export_transactions(
+        portfolio: Portfolio = Depends(get_portfolio_with_owner_check),
+        export_format: ExportFormat = Query(default="csv", alias="format", description="csv, parquet or arrow"),
+        db: Session = Depends(get_db),
+        service: ExportService = Depends(get_export_service),
+) -> StreamingResponse:
+    """
+    Download all transactions of the portfolio, ordered by date.
+
+    Raises **400** if the format is not available on this server.
+    Raises **403** if you don't own the portfolio.
+    """
+    chunks = service.stream_transactions(db, portfolio.id, export_format)
+    return _file_response(chunks, portfolio.id, "transactions", export_format)
+
+
+@router.get(
+    "/{portfolio_id}/export/holdings",
+    summary="Export holdings",
+    response_description="File with one row per holding",
+)
+def export_holdings(
+        portfolio: Portfolio = Depends(get_portfolio_with_owner_check),
+        valuation_date: date | None = Query(
+            default=None,
+            description="Valuation date (default: today)",
+            alias="date"
+        ),
+        export_format: ExportFormat = Query(default="csv", alias="format", description="csv, parquet or arrow"),
+        db: Session = Depends(get_db),
+        service: ExportService = Depends(get_export_service),
+        context: PortfolioDataContext = Depends(get_portfolio_data_context),
+) -> StreamingResponse:
+    """
+    Download the portfolio's holdings valued on a date, amounts in the
+    portfolio currency.
+
+    Raises **400** if the format is not available on this server.
+    Raises **403** if you don't own the portfolio.
+    """
+    chunks = service.stream_holdings(db, portfolio.id, valuation_date, export_format, context=context)
+    return _file_response(chunks, portfolio.id, "holdings", export_format)
+
+
+@router.get(
+    "/{portfolio_id}/export/history",
+    summary="Export valuation history",
+    response_description="File with one row per date",
+)
+def export_history(
+        portfolio: Portfolio = Depends(get_portfolio_with_owner_check),
+        from_date: date = Query(..., description="Start date for history"),
+        to_date: date = Query(..., description="End date for history"),
+        interval: str = Query(
+            default="daily",
+            pattern=r"^(daily|weekly|monthly)$",
+            description="Data interval: daily, weekly, monthly"
+        ),
+        export_format: ExportFormat = Query(default="csv", alias="format", description="csv, parquet or arrow"),
+        db: Session = Depends(get_db),
+        service: ExportService = Depends(get_export_service),
+        context: PortfolioDataContext = Depends(get_portfolio_data_context),
+) -> StreamingResponse:
+    """
+    Download the valuation time series (same points as
+    /valuation/history), calculated while it streams.
+
+    Raises **400** for an invalid date range or unavailable format.
+    Raises **403** if you don't own the portfolio.
+    """
+    if from_date > to_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="from_date must be before or equal to to_date"
+        )
+
+    date_range_days = (to_date - from_date).days
+    if date_range_days > MAX_HISTORY_DAYS:
+        max_years = MAX_HISTORY_DAYS // 365
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Date range of {date_range_days} days exceeds maximum of {MAX_HISTORY_DAYS} days ({max_years} years)"
+        )
+
+    chunks = service.stream_history(
+        db, portfolio.id, from_date, to_date, interval, export_format, context=context,
+    )
+    return _file_response(chunks, portfolio.id, "history", export_format)
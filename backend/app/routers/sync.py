@@ -6,9 +6,12 @@ Provides endpoints for synchronizing market data (prices, FX rates)
 for portfolios. This is Phase 3 functionality.
 
 Key features:
-- Sync portfolio market data from Yahoo Finance
-- Check sync status
+- Queue a portfolio sync (runs in a separate worker process)
+- Check sync status and job progress
 - Force refresh capability
+
+Sync endpoints return 202 Accepted with a job ID as soon as the job is
+queued; the work is done by `python -m app.worker`.
 """
 
 import logging
@@ -20,10 +23,13 @@ from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.models import Portfolio, SyncStatus, User
-from app.services.market_data import MarketDataSyncService, SyncResult
-from app.services.analytics.service import AnalyticsService
-from app.dependencies import get_sync_service, get_analytics_service, get_portfolio_with_owner_check
+from app.models import Portfolio, SyncJob, SyncJobType, SyncStatus, User
+from app.services.market_data import MarketDataSyncService, SyncJobQueue
+from app.dependencies import (
+    get_sync_service,
+    get_sync_job_queue,
+    get_portfolio_with_owner_check,
+)
 from app.middleware.rate_limit import limiter, RATE_LIMIT_SYNC, RATE_LIMIT_DEFAULT
 
 # Full re-sync can only be done once per hour
@@ -54,7 +60,7 @@ class SyncRequest(BaseModel):
 
 
 class SyncResponse(BaseModel):
-    """Response from sync operation."""
+    """Result of a finished sync job."""
     success: bool
     portfolio_id: int
     status: str = Field(description="completed, partial, or failed")
@@ -69,10 +75,31 @@ class SyncResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class SyncJobResponse(BaseModel):
+    """State of a queued sync job."""
+    job_id: int
+    portfolio_id: int
+    job_type: str = Field(description="SYNC or FULL_RESYNC")
+    status: str = Field(description="QUEUED, RUNNING, SUCCEEDED, or FAILED")
+    force: bool = False
+    attempts: int = 0
+    created_at: str
+    started_at: str | None = None
+    finished_at: str | None = None
+    result: SyncResponse | None = Field(
+        default=None,
+        description="Sync statistics once the job has finished"
+    )
+    error: str | None = None
+    status_url: str = Field(description="URL to poll for job progress")
+
+    model_config = {"from_attributes": True}
+
+
 class SyncStatusResponse(BaseModel):
     """Response for sync status check."""
     portfolio_id: int
-    status: str = Field(description="NEVER, IN_PROGRESS, COMPLETED, PARTIAL, FAILED")
+    status: str = Field(description="NEVER, PENDING, IN_PROGRESS, COMPLETED, PARTIAL, FAILED")
     last_sync_started: str | None = None
     last_sync_completed: str | None = None
     last_full_sync: str | None = None
@@ -82,28 +109,42 @@ class SyncStatusResponse(BaseModel):
         default=None,
         description="Error message from last failed sync (if status is FAILED or PARTIAL)"
     )
+    latest_job: SyncJobResponse | None = Field(
+        default=None,
+        description="Most recently queued sync job for this portfolio"
+    )
 
     model_config = {"from_attributes": True}
 
 
-class FullResyncResponse(BaseModel):
-    """Response from full re-sync operation."""
-    success: bool
-    portfolio_id: int
-    status: str = Field(description="completed, partial, or failed")
-    assets_synced: int = 0
-    assets_failed: int = 0
-    prices_fetched: int = 0
-    fx_pairs_synced: int = 0
-    fx_rates_fetched: int = 0
-    warnings: list[str] = []
-    error: str | None = None
-    next_full_resync_available: str | None = Field(
-        default=None,
-        description="ISO timestamp when next full re-sync will be available"
-    )
+# =============================================================================
+# HELPER FUNCTIONS
+# =============================================================================
 
-    model_config = {"from_attributes": True}
+def _build_job_response(job: SyncJob) -> SyncJobResponse:
+    """Convert a SyncJob row to its API representation."""
+    result = None
+    if job.result is not None:
+        result = SyncResponse(
+            success=job.result.get("status") in ("completed", "partial"),
+            portfolio_id=job.portfolio_id,
+            **job.result,
+        )
+
+    return SyncJobResponse(
+        job_id=job.id,
+        portfolio_id=job.portfolio_id,
+        job_type=job.job_type.value,
+        status=job.status.value,
+        force=job.force,
+        attempts=job.attempts,
+        created_at=job.created_at.isoformat(),
+        started_at=job.started_at.isoformat() if job.started_at else None,
+        finished_at=job.finished_at.isoformat() if job.finished_at else None,
+        result=result,
+        error=job.error,
+        status_url=f"/portfolios/{job.portfolio_id}/sync/jobs/{job.id}",
+    )
 
 
 # =============================================================================
@@ -112,9 +153,10 @@ class FullResyncResponse(BaseModel):
 
 @router.post(
     "/{portfolio_id}/sync",
-    response_model=SyncResponse,
-    summary="Sync portfolio market data",
-    response_description="Sync result with statistics"
+    response_model=SyncJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Queue portfolio market data sync",
+    response_description="Queued sync job"
 )
 @limiter.limit(RATE_LIMIT_SYNC)
 def sync_portfolio(
@@ -122,20 +164,22 @@ def sync_portfolio(
         portfolio: Portfolio = Depends(get_portfolio_with_owner_check),
         sync_request: SyncRequest = SyncRequest(),
         db: Session = Depends(get_db),
-        service: MarketDataSyncService = Depends(get_sync_service),
-        analytics_service: AnalyticsService = Depends(get_analytics_service),
-) -> SyncResponse:
+        queue: SyncJobQueue = Depends(get_sync_job_queue),
+) -> SyncJobResponse:
     """
-    Synchronize market data for a portfolio.
+    Queue a market data sync for a portfolio.
 
-    This endpoint fetches:
+    A background worker fetches:
     - Historical prices for all assets in the portfolio
     - FX rates for currency conversion
 
     Data is fetched from Yahoo Finance and stored in the database
     for fast valuation lookups.
 
-    **Note:** This may take 10-30 seconds depending on the number of assets.
+    Returns **202** immediately with the job. Poll `status_url` (or
+    `/sync/status`) until the job is SUCCEEDED or FAILED. If a sync is
+    already waiting for this portfolio, that job is returned instead of
+    queuing another one.
 
     Set `force_refresh: true` to re-fetch all data even if recent data exists.
 
@@ -143,39 +187,50 @@ def sync_portfolio(
     """
     portfolio_id = portfolio.id
 
-    logger.info(f"Starting sync for portfolio {portfolio_id} (force={sync_request.force_refresh})")
+    logger.info(f"Queuing sync for portfolio {portfolio_id} (force={sync_request.force_refresh})")
 
-    try:
-        result: SyncResult = service.sync_portfolio(
-            db=db,
-            portfolio_id=portfolio_id,
-            force=sync_request.force_refresh,
-        )
+    job = queue.enqueue(
+        db,
+        portfolio_id,
+        job_type=SyncJobType.SYNC,
+        force=sync_request.force_refresh,
+    )
 
-        # Invalidate analytics cache after sync (prices/FX rates changed)
-        # Do this regardless of partial success since some data may have changed
-        analytics_service.invalidate_cache(portfolio_id)
-
-        return SyncResponse(
-            success=result.status in ("completed", "partial"),
-            portfolio_id=result.portfolio_id,
-            status=result.status,
-            assets_synced=result.assets_synced,
-            assets_failed=result.assets_failed,
-            prices_fetched=result.prices_fetched,
-            fx_pairs_synced=result.fx_pairs_synced,
-            fx_rates_fetched=result.fx_rates_fetched,
-            warnings=result.warnings,
-            error=result.error,
-        )
+    # Cached analytics are dropped once the worker finishes: the cache is
+    # keyed on SyncStatus.last_sync_completed, which the sync updates
+    return _build_job_response(job)
+
+
+@router.get(
+    "/{portfolio_id}/sync/jobs/{job_id}",
+    response_model=SyncJobResponse,
+    summary="Get sync job",
+    response_description="Current state of a sync job"
+)
+@limiter.limit(RATE_LIMIT_DEFAULT)
+def get_sync_job(
+        request: Request,  # Required for rate limiting
+        job_id: int,
+        portfolio: Portfolio = Depends(get_portfolio_with_owner_check),
+        db: Session = Depends(get_db),
+        queue: SyncJobQueue = Depends(get_sync_job_queue),
+) -> SyncJobResponse:
+    """
+    Get the progress and result of a queued sync job.
+
+    Raises **403** if you don't own the portfolio.
+    Raises **404** if the job doesn't exist for this portfolio.
+    """
+    job = queue.get_job(db, portfolio.id, job_id)
 
-    except Exception as e:
-        logger.error(f"Sync failed for portfolio {portfolio_id}: {e}")
+    if job is None:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Sync failed: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Sync job {job_id} not found"
         )
 
+    return _build_job_response(job)
+
 
 @router.get(
     "/{portfolio_id}/sync/status",
@@ -189,14 +244,16 @@ def get_sync_status(
         portfolio: Portfolio = Depends(get_portfolio_with_owner_check),
         db: Session = Depends(get_db),
         service: MarketDataSyncService = Depends(get_sync_service),
+        queue: SyncJobQueue = Depends(get_sync_job_queue),
 ) -> SyncStatusResponse:
     """
     Get the current sync status for a portfolio.
 
     Returns:
-    - **status**: Current sync state (NEVER, COMPLETED, etc.)
+    - **status**: Current sync state (NEVER, PENDING, IN_PROGRESS, COMPLETED, etc.)
     - **is_stale**: Whether data needs to be refreshed
     - **staleness_reason**: Why data is considered stale (if applicable)
+    - **latest_job**: The most recently queued sync job, if any
 
     Raises **403** if you don't own the portfolio.
     """
@@ -210,6 +267,9 @@ def get_sync_status(
     # Check staleness
     is_stale, staleness_reason = service.is_data_stale(db, portfolio_id)
 
+    latest_job = queue.get_latest_job(db, portfolio_id)
+    latest_job_response = _build_job_response(latest_job) if latest_job else None
+
     if sync_status:
         return SyncStatusResponse(
             portfolio_id=portfolio_id,
@@ -220,6 +280,7 @@ def get_sync_status(
             is_stale=is_stale,
             staleness_reason=staleness_reason,
             last_error=sync_status.last_error,
+            latest_job=latest_job_response,
         )
     else:
         return SyncStatusResponse(
@@ -231,32 +292,34 @@ def get_sync_status(
             is_stale=True,
             staleness_reason="Portfolio has never been synced",
             last_error=None,
+            latest_job=latest_job_response,
         )
 
 
 @router.post(
     "/{portfolio_id}/sync/full",
-    response_model=FullResyncResponse,
-    summary="Full re-sync portfolio market data",
-    response_description="Full re-sync result with statistics"
+    response_model=SyncJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Queue full re-sync of portfolio market data",
+    response_description="Queued full re-sync job"
 )
 @limiter.limit(RATE_LIMIT_SYNC)
 def full_resync_portfolio(
         request: Request,  # Required for rate limiting
         portfolio: Portfolio = Depends(get_portfolio_with_owner_check),
         db: Session = Depends(get_db),
-        service: MarketDataSyncService = Depends(get_sync_service),
-        analytics_service: AnalyticsService = Depends(get_analytics_service),
-) -> FullResyncResponse:
+        queue: SyncJobQueue = Depends(get_sync_job_queue),
+) -> SyncJobResponse:
     """
-    Perform a full re-sync of all market data for a portfolio.
+    Queue a full re-sync of all market data for a portfolio.
 
-    This operation:
-    - Clears "no data" markers for dates that previously had no data
+    The worker:
+    - Ignores previously fetched date ranges
     - Re-fetches all historical prices from Yahoo Finance
     - Re-fetches all FX rates
 
     **Rate Limited:** Can only be performed once per hour per portfolio.
+    The cooldown starts when the re-sync finishes.
 
     Use this when:
     - You suspect data provider has corrected historical data
@@ -265,6 +328,8 @@ def full_resync_portfolio(
 
     For regular daily updates, use the standard `/sync` endpoint instead.
 
+    Returns **202** immediately with the job; poll `status_url` for progress.
+
     Raises **403** if you don't own the portfolio.
     Raises **429** if a full re-sync was performed within the last hour.
     """
@@ -279,53 +344,22 @@ def full_resync_portfolio(
     cooldown = timedelta(hours=FULL_RESYNC_COOLDOWN_HOURS)
 
     if sync_status and sync_status.last_full_sync:
-        time_since_last = now - sync_status.last_full_sync
+        last_full_sync = sync_status.last_full_sync
+        if last_full_sync.tzinfo is None:
+            last_full_sync = last_full_sync.replace(tzinfo=timezone.utc)
+        time_since_last = now - last_full_sync
         if time_since_last < cooldown:
-            next_available = sync_status.last_full_sync + cooldown
+            next_available = last_full_sync + cooldown
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 detail=f"Full re-sync can only be performed once per hour. "
                        f"Next available: {next_available.isoformat()}"
             )
 
-    logger.info(f"Starting full re-sync for portfolio {portfolio_id}")
+    logger.info(f"Queuing full re-sync for portfolio {portfolio_id}")
 
-    try:
-        result: SyncResult = service.sync_portfolio(
-            db=db,
-            portfolio_id=portfolio_id,
-            force=True,  # Force re-fetch all data
-        )
+    job = queue.enqueue(db, portfolio_id, job_type=SyncJobType.FULL_RESYNC)
 
-        # Update last_full_sync timestamp
-        if sync_status:
-            sync_status.last_full_sync = now
-            db.commit()
-
-        # Invalidate analytics cache after sync
-        analytics_service.invalidate_cache(portfolio_id)
-
-        next_available = now + cooldown
-
-        return FullResyncResponse(
-            success=result.status in ("completed", "partial"),
-            portfolio_id=result.portfolio_id,
-            status=result.status,
-            assets_synced=result.assets_synced,
-            assets_failed=result.assets_failed,
-            prices_fetched=result.prices_fetched,
-            fx_pairs_synced=result.fx_pairs_synced,
-            fx_rates_fetched=result.fx_rates_fetched,
-            warnings=result.warnings,
-            error=result.error,
-            next_full_resync_available=next_available.isoformat(),
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Full re-sync failed for portfolio {portfolio_id}: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Full re-sync failed: {str(e)}"
-        )
+    # Cached analytics are dropped once the worker finishes: the cache is
+    # keyed on SyncStatus.last_sync_completed, which the sync updates
+    return _build_job_response(job)
@@ -22,16 +22,16 @@ from typing import Annotated
 
 logger = logging.getLogger(__name__)
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from fastapi.responses import JSONResponse
 from pydantic import AfterValidator
-from sqlalchemy import select, func
+from sqlalchemy import select, func, tuple_
 from sqlalchemy.orm import Session
 from sqlalchemy.orm import joinedload, contains_eager
 
 from app.database import get_db
 from app.models import Transaction, Portfolio, Asset, TransactionType, User
-from app.schemas.pagination import PaginationMeta
+from app.schemas.pagination import PaginationMeta, decode_keyset_cursor, encode_keyset_cursor
 from app.schemas.transactions import (
     TransactionCreate,
     TransactionUpdate,
@@ -43,13 +43,27 @@ from app.schemas.transactions import (
 from app.schemas.validators import validate_currency_query, validate_ticker_query
 from app.services.asset_resolution import AssetResolutionService
 from app.services.analytics.service import AnalyticsService
-from app.services.constants import MAX_BATCH_SIZE
+from app.services.constants import LIST_STREAM_BATCH_SIZE, LIST_STREAM_THRESHOLD, MAX_BATCH_SIZE
+from app.services.position_ledger import (
+    apply_deltas,
+    quantity_held,
+    record_transactions,
+    remove_transactions,
+    transaction_delta,
+)
+from app.services.sell_validation import find_sell_shortfalls
+from app.services.transaction_writer import (
+    insert_transactions,
+    split_new_transactions,
+    transaction_fingerprint,
+)
 from app.dependencies import (
     get_asset_resolution_service,
     get_analytics_service,
     get_current_user,
     get_portfolio_with_owner_check,
 )
+from app.utils.sql import estimate_row_count
 
 # Validated query parameter types
 CurrencyQuery = Annotated[str | None, AfterValidator(validate_currency_query)]
@@ -145,6 +159,10 @@ def get_current_quantity_held(
     """
     Calculate the current quantity held for an asset in a portfolio.
 
+    Reads the portfolio_positions ledger row instead of summing the
+    asset's transactions; with as_of_date, only transactions dated after
+    it are scanned and taken back out.
+
     Args:
         db: Database session
         portfolio_id: Portfolio to check
@@ -155,37 +173,7 @@ def get_current_quantity_held(
     Returns:
         Tuple of (net_quantity, total_bought, total_sold)
     """
-    # Build base query for transactions of this asset in this portfolio
-    query = (
-        select(
-            Transaction.transaction_type,
-            func.sum(Transaction.quantity).label("total_qty")
-        )
-        .where(
-            Transaction.portfolio_id == portfolio_id,
-            Transaction.asset_id == asset_id,
-            Transaction.transaction_type.in_([TransactionType.BUY, TransactionType.SELL])
-        )
-        .group_by(Transaction.transaction_type)
-    )
-
-    # If as_of_date is specified, only include transactions up to that date
-    if as_of_date is not None:
-        query = query.where(Transaction.date <= as_of_date)
-
-    results = db.execute(query).all()
-
-    total_bought = Decimal("0")
-    total_sold = Decimal("0")
-
-    for row in results:
-        if row.transaction_type == TransactionType.BUY:
-            total_bought = Decimal(str(row.total_qty))
-        elif row.transaction_type == TransactionType.SELL:
-            total_sold = Decimal(str(row.total_qty))
-
-    net_quantity = total_bought - total_sold
-    return net_quantity, total_bought, total_sold
+    return quantity_held(db, portfolio_id, asset_id, as_of=as_of_date)
 
 
 def validate_sell_quantity(
@@ -308,8 +296,10 @@ def create_transaction(
         fee_currency=fee_currency,
         exchange_rate=transaction.exchange_rate,
     )
+    db_transaction.fingerprint = transaction_fingerprint(db_transaction)
 
     db.add(db_transaction)
+    record_transactions(db, [db_transaction])
     db.commit()
     db.refresh(db_transaction)
 
@@ -364,6 +354,14 @@ def list_transactions(
         # Pagination
         skip: int = Query(default=0, ge=0, description="Number of records to skip"),
         limit: int = Query(default=100, ge=1, le=1000, description="Maximum records to return"),
+        cursor: str | None = Query(
+            default=None,
+            description="Continue after the page that returned this next_cursor (replaces skip)"
+        ),
+        estimate_total: bool = Query(
+            default=False,
+            description="Return a fast planner estimate as pagination.total instead of an exact count"
+        ),
 ) -> TransactionListResponse:
     """
     Retrieve a list of transactions with optional filtering.
@@ -378,21 +376,38 @@ def list_transactions(
     - **currency**: Trade currency (EUR, USD, etc.)
     - **date_from / date_to**: Date range
 
-    Supports pagination with **skip** and **limit**.
+    Supports pagination with **skip** and **limit**, or with **cursor**:
+    pass `pagination.next_cursor` from the previous page to get the next
+    one. Cursor pages cost the same at any depth; skip gets slower the
+    further it goes. **estimate_total** skips the exact count (PostgreSQL).
 
     Results are ordered by date (newest first).
     """
+    if cursor is not None and skip:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Use either cursor or skip, not both",
+        )
+    after = None
+    if cursor is not None:
+        try:
+            after = decode_keyset_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor",
+            )
+
     # If portfolio_id provided, verify ownership
     if portfolio_id is not None:
         validate_portfolio_ownership(db, portfolio_id, current_user)
 
-    # Get user's portfolio IDs
-    user_portfolio_ids = db.scalars(
-        select(Portfolio.id).where(Portfolio.user_id == current_user.id)
-    ).all()
-
-    # Build base query - only from user's portfolios
-    query = select(Transaction).where(Transaction.portfolio_id.in_(user_portfolio_ids))
+    # Base query - only from user's portfolios (ownership join, no ID list)
+    query = (
+        select(Transaction)
+        .join(Portfolio, Portfolio.id == Transaction.portfolio_id)
+        .where(Portfolio.user_id == current_user.id)
+    )
 
     if ticker is not None:
         # Use explicit join + contains_eager when filtering
@@ -426,19 +441,43 @@ def list_transactions(
     if date_to is not None:
         query = query.where(Transaction.date <= date_to)
 
-    # Order by date (newest first), then by id for consistency
+    # Total over all pages (cursor excluded): exact, or the planner estimate
+    total = estimate_row_count(db, query) if estimate_total else None
+    total_is_estimate = total is not None
+    if total is None:
+        total = db.scalar(select(func.count()).select_from(query.subquery()))
+
+    # Order by date (newest first), then by id for consistency. With a
+    # portfolio filter this walks ix_transaction_portfolio_date backwards.
     query = query.order_by(Transaction.date.desc(), Transaction.id.desc())
 
-    # Get total count before pagination
-    count_query = select(func.count()).select_from(query.subquery())
-    total = db.scalar(count_query)
+    if after is not None:
+        query = query.where(tuple_(Transaction.date, Transaction.id) < tuple_(*after))
+    else:
+        query = query.offset(skip)
 
-    # Apply pagination and use .unique() to handle joinedload properly
-    transactions = db.scalars(query.offset(skip).limit(limit)).unique().all()
+    # One row past the page tells whether a next page exists
+    query = query.limit(limit + 1)
+    if limit > LIST_STREAM_THRESHOLD:
+        # Server-side cursor: rows are fetched and turned into responses
+        # in batches instead of buffering the whole page first
+        query = query.execution_options(yield_per=LIST_STREAM_BATCH_SIZE)
+
+    items = [TransactionResponse.model_validate(transaction) for transaction in db.scalars(query)]
+    has_more = len(items) > limit
+    if has_more:
+        del items[limit:]
 
     return TransactionListResponse(
-        items=list(transactions),
-        pagination=PaginationMeta.create(total=total, skip=skip, limit=limit),
+        items=items,
+        pagination=PaginationMeta.create(
+            total=total,
+            skip=0 if after is not None else skip,
+            limit=limit,
+            next_cursor=encode_keyset_cursor(items[-1].date, items[-1].id) if has_more else None,
+            has_more=has_more,
+            total_is_estimate=total_is_estimate,
+        ),
     )
 
 
@@ -494,11 +533,15 @@ def update_transaction(
     db_transaction = get_transaction_with_owner_check(db, transaction_id, current_user)
 
     update_data = transaction_update.model_dump(exclude_unset=True)
+    before = transaction_delta(db_transaction)
 
     # Apply updates
     for field, value in update_data.items():
         setattr(db_transaction, field, value)
+    db_transaction.fingerprint = transaction_fingerprint(db_transaction)
 
+    # Swap the old amounts for the new ones in the position ledger
+    apply_deltas(db, [-before if before is not None else None, transaction_delta(db_transaction)])
     db.commit()
     db.refresh(db_transaction)
 
@@ -534,6 +577,7 @@ def delete_transaction(
     # Capture portfolio_id before deletion
     portfolio_id = db_transaction.portfolio_id
 
+    remove_transactions(db, [db_transaction])
     db.delete(db_transaction)
     db.commit()
 
@@ -677,6 +721,7 @@ def get_portfolio_transaction_types(
 )
 def create_transactions_batch(
         transactions: list[TransactionCreate],
+        response: Response,
         db: Annotated[Session, Depends(get_db)],
         current_user: Annotated[User, Depends(get_current_user)],
         asset_service: Annotated[AssetResolutionService, Depends(get_asset_resolution_service)],
@@ -698,6 +743,11 @@ def create_transactions_batch(
     **Error Response:** On validation failure, returns a structured response with
     detailed per-transaction error information including the index, ticker,
     error type, and message for each failing transaction.
+
+    **Duplicates:** Transactions already recorded in their portfolio (same
+    asset, type, date, quantity, price and fee) are skipped, so re-sending
+    a batch is safe. Only newly created transactions are returned; the
+    `X-Skipped-Count` header reports how many were skipped.
     """
     if not transactions:
         return []
@@ -795,45 +845,59 @@ def create_transactions_batch(
             content=error_response.model_dump(),
         )
 
-    # 4. Validate SELL Quantities
-    # Group transactions by (portfolio_id, asset_id) and validate in date order
+    # 4. Skip Transactions Already Recorded
     resolved_assets_map = resolution_result.resolved
-    from collections import defaultdict
-
-    # Build map of normalized key to asset for quick lookup
-    portfolio_asset_txns: dict[tuple[int, int], list[tuple[int, TransactionCreate]]] = defaultdict(list)
+    rows = []
     for i, txn_data in enumerate(transactions):
         key = (txn_data.ticker.strip().upper(), txn_data.exchange.strip().upper() if txn_data.exchange else "")
         asset = resolved_assets_map[key]
-        portfolio_asset_txns[(txn_data.portfolio_id, asset.id)].append((i, txn_data))
 
-    # Validate each portfolio-asset group
+        rows.append({
+            "index": i,
+            "portfolio_id": txn_data.portfolio_id,
+            "asset_id": asset.id,
+            "transaction_type": txn_data.transaction_type,
+            "date": txn_data.date,
+            "quantity": txn_data.quantity,
+            "price_per_share": txn_data.price_per_share,
+            "currency": txn_data.currency,
+            "fee": txn_data.fee,
+            # Default fee logic
+            "fee_currency": txn_data.fee_currency or txn_data.currency,
+            "exchange_rate": txn_data.exchange_rate,
+        })
+
+    new_rows, skipped_rows = split_new_transactions(db, rows)
+    response.headers["X-Skipped-Count"] = str(len(skipped_rows))
+    if skipped_rows:
+        logger.info(f"Batch create: skipping {len(skipped_rows)} already recorded transaction(s)")
+
+    # 5. Validate SELL Quantities
+    # One ledger query for every position sold from, then an in-memory replay
+    # of the batch together with the transactions already recorded after it
     sell_errors: list[BatchTransactionError] = []
-    for (portfolio_id, asset_id), txn_list in portfolio_asset_txns.items():
-        # Sort by date for proper validation
-        txn_list.sort(key=lambda x: x[1].date)
-
-        # Get current holding for this asset
-        current_qty, _, _ = get_current_quantity_held(db, portfolio_id, asset_id)
-
-        # Track running balance through the batch
-        running_balance = current_qty
-
-        for idx, txn_data in txn_list:
-            if txn_data.transaction_type == TransactionType.BUY:
-                running_balance += txn_data.quantity
-            elif txn_data.transaction_type == TransactionType.SELL:
-                if txn_data.quantity > running_balance:
-                    sell_errors.append(BatchTransactionError(
-                        index=idx,
-                        ticker=txn_data.ticker,
-                        stage="sell_quantity",
-                        error_type="insufficient_quantity",
-                        message=f"Cannot sell {txn_data.quantity} shares of {txn_data.ticker}. Only {running_balance} shares available as of {txn_data.date.date()}.",
-                        field="quantity",
-                    ))
-                else:
-                    running_balance -= txn_data.quantity
+    for shortfall in find_sell_shortfalls(db, new_rows):
+        row = new_rows[shortfall.position]
+        txn_data = transactions[row["index"]]
+        if shortfall.recorded_sell_date is None:
+            message = (
+                f"Cannot sell {txn_data.quantity} shares of {txn_data.ticker}. "
+                f"Only {shortfall.available} shares available as of {txn_data.date.date()}."
+            )
+        else:
+            message = (
+                f"Selling {txn_data.quantity} shares of {txn_data.ticker} on {txn_data.date.date()} "
+                f"leaves only {shortfall.available} shares for the SELL of "
+                f"{shortfall.recorded_sell_quantity} already recorded on {shortfall.recorded_sell_date.date()}."
+            )
+        sell_errors.append(BatchTransactionError(
+            index=row["index"],
+            ticker=txn_data.ticker,
+            stage="sell_quantity",
+            error_type="insufficient_quantity",
+            message=message,
+            field="quantity",
+        ))
 
     if sell_errors:
         error_response = BatchTransactionErrorResponse(
@@ -846,34 +910,10 @@ def create_transactions_batch(
             content=error_response.model_dump(),
         )
 
-    # 5. Create Transaction Objects (step 4 was SELL validation above)
-    new_transactions = []
-
-    for i, txn_data in enumerate(transactions):
-        key = (txn_data.ticker.strip().upper(), txn_data.exchange.strip().upper() if txn_data.exchange else "")
-        asset = resolved_assets_map[key]
-
-        # Default fee logic
-        fee_currency = txn_data.fee_currency or txn_data.currency
-
-        new_txn = Transaction(
-            portfolio_id=txn_data.portfolio_id,
-            asset_id=asset.id,
-            transaction_type=txn_data.transaction_type,
-            date=txn_data.date,
-            quantity=txn_data.quantity,
-            price_per_share=txn_data.price_per_share,
-            currency=txn_data.currency,
-            fee=txn_data.fee,
-            fee_currency=fee_currency,
-            exchange_rate=txn_data.exchange_rate,
-        )
-        new_transactions.append(new_txn)
-
     # 6. Atomic Commit (All or Nothing)
     from sqlalchemy.exc import IntegrityError, DataError, OperationalError
     try:
-        db.add_all(new_transactions)
+        result_ids = insert_transactions(db, new_rows)
         db.commit()
     except IntegrityError as e:
         db.rollback()
@@ -905,12 +945,11 @@ def create_transactions_batch(
             detail="An unexpected error occurred while saving transactions."
         )
 
-    # 6. Invalidate analytics cache for all affected portfolios
+    # 7. Invalidate analytics cache for all affected portfolios
     for portfolio_id in portfolio_ids:
         analytics_service.invalidate_cache(portfolio_id)
 
-    # 7. Reload with eager-loaded assets for response
-    result_ids = [txn.id for txn in new_transactions]
+    # 8. Reload with eager-loaded assets for response
     query = (
         select(Transaction)
         .options(joinedload(Transaction.asset))
@@ -3,7 +3,8 @@
 File upload endpoints.
 
 Provides endpoints for uploading transaction data from files.
-Supports multiple file formats (CSV now, JSON/Excel in future).
+Supports multiple file formats (CSV, Parquet/Arrow when pyarrow is
+installed, JSON/Excel in future).
 
 Key features:
 - Multi-format support via parser abstraction
@@ -11,6 +12,9 @@ Key features:
 - Batch asset resolution (efficient Yahoo API usage)
 - Atomic transaction creation (all or nothing)
 - Detailed error reporting per row
+- Background mode for large files: POST /upload/transactions/jobs returns
+  202 with a job ID; `python -m app.worker` processes the file and
+  GET /upload/jobs/{job_id} reports progress
 """
 
 import logging
@@ -22,18 +26,20 @@ from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.models import User, Portfolio
+from app.models import User, Portfolio, UploadJob
 from app.schemas.upload import (
     UploadResponse,
     UploadErrorResponse,
+    UploadJobResponse,
     SupportedFormatsResponse,
     DateSampleResponse,
     DateDetectionResponse,
     AmbiguousDateFormatError,
 )
-from app.dependencies import get_current_user, get_portfolio_with_owner_check
+from app.dependencies import get_current_user, get_portfolio_with_owner_check, get_upload_job_queue
 from app.services.upload import (
     UploadService,
+    UploadJobQueue,
     DateFormat,
     get_supported_extensions,
     get_supported_content_types,
@@ -106,6 +112,128 @@ def validate_portfolio_ownership(
     return portfolio
 
 
+def _check_file_size(file: UploadFile) -> None:
+    """
+    Reject files larger than MAX_UPLOAD_FILE_SIZE_BYTES.
+
+    Raises:
+        HTTPException: 413 if the file is too large
+    """
+    # Seek to the end instead of reading the content, which the parser
+    # streams later (seek back to start for processing)
+    file.file.seek(0, 2)
+    file_size = file.file.tell()
+    file.file.seek(0)  # Reset for processing
+
+    if file_size > MAX_UPLOAD_FILE_SIZE_BYTES:
+        max_mb = MAX_UPLOAD_FILE_SIZE_BYTES / (1024 * 1024)
+        actual_mb = file_size / (1024 * 1024)
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File too large: {actual_mb:.1f}MB exceeds maximum of {max_mb:.0f}MB"
+        )
+
+    logger.debug(f"File size: {file_size} bytes")
+
+
+def _resolve_date_format(
+        file: UploadFile,
+        date_format: str,
+) -> DateFormat | JSONResponse:
+    """
+    Resolve the requested date format, auto-detecting it for AUTO.
+
+    Returns:
+        The date format to parse with, or a 422 response with sample
+        interpretations when auto-detection finds the dates ambiguous
+
+    Raises:
+        HTTPException: 400 if detection fails
+    """
+    if date_format != "AUTO":
+        return DateFormat(date_format)
+
+    logger.info("Auto-detecting date format")
+    try:
+        parser = get_parser(file.filename or "unknown", file.content_type)
+        detection = parser.detect_date_format(
+            file.file,
+            file.filename or "unknown",
+        )
+        file.file.seek(0)  # Reset for parsing
+
+        if detection.status == DateDetectionStatus.ERROR:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=detection.reason,
+            )
+
+        if detection.status == DateDetectionStatus.AMBIGUOUS:
+            # Return 422 with detection data for user to choose
+            logger.info("Date format is ambiguous, requesting user input")
+            return JSONResponse(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                content={
+                    "error": "ambiguous_date_format",
+                    "message": "Could not automatically determine date format. Please select the correct format.",
+                    "detection": {
+                        "status": detection.status.value,
+                        "detected_format": None,
+                        "samples": [
+                            {
+                                "raw_value": s.raw_value,
+                                "row_number": s.row_number,
+                                "us_interpretation": s.us_interpretation,
+                                "eu_interpretation": s.eu_interpretation,
+                                "iso_interpretation": s.iso_interpretation,
+                                "is_disambiguator": s.is_disambiguator,
+                            }
+                            for s in detection.samples
+                        ],
+                        "reason": detection.reason,
+                    },
+                },
+            )
+
+        # Unambiguous - use detected format
+        logger.info(f"Auto-detected date format: {detection.detected_format.value}")
+        return detection.detected_format
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Date format detection failed: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Failed to detect date format: {e}",
+        )
+
+
+def _build_job_response(job: UploadJob) -> UploadJobResponse:
+    """Convert an UploadJob row to its API representation."""
+    return UploadJobResponse(
+        job_id=job.id,
+        portfolio_id=job.portfolio_id,
+        filename=job.filename,
+        status=job.status.value,
+        stage=job.stage,
+        total_rows=job.total_rows,
+        rows_validated=job.rows_validated,
+        rows_resolved=job.rows_resolved,
+        rows_skipped=job.rows_skipped,
+        rows_inserted=job.rows_inserted,
+        error_count=job.error_count,
+        errors=[UploadErrorResponse(**e) for e in job.errors or []],
+        warnings=[UploadErrorResponse(**w) for w in job.warnings or []],
+        created_transaction_ids=job.created_transaction_ids or [],
+        error=job.error,
+        created_at=job.created_at.isoformat(),
+        started_at=job.started_at.isoformat() if job.started_at else None,
+        finished_at=job.finished_at.isoformat() if job.finished_at else None,
+        status_url=f"/upload/jobs/{job.id}",
+    )
+
+
 # =============================================================================
 # ENDPOINTS
 # =============================================================================
@@ -188,7 +316,9 @@ def upload_transactions(
     """
     Upload transactions from a file.
 
-    **Supported formats:** CSV (more coming soon)
+    **Supported formats:** CSV; Parquet and Arrow IPC when pyarrow is installed
+    on the server (same column names, typed date and amount columns allowed;
+    use the background endpoint for large files)
 
     **Date Format Parameter:**
 
@@ -240,7 +370,12 @@ def upload_transactions(
     - **Asset Resolution:** Unknown tickers are automatically looked up on 
       Yahoo Finance and added to the database.
     - **Atomic:** If ANY row fails validation, NO transactions are created.
+    - **Re-uploads:** Rows identical to a transaction already in the portfolio
+      (asset, type, date, quantity, price, fee) are skipped and counted in
+      `skipped_count`, so uploading a full broker export again only adds new rows.
     - **Detailed Errors:** Each failure includes row number, field, and message.
+    - **Large Files:** Use `POST /upload/transactions/jobs` to process the file
+      in the background and poll its progress instead of waiting here.
     
     **Example requests:**
     
@@ -303,81 +438,11 @@ def upload_transactions(
         f"(date_format={date_format})"
     )
 
-    # Validate file size
-    # Read the file content to check size (seek back to start for processing)
-    file_content = file.file.read()
-    file_size = len(file_content)
-    file.file.seek(0)  # Reset for processing
+    _check_file_size(file)
 
-    if file_size > MAX_UPLOAD_FILE_SIZE_BYTES:
-        max_mb = MAX_UPLOAD_FILE_SIZE_BYTES / (1024 * 1024)
-        actual_mb = file_size / (1024 * 1024)
-        raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail=f"File too large: {actual_mb:.1f}MB exceeds maximum of {max_mb:.0f}MB"
-        )
-
-    logger.debug(f"File size: {file_size} bytes")
-
-    # Handle AUTO date format detection
-    resolved_date_format: DateFormat
-    if date_format == "AUTO":
-        logger.info("Auto-detecting date format")
-        try:
-            parser = get_parser(file.filename or "unknown", file.content_type)
-            detection = parser.detect_date_format(
-                file.file,
-                file.filename or "unknown",
-            )
-            file.file.seek(0)  # Reset for parsing
-
-            if detection.status == DateDetectionStatus.ERROR:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=detection.reason,
-                )
-
-            if detection.status == DateDetectionStatus.AMBIGUOUS:
-                # Return 422 with detection data for user to choose
-                logger.info("Date format is ambiguous, requesting user input")
-                return JSONResponse(
-                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                    content={
-                        "error": "ambiguous_date_format",
-                        "message": "Could not automatically determine date format. Please select the correct format.",
-                        "detection": {
-                            "status": detection.status.value,
-                            "detected_format": None,
-                            "samples": [
-                                {
-                                    "raw_value": s.raw_value,
-                                    "row_number": s.row_number,
-                                    "us_interpretation": s.us_interpretation,
-                                    "eu_interpretation": s.eu_interpretation,
-                                    "iso_interpretation": s.iso_interpretation,
-                                    "is_disambiguator": s.is_disambiguator,
-                                }
-                                for s in detection.samples
-                            ],
-                            "reason": detection.reason,
-                        },
-                    },
-                )
-
-            # Unambiguous - use detected format
-            resolved_date_format = detection.detected_format
-            logger.info(f"Auto-detected date format: {resolved_date_format.value}")
-
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error(f"Date format detection failed: {e}", exc_info=True)
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Failed to detect date format: {e}",
-            )
-    else:
-        resolved_date_format = DateFormat(date_format)
+    resolved_date_format = _resolve_date_format(file, date_format)
+    if isinstance(resolved_date_format, JSONResponse):
+        return resolved_date_format
 
     # Process the file
     result = upload_service.process_file(
@@ -395,6 +460,7 @@ def upload_transactions(
         filename=result.filename,
         total_rows=result.total_rows,
         created_count=result.created_count,
+        skipped_count=result.skipped_count,
         error_count=result.error_count,
         errors=[
             UploadErrorResponse(
@@ -436,3 +502,115 @@ def upload_transactions(
     # Note: We return 200 even on validation failures because the request
     # itself was valid - the response body indicates success/failure
     return response
+
+
+@router.post(
+    "/transactions/jobs",
+    response_model=UploadJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Upload transactions from file in the background",
+    response_description="Queued upload job",
+    responses={
+        413: {
+            "description": "File too large",
+        },
+        422: {
+            "description": "Ambiguous date format - user must specify",
+            "model": AmbiguousDateFormatError,
+        },
+    },
+)
+@limiter.limit(RATE_LIMIT_UPLOAD)
+def upload_transactions_job(
+        request: Request,  # Required for rate limiting
+        file: UploadFile = File(
+            ...,
+            description="Transaction file to upload (CSV, JSON, or Excel)"
+        ),
+        portfolio_id: int = Query(
+            ...,
+            gt=0,
+            description="ID of the target portfolio"
+        ),
+        date_format: Literal["ISO", "US", "EU", "AUTO"] = Query(
+            default="AUTO",
+            description="Date format used in the file (see POST /upload/transactions)"
+        ),
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_current_user),
+        queue: UploadJobQueue = Depends(get_upload_job_queue),
+) -> UploadJobResponse | JSONResponse:
+    """
+    Queue a transaction file for background processing.
+
+    Accepts the same files and parameters as `POST /upload/transactions`
+    and processes them the same way (including the all-or-nothing
+    commit), but returns **202** as soon as the file is stored. Use it
+    for large files that would otherwise run into request timeouts.
+
+    Poll `status_url` until the job is SUCCEEDED or FAILED. While it runs,
+    the job reports rows parsed, validated, resolved and inserted, plus
+    the errors found so far.
+
+    Date format auto-detection still happens here, so an ambiguous file
+    gets the same **422** response before anything is queued.
+
+    Raises **403** if you don't own the portfolio.
+    """
+    validate_portfolio_ownership(db, portfolio_id, current_user)
+
+    logger.info(
+        f"Background upload request: {file.filename} -> portfolio {portfolio_id} "
+        f"(date_format={date_format})"
+    )
+
+    _check_file_size(file)
+
+    resolved_date_format = _resolve_date_format(file, date_format)
+    if isinstance(resolved_date_format, JSONResponse):
+        return resolved_date_format
+
+    job = queue.enqueue(
+        db,
+        portfolio_id,
+        file=file.file,
+        filename=file.filename or "unknown",
+        content_type=file.content_type,
+        date_format=resolved_date_format,
+    )
+    return _build_job_response(job)
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=UploadJobResponse,
+    summary="Get upload job",
+    response_description="Current state of a background upload job",
+)
+@limiter.limit(RATE_LIMIT_DEFAULT)
+def get_upload_job(
+        request: Request,  # Required for rate limiting
+        job_id: int,
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_current_user),
+        queue: UploadJobQueue = Depends(get_upload_job_queue),
+) -> UploadJobResponse:
+    """
+    Get the progress and result of a background upload job.
+
+    Raises **403** if you don't own the job's portfolio.
+    Raises **404** if the job doesn't exist.
+    """
+    job = queue.get_job(db, job_id)
+
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Upload job {job_id} not found"
+        )
+
+    validate_portfolio_ownership(db, job.portfolio_id, current_user)
+
+    # No cache invalidation here: the worker bumps Portfolio.data_version
+    # when the job succeeds, which the analytics cache checks
+    return _build_job_response(job)
@@ -33,7 +33,7 @@ from app.schemas.user_profile import (
     AccountDeleteRequest,
 )
 from app.services.user_settings_service import UserSettingsService
-from app.dependencies import get_current_user
+from app.dependencies import get_current_user, get_password_hashing_pool
 
 logger = logging.getLogger(__name__)
 
@@ -54,7 +54,7 @@ router = APIRouter(
 
 def get_user_settings_service() -> UserSettingsService:
     """Dependency that provides the user settings service."""
-    return UserSettingsService()
+    return UserSettingsService(password_pool=get_password_hashing_pool())
 
 
 # =============================================================================
@@ -301,7 +301,7 @@ def update_user_profile(
         },
     },
 )
-def change_password(
+async def change_password(
         password_request: PasswordChangeRequest,
         current_user: Annotated[User, Depends(get_current_user)],
         db: Annotated[Session, Depends(get_db)],
@@ -317,7 +317,7 @@ def change_password(
     """
     logger.info(f"Password change requested for user {current_user.id}")
 
-    service.change_password(
+    await service.change_password_async(
         db=db,
         user_id=current_user.id,
         current_password=password_request.current_password,
@@ -20,7 +20,7 @@ from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models import Portfolio, User
 from app.services.constants import MAX_HISTORY_DAYS
-from app.dependencies import get_portfolio_with_owner_check
+from app.dependencies import get_portfolio_with_owner_check, get_portfolio_data_context
 from app.schemas.valuation import (
     CostBasisDetail,
     CurrentValueDetail,
@@ -32,6 +32,7 @@ from app.schemas.valuation import (
     ValuationHistoryPoint,
     PortfolioHistoryResponse,
 )
+from app.services.portfolio_context import PortfolioDataContext
 from app.services.valuation import ValuationService
 from app.dependencies import get_valuation_service
 
@@ -159,6 +160,7 @@ def get_portfolio_valuation(
         ),
         db: Session = Depends(get_db),
         service: ValuationService = Depends(get_valuation_service),
+        context: PortfolioDataContext = Depends(get_portfolio_data_context),
 ) -> PortfolioValuationResponse:
     """
     Get complete portfolio valuation for a specific date.
@@ -187,6 +189,7 @@ def get_portfolio_valuation(
         db=db,
         portfolio_id=portfolio_id,
         valuation_date=valuation_date,
+        context=context,
     )
 
     # Calculate day change by comparing to yesterday
@@ -195,12 +198,14 @@ def get_portfolio_valuation(
 
     if valuation.total_equity is not None:
         # Use actual valuation date (which defaults to today if not specified)
+        # Shares the context: transactions, assets and most prices are already loaded
         actual_date = valuation.valuation_date
         yesterday = actual_date - timedelta(days=1)
         prev_valuation = service.get_valuation(
             db=db,
             portfolio_id=portfolio_id,
             valuation_date=yesterday,
+            context=context,
         )
 
         if prev_valuation.total_equity is not None:
@@ -266,6 +271,7 @@ def get_portfolio_valuation_history(
         ),
         db: Session = Depends(get_db),
         service: ValuationService = Depends(get_valuation_service),
+        context: PortfolioDataContext = Depends(get_portfolio_data_context),
 ) -> PortfolioHistoryResponse:
     """
     Get portfolio valuation history for charting.
@@ -311,6 +317,7 @@ def get_portfolio_valuation_history(
         start_date=from_date,
         end_date=to_date,
         interval=interval,
+        context=context,
     )
 
     # Map to response schema
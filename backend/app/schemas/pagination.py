@@ -36,10 +36,23 @@ Pagination Metadata:
     - pages: Total number of pages
     - has_next: Whether more pages exist
     - has_previous: Whether previous pages exist
+    - next_cursor: Keyset cursor for the next page (endpoints that support it)
+    - total_is_estimate: Whether total is a planner estimate
+
+Keyset (cursor) pagination:
+    Endpoints ordered by (date, id) can return next_cursor; passing it back
+    as ?cursor= continues after the last item without OFFSET, so deep pages
+    cost the same as the first one. Cursors are opaque to clients.
+
+        cursor = encode_keyset_cursor(last.date, last.id)
+        after_date, after_id = decode_keyset_cursor(cursor)
 """
 
+import base64
+import json
+from datetime import datetime
 from typing import Generic, TypeVar
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, Field, PrivateAttr, computed_field
 
 T = TypeVar("T")
 
@@ -63,6 +76,18 @@ class PaginationMeta(BaseModel):
     total: int = Field(..., ge=0, description="Total number of items matching query")
     skip: int = Field(..., ge=0, description="Number of items skipped (offset)")
     limit: int = Field(..., ge=1, description="Maximum items per page")
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor for the next page (pass as ?cursor=), null on the last page",
+    )
+    total_is_estimate: bool = Field(
+        default=False,
+        description="Whether total is a query planner estimate rather than an exact count",
+    )
+
+    # Set when the endpoint fetched one item past the page and knows exactly
+    # whether more follow; has_next then does not depend on total or skip
+    _has_more: bool | None = PrivateAttr(default=None)
 
     @computed_field
     @property
@@ -84,6 +109,8 @@ class PaginationMeta(BaseModel):
     @property
     def has_next(self) -> bool:
         """Whether there are more pages after current."""
+        if self._has_more is not None:
+            return self._has_more
         return self.skip + self.limit < self.total
 
     @computed_field
@@ -93,7 +120,15 @@ class PaginationMeta(BaseModel):
         return self.skip > 0
 
     @classmethod
-    def create(cls, total: int, skip: int, limit: int) -> "PaginationMeta":
+    def create(
+            cls,
+            total: int,
+            skip: int,
+            limit: int,
+            next_cursor: str | None = None,
+            has_more: bool | None = None,
+            total_is_estimate: bool = False,
+    ) -> "PaginationMeta":
         """
         Factory method to create pagination metadata.
 
@@ -101,11 +136,23 @@ class PaginationMeta(BaseModel):
             total: Total items matching query
             skip: Items to skip (offset)
             limit: Max items per page
+            next_cursor: Keyset cursor for the next page
+            has_more: Whether items follow this page, when known exactly
+                      (required for cursor pages, where skip is 0)
+            total_is_estimate: Whether total is an estimate
 
         Returns:
             PaginationMeta instance
         """
-        return cls(total=total, skip=skip, limit=limit)
+        meta = cls(
+            total=total,
+            skip=skip,
+            limit=limit,
+            next_cursor=next_cursor,
+            total_is_estimate=total_is_estimate,
+        )
+        meta._has_more = has_more
+        return meta
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
@@ -144,6 +191,41 @@ def create_pagination_meta(total: int, skip: int, limit: int) -> PaginationMeta:
     return PaginationMeta.create(total=total, skip=skip, limit=limit)
 
 
+def encode_keyset_cursor(after_date: datetime, after_id: int) -> str:
+    """
+    Opaque cursor for the page after the item (after_date, after_id).
+
+    Args:
+        after_date: Sort date of the last item on the current page
+        after_id: ID of the last item on the current page
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps([after_date.isoformat(), after_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_keyset_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Decode a cursor from encode_keyset_cursor().
+
+    Returns:
+        (after_date, after_id)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        after_date, after_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(after_id, int):
+            raise TypeError(after_id)
+        return datetime.fromisoformat(after_date), after_id
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
 # =============================================================================
 # BACKWARD COMPATIBLE DICT HELPER
 # =============================================================================
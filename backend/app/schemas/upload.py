@@ -68,6 +68,10 @@ class UploadResponse(BaseModel):
         ...,
         description="Number of transactions created"
     )
+    skipped_count: int = Field(
+        default=0,
+        description="Rows skipped because the portfolio already has an identical transaction"
+    )
     error_count: int = Field(
         ...,
         description="Number of rows with errors"
@@ -88,6 +92,47 @@ class UploadResponse(BaseModel):
     )
 
 
+class UploadJobResponse(BaseModel):
+    """
+    State of a background upload job.
+
+    Counters grow while the job runs; errors and warnings found so far
+    are listed as soon as they are detected (capped, see error_count).
+    """
+
+    job_id: int = Field(..., description="Upload job ID")
+    portfolio_id: int = Field(..., description="Target portfolio")
+    filename: str = Field(..., description="Original filename")
+    status: str = Field(..., description="QUEUED, RUNNING, SUCCEEDED, or FAILED")
+    stage: str | None = Field(
+        default=None,
+        description="Last completed step: parsing, asset_resolution, persistence"
+    )
+    total_rows: int = Field(default=0, description="Data rows parsed so far")
+    rows_validated: int = Field(default=0, description="Rows that passed validation so far")
+    rows_resolved: int = Field(default=0, description="Rows mapped to an asset")
+    rows_skipped: int = Field(default=0, description="Rows skipped as already recorded in the portfolio")
+    rows_inserted: int = Field(default=0, description="Transactions created (all at once, on success)")
+    error_count: int = Field(default=0, description="Number of errors found so far")
+    errors: list[UploadErrorResponse] = Field(
+        default_factory=list,
+        description="Errors found so far (the first ones if there are many)"
+    )
+    warnings: list[UploadErrorResponse] = Field(
+        default_factory=list,
+        description="Non-blocking warnings (e.g. asset exchange mismatches)"
+    )
+    created_transaction_ids: list[int] = Field(
+        default_factory=list,
+        description="IDs of created transactions once the job SUCCEEDED"
+    )
+    error: str | None = Field(default=None, description="Why the job stopped, if it crashed")
+    created_at: str
+    started_at: str | None = None
+    finished_at: str | None = None
+    status_url: str = Field(..., description="URL to poll for job progress")
+
+
 class SupportedFormatsResponse(BaseModel):
     """
     Response schema listing supported file formats.
@@ -43,19 +43,23 @@ Usage:
     result = service.get_analytics(db, portfolio_id=1, start_date, end_date)
 """
 
+from __future__ import annotations
+
 import logging
 import threading
 from datetime import date, datetime, timedelta
 import decimal
 from decimal import Decimal
-from typing import Any
+from typing import Any, TYPE_CHECKING
 
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.models import Transaction, TransactionType, Portfolio, Asset, MarketData
+from app.models import TransactionType, Portfolio, Asset, MarketData, SyncStatus
 from app.services.analytics.benchmark import BenchmarkCalculator
 from app.services.protocols import ValuationServiceProtocol
+from app.services.portfolio_context import PortfolioDataContext, resolve_context
+from app.services.transaction_records import TransactionRecord
 from app.services.valuation.types import PortfolioHistory
 from app.services.analytics.returns import ReturnsCalculator, calculate_series_returns
 from app.services.analytics.risk import RiskCalculator
@@ -69,6 +73,10 @@ from app.services.analytics.types import (
     AnalyticsResult,
 )
 
+if TYPE_CHECKING:
+    from app.services.market_data.price_cache import PriceSeriesCache
+    from app.services.market_data.price_store import ColumnarPriceStore
+
 logger = logging.getLogger(__name__)
 
 # =============================================================================
@@ -114,6 +122,12 @@ class AnalyticsCache:
 
     Cache key format: "analytics:{portfolio_id}:{start}:{end}:{benchmark}"
 
+    Entries can carry a data version (the portfolio's data_version and last
+    completed sync). A lookup with a different version is a miss, which
+    keeps results fresh when market data is synced or transactions are
+    imported by a separate worker process that cannot call invalidate() on
+    this cache.
+
     Thread Safety:
         Uses threading.Lock for safe concurrent access in single-worker mode.
         For production with multiple workers, consider using Redis instead.
@@ -132,7 +146,7 @@ class AnalyticsCache:
             max_size: Maximum number of entries (default 1000)
         """
         from collections import OrderedDict
-        self._cache: OrderedDict[str, tuple[datetime, Any]] = OrderedDict()
+        self._cache: OrderedDict[str, tuple[datetime, Any, str | None]] = OrderedDict()
         self._ttl = timedelta(seconds=ttl_seconds)
         self._max_size = max_size
         self._lock = threading.Lock()
@@ -153,21 +167,26 @@ class AnalyticsCache:
             start_date: date,
             end_date: date,
             benchmark: str | None,
+            version: str | None = None,
     ) -> AnalyticsResult | None:
         """
-        Get cached result if exists and not expired.
+        Get cached result if exists, not expired and computed from the same data version.
 
         Implements LRU by moving accessed entries to the end.
 
         Returns:
-            Cached AnalyticsResult or None if not found/expired
+            Cached AnalyticsResult or None if not found/expired/outdated
         """
         key = self._make_key(portfolio_id, start_date, end_date, benchmark)
 
         with self._lock:
             if key in self._cache:
-                timestamp, result = self._cache[key]
-                if datetime.now() - timestamp < self._ttl:
+                timestamp, result, cached_version = self._cache[key]
+                if cached_version != version:
+                    # Data changed since this result was computed
+                    del self._cache[key]
+                    logger.debug(f"Cache outdated for {key}")
+                elif datetime.now() - timestamp < self._ttl:
                     # Move to end (most recently used)
                     self._cache.move_to_end(key)
                     logger.debug(f"Cache hit for {key}")
@@ -186,6 +205,7 @@ class AnalyticsCache:
             end_date: date,
             benchmark: str | None,
             result: AnalyticsResult,
+            version: str | None = None,
     ) -> None:
         """
         Store result in cache with LRU eviction.
@@ -204,7 +224,7 @@ class AnalyticsCache:
                 del self._cache[oldest_key]
                 logger.debug(f"Cache evicted {oldest_key} (LRU)")
             # Add new entry at end (most recently used)
-            self._cache[key] = (datetime.now(), result)
+            self._cache[key] = (datetime.now(), result, version)
         logger.debug(f"Cached result for {key}")
 
     def invalidate(self, portfolio_id: int) -> int:
@@ -275,6 +295,8 @@ class AnalyticsService:
             self,
             valuation_service: ValuationServiceProtocol | None = None,
             cache: AnalyticsCache | None = None,
+            price_store: ColumnarPriceStore | None = None,
+            price_cache: PriceSeriesCache | None = None,
     ):
         """
         Initialize the Analytics Service.
@@ -283,6 +305,10 @@ class AnalyticsService:
             valuation_service: ValuationService instance for portfolio history.
                               If None, creates a new instance.
             cache: AnalyticsCache instance. If None, uses shared cache.
+            price_store: Local price store for benchmark and portfolio price
+                         reads (None = database only)
+            price_cache: Shared price series cache for contexts this service
+                         creates (None = no caching across requests)
         """
         # Lazy import to avoid circular dependencies
         if valuation_service is None:
@@ -290,6 +316,8 @@ class AnalyticsService:
             valuation_service = ValuationService()
 
         self._valuation_service: ValuationServiceProtocol = valuation_service
+        self._price_store = price_store
+        self._price_cache = price_cache
 
         # Use shared cache or create one
         if cache is not None:
@@ -311,6 +339,7 @@ class AnalyticsService:
             portfolio_id: int,
             start_date: date,
             end_date: date,
+            context: PortfolioDataContext | None = None,
     ) -> PerformanceMetrics:
         """
         Calculate performance metrics for a portfolio.
@@ -322,6 +351,7 @@ class AnalyticsService:
             portfolio_id: Portfolio to analyze
             start_date: Start of analysis period
             end_date: End of analysis period
+            context: Request-scoped data shared with other calls
 
         Returns:
             PerformanceMetrics with all return calculations
@@ -330,9 +360,10 @@ class AnalyticsService:
             f"Calculating performance for portfolio {portfolio_id} "
             f"from {start_date} to {end_date}"
         )
+        context = resolve_context(db, portfolio_id, context, self._price_store, self._price_cache)
 
         # Get daily values from valuation service
-        daily_values = self._get_daily_values(db, portfolio_id, start_date, end_date)
+        daily_values = self._get_daily_values(context, start_date, end_date)
 
         if not daily_values:
             return PerformanceMetrics(
@@ -341,7 +372,7 @@ class AnalyticsService:
             )
 
         # Get cash flows for XIRR calculation
-        cash_flows = self._get_cash_flows(db, portfolio_id, start_date, end_date)
+        cash_flows = self._get_cash_flows(context, start_date, end_date)
 
         if daily_values:
             # Add start value as positive cash flow (capital already invested at period start)
@@ -360,7 +391,7 @@ class AnalyticsService:
 
         # Get cost_basis and realized_pnl from valuation for accurate simple_return calculation
         # This is crucial for portfolios without cash tracking (no DEPOSIT/WITHDRAWAL)
-        cost_basis, realized_pnl, net_invested = self._get_valuation_data(db, portfolio_id, end_date)
+        cost_basis, realized_pnl, net_invested = self._get_valuation_data(context, end_date)
 
         # Calculate all return metrics
         result = ReturnsCalculator.calculate_all(
@@ -375,8 +406,7 @@ class AnalyticsService:
 
     def _get_valuation_data(
             self,
-            db: Session,
-            portfolio_id: int,
+            context: PortfolioDataContext,
             valuation_date: date,
     ) -> tuple[Decimal | None, Decimal | None, Decimal | None]:
         """
@@ -387,9 +417,10 @@ class AnalyticsService:
         """
         try:
             valuation = self._valuation_service.get_valuation(
-                db=db,
-                portfolio_id=portfolio_id,
+                db=context.db,
+                portfolio_id=context.portfolio_id,
                 valuation_date=valuation_date,
+                context=context,
             )
             return (
                 valuation.total_cost_basis,
@@ -407,7 +438,8 @@ class AnalyticsService:
             start_date: date,
             end_date: date,
             risk_free_rate: Decimal = DEFAULT_RISK_FREE_RATE,
-            scope: str = "current_period"
+            scope: str = "current_period",
+            context: PortfolioDataContext | None = None,
     ) -> RiskMetrics:
         """
         Calculate risk metrics for a portfolio.
@@ -420,6 +452,7 @@ class AnalyticsService:
             start_date: Start of analysis period
             end_date: End of analysis period
             risk_free_rate: Annual risk-free rate (default 2%)
+            context: Request-scoped data shared with other calls
 
         Returns:
             RiskMetrics with all risk calculations
@@ -428,9 +461,10 @@ class AnalyticsService:
             f"Calculating risk for portfolio {portfolio_id} "
             f"from {start_date} to {end_date}"
         )
+        context = resolve_context(db, portfolio_id, context, self._price_store, self._price_cache)
 
         # Get daily values
-        daily_values = self._get_daily_values(db, portfolio_id, start_date, end_date)
+        daily_values = self._get_daily_values(context, start_date, end_date)
 
         if not daily_values:
             return RiskMetrics(
@@ -439,7 +473,7 @@ class AnalyticsService:
             )
 
         # Get cost_basis and realized_pnl for accurate CAGR calculation (needed for Calmar ratio)
-        cost_basis, realized_pnl, net_invested = self._get_valuation_data(db, portfolio_id, end_date)
+        cost_basis, realized_pnl, net_invested = self._get_valuation_data(context, end_date)
 
         # Get performance metrics for CAGR (needed for Calmar ratio)
         # Pass cost_basis and realized_pnl for accurate simple_return/CAGR calculation
@@ -469,6 +503,7 @@ class AnalyticsService:
             end_date: date,
             benchmark_symbol: str | None = None,
             risk_free_rate: Decimal = DEFAULT_RISK_FREE_RATE,
+            context: PortfolioDataContext | None = None,
     ) -> BenchmarkMetrics:
         """
         Calculate benchmark comparison metrics.
@@ -483,6 +518,7 @@ class AnalyticsService:
             benchmark_symbol: Benchmark ticker (e.g., "^SPX", "IWDA.AS").
                             If None, uses default based on portfolio currency.
             risk_free_rate: Annual risk-free rate
+            context: Request-scoped data shared with other calls
 
         Returns:
             BenchmarkMetrics with comparison analysis
@@ -490,8 +526,10 @@ class AnalyticsService:
         Raises:
             BenchmarkNotSyncedError: If benchmark not found or has no data
         """
+        context = resolve_context(db, portfolio_id, context, self._price_store, self._price_cache)
+
         # Get portfolio to determine currency for default benchmark
-        portfolio = db.get(Portfolio, portfolio_id)
+        portfolio = context.portfolio
 
         # Determine benchmark symbol
         if benchmark_symbol is None:
@@ -506,7 +544,7 @@ class AnalyticsService:
         )
 
         # Get portfolio daily values
-        portfolio_values = self._get_daily_values(db, portfolio_id, start_date, end_date)
+        portfolio_values = self._get_daily_values(context, start_date, end_date)
 
         if not portfolio_values:
             return self._build_insufficient_benchmark_result(
@@ -571,6 +609,7 @@ class AnalyticsService:
             benchmark_symbol: str | None = None,
             risk_free_rate: Decimal = DEFAULT_RISK_FREE_RATE,
             scope: str = "current_period",
+            context: PortfolioDataContext | None = None,
     ) -> AnalyticsResult:
         """
         Calculate all analytics metrics for a portfolio.
@@ -590,6 +629,7 @@ class AnalyticsService:
             benchmark_symbol: Optional benchmark ticker (e.g., "^SPX")
             risk_free_rate: Annual risk-free rate for Sharpe ratio
             scope: Analysis scope - "current_period" or "full_history"
+            context: Request-scoped data shared with other calls
 
         Returns:
             AnalyticsResult with all metrics
@@ -603,13 +643,17 @@ class AnalyticsService:
         )
 
         # Check cache
-        cached = self._cache.get(portfolio_id, start_date, end_date, benchmark_symbol)
+        data_version = self._get_data_version(db, portfolio_id)
+        cached = self._cache.get(
+            portfolio_id, start_date, end_date, benchmark_symbol, version=data_version
+        )
         if cached is not None:
             logger.debug(f"Cache hit for portfolio {portfolio_id}")
             return cached
 
         # Validate portfolio
-        portfolio = db.get(Portfolio, portfolio_id)
+        context = resolve_context(db, portfolio_id, context, self._price_store, self._price_cache)
+        portfolio = context.portfolio
         if portfolio is None:
             return self._build_not_found_result(portfolio_id, start_date, end_date)
 
@@ -617,16 +661,17 @@ class AnalyticsService:
         history = self._valuation_service.get_history(
             db=db, portfolio_id=portfolio_id,
             start_date=start_date, end_date=end_date, interval="daily",
+            context=context,
         )
         # Pass history to avoid duplicate get_history call
         daily_values = self._get_daily_values(
-            db, portfolio_id, start_date, end_date, history=history
+            context, start_date, end_date, history=history
         )
-        cost_basis, realized_pnl, net_invested = self._get_valuation_data(db, portfolio_id, end_date)
+        cost_basis, realized_pnl, net_invested = self._get_valuation_data(context, end_date)
 
         # Calculate metrics
         performance = self._calculate_performance_metrics(
-            db, portfolio_id, start_date, end_date,
+            context, start_date, end_date,
             daily_values, cost_basis, realized_pnl, net_invested, scope,
         )
         risk = RiskCalculator.calculate_all(
@@ -639,7 +684,7 @@ class AnalyticsService:
         if benchmark_symbol:
             benchmark = self.get_benchmark(
                 db, portfolio_id, start_date, end_date,
-                benchmark_symbol, risk_free_rate
+                benchmark_symbol, risk_free_rate, context=context,
             )
 
         # Build result
@@ -649,7 +694,9 @@ class AnalyticsService:
         )
 
         # Cache and return
-        self._cache.set(portfolio_id, start_date, end_date, benchmark_symbol, result)
+        self._cache.set(
+            portfolio_id, start_date, end_date, benchmark_symbol, result, version=data_version
+        )
         return result
 
     def invalidate_cache(self, portfolio_id: int) -> int:
@@ -677,6 +724,26 @@ class AnalyticsService:
     # PRIVATE HELPERS
     # =========================================================================
 
+    @staticmethod
+    def _get_data_version(db: Session, portfolio_id: int) -> str | None:
+        """
+        Version of the portfolio's data for cache validation.
+
+        Combines Portfolio.data_version, which upload workers increment
+        after importing transactions, with the last completed sync
+        timestamp, which sync workers update when new prices or FX rates
+        are stored.
+        """
+        row = db.execute(
+            select(Portfolio.data_version, SyncStatus.last_sync_completed)
+            .outerjoin(SyncStatus, SyncStatus.portfolio_id == Portfolio.id)
+            .where(Portfolio.id == portfolio_id)
+        ).first()
+        if row is None:
+            return None
+        last_sync = row.last_sync_completed.isoformat() if row.last_sync_completed else ""
+        return f"{row.data_version}:{last_sync}"
+
     def _get_default_benchmark(self, portfolio_currency: str) -> str:
         """
         Get default benchmark symbol based on portfolio currency.
@@ -694,8 +761,7 @@ class AnalyticsService:
 
     def _get_daily_values(
             self,
-            db: Session,
-            portfolio_id: int,
+            context: PortfolioDataContext,
             start_date: date,
             end_date: date,
             history: PortfolioHistory | None = None,
@@ -713,8 +779,7 @@ class AnalyticsService:
         cash flows are counted for TWR/deposit/withdrawal calculations.
 
         Args:
-            db: Database session
-            portfolio_id: Portfolio ID
+            context: Data context for the portfolio
             start_date: Start date for analysis
             end_date: End date for analysis
             history: Optional pre-fetched history to avoid duplicate DB calls.
@@ -726,11 +791,12 @@ class AnalyticsService:
             if history is None:
                 # CRITICAL: Always use daily interval for risk metrics
                 history = self._valuation_service.get_history(
-                    db=db,
-                    portfolio_id=portfolio_id,
+                    db=context.db,
+                    portfolio_id=context.portfolio_id,
                     start_date=start_date,
                     end_date=end_date,
                     interval=_INTERNAL_INTERVAL,  # Always "daily"
+                    context=context,
                 )
 
             # Step 1: Build list of DailyValue for dates with valid equity
@@ -747,7 +813,7 @@ class AnalyticsService:
                 return []
 
             # Step 2: Get ALL cash flows from transactions
-            cash_flow_map = self._get_cash_flow_map(db, portfolio_id, start_date, end_date)
+            cash_flow_map = self._get_cash_flow_map(context, start_date, end_date)
 
             if not cash_flow_map:
                 return daily_values
@@ -798,7 +864,7 @@ class AnalyticsService:
 
     def _calculate_cash_flow_amount(
             self,
-            txn: Transaction,
+            txn: TransactionRecord,
             has_cash_tracking: bool,
     ) -> Decimal | None:
         """
@@ -837,8 +903,7 @@ class AnalyticsService:
 
     def _get_cash_flows(
             self,
-            db: Session,
-            portfolio_id: int,
+            context: PortfolioDataContext,
             start_date: date,
             end_date: date,
     ) -> list[CashFlow]:
@@ -859,49 +924,39 @@ class AnalyticsService:
         Returns:
             List of CashFlow objects with date and amount
         """
-        # Check if portfolio has DEPOSIT/WITHDRAWAL transactions
-        deposit_withdrawal_stmt = select(Transaction).where(
-            Transaction.portfolio_id == portfolio_id,
-            Transaction.transaction_type.in_([
-                TransactionType.DEPOSIT,
-                TransactionType.WITHDRAWAL,
-            ])
-        ).limit(1)
-
-        has_cash_tracking = db.execute(deposit_withdrawal_stmt).scalar() is not None
+        # Check if portfolio has DEPOSIT/WITHDRAWAL transactions (over its whole history)
+        has_cash_tracking = any(
+            txn.transaction_type in (TransactionType.DEPOSIT, TransactionType.WITHDRAWAL)
+            for txn in context.get_transactions()
+        )
 
         # Select transaction types based on cash tracking mode
         if has_cash_tracking:
-            txn_types = [TransactionType.DEPOSIT, TransactionType.WITHDRAWAL]
+            txn_types = {TransactionType.DEPOSIT, TransactionType.WITHDRAWAL}
         else:
-            txn_types = [TransactionType.BUY, TransactionType.SELL]
+            txn_types = {TransactionType.BUY, TransactionType.SELL}
 
-        stmt = select(Transaction).where(
-            Transaction.portfolio_id == portfolio_id,
-            Transaction.date >= start_date,
-            Transaction.date <= end_date,
-            Transaction.transaction_type.in_(txn_types)
-        ).order_by(Transaction.date)
-
-        transactions = db.execute(stmt).scalars().all()
+        transactions = [
+            txn for txn in context.get_transactions(start_date, end_date)
+            if txn.transaction_type in txn_types
+        ]
 
         cash_flows = []
         for txn in transactions:
             amount = self._calculate_cash_flow_amount(txn, has_cash_tracking)
             if amount is not None:
-                cash_flows.append(CashFlow(date=txn.date.date(), amount=amount))
+                cash_flows.append(CashFlow(date=txn.date, amount=amount))
 
         return cash_flows
 
     def _get_cash_flow_map(
             self,
-            db: Session,
-            portfolio_id: int,
+            context: PortfolioDataContext,
             start_date: date,
             end_date: date,
     ) -> dict[date, Decimal]:
         """Get cash flows grouped by date."""
-        cash_flows = self._get_cash_flows(db, portfolio_id, start_date, end_date)
+        cash_flows = self._get_cash_flows(context, start_date, end_date)
 
         result = {}
         for cf in cash_flows:
@@ -952,17 +1007,26 @@ class AnalyticsService:
                 )
             )
 
-        # Get market data (exclude no_data_available placeholders)
-        stmt = select(MarketData).where(
-            MarketData.asset_id == asset.id,
-            MarketData.date >= start_date,
-            MarketData.date <= end_date,
-            MarketData.no_data_available == False,
-        ).order_by(MarketData.date)
-
-        market_data = db.execute(stmt).scalars().all()
-
-        if not market_data:
+        # Read from the local price store when it holds the benchmark
+        stored = (
+            self._price_store.read_window(asset.id, start_date, end_date, asset.price_version)
+            if self._price_store is not None else None
+        )
+        if stored is not None:
+            prices = {price_date: close_price for price_date, (close_price, _, _) in stored}
+        else:
+            # Get market data (exclude no_data_available placeholders)
+            stmt = select(MarketData).where(
+                MarketData.asset_id == asset.id,
+                MarketData.date >= start_date,
+                MarketData.date <= end_date,
+                MarketData.no_data_available == False,
+            ).order_by(MarketData.date)
+
+            market_data = db.execute(stmt).scalars().all()
+            prices = {md.date: md.close_price for md in market_data if md.close_price}
+
+        if not prices:
             raise BenchmarkNotSyncedError(
                 symbol=symbol,
                 message=(
@@ -972,7 +1036,7 @@ class AnalyticsService:
                 )
             )
 
-        return {md.date: md.close_price for md in market_data if md.close_price}
+        return prices
 
     def _annualize_return(self, total_return: Decimal, days: int) -> Decimal:
         """
@@ -1049,8 +1113,7 @@ class AnalyticsService:
 
     def _calculate_performance_metrics(
             self,
-            db: Session,
-            portfolio_id: int,
+            context: PortfolioDataContext,
             start_date: date,
             end_date: date,
             daily_values: list[DailyValue],
@@ -1061,7 +1124,7 @@ class AnalyticsService:
     ) -> PerformanceMetrics:
         """Calculate performance metrics with cash flow adjustments."""
         # Get cash flows during the period
-        cash_flows = self._get_cash_flows(db, portfolio_id, start_date, end_date)
+        cash_flows = self._get_cash_flows(context, start_date, end_date)
 
         if daily_values:
             # Add start value as positive cash flow (capital already invested at period start)
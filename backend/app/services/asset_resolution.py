@@ -10,6 +10,9 @@ It implements the core business logic for automatic asset creation:
 3. If found and deactivated → raise error
 4. If not found → fetch from market data provider, create, and return
 
+Provider answers, including "not found", are cached in memory and in the
+asset_info_cache table, so restarts and other worker processes reuse them.
+
 Design Principles:
 - Single Responsibility: Only handles asset resolution
 - Dependency Injection: Provider is injected via constructor
@@ -26,21 +29,22 @@ Usage:
 import logging
 import threading
 from collections import OrderedDict
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import select, and_, or_
+from sqlalchemy import delete, insert, select, and_, tuple_
 from sqlalchemy.dialects.postgresql import insert as pg_insert
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Session
 
-from app.models import Asset
+from app.models import Asset, AssetClass, AssetInfoCache
 
 
 def _is_postgresql(db: Session) -> bool:
     """Check if the database is PostgreSQL."""
     dialect_name = db.get_bind().dialect.name
     return dialect_name == "postgresql"
-from app.services.constants import ASSET_CACHE_TTL_SECONDS
+from app.services.constants import ASSET_CACHE_TTL_SECONDS, ASSET_NOT_FOUND_CACHE_TTL_SECONDS
 from app.services.exceptions import (
     AssetNotFoundError,
     AssetDeactivatedError,
@@ -144,6 +148,16 @@ class BoundedLRUCache:
                     self._cache.popitem(last=False)  # Remove oldest
                 self._cache[key] = (timestamp, value)
 
+    def pop(self, key) -> None:
+        """Remove an entry if present."""
+        with self._lock:
+            self._cache.pop(key, None)
+
+    def items(self) -> list[tuple]:
+        """Snapshot of (key, value) pairs (including potentially expired)."""
+        with self._lock:
+            return [(key, value) for key, (_, value) in self._cache.items()]
+
     def clear(self) -> None:
         """Clear all entries from the cache."""
         with self._lock:
@@ -219,10 +233,14 @@ class AssetResolutionService:
     redundant API calls. Cache features:
     - Size limit: CACHE_MAX_SIZE entries to prevent memory leaks
     - TTL: ASSET_CACHE_TTL_SECONDS to prevent stale data persistence
+    - "Not found" answers: kept for ASSET_NOT_FOUND_CACHE_TTL_SECONDS
+    - Persistence: entries are also written to the asset_info_cache table,
+      which is read on a memory miss (one query per batch)
 
     Attributes:
         _provider: Market data provider for fetching asset metadata
         _cache: Bounded LRU cache with TTL for provider responses
+        _not_found_cache: Bounded LRU cache of keys the provider did not find
         CACHE_MAX_SIZE: Maximum entries in the cache (default 10,000)
 
     Example:
@@ -251,6 +269,10 @@ class AssetResolutionService:
             maxsize=self.CACHE_MAX_SIZE,
             ttl_seconds=ASSET_CACHE_TTL_SECONDS,
         )
+        self._not_found_cache: BoundedLRUCache = BoundedLRUCache(
+            maxsize=self.CACHE_MAX_SIZE,
+            ttl_seconds=ASSET_NOT_FOUND_CACHE_TTL_SECONDS,
+        )
 
         logger.info(f"AssetResolutionService initialized with provider: {self._provider.name}")
 
@@ -312,7 +334,7 @@ class AssetResolutionService:
         logger.info(f"Asset {ticker} on {exchange} not in DB, fetching from provider")
 
         try:
-            asset_info = self._fetch_from_provider(ticker, exchange)
+            asset_info = self._fetch_from_provider(db, ticker, exchange)
             new_asset = self._create_asset(db, asset_info)
             logger.info(f"Created new asset: {new_asset.id} ({ticker} on {exchange})")
             return new_asset
@@ -360,11 +382,9 @@ class AssetResolutionService:
         ))
 
         # 2. Batch DB Lookup
-        conditions = [
-            and_(Asset.ticker == t, Asset.exchange == e)
-            for t, e in normalized_reqs
-        ]
-        existing_assets = db.scalars(select(Asset).where(or_(*conditions))).all()
+        existing_assets = db.scalars(
+            select(Asset).where(tuple_(Asset.ticker, Asset.exchange).in_(normalized_reqs))
+        ).all()
 
         # Index existing assets
         found_keys = set()
@@ -383,17 +403,10 @@ class AssetResolutionService:
         if not missing:
             return result
 
-        # 4. Check cache for missing assets
+        # 4. Check caches (memory, then asset_info_cache) for missing assets
         logger.info(f"Batch resolving {len(missing)} missing assets")
-        really_missing = []
-        cached_infos = []
-
-        for req in missing:
-            cached = self._cache.get(req)
-            if cached is not None:
-                cached_infos.append(cached)
-            else:
-                really_missing.append(req)
+        cached, cached_not_found, really_missing = self._lookup_cached(db, missing)
+        cached_infos = list(cached.values())
 
         # 5. Create assets from cache (single transaction)
         if cached_infos:
@@ -406,20 +419,27 @@ class AssetResolutionService:
                 for info in cached_infos:
                     result.errors[(info.ticker, info.exchange)] = e
 
+        for key in cached_not_found:
+            result.not_found.append(key)
+            logger.info(f"Asset not found by provider (cached): {key}")
+
         if not really_missing:
             return result
 
         # 6. Batch Provider Fetch
         batch_result = self._provider.get_asset_info_batch(really_missing)
 
+        # Update caches (transient provider errors are not cached)
+        self._remember(
+            db,
+            found=batch_result.successful,
+            not_found=[key for key, error in batch_result.failed.items() if isinstance(error, TickerNotFoundError)],
+        )
+
         # 7. Create new assets from provider results (single transaction)
         if batch_result.successful:
             infos_to_create = list(batch_result.successful.values())
 
-            # Update cache
-            for key, info in batch_result.successful.items():
-                self._cache.set(key, info)
-
             try:
                 new_assets = self._create_assets_batch(db, infos_to_create)
                 for asset in new_assets:
@@ -456,14 +476,16 @@ class AssetResolutionService:
         )
         return db.scalar(query)
 
-    def _fetch_from_provider(self, ticker: str, exchange: str) -> AssetInfo:
+    def _fetch_from_provider(self, db: Session, ticker: str, exchange: str) -> AssetInfo:
         """
         Fetch asset metadata from the market data provider.
 
-        Uses an in-memory cache to avoid redundant API calls for the same
-        ticker+exchange combination within the application lifecycle.
+        Uses the in-memory and asset_info_cache caches to avoid redundant API
+        calls for the same ticker+exchange combination, including ones the
+        provider recently reported as not found.
 
         Args:
+            db: Database session (for the persistent cache)
             ticker: Normalized ticker symbol
             exchange: Normalized exchange code
 
@@ -478,21 +500,156 @@ class AssetResolutionService:
         cache_key = (ticker, exchange)
 
         # Check cache first
-        cached = self._cache.get(cache_key)
-        if cached is not None:
+        cached, cached_not_found, _ = self._lookup_cached(db, [cache_key])
+        if cache_key in cached:
             logger.debug(f"Cache hit for {ticker} on {exchange}")
-            return cached
+            return cached[cache_key]
+        if cached_not_found:
+            logger.debug(f"Cached not found for {ticker} on {exchange}")
+            raise TickerNotFoundError(ticker=ticker, exchange=exchange, provider=self._provider.name)
 
         # Fetch from provider
         logger.debug(f"Cache miss for {ticker} on {exchange}, calling provider")
-        asset_info = self._provider.get_asset_info(ticker, exchange)
+        try:
+            asset_info = self._provider.get_asset_info(ticker, exchange)
+        except TickerNotFoundError:
+            self._remember(db, found={}, not_found=[cache_key])
+            raise
 
         # Cache the result
-        self._cache.set(cache_key, asset_info)
+        self._remember(db, found={cache_key: asset_info}, not_found=[])
         logger.debug(f"Cached asset info for {ticker} on {exchange}")
 
         return asset_info
 
+    def _lookup_cached(
+            self,
+            db: Session,
+            keys: list[tuple[str, str]],
+    ) -> tuple[dict[tuple[str, str], AssetInfo], list[tuple[str, str]], list[tuple[str, str]]]:
+        """
+        Look up provider answers in memory, then in asset_info_cache.
+
+        Args:
+            db: Database session
+            keys: Normalized (ticker, exchange) keys
+
+        Returns:
+            Tuple of (cached infos by key, keys cached as not found, uncached keys)
+        """
+        found: dict[tuple[str, str], AssetInfo] = {}
+        not_found: list[tuple[str, str]] = []
+        uncached: list[tuple[str, str]] = []
+
+        for key in keys:
+            info = self._cache.get(key)
+            if info is not None:
+                found[key] = info
+            elif self._not_found_cache.get(key) is not None:
+                not_found.append(key)
+            else:
+                uncached.append(key)
+
+        if not uncached:
+            return found, not_found, uncached
+
+        try:
+            rows = db.execute(
+                select(AssetInfoCache.ticker, AssetInfoCache.exchange, AssetInfoCache.info).where(
+                    AssetInfoCache.provider == self._provider.name,
+                    tuple_(AssetInfoCache.ticker, AssetInfoCache.exchange).in_(uncached),
+                    AssetInfoCache.expires_at > datetime.now(timezone.utc),
+                )
+            ).all()
+        except SQLAlchemyError as e:
+            # The persistent cache is an optimization; fall back to the provider
+            logger.warning(f"Asset info cache lookup failed: {e}")
+            db.rollback()
+            return found, not_found, uncached
+
+        persisted = {(ticker, exchange): info for ticker, exchange, info in rows}
+        remaining = []
+        for key in uncached:
+            if key not in persisted:
+                remaining.append(key)
+            elif persisted[key] is None:
+                self._not_found_cache.set(key, True)
+                not_found.append(key)
+            else:
+                info = AssetInfo(**{**persisted[key], "asset_class": AssetClass(persisted[key]["asset_class"])})
+                self._cache.set(key, info)
+                found[key] = info
+
+        return found, not_found, remaining
+
+    def _remember(
+            self,
+            db: Session,
+            found: dict[tuple[str, str], AssetInfo],
+            not_found: list[tuple[str, str]],
+    ) -> None:
+        """
+        Cache provider answers in memory and in asset_info_cache.
+
+        Args:
+            db: Database session (committed after the write)
+            found: AssetInfo returned by the provider, by key
+            not_found: Keys the provider reported as not found
+        """
+        for key, info in found.items():
+            self._cache.set(key, info)
+        for key in not_found:
+            self._not_found_cache.set(key, True)
+
+        if not found and not not_found:
+            return
+
+        now = datetime.now(timezone.utc)
+        values = [
+            {
+                "provider": self._provider.name,
+                "ticker": ticker,
+                "exchange": exchange,
+                "info": {**asdict(info), "asset_class": info.asset_class.value},
+                "fetched_at": now,
+                "expires_at": now + timedelta(seconds=ASSET_CACHE_TTL_SECONDS),
+            }
+            for (ticker, exchange), info in found.items()
+        ] + [
+            {
+                "provider": self._provider.name,
+                "ticker": ticker,
+                "exchange": exchange,
+                "info": None,
+                "fetched_at": now,
+                "expires_at": now + timedelta(seconds=ASSET_NOT_FOUND_CACHE_TTL_SECONDS),
+            }
+            for ticker, exchange in not_found
+        ]
+
+        try:
+            if _is_postgresql(db):
+                stmt = pg_insert(AssetInfoCache).values(values)
+                db.execute(stmt.on_conflict_do_update(
+                    constraint='uq_asset_info_cache_key',
+                    set_={
+                        "info": stmt.excluded.info,
+                        "fetched_at": stmt.excluded.fetched_at,
+                        "expires_at": stmt.excluded.expires_at,
+                    },
+                ))
+            else:
+                db.execute(delete(AssetInfoCache).where(
+                    AssetInfoCache.provider == self._provider.name,
+                    tuple_(AssetInfoCache.ticker, AssetInfoCache.exchange).in_([*found, *not_found]),
+                ))
+                db.execute(insert(AssetInfoCache), values)
+            db.commit()
+        except SQLAlchemyError as e:
+            # Another worker may have written the same keys; memory still has them
+            logger.warning(f"Failed to persist asset info cache: {e}")
+            db.rollback()
+
     def _create_asset(self, db: Session, asset_info: AssetInfo) -> Asset:
         """
         Create a new Asset in the database from provider data.
@@ -674,11 +831,9 @@ class AssetResolutionService:
         db.commit()
 
         # Fetch all assets (both newly created and pre-existing)
-        conditions = [
-            and_(Asset.ticker == info.ticker, Asset.exchange == info.exchange)
-            for info in asset_infos
-        ]
-        query = select(Asset).where(or_(*conditions))
+        query = select(Asset).where(
+            tuple_(Asset.ticker, Asset.exchange).in_([(info.ticker, info.exchange) for info in asset_infos])
+        )
         all_assets = {(a.ticker, a.exchange): a for a in db.scalars(query).all()}
 
         # Return assets in the same order as input
@@ -747,11 +902,12 @@ class AssetResolutionService:
 
     def clear_cache(self) -> None:
         """
-        Clear the in-memory cache.
+        Clear the in-memory caches.
 
-        Useful for testing or when you want to force fresh data from the provider.
+        Useful for testing. Entries in asset_info_cache stay until they expire.
         """
         self._cache.clear()
+        self._not_found_cache.clear()
         logger.debug("Asset resolution cache cleared")
 
     @property
@@ -0,0 +1,269 @@
+# backend/app/services/asset_search.py
+"""
+Ranked asset search over ticker, name and ISIN.
+
+Backs type-ahead search in the UI, so it returns a small, ranked list of
+active assets rather than a paginated, exchange-ordered one:
+
+1. Exact ticker or ISIN match
+2. Ticker prefix match
+3. ISIN prefix match
+4. Name match (word prefix; on PostgreSQL also substring and fuzzy)
+
+Ties are broken by trigram similarity on PostgreSQL, then by shorter
+ticker, ticker and exchange.
+
+Backends:
+- PostgreSQL: one query served by the pg_trgm GIN indexes on ticker, name
+  and isin (migration 011). Queries shorter than
+  ASSET_SEARCH_MIN_SUBSTRING_LENGTH only match prefixes.
+- Other databases (SQLite in tests and local runs): an in-process sorted
+  prefix index of ticker, ISIN and name words, rebuilt when the assets
+  table changes.
+
+Usage:
+    service = AssetSearchService()
+    assets = service.search(db, "appl", limit=10)
+"""
+
+import bisect
+import heapq
+import logging
+import re
+import threading
+from dataclasses import dataclass
+
+from sqlalchemy import case, func, literal, or_, select
+from sqlalchemy.orm import Session
+
+from app.models import Asset
+from app.services.constants import ASSET_SEARCH_DEFAULT_LIMIT, ASSET_SEARCH_MIN_SUBSTRING_LENGTH
+from app.utils import escape_like_pattern
+
+logger = logging.getLogger(__name__)
+
+# Match tiers, best first
+_EXACT = 0
+_TICKER_PREFIX = 1
+_ISIN_PREFIX = 2
+_NAME = 3
+
+# Kinds of prefix index entries
+_KIND_TICKER = 0
+_KIND_ISIN = 1
+_KIND_NAME = 2
+
+# Sorts after any token that starts with a given prefix
+_PREFIX_END = "\uffff"
+
+_WORD_SPLIT = re.compile(r"[^0-9a-z]+")
+
+
+def _name_tokens(name: str) -> set[str]:
+    """Words of a name, whole ("coca-cola") and split ("coca", "cola")."""
+    lowered = name.lower()
+    return {word for word in lowered.split()} | {word for word in _WORD_SPLIT.split(lowered) if word}
+
+
+@dataclass(frozen=True, slots=True)
+class _PrefixSnapshot:
+    """One immutable build of the prefix index."""
+    version: tuple
+    keys: list[str]  # Sorted tokens
+    entries: list[tuple[int, int]]  # (kind, asset_id), parallel to keys
+    assets: dict[int, tuple[str, str, bool]]  # asset_id -> (ticker, exchange, is_active)
+
+
+class AssetPrefixIndex:
+    """
+    In-process prefix index of the assets table.
+
+    Holds every ticker, ISIN and name word in one sorted list, so a prefix
+    lookup is a bisect plus a scan of the matching range. Each
+    whitespace-separated query word must prefix-match a token of the asset. The index is
+    rebuilt when the table's (count, max id, max updated_at) changes, which
+    costs one aggregate query per search.
+
+    Thread-safe: searches read an immutable snapshot; rebuilds are
+    serialized by a lock.
+    """
+
+    def __init__(self) -> None:
+        self._snapshot: _PrefixSnapshot | None = None
+        self._lock = threading.Lock()
+
+    def search(self, db: Session, query: str, limit: int) -> list[int]:
+        """
+        Find the ids of the best matching active assets.
+
+        Args:
+            db: Database session
+            query: Search text (case-insensitive)
+            limit: Maximum number of ids
+
+        Returns:
+            Asset ids, best match first
+        """
+        snapshot = self._current(db)
+        normalized = query.strip().lower()
+        words = normalized.split()
+        if not words:
+            return []
+
+        # Every query word must match some token of the asset
+        tiers: dict[int, int] | None = None
+        for position, word in enumerate(words):
+            word_tiers: dict[int, int] = {}
+            start = bisect.bisect_left(snapshot.keys, word)
+            end = bisect.bisect_left(snapshot.keys, word + _PREFIX_END, lo=start)
+            for i in range(start, end):
+                kind, asset_id = snapshot.entries[i]
+                tier = self._tier(kind, snapshot.keys[i] == normalized) if position == 0 else _NAME
+                if tier < word_tiers.get(asset_id, _NAME + 1):
+                    word_tiers[asset_id] = tier
+            if tiers is None:
+                tiers = word_tiers
+            else:
+                tiers = {
+                    asset_id: min(tier, word_tiers[asset_id])
+                    for asset_id, tier in tiers.items()
+                    if asset_id in word_tiers
+                }
+
+        def sort_key(asset_id: int) -> tuple:
+            ticker, exchange, _ = snapshot.assets[asset_id]
+            return tiers[asset_id], len(ticker), ticker, exchange
+
+        active = (asset_id for asset_id in tiers if snapshot.assets[asset_id][2])
+        return heapq.nsmallest(limit, active, key=sort_key)
+
+    @staticmethod
+    def _tier(kind: int, exact: bool) -> int:
+        if kind == _KIND_TICKER:
+            return _EXACT if exact else _TICKER_PREFIX
+        if kind == _KIND_ISIN:
+            return _EXACT if exact else _ISIN_PREFIX
+        return _NAME
+
+    def _current(self, db: Session) -> _PrefixSnapshot:
+        """Return the snapshot for the current table contents, rebuilding if needed."""
+        version = tuple(db.execute(
+            select(func.count(Asset.id), func.max(Asset.id), func.max(Asset.updated_at))
+        ).one())
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+
+        with self._lock:
+            if self._snapshot is not None and self._snapshot.version == version:
+                return self._snapshot
+
+            tokens: list[tuple[str, int, int]] = []
+            assets: dict[int, tuple[str, str, bool]] = {}
+            for asset_id, ticker, exchange, isin, name, is_active in db.execute(
+                select(Asset.id, Asset.ticker, Asset.exchange, Asset.isin, Asset.name, Asset.is_active)
+            ):
+                assets[asset_id] = (ticker, exchange, is_active)
+                tokens.append((ticker.lower(), _KIND_TICKER, asset_id))
+                if isin:
+                    tokens.append((isin.lower(), _KIND_ISIN, asset_id))
+                for word in _name_tokens(name or ""):
+                    tokens.append((word, _KIND_NAME, asset_id))
+            tokens.sort()
+
+            self._snapshot = _PrefixSnapshot(
+                version=version,
+                keys=[token for token, _, _ in tokens],
+                entries=[(kind, asset_id) for _, kind, asset_id in tokens],
+                assets=assets,
+            )
+            logger.debug(f"Built asset prefix index: {len(assets)} assets, {len(tokens)} tokens")
+            return self._snapshot
+
+
+class AssetSearchService:
+    """
+    Ranked type-ahead search over the asset registry.
+
+    Uses pg_trgm on PostgreSQL and an AssetPrefixIndex elsewhere. Keep one
+    instance per process (see dependencies.get_asset_search_service) so the
+    prefix index is built once.
+    """
+
+    def __init__(self) -> None:
+        self._prefix_index = AssetPrefixIndex()
+
+    def search(self, db: Session, query: str, limit: int = ASSET_SEARCH_DEFAULT_LIMIT) -> list[Asset]:
+        """
+        Search active assets by ticker, name and ISIN.
+
+        Args:
+            db: Database session
+            query: Search text (case-insensitive)
+            limit: Maximum number of results
+
+        Returns:
+            Matching assets, best match first
+        """
+        query = query.strip()
+        if not query:
+            return []
+
+        if db.get_bind().dialect.name == "postgresql":
+            return list(db.scalars(self.build_trigram_query(query, limit)).all())
+
+        ids = self._prefix_index.search(db, query, limit)
+        if not ids:
+            return []
+        by_id = {asset.id: asset for asset in db.scalars(select(Asset).where(Asset.id.in_(ids)))}
+        return [by_id[asset_id] for asset_id in ids if asset_id in by_id]
+
+    @staticmethod
+    def build_trigram_query(query: str, limit: int):
+        """
+        Build the PostgreSQL search query (served by the pg_trgm GIN indexes).
+
+        Args:
+            query: Stripped search text
+            limit: Maximum number of results
+
+        Returns:
+            SELECT of Asset, ranked
+        """
+        escaped = escape_like_pattern(query)
+        prefix = f"{escaped}%"
+        upper = query.upper()
+
+        if len(query) >= ASSET_SEARCH_MIN_SUBSTRING_LENGTH:
+            contains = f"%{escaped}%"
+            match = or_(
+                Asset.ticker.ilike(contains, escape="\\"),
+                Asset.name.ilike(contains, escape="\\"),
+                Asset.isin.ilike(prefix, escape="\\"),
+                # Fuzzy: a word of the name is similar to the query (typos)
+                Asset.name.op("%>")(query),
+            )
+        else:
+            match = or_(
+                Asset.ticker.ilike(prefix, escape="\\"),
+                Asset.isin.ilike(prefix, escape="\\"),
+                Asset.name.ilike(prefix, escape="\\"),
+            )
+
+        tier = case(
+            (or_(func.upper(Asset.ticker) == upper, func.upper(Asset.isin) == upper), _EXACT),
+            (Asset.ticker.ilike(prefix, escape="\\"), _TICKER_PREFIX),
+            (Asset.isin.ilike(prefix, escape="\\"), _ISIN_PREFIX),
+            else_=_NAME,
+        )
+        similarity = func.greatest(
+            func.similarity(Asset.ticker, query),
+            func.word_similarity(literal(query), func.coalesce(Asset.name, "")),
+        )
+
+        return (
+            select(Asset)
+            .where(Asset.is_active.is_(True), match)
+            .order_by(tier, similarity.desc(), func.length(Asset.ticker), Asset.ticker, Asset.exchange)
+            .limit(limit)
+        )
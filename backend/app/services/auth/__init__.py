@@ -3,10 +3,12 @@ Authentication services for the Investment Portfolio Analyzer.
 
 This module provides:
 - Password hashing and verification (bcrypt)
+- Dedicated executor for bcrypt in request handlers (PasswordHashingPool)
 - JWT token creation and validation
 - OAuth2 integration (Google)
 - Email verification and password reset
 - Core authentication service (AuthService)
+- Short-TTL cache of users and portfolio owners (AuthCache)
 
 Usage:
     from app.services.auth import AuthService, PasswordService, JWTHandler
@@ -25,16 +27,22 @@ Usage:
 """
 
 from app.services.auth.password import PasswordService
+from app.services.auth.password_pool import PasswordHashingPool, PasswordPoolStats
 from app.services.auth.jwt_handler import JWTHandler
 from app.services.auth.service import AuthService
 from app.services.auth.email_service import EmailService
 from app.services.auth.oauth_google import GoogleOAuthService, get_oauth_state_store
+from app.services.auth.auth_cache import AuthCache, AuthCacheStats
 
 __all__ = [
     "PasswordService",
+    "PasswordHashingPool",
+    "PasswordPoolStats",
     "JWTHandler",
     "AuthService",
     "EmailService",
     "GoogleOAuthService",
     "get_oauth_state_store",
+    "AuthCache",
+    "AuthCacheStats",
 ]
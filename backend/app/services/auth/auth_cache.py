@@ -0,0 +1,222 @@
+"""
+Short-TTL cache of authenticated users and portfolio owners.
+
+get_current_user and get_portfolio_with_owner_check load the same User
+and Portfolio rows on nearly every request. This cache keeps their column
+values per process for AUTH_CACHE_TTL_SECONDS, and hands them back as
+session-attached ORM objects via Session.merge(load=False), so routers
+keep working with regular User / Portfolio instances and no query is run.
+
+User.hashed_password is never cached; it is loaded on first access.
+
+Invalidation:
+- Any ORM update or delete of a User or Portfolio (deactivation, password
+  change or reset, profile edits, portfolio rename or delete) drops the
+  entry when flushed and again after commit. Deleting a user also drops
+  their portfolios.
+- Callers invalidate explicitly where no row changes (logout-all).
+- Other worker processes see changes once the TTL expires.
+
+Usage:
+    cache = AuthCache()
+    user = cache.get_user(db, user_id)
+    if user is None:
+        user = db.get(User, user_id)
+        cache.put_user(user)
+"""
+
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached, object_session
+
+from app.models import Portfolio, User
+from app.services.asset_resolution import BoundedLRUCache
+from app.services.constants import AUTH_CACHE_MAX_ENTRIES, AUTH_CACHE_TTL_SECONDS
+
+# Column attributes that are never cached
+_USER_EXCLUDED = frozenset({"hashed_password"})
+
+# Session.info keys of ids to invalidate again after commit
+_PENDING_USERS = "auth_cache_users"
+_PENDING_PORTFOLIOS = "auth_cache_portfolios"
+
+# Every live cache, for the ORM event listeners below
+_caches: "weakref.WeakSet[AuthCache]" = weakref.WeakSet()
+
+
+@dataclass(frozen=True)
+class AuthCacheStats:
+    """Hit / miss counters of an AuthCache."""
+    user_hits: int
+    user_misses: int
+    portfolio_hits: int
+    portfolio_misses: int
+    users_cached: int
+    portfolios_cached: int
+
+    @property
+    def user_hit_rate(self) -> float:
+        lookups = self.user_hits + self.user_misses
+        return self.user_hits / lookups if lookups else 0.0
+
+    @property
+    def portfolio_hit_rate(self) -> float:
+        lookups = self.portfolio_hits + self.portfolio_misses
+        return self.portfolio_hits / lookups if lookups else 0.0
+
+
+class AuthCache:
+    """
+    Thread-safe TTL cache of User and Portfolio rows by primary key.
+
+    Attributes:
+        ttl_seconds: Lifetime of an entry
+    """
+
+    def __init__(self, ttl_seconds: int = AUTH_CACHE_TTL_SECONDS, maxsize: int = AUTH_CACHE_MAX_ENTRIES) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._users = BoundedLRUCache(maxsize=maxsize, ttl_seconds=ttl_seconds)
+        self._portfolios = BoundedLRUCache(maxsize=maxsize, ttl_seconds=ttl_seconds)
+        self._lock = threading.Lock()
+        self._user_hits = 0
+        self._user_misses = 0
+        self._portfolio_hits = 0
+        self._portfolio_misses = 0
+        _caches.add(self)
+
+    # =========================================================================
+    # USERS
+    # =========================================================================
+
+    def get_user(self, db: Session, user_id: int) -> User | None:
+        """Cached user attached to db, or None on a miss."""
+        values = self._users.get(user_id)
+        with self._lock:
+            if values is None:
+                self._user_misses += 1
+                return None
+            self._user_hits += 1
+        return self._attach(db, User, values)
+
+    def put_user(self, user: User) -> None:
+        """Cache a user loaded from the database."""
+        self._users.set(user.id, _column_values(user, _USER_EXCLUDED))
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Drop a user and the portfolios cached for them."""
+        self._users.pop(user_id)
+        for portfolio_id, values in self._portfolios.items():
+            if values["user_id"] == user_id:
+                self._portfolios.pop(portfolio_id)
+
+    # =========================================================================
+    # PORTFOLIOS
+    # =========================================================================
+
+    def get_portfolio(self, db: Session, portfolio_id: int) -> Portfolio | None:
+        """Cached portfolio attached to db, or None on a miss."""
+        values = self._portfolios.get(portfolio_id)
+        with self._lock:
+            if values is None:
+                self._portfolio_misses += 1
+                return None
+            self._portfolio_hits += 1
+        return self._attach(db, Portfolio, values)
+
+    def put_portfolio(self, portfolio: Portfolio) -> None:
+        """Cache a portfolio loaded from the database."""
+        self._portfolios.set(portfolio.id, _column_values(portfolio))
+
+    def invalidate_portfolio(self, portfolio_id: int) -> None:
+        """Drop a portfolio."""
+        self._portfolios.pop(portfolio_id)
+
+    # =========================================================================
+    # MONITORING
+    # =========================================================================
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        self._users.clear()
+        self._portfolios.clear()
+        with self._lock:
+            self._user_hits = self._user_misses = 0
+            self._portfolio_hits = self._portfolio_misses = 0
+
+    @property
+    def stats(self) -> AuthCacheStats:
+        """Snapshot of the hit / miss counters."""
+        with self._lock:
+            return AuthCacheStats(
+                user_hits=self._user_hits,
+                user_misses=self._user_misses,
+                portfolio_hits=self._portfolio_hits,
+                portfolio_misses=self._portfolio_misses,
+                users_cached=len(self._users),
+                portfolios_cached=len(self._portfolios),
+            )
+
+    @staticmethod
+    def _attach(db: Session, model: type, values: dict[str, Any]):
+        """Rebuild a persistent instance from cached values without a query."""
+        instance = model(**values)
+        make_transient_to_detached(instance)  # Uncached attributes load on access
+        return db.merge(instance, load=False)
+
+
+def _column_values(instance: Any, excluded: frozenset[str] = frozenset()) -> dict[str, Any]:
+    return {
+        attr.key: getattr(instance, attr.key)
+        for attr in inspect(type(instance)).column_attrs
+        if attr.key not in excluded
+    }
+
+
+# =============================================================================
+# ORM INVALIDATION
+# =============================================================================
+
+def _invalidate(user_ids: set[int], portfolio_ids: set[int]) -> None:
+    for cache in list(_caches):
+        for user_id in user_ids:
+            cache.invalidate_user(user_id)
+        for portfolio_id in portfolio_ids:
+            cache.invalidate_portfolio(portfolio_id)
+
+
+def _on_user_change(mapper, connection, target: User) -> None:
+    _invalidate({target.id}, set())
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING_USERS, set()).add(target.id)
+
+
+def _on_portfolio_change(mapper, connection, target: Portfolio) -> None:
+    _invalidate(set(), {target.id})
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING_PORTFOLIOS, set()).add(target.id)
+
+
+def _after_commit(session: Session) -> None:
+    # A request may have re-cached the old row between flush and commit
+    user_ids = session.info.pop(_PENDING_USERS, set())
+    portfolio_ids = session.info.pop(_PENDING_PORTFOLIOS, set())
+    if user_ids or portfolio_ids:
+        _invalidate(user_ids, portfolio_ids)
+
+
+def _after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_USERS, None)
+    session.info.pop(_PENDING_PORTFOLIOS, None)
+
+
+for _event_name in ("after_update", "after_delete"):
+    event.listen(User, _event_name, _on_user_change)
+    event.listen(Portfolio, _event_name, _on_portfolio_change)
+event.listen(Session, "after_commit", _after_commit)
+event.listen(Session, "after_rollback", _after_rollback)
@@ -2,8 +2,8 @@
 Password hashing and verification using bcrypt.
 
 Uses passlib with bcrypt backend for secure password hashing.
-Cost factor is set to 12 (default) which provides good security
-while keeping hash time reasonable (~250ms).
+Cost factor comes from settings.bcrypt_rounds: 12 by default, which provides
+good security while keeping hash time reasonable (~250ms), and 4 in test.
 
 Security considerations:
 - Bcrypt automatically handles salt generation
@@ -13,13 +13,17 @@ Security considerations:
 
 from passlib.context import CryptContext
 
+from app.config import settings
 
-# Configure bcrypt with cost factor 12
+
+# Configure bcrypt with the environment's cost factor
 # "deprecated='auto'" allows seamless algorithm upgrades
+# min_rounds makes needs_rehash() flag hashes made before the cost was raised
 _pwd_context = CryptContext(
     schemes=["bcrypt"],
     deprecated="auto",
-    bcrypt__rounds=12,
+    bcrypt__rounds=settings.bcrypt_rounds,
+    bcrypt__min_rounds=settings.bcrypt_rounds,
 )
 
 
@@ -27,8 +31,10 @@ class PasswordService:
     """
     Service for password hashing and verification.
 
-    Uses bcrypt algorithm with cost factor 12.
+    Uses bcrypt algorithm with the configured cost factor.
     All methods are stateless and can be called as class methods.
+    They block for the full hash time; request handlers should go through
+    PasswordHashingPool instead.
     """
 
     @staticmethod
@@ -0,0 +1,118 @@
+"""
+Dedicated executor for password hashing and verification.
+
+bcrypt deliberately takes ~250ms per call. Run inline in sync handlers, a
+login burst occupies the shared Starlette threadpool and delays every other
+endpoint. PasswordHashingPool runs PasswordService on its own small thread
+pool (bcrypt releases the GIL while hashing), and the async auth endpoints
+await it, so password work is capped at settings.password_hash_workers
+concurrent hashes and never holds a general-purpose worker.
+
+Queue depth (operations waiting for a thread) and throughput are exposed via
+stats and reported by /health.
+
+Usage:
+    pool = PasswordHashingPool(max_workers=2)
+    hashed = await pool.hash_password("mypassword123")
+    is_valid = await pool.verify_password("mypassword123", hashed)
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, TypeVar
+
+from app.services.auth.password import PasswordService
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class PasswordPoolStats:
+    """Snapshot of a PasswordHashingPool."""
+    max_workers: int
+    queued: int          # Submitted, waiting for a thread
+    active: int          # Hashing right now
+    peak_queued: int     # Highest queue depth seen
+    completed: int
+
+
+class PasswordHashingPool:
+    """
+    Size-capped thread pool for bcrypt operations.
+
+    Attributes:
+        max_workers: Maximum concurrent hash / verify operations
+    """
+
+    def __init__(self, max_workers: int = 2) -> None:
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="password-hash",
+        )
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._peak_queued = 0
+        self._completed = 0
+
+    async def hash_password(self, password: str) -> str:
+        """Hash a password on the pool (see PasswordService.hash_password)."""
+        return await self._run(PasswordService.hash_password, password)
+
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password on the pool (see PasswordService.verify_password)."""
+        return await self._run(PasswordService.verify_password, plain_password, hashed_password)
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        with self._lock:
+            self._queued += 1
+            self._peak_queued = max(self._peak_queued, self._queued)
+        try:
+            future = self._executor.submit(self._tracked, func, *args)
+        except RuntimeError:  # Pool closed
+            self._dequeue()
+            raise
+        future.add_done_callback(self._on_done)
+        return await asyncio.wrap_future(future)
+
+    def _on_done(self, future: Future) -> None:
+        if future.cancelled():  # Caller went away before a thread picked it up
+            self._dequeue()
+
+    def _dequeue(self) -> None:
+        with self._lock:
+            self._queued -= 1
+
+    def _tracked(self, func: Callable[..., T], *args) -> T:
+        with self._lock:
+            self._queued -= 1
+            self._active += 1
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._completed += 1
+
+    # =========================================================================
+    # MONITORING
+    # =========================================================================
+
+    @property
+    def stats(self) -> PasswordPoolStats:
+        """Current queue depth and counters."""
+        with self._lock:
+            return PasswordPoolStats(
+                max_workers=self.max_workers,
+                queued=self._queued,
+                active=self._active,
+                peak_queued=self._peak_queued,
+                completed=self._completed,
+            )
+
+    def close(self) -> None:
+        """Stop accepting work (in-flight operations are left to finish)."""
+        self._executor.shutdown(wait=False)
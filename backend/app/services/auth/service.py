@@ -9,6 +9,11 @@ Handles:
 - Email verification
 - Password reset
 
+Each password endpoint has an async variant (register_async, login_async,
+reset_password_async) that runs bcrypt on the dedicated PasswordHashingPool
+and the surrounding database work on the Starlette threadpool, so request
+handlers never block a general-purpose worker for the full hash time.
+
 Security features:
 - Refresh token rotation on each use
 - Token family tracking for replay detection
@@ -23,10 +28,12 @@ from dataclasses import dataclass
 
 from sqlalchemy import select, and_
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.config import settings
 from app.models import User, RefreshToken
 from app.services.auth.password import PasswordService
+from app.services.auth.password_pool import PasswordHashingPool
 from app.services.auth.jwt_handler import JWTHandler
 from app.services.auth.email_service import EmailService
 from app.services.exceptions import (
@@ -59,15 +66,22 @@ class AuthService:
     Manages user registration, authentication, and token lifecycle.
     """
 
-    def __init__(self, email_service: EmailService | None = None) -> None:
+    def __init__(
+        self,
+        email_service: EmailService | None = None,
+        password_pool: PasswordHashingPool | None = None,
+    ) -> None:
         """
         Initialize the auth service.
 
         Args:
             email_service: Optional email service for sending verification emails.
                           If not provided, a new instance will be created.
+            password_pool: Executor used by the async methods for bcrypt.
+                          If not provided, a new instance will be created.
         """
         self._email_service = email_service or EmailService()
+        self._password_pool = password_pool or PasswordHashingPool()
 
     def register(
         self,
@@ -91,7 +105,22 @@ class AuthService:
         Raises:
             UserExistsError: If email is already registered
         """
-        # Check if user exists
+        self._ensure_email_available(db, email)
+        return self._create_user(db, email, PasswordService.hash_password(password), full_name)
+
+    async def register_async(
+        self,
+        db: Session,
+        email: str,
+        password: str,
+        full_name: str | None = None,
+    ) -> User:
+        """register() with the password hashed on the password pool."""
+        await run_in_threadpool(self._ensure_email_available, db, email)
+        hashed_password = await self._password_pool.hash_password(password)
+        return await run_in_threadpool(self._create_user, db, email, hashed_password, full_name)
+
+    def _ensure_email_available(self, db: Session, email: str) -> None:
         existing_user = db.execute(
             select(User).where(User.email == email.lower())
         ).scalar_one_or_none()
@@ -99,10 +128,16 @@ class AuthService:
         if existing_user:
             raise UserExistsError(email)
 
-        # Create user
+    def _create_user(
+        self,
+        db: Session,
+        email: str,
+        hashed_password: str,
+        full_name: str | None,
+    ) -> User:
         user = User(
             email=email.lower(),
-            hashed_password=PasswordService.hash_password(password),
+            hashed_password=hashed_password,
             full_name=full_name,
             is_email_verified=False,
             is_active=True,
@@ -144,7 +179,46 @@ class AuthService:
             EmailNotVerifiedError: If email is not verified
             UserInactiveError: If user account is inactive
         """
-        # Find user
+        user = self._find_password_user(db, email)
+
+        # Verify password
+        if not PasswordService.verify_password(password, user.hashed_password):
+            raise InvalidCredentialsError()
+
+        self._check_can_login(user)
+
+        # Check if password needs rehash
+        rehashed_password = None
+        if PasswordService.needs_rehash(user.hashed_password):
+            rehashed_password = PasswordService.hash_password(password)
+
+        return self._finish_login(db, user, device_info, ip_address, rehashed_password)
+
+    async def login_async(
+        self,
+        db: Session,
+        email: str,
+        password: str,
+        device_info: str | None = None,
+        ip_address: str | None = None,
+    ) -> TokenPair:
+        """login() with the password verified (and rehashed) on the password pool."""
+        user = await run_in_threadpool(self._find_password_user, db, email)
+
+        if not await self._password_pool.verify_password(password, user.hashed_password):
+            raise InvalidCredentialsError()
+
+        self._check_can_login(user)
+
+        rehashed_password = None
+        if PasswordService.needs_rehash(user.hashed_password):
+            rehashed_password = await self._password_pool.hash_password(password)
+
+        return await run_in_threadpool(
+            self._finish_login, db, user, device_info, ip_address, rehashed_password
+        )
+
+    def _find_password_user(self, db: Session, email: str) -> User:
         user = db.execute(
             select(User).where(User.email == email.lower())
         ).scalar_one_or_none()
@@ -152,10 +226,9 @@ class AuthService:
         if not user or not user.hashed_password:
             raise InvalidCredentialsError()
 
-        # Verify password
-        if not PasswordService.verify_password(password, user.hashed_password):
-            raise InvalidCredentialsError()
+        return user
 
+    def _check_can_login(self, user: User) -> None:
         # Check if email is verified
         if not user.is_email_verified:
             raise EmailNotVerifiedError(user.email)
@@ -164,9 +237,16 @@ class AuthService:
         if not user.is_active:
             raise UserInactiveError()
 
-        # Check if password needs rehash
-        if PasswordService.needs_rehash(user.hashed_password):
-            user.hashed_password = PasswordService.hash_password(password)
+    def _finish_login(
+        self,
+        db: Session,
+        user: User,
+        device_info: str | None,
+        ip_address: str | None,
+        rehashed_password: str | None,
+    ) -> TokenPair:
+        if rehashed_password is not None:
+            user.hashed_password = rehashed_password
             db.commit()
 
         # Create tokens
@@ -427,6 +507,21 @@ class AuthService:
             InvalidCredentialsError: If token is invalid
             UserNotFoundError: If user doesn't exist
         """
+        user = self._find_reset_user(db, token)
+        return self._store_reset_password(db, user, PasswordService.hash_password(new_password))
+
+    async def reset_password_async(
+        self,
+        db: Session,
+        token: str,
+        new_password: str,
+    ) -> User:
+        """reset_password() with the new password hashed on the password pool."""
+        user = await run_in_threadpool(self._find_reset_user, db, token)
+        hashed_password = await self._password_pool.hash_password(new_password)
+        return await run_in_threadpool(self._store_reset_password, db, user, hashed_password)
+
+    def _find_reset_user(self, db: Session, token: str) -> User:
         email = self._email_service.validate_password_reset_token(token)
 
         user = db.execute(
@@ -436,8 +531,11 @@ class AuthService:
         if not user:
             raise UserNotFoundError(email)
 
+        return user
+
+    def _store_reset_password(self, db: Session, user: User, hashed_password: str) -> User:
         # Update password
-        user.hashed_password = PasswordService.hash_password(new_password)
+        user.hashed_password = hashed_password
         user.password_reset_at = datetime.now(timezone.utc)
 
         # Revoke all refresh tokens for security
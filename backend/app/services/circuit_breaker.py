@@ -48,7 +48,10 @@ import time
 from dataclasses import dataclass, field
 from enum import Enum
 from functools import wraps
-from typing import Callable, TypeVar, Any
+from typing import Callable, TypeVar, Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from app.services.rate_limiter import TokenBucketStats
 
 logger = logging.getLogger(__name__)
 
@@ -96,6 +99,8 @@ class CircuitBreakerStats:
         state_changes: Number of state transitions
         last_failure_time: Timestamp of last failure
         last_success_time: Timestamp of last success
+        rate_limiter: Request pacing stats of the protected client, if any
+                      (filled in by the owner, e.g. MarketDataProvider)
     """
     total_calls: int = 0
     successful_calls: int = 0
@@ -104,6 +109,7 @@ class CircuitBreakerStats:
     state_changes: int = 0
     last_failure_time: float | None = None
     last_success_time: float | None = None
+    rate_limiter: "TokenBucketStats | None" = None
 
 
 @dataclass
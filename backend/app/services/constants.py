@@ -65,6 +65,15 @@ FX_FALLBACK_DAYS: int = 7
 # 24 hours = sync once per day during market hours
 DEFAULT_STALENESS_HOURS: int = 24
 
+# Price rows above which a batch is written with COPY into a staging table
+# instead of one multi-row INSERT (PostgreSQL only)
+# 5000 = roughly 20 years of daily prices for one asset
+MARKET_DATA_COPY_THRESHOLD: int = 5000
+
+# Seconds between heartbeats of a running sync job
+# Must stay well below settings.sync_job_stale_after_minutes, or live jobs get requeued
+SYNC_JOB_HEARTBEAT_SECONDS: int = 60
+
 
 # =============================================================================
 # CACHE SETTINGS
@@ -83,6 +92,13 @@ CACHE_TTL_SECONDS: int = 3600
 # - Stale metadata after corporate actions (mergers, name changes)
 ASSET_CACHE_TTL_SECONDS: int = 3600
 
+# Time-to-live for cached "not found" provider answers (memory and
+# asset_info_cache table)
+# 15 minutes = 900 seconds
+# Shorter than ASSET_CACHE_TTL_SECONDS so typos stop reaching the provider
+# on every upload, while newly listed tickers are found again soon
+ASSET_NOT_FOUND_CACHE_TTL_SECONDS: int = 900
+
 
 # =============================================================================
 # IRR/XIRR CALCULATION SETTINGS
@@ -159,6 +175,60 @@ CIRCUIT_BREAKER_HALF_OPEN_MAX_CALLS: int = 3
 CIRCUIT_BREAKER_FAILURE_WINDOW: float = 300.0
 
 
+# =============================================================================
+# MARKET DATA REQUEST PACING (token bucket)
+# =============================================================================
+
+# Sustained requests per second to the market data provider
+# Shared by every service using the singleton provider
+MARKET_DATA_RATE_LIMIT_PER_SECOND: float = 2.0
+
+# Burst size - requests that may be sent back-to-back after an idle period
+MARKET_DATA_RATE_LIMIT_BURST: float = 5.0
+
+# Floor for the request rate after repeated rate-limit responses
+# 0.1 = one request every 10 seconds
+MARKET_DATA_RATE_LIMIT_MIN_PER_SECOND: float = 0.1
+
+# Multiplier applied to the rate on each rate-limit response
+# 0.5 = halve the rate
+MARKET_DATA_RATE_LIMIT_BACKOFF_FACTOR: float = 0.5
+
+# Requests per second added back per recovery step
+MARKET_DATA_RATE_LIMIT_RECOVERY_STEP: float = 0.1
+
+# Seconds between recovery steps (and after a rate-limit response before recovery starts)
+MARKET_DATA_RATE_LIMIT_RECOVERY_INTERVAL: float = 5.0
+
+
+# =============================================================================
+# MARKET DATA HEDGED REQUESTS (composite provider)
+# =============================================================================
+
+# Latency percentile of the provider being waited on after which a hedged
+# request is sent to the next provider (0.95 = only the slowest 5% get hedged)
+MARKET_DATA_HEDGE_PERCENTILE: float = 0.95
+
+# Latency samples needed before the percentile is trusted
+# Until then MARKET_DATA_HEDGE_DEFAULT_DELAY is used
+MARKET_DATA_HEDGE_MIN_SAMPLES: int = 20
+
+# Hedge delay (seconds) used while a provider has too few samples
+MARKET_DATA_HEDGE_DEFAULT_DELAY: float = 2.0
+
+# Bounds for the hedge delay (seconds)
+# The floor stops a very fast provider from being hedged on every jitter
+MARKET_DATA_HEDGE_MIN_DELAY: float = 0.25
+MARKET_DATA_HEDGE_MAX_DELAY: float = 10.0
+
+# Worker threads shared by all in-flight provider calls
+MARKET_DATA_HEDGE_MAX_WORKERS: int = 8
+
+# Worker threads for concurrent asset metadata lookups within one batch
+# (one provider request per symbol, so this bounds in-flight requests)
+ASSET_INFO_FETCH_MAX_WORKERS: int = 8
+
+
 # =============================================================================
 # EXTERNAL API TIMEOUT SETTINGS
 # =============================================================================
@@ -314,6 +384,19 @@ RATE_LIMIT_AUTH_EMAIL: str = "3/minute"
 RATE_LIMIT_AUTH_REFRESH: str = "30/minute"
 
 
+# =============================================================================
+# AUTHENTICATION CACHE CONSTANTS
+# =============================================================================
+# Users and portfolio owners looked up on every authenticated request
+
+# How long a cached user / portfolio row is trusted (seconds)
+# Local writes invalidate immediately; other workers see them after this
+AUTH_CACHE_TTL_SECONDS: int = 30
+
+# Maximum cached users (and, separately, portfolios) per process
+AUTH_CACHE_MAX_ENTRIES: int = 10000
+
+
 # =============================================================================
 # RESOURCE LIMIT CONSTANTS
 # =============================================================================
@@ -331,6 +414,21 @@ MAX_BATCH_SIZE: int = 500
 # Prevents processing extremely large files
 MAX_UPLOAD_ROWS: int = 10000
 
+# Rows parsed and validated per chunk during upload processing
+# Bounds memory for parsed rows and their raw data independent of file size
+UPLOAD_PARSE_CHUNK_ROWS: int = 1000
+
+# Bytes read and decoded at a time when parsing an uploaded CSV file
+UPLOAD_READ_BLOCK_BYTES: int = 64 * 1024  # 64 KB
+
+# Rows per INSERT ... RETURNING statement when bulk-creating transactions
+# (uploads and batch creates); all batches share one database transaction
+TRANSACTION_INSERT_BATCH_ROWS: int = 1000
+
+# Errors (and warnings) kept on a background upload job for the status endpoint
+# error_count still counts all of them; the full list is only in the sync response
+UPLOAD_JOB_MAX_STORED_ERRORS: int = 1000
+
 # Maximum date range for history endpoints (days)
 # 20 years of daily data = ~7,305 data points (accounting for leap years)
 MAX_HISTORY_DAYS: int = 365 * 20 + 5  # 20 years with leap year buffer
@@ -338,3 +436,25 @@ MAX_HISTORY_DAYS: int = 365 * 20 + 5  # 20 years with leap year buffer
 # Maximum number of items returned in a single list response
 # Used as upper bound for pagination limit parameter
 MAX_LIST_LIMIT: int = 1000
+
+# List pages larger than this are read through a server-side cursor in
+# batches of LIST_STREAM_BATCH_SIZE instead of buffering the whole result
+LIST_STREAM_THRESHOLD: int = 200
+LIST_STREAM_BATCH_SIZE: int = 100
+
+# Rows per batch in streaming exports: fetched per server-side cursor
+# round trip, encoded and sent as one chunk (one Parquet row group)
+EXPORT_BATCH_ROWS: int = 5000
+
+
+# =============================================================================
+# ASSET SEARCH SETTINGS
+# =============================================================================
+
+# Results returned by the type-ahead asset search (default and maximum)
+ASSET_SEARCH_DEFAULT_LIMIT: int = 10
+ASSET_SEARCH_MAX_LIMIT: int = 50
+
+# Shorter queries only match prefixes: a substring or trigram match on one
+# or two characters hits most of the asset universe
+ASSET_SEARCH_MIN_SUBSTRING_LENGTH: int = 3
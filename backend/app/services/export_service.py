@@ -0,0 +1,429 @@
+# backend/app/services/export_service.py
+"""
+Streaming bulk export of portfolio data.
+
+Exports transactions, holdings and valuation history as CSV, Parquet or
+Arrow IPC stream files. Every export is a generator of byte chunks that
+the router hands to a StreamingResponse:
+
+- transactions are read through a server-side cursor (yield_per), so
+  exporting 100k rows never holds more than one batch of ORM rows
+- history points come from ValuationService.iter_history(), which
+  calculates one chunk of dates at a time
+- rows are encoded EXPORT_BATCH_ROWS at a time and sent as soon as each
+  batch is encoded, so the download starts immediately
+
+Formats:
+    csv      UTF-8, header row, Decimals written exactly
+    parquet  one row group per batch (requires pyarrow)
+    arrow    Arrow IPC stream, one record batch per batch (requires pyarrow)
+
+pyarrow is a declared dependency; the availability check stays so an
+install without it fails Parquet / Arrow requests with a ValidationError
+while CSV keeps working.
+
+Usage:
+    service = ExportService(valuation_service)
+    chunks = service.stream_transactions(db, portfolio_id, "csv")
+    return StreamingResponse(chunks, media_type=EXPORT_MEDIA_TYPES["csv"])
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import logging
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Literal
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models import Asset, Transaction
+from app.services.constants import EXPORT_BATCH_ROWS
+from app.services.exceptions import ValidationError
+from app.services.portfolio_context import PortfolioDataContext
+
+if TYPE_CHECKING:
+    from app.services.protocols import ValuationServiceProtocol
+
+logger = logging.getLogger(__name__)
+
+ExportFormat = Literal["csv", "parquet", "arrow"]
+
+EXPORT_MEDIA_TYPES: dict[str, str] = {
+    "csv": "text/csv; charset=utf-8",
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+
+EXPORT_FILE_EXTENSIONS: dict[str, str] = {
+    "csv": "csv",
+    "parquet": "parquet",
+    "arrow": "arrows",
+}
+
+# Decimals are written to Parquet / Arrow as decimal128 with this scale,
+# matching the Numeric(18, 8) columns they come from
+_DECIMAL_PRECISION = 38
+_DECIMAL_SCALE = 8
+_DECIMAL_QUANTUM = Decimal(1).scaleb(-_DECIMAL_SCALE)
+
+
+@dataclass(frozen=True)
+class ExportColumn:
+    """
+    One column of an export file.
+
+    Attributes:
+        name: Header / field name
+        kind: "int", "str", "bool", "decimal", "date" or "datetime"
+    """
+
+    name: str
+    kind: str
+
+
+TRANSACTION_COLUMNS: tuple[ExportColumn, ...] = (
+    ExportColumn("id", "int"),
+    ExportColumn("date", "datetime"),
+    ExportColumn("transaction_type", "str"),
+    ExportColumn("ticker", "str"),
+    ExportColumn("exchange", "str"),
+    ExportColumn("quantity", "decimal"),
+    ExportColumn("price_per_share", "decimal"),
+    ExportColumn("currency", "str"),
+    ExportColumn("fee", "decimal"),
+    ExportColumn("fee_currency", "str"),
+    ExportColumn("exchange_rate", "decimal"),
+)
+
+HOLDING_COLUMNS: tuple[ExportColumn, ...] = (
+    ExportColumn("valuation_date", "date"),
+    ExportColumn("asset_id", "int"),
+    ExportColumn("ticker", "str"),
+    ExportColumn("exchange", "str"),
+    ExportColumn("asset_name", "str"),
+    ExportColumn("asset_class", "str"),
+    ExportColumn("asset_currency", "str"),
+    ExportColumn("quantity", "decimal"),
+    ExportColumn("avg_cost_per_share", "decimal"),
+    ExportColumn("cost_basis", "decimal"),
+    ExportColumn("price", "decimal"),
+    ExportColumn("price_date", "date"),
+    ExportColumn("value", "decimal"),
+    ExportColumn("unrealized_pnl", "decimal"),
+    ExportColumn("realized_pnl", "decimal"),
+    ExportColumn("portfolio_currency", "str"),
+    ExportColumn("has_complete_data", "bool"),
+    ExportColumn("price_is_synthetic", "bool"),
+)
+
+HISTORY_COLUMNS: tuple[ExportColumn, ...] = (
+    ExportColumn("date", "date"),
+    ExportColumn("value", "decimal"),
+    ExportColumn("cash", "decimal"),
+    ExportColumn("equity", "decimal"),
+    ExportColumn("cost_basis", "decimal"),
+    ExportColumn("net_invested", "decimal"),
+    ExportColumn("unrealized_pnl", "decimal"),
+    ExportColumn("realized_pnl", "decimal"),
+    ExportColumn("total_pnl", "decimal"),
+    ExportColumn("drawdown", "decimal"),
+    ExportColumn("has_complete_data", "bool"),
+    ExportColumn("has_synthetic_data", "bool"),
+)
+
+
+class ExportService:
+    """
+    Builds streaming exports of portfolio data.
+
+    Each stream_* method validates its input eagerly (raising before any
+    byte is produced, so routers can still answer with an error status)
+    and returns an iterator of encoded chunks.
+
+    Attributes:
+        _valuation_service: Source of holdings and history
+    """
+
+    def __init__(self, valuation_service: ValuationServiceProtocol) -> None:
+        self._valuation_service = valuation_service
+
+    def stream_transactions(
+            self,
+            db: Session,
+            portfolio_id: int,
+            export_format: ExportFormat,
+    ) -> Iterator[bytes]:
+        """
+        Export all of a portfolio's transactions, oldest first.
+
+        The db session must stay open until the iterator is exhausted.
+        """
+        check_format_available(export_format)
+
+        query = (
+            select(
+                Transaction.id,
+                Transaction.date,
+                Transaction.transaction_type,
+                Asset.ticker,
+                Asset.exchange,
+                Transaction.quantity,
+                Transaction.price_per_share,
+                Transaction.currency,
+                Transaction.fee,
+                Transaction.fee_currency,
+                Transaction.exchange_rate,
+            )
+            .outerjoin(Asset, Asset.id == Transaction.asset_id)
+            .where(Transaction.portfolio_id == portfolio_id)
+            .order_by(Transaction.date, Transaction.id)
+            .execution_options(yield_per=EXPORT_BATCH_ROWS)
+        )
+
+        def rows() -> Iterator[tuple]:
+            for row in db.execute(query):
+                yield (row[0], row[1], row[2].value, *row[3:])
+
+        return encode_rows(TRANSACTION_COLUMNS, rows(), export_format)
+
+    def stream_holdings(
+            self,
+            db: Session,
+            portfolio_id: int,
+            valuation_date: date | None,
+            export_format: ExportFormat,
+            context: PortfolioDataContext | None = None,
+    ) -> Iterator[bytes]:
+        """Export the holdings of a valuation on valuation_date (default: today)."""
+        check_format_available(export_format)
+
+        valuation = self._valuation_service.get_valuation(
+            db=db,
+            portfolio_id=portfolio_id,
+            valuation_date=valuation_date,
+            context=context,
+        )
+
+        rows = (
+            (
+                valuation.valuation_date,
+                h.asset_id,
+                h.ticker,
+                h.exchange,
+                h.asset_name,
+                h.asset_class,
+                h.asset_currency,
+                h.quantity,
+                h.cost_basis.avg_cost_per_share,
+                h.cost_basis.portfolio_amount,
+                h.current_value.price,
+                h.current_value.price_date,
+                h.current_value.portfolio_amount,
+                h.pnl.unrealized_amount,
+                h.pnl.realized_amount,
+                valuation.portfolio_currency,
+                h.has_complete_data,
+                h.price_is_synthetic,
+            )
+            for h in valuation.holdings
+        )
+        return encode_rows(HOLDING_COLUMNS, rows, export_format)
+
+    def stream_history(
+            self,
+            db: Session,
+            portfolio_id: int,
+            start_date: date,
+            end_date: date,
+            interval: str,
+            export_format: ExportFormat,
+            context: PortfolioDataContext | None = None,
+    ) -> Iterator[bytes]:
+        """
+        Export the valuation history series, calculated while streaming.
+
+        Raises:
+            PortfolioNotFoundError: If the portfolio does not exist
+            InvalidIntervalError: If interval is not supported
+        """
+        check_format_available(export_format)
+
+        points = self._valuation_service.iter_history(
+            db=db,
+            portfolio_id=portfolio_id,
+            start_date=start_date,
+            end_date=end_date,
+            interval=interval,
+            context=context,
+        )
+
+        rows = (
+            (
+                p.date,
+                p.value,
+                p.cash,
+                p.equity,
+                p.cost_basis,
+                p.net_invested,
+                p.unrealized_pnl,
+                p.realized_pnl,
+                p.total_pnl,
+                p.drawdown,
+                p.has_complete_data,
+                p.has_synthetic_data,
+            )
+            for p in points
+        )
+        return encode_rows(HISTORY_COLUMNS, rows, export_format)
+
+
+# =============================================================================
+# ENCODING
+# =============================================================================
+
+def check_format_available(export_format: ExportFormat) -> None:
+    """
+    Raise if export_format cannot be produced on this server.
+
+    Raises:
+        ValidationError: For parquet / arrow when pyarrow is not installed
+    """
+    if export_format == "csv":
+        return
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        raise ValidationError(
+            f"{export_format} export requires pyarrow, which is not installed on this server",
+            field="format",
+        )
+
+
+def encode_rows(
+        columns: tuple[ExportColumn, ...],
+        rows: Iterable[tuple],
+        export_format: ExportFormat,
+) -> Iterator[bytes]:
+    """
+    Encode rows (tuples in column order) as export_format, batch by batch.
+
+    Returns:
+        Iterator of byte chunks; concatenated they form the file
+    """
+    if export_format == "csv":
+        return _encode_csv(columns, rows)
+    return _encode_arrow(columns, rows, parquet=export_format == "parquet")
+
+
+def _batched(rows: Iterable[tuple]) -> Iterator[list[tuple]]:
+    batch: list[tuple] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == EXPORT_BATCH_ROWS:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def _encode_csv(columns: tuple[ExportColumn, ...], rows: Iterable[tuple]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+
+    writer.writerow([column.name for column in columns])
+    yield buffer.getvalue().encode("utf-8")
+
+    for batch in _batched(rows):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([_csv_value(value) for value in row] for row in batch)
+        yield buffer.getvalue().encode("utf-8")
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file object whose written bytes are drained after each batch."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _arrow_type(kind: str):
+    import pyarrow as pa
+
+    return {
+        "int": pa.int64(),
+        "str": pa.string(),
+        "bool": pa.bool_(),
+        "decimal": pa.decimal128(_DECIMAL_PRECISION, _DECIMAL_SCALE),
+        "date": pa.date32(),
+        "datetime": pa.timestamp("us"),
+    }[kind]
+
+
+def _arrow_value(kind: str, value: Any) -> Any:
+    if value is None:
+        return None
+    if kind == "decimal":
+        return Decimal(value).quantize(_DECIMAL_QUANTUM)
+    if kind == "datetime" and value.tzinfo is not None:
+        return value.replace(tzinfo=None)
+    return value
+
+
+def _encode_arrow(
+        columns: tuple[ExportColumn, ...],
+        rows: Iterable[tuple],
+        parquet: bool,
+) -> Iterator[bytes]:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet
+
+    schema = pa.schema([(column.name, _arrow_type(column.kind)) for column in columns])
+    sink = _ChunkSink()
+    if parquet:
+        writer = pyarrow.parquet.ParquetWriter(sink, schema)
+    else:
+        writer = pyarrow.ipc.new_stream(sink, schema)
+
+    try:
+        for batch in _batched(rows):
+            arrays = [
+                pa.array(
+                    [_arrow_value(column.kind, row[i]) for row in batch],
+                    type=schema.field(i).type,
+                )
+                for i, column in enumerate(columns)
+            ]
+            writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
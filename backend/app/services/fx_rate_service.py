@@ -96,11 +96,12 @@ from sqlalchemy import select, and_, func
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
-from app.models import ExchangeRate, Transaction, Asset, Portfolio
+from app.models import ExchangeRate, ExchangeRateCoverage, Transaction, Asset, Portfolio
 from app.services.exceptions import FXRateNotFoundError, FXProviderError, FXConversionError
 from app.services.market_data.base import MarketDataProvider
 from app.services.constants import FX_FALLBACK_DAYS
-from app.utils.date_utils import get_business_days
+from app.utils.date_utils import merge_date_ranges, subtract_date_ranges
+from app.utils.trading_calendar import get_fx_calendar
 
 logger = logging.getLogger(__name__)
 
@@ -208,8 +209,8 @@ class FXRateService:
         """
         Fetch and store FX rates for a currency pair and date range.
 
-        Also stores "no data" markers for dates that have no FX data
-        (holidays, weekends) to prevent repeated API calls.
+        The fetched range is recorded in exchange_rate_coverage so dates
+        without FX data (holidays) are not requested again.
 
         Args:
             db: Database session
@@ -217,7 +218,7 @@ class FXRateService:
             quote_currency: Quote currency code (e.g., "EUR")
             start_date: Start of date range (inclusive)
             end_date: End of date range (inclusive)
-            force: If True, re-fetch all dates (clears no-data markers first).
+            force: If True, re-fetch all dates regardless of recorded coverage.
 
         Returns:
             FXSyncResult with sync statistics
@@ -242,30 +243,34 @@ class FXRateService:
 
         logger.info(f"Syncing FX rates: {base}/{quote} from {start_date} to {end_date}")
 
-        # For force sync, clear existing no-data markers to allow re-fetching
+        # Force sync ignores recorded coverage and re-fetches everything
         if force:
-            self._clear_no_data_markers(db, base, quote, start_date, end_date)
-            dates_to_fetch = get_business_days(start_date, end_date)
+            covered: list[tuple[date, date]] = []
         else:
-            existing_dates = self._get_existing_dates(db, base, quote, start_date, end_date)
-            all_dates = get_business_days(start_date, end_date)
-            dates_to_fetch = [d for d in all_dates if d not in existing_dates]
+            covered = self._get_coverage_intervals(db, base, quote, start_date, end_date)
 
-        if not dates_to_fetch:
+        # FX markets only close on New Year's Day and Christmas
+        missing_ranges = subtract_date_ranges(
+            start_date, end_date, covered, get_fx_calendar().is_trading_day
+        )
+
+        if not missing_ranges:
             logger.info(f"No missing dates for {base}/{quote}")
             return result
 
-        logger.info(f"Fetching {len(dates_to_fetch)} dates for {base}/{quote}")
+        # One provider call spanning all gaps (FX history is cheap to over-fetch)
+        fetch_start = missing_ranges[0][0]
+        fetch_end = missing_ranges[-1][1]
 
-        # Track requested dates to identify dates with no data
-        requested_dates = set(dates_to_fetch)
+        logger.info(
+            f"Fetching {base}/{quote} from {fetch_start} to {fetch_end} "
+            f"({len(missing_ranges)} missing range(s))"
+        )
 
         # Fetch from market data provider
         try:
-            rates = self._fetch_rates_from_provider(
-                base, quote,
-                min(dates_to_fetch),
-                max(dates_to_fetch)
+            rates, provider_name = self._fetch_rates_from_provider(
+                base, quote, fetch_start, fetch_end
             )
             result.rates_fetched = len(rates)
         except FXProviderError as e:
@@ -273,26 +278,18 @@ class FXRateService:
             logger.error(f"Provider error: {e}")
             return result
 
-        # Store rates in database (even if empty, we'll store markers)
+        # Record coverage first so it commits together with the rates
+        self._record_coverage(db, base, quote, fetch_start, fetch_end, provider_name)
+
         if rates:
-            inserted, updated = self._upsert_rates(db, base, quote, rates)
+            inserted, updated = self._upsert_rates(db, base, quote, rates, provider_name)
             result.rates_inserted = inserted
             result.rates_updated = updated
-
-        # Identify dates that were requested but had no data returned
-        dates_with_data = set(rates.keys()) if rates else set()
-        dates_with_no_data = sorted(requested_dates - dates_with_data)
-
-        # Store "no data" markers to prevent re-fetching these dates
-        if dates_with_no_data:
-            self._store_no_data_markers(db, base, quote, dates_with_no_data)
-            logger.debug(
-                f"Marked {len(dates_with_no_data)} dates as no-data for {base}/{quote}"
-            )
+        else:
+            db.commit()
 
         logger.info(
-            f"Sync complete: {base}/{quote} - "
-            f"fetched={result.rates_fetched}, no-data markers={len(dates_with_no_data)}"
+            f"Sync complete: {base}/{quote} - fetched={result.rates_fetched}"
         )
 
         return result
@@ -675,7 +672,7 @@ class FXRateService:
             quote_currency: str,
             start_date: date,
             end_date: date,
-    ) -> dict[date, Decimal]:
+    ) -> tuple[dict[date, Decimal], str]:
         """
         Fetch FX rates from the market data provider.
 
@@ -686,7 +683,8 @@ class FXRateService:
             end_date: End date
 
         Returns:
-            Dict mapping date -> rate (Decimal)
+            Tuple of (dict mapping date -> rate, name of the provider that
+            answered - a composite provider's fallback, or ours)
 
         Raises:
             FXProviderError: If provider fails
@@ -707,24 +705,6 @@ class FXRateService:
                 start_date=start_date,
                 end_date=end_date,
             )
-
-            if not result.success:
-                logger.warning(f"Provider returned error for {symbol}: {result.error}")
-                return {}
-
-            if not result.prices:
-                logger.warning(f"No data returned for {symbol}")
-                return {}
-
-            # Extract close prices from OHLCV data
-            rates = {}
-            for ohlcv in result.prices:
-                # Use close price as the FX rate
-                rates[ohlcv.date] = ohlcv.close
-
-            logger.debug(f"Fetched {len(rates)} rates for {symbol}")
-            return rates
-
         except Exception as e:
             logger.error(f"Provider error for {symbol}: {e}")
             raise FXProviderError(
@@ -732,36 +712,57 @@ class FXRateService:
                 reason=f"Failed to fetch {symbol}: {e}"
             )
 
+        # A failed fetch must not be recorded as coverage, so surface it
+        if not result.success:
+            logger.warning(f"Provider returned error for {symbol}: {result.error}")
+            raise FXProviderError(
+                provider=self._provider.name,
+                reason=f"Failed to fetch {symbol}: {result.error}"
+            )
+
+        provider_name = result.provider if isinstance(result.provider, str) else self._provider.name
+
+        if not result.prices:
+            logger.warning(f"No data returned for {symbol}")
+            return {}, provider_name
+
+        # Extract close prices from OHLCV data
+        rates = {}
+        for ohlcv in result.prices:
+            # Use close price as the FX rate
+            rates[ohlcv.date] = ohlcv.close
+
+        logger.debug(f"Fetched {len(rates)} rates for {symbol}")
+        return rates, provider_name
+
     # =========================================================================
     # PRIVATE METHODS - Database
     # =========================================================================
 
-    def _get_existing_dates(
+    def _get_coverage_intervals(
             self,
             db: Session,
             base_currency: str,
             quote_currency: str,
             start_date: date,
             end_date: date,
-    ) -> set[date]:
-        """Get dates that already have rates in the database."""
-        query = (
-            select(ExchangeRate.date)
+    ) -> list[tuple[date, date]]:
+        """Get fetched intervals for a pair that overlap a date range."""
+        rows = db.execute(
+            select(ExchangeRateCoverage.start_date, ExchangeRateCoverage.end_date)
             .where(
                 and_(
-                    ExchangeRate.base_currency == base_currency,
-                    ExchangeRate.quote_currency == quote_currency,
-                    func.date(ExchangeRate.date) >= start_date,
-                    func.date(ExchangeRate.date) <= end_date,
+                    ExchangeRateCoverage.base_currency == base_currency,
+                    ExchangeRateCoverage.quote_currency == quote_currency,
+                    ExchangeRateCoverage.provider == self._provider.name,
+                    ExchangeRateCoverage.start_date <= end_date,
+                    ExchangeRateCoverage.end_date >= start_date,
                 )
             )
-        )
+            .order_by(ExchangeRateCoverage.start_date)
+        ).all()
 
-        dates = set()
-        for dt in db.scalars(query).all():
-            dates.add(self._extract_date(dt))
-
-        return dates
+        return [(row.start_date, row.end_date) for row in rows]
 
     def _get_rates_in_range(
             self,
@@ -899,11 +900,13 @@ class FXRateService:
             base_currency: str,
             quote_currency: str,
             rates: dict[date, Decimal],
+            provider_name: str,
     ) -> tuple[int, int]:
         """
         Insert or update rates in the database.
 
-        Uses PostgreSQL ON CONFLICT for efficient upsert.
+        Uses PostgreSQL ON CONFLICT for efficient upsert. Rows record
+        provider_name, the provider that supplied the rates.
 
         Returns:
             Tuple of (inserted_count, updated_count)
@@ -918,7 +921,7 @@ class FXRateService:
                 "quote_currency": quote_currency,
                 "date": rate_date,
                 "rate": rate,
-                "provider": self._provider.name,
+                "provider": provider_name,
             }
             for rate_date, rate in rates.items()
         ]
@@ -939,111 +942,60 @@ class FXRateService:
         # PostgreSQL doesn't easily distinguish inserts vs updates in upsert
         return len(rates), 0
 
-    def _store_no_data_markers(
-            self,
-            db: Session,
-            base_currency: str,
-            quote_currency: str,
-            dates_with_no_data: list[date],
-    ) -> int:
-        """
-        Store markers for dates where no FX rate data is available.
-
-        These markers prevent repeated API calls for holidays and weekends.
-
-        Args:
-            db: Database session
-            base_currency: Base currency code
-            quote_currency: Quote currency code
-            dates_with_no_data: Dates that had no data from API
-
-        Returns:
-            Number of markers stored
-        """
-        if not dates_with_no_data:
-            return 0
-
-        records = [
-            {
-                "base_currency": base_currency,
-                "quote_currency": quote_currency,
-                "date": d,
-                "rate": None,
-                "no_data_available": True,
-                "provider": self._provider.name,
-            }
-            for d in dates_with_no_data
-        ]
-
-        try:
-            stmt = pg_insert(ExchangeRate).values(records)
-            upsert_stmt = stmt.on_conflict_do_update(
-                constraint="uq_exchange_rate_pair_date",
-                set_={
-                    "no_data_available": True,
-                    "rate": None,
-                },
-            )
-            db.execute(upsert_stmt)
-            db.commit()
-
-            logger.debug(
-                f"Stored {len(records)} no-data markers for {base_currency}/{quote_currency}"
-            )
-            return len(records)
-
-        except Exception as e:
-            logger.error(f"Error storing FX no-data markers: {e}")
-            db.rollback()
-            return 0
-
-    def _clear_no_data_markers(
+    def _record_coverage(
             self,
             db: Session,
             base_currency: str,
             quote_currency: str,
             start_date: date,
             end_date: date,
-    ) -> int:
+            provider_name: str,
+    ) -> None:
         """
-        Clear no-data markers for a currency pair to allow re-fetching.
+        Record a fetched date range for a currency pair.
 
-        Used during full re-sync.
+        Merges the range with existing intervals it overlaps or touches
+        (weekends in between are ignored). Does not commit.
 
         Args:
             db: Database session
             base_currency: Base currency code
             quote_currency: Quote currency code
-            start_date: Start of range to clear
-            end_date: End of range to clear
-
-        Returns:
-            Number of markers cleared
+            start_date: First fetched date
+            end_date: Last fetched date
+            provider_name: Provider that supplied the range
         """
-        try:
-            result = db.execute(
-                ExchangeRate.__table__.delete().where(
-                    and_(
-                        ExchangeRate.base_currency == base_currency,
-                        ExchangeRate.quote_currency == quote_currency,
-                        ExchangeRate.date >= start_date,
-                        ExchangeRate.date <= end_date,
-                        ExchangeRate.no_data_available == True,
-                    )
+
+        existing = db.scalars(
+            select(ExchangeRateCoverage).where(
+                and_(
+                    ExchangeRateCoverage.base_currency == base_currency,
+                    ExchangeRateCoverage.quote_currency == quote_currency,
+                    ExchangeRateCoverage.provider == provider_name,
+                    ExchangeRateCoverage.start_date <= end_date + timedelta(days=7),
+                    ExchangeRateCoverage.end_date >= start_date - timedelta(days=7),
                 )
             )
-            db.commit()
-            deleted = result.rowcount
-            if deleted > 0:
-                logger.debug(
-                    f"Cleared {deleted} FX no-data markers for {base_currency}/{quote_currency}"
-                )
-            return deleted
+        ).all()
 
-        except Exception as e:
-            logger.error(f"Error clearing FX no-data markers: {e}")
-            db.rollback()
-            return 0
+        merged = merge_date_ranges(
+            [(row.start_date, row.end_date) for row in existing] + [(start_date, end_date)],
+            get_fx_calendar().is_trading_day,
+        )
+
+        for row in existing:
+            db.delete(row)
+        db.add_all([
+            ExchangeRateCoverage(
+                base_currency=base_currency,
+                quote_currency=quote_currency,
+                provider=provider_name,
+                start_date=start,
+                end_date=end,
+            )
+            for start, end in merged
+        ])
+        db.flush()
 
     @staticmethod
     def _extract_date(dt: datetime | date | None) -> date | None:
@@ -0,0 +1,173 @@
+# backend/app/services/latency_histogram.py
+"""
+Fixed-bucket latency histogram for outbound calls.
+
+Records how long calls to an external service take so callers can make
+decisions from the observed distribution (e.g. when to send a hedged
+request) and so the distribution can be exposed for monitoring.
+
+Buckets are cumulative upper bounds in seconds, like a Prometheus
+histogram. Percentiles are estimated as the upper bound of the bucket the
+requested rank falls into, capped at the largest latency actually seen.
+Memory use is constant no matter how many samples are recorded.
+
+Usage:
+    from app.services.latency_histogram import LatencyHistogram
+
+    histogram = LatencyHistogram(name="yahoo")
+
+    started = time.monotonic()
+    try:
+        result = call_external_service()
+    except Exception:
+        histogram.record_error()
+        raise
+    histogram.record(time.monotonic() - started)
+
+    histogram.percentile(0.95)  # -> seconds, or None before any samples
+"""
+
+import bisect
+import threading
+from dataclasses import dataclass, field
+
+# Default bucket upper bounds in seconds (5ms .. 60s, roughly x2.5 steps)
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+
+@dataclass
+class LatencyHistogramStats:
+    """
+    Snapshot of a latency histogram for monitoring.
+
+    Attributes:
+        count: Number of recorded latencies
+        errors: Number of calls that failed without a usable latency
+        mean_seconds: Average latency (None before any samples)
+        p50_seconds: Estimated median latency
+        p95_seconds: Estimated 95th percentile latency
+        p99_seconds: Estimated 99th percentile latency
+        max_seconds: Largest latency recorded
+        buckets: Mapping of bucket upper bound to cumulative count
+    """
+    count: int
+    errors: int
+    mean_seconds: float | None
+    p50_seconds: float | None
+    p95_seconds: float | None
+    p99_seconds: float | None
+    max_seconds: float | None
+    buckets: dict[float, int] = field(default_factory=dict)
+
+
+@dataclass
+class LatencyHistogram:
+    """
+    Thread-safe latency histogram with fixed buckets.
+
+    Attributes:
+        name: Identifier for the measured service (used in stats)
+        buckets: Sorted bucket upper bounds in seconds; latencies above the
+                 last bound go to an overflow bucket
+    """
+
+    name: str
+    buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS
+
+    # Internal state (not part of constructor)
+    _counts: list[int] = field(default_factory=list, init=False)
+    _count: int = field(default=0, init=False)
+    _sum: float = field(default=0.0, init=False)
+    _max: float = field(default=0.0, init=False)
+    _errors: int = field(default=0, init=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False)
+
+    def __post_init__(self) -> None:
+        """Validate buckets and allocate counters (+1 for overflow)."""
+        if not self.buckets:
+            raise ValueError("buckets must not be empty")
+        if any(b <= 0 for b in self.buckets) or list(self.buckets) != sorted(set(self.buckets)):
+            raise ValueError("buckets must be positive and strictly increasing")
+        self._counts = [0] * (len(self.buckets) + 1)
+
+    @property
+    def count(self) -> int:
+        """Number of recorded latencies."""
+        with self._lock:
+            return self._count
+
+    def record(self, seconds: float) -> None:
+        """Record the latency of a completed call."""
+        seconds = max(0.0, seconds)
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += seconds
+            self._max = max(self._max, seconds)
+
+    def record_error(self) -> None:
+        """Record a failed call (not included in the latency distribution)."""
+        with self._lock:
+            self._errors += 1
+
+    def percentile(self, quantile: float) -> float | None:
+        """
+        Estimate a latency percentile.
+
+        Args:
+            quantile: Fraction between 0 and 1 (e.g. 0.95 for p95)
+
+        Returns:
+            Estimated latency in seconds, or None if nothing was recorded
+        """
+        if not 0 < quantile <= 1:
+            raise ValueError("quantile must be in (0, 1]")
+        with self._lock:
+            return self._percentile(quantile)
+
+    def _percentile(self, quantile: float) -> float | None:
+        """Percentile estimate. Must hold the lock."""
+        if self._count == 0:
+            return None
+        rank = quantile * self._count
+        cumulative = 0
+        for index, bucket_count in enumerate(self._counts):
+            cumulative += bucket_count
+            if cumulative >= rank:
+                if index < len(self.buckets):
+                    return min(self.buckets[index], self._max)
+                return self._max
+        return self._max
+
+    @property
+    def stats(self) -> LatencyHistogramStats:
+        """Get a snapshot of the distribution."""
+        with self._lock:
+            cumulative = 0
+            buckets: dict[float, int] = {}
+            for bound, bucket_count in zip(self.buckets, self._counts):
+                cumulative += bucket_count
+                buckets[bound] = cumulative
+            return LatencyHistogramStats(
+                count=self._count,
+                errors=self._errors,
+                mean_seconds=self._sum / self._count if self._count else None,
+                p50_seconds=self._percentile(0.5),
+                p95_seconds=self._percentile(0.95),
+                p99_seconds=self._percentile(0.99),
+                max_seconds=self._max if self._count else None,
+                buckets=buckets,
+            )
+
+    def reset(self) -> None:
+        """Discard all recorded samples."""
+        with self._lock:
+            self._counts = [0] * (len(self.buckets) + 1)
+            self._count = 0
+            self._sum = 0.0
+            self._max = 0.0
+            self._errors = 0
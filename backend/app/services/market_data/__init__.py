@@ -5,7 +5,12 @@ Market data services package.
 This package contains:
 - Abstract interface for market data providers (base.py)
 - Yahoo Finance implementation (yahoo.py)
+- Local record/replay provider (replay.py)
+- Composite provider with hedged requests and fallback (composite.py)
 - Market data sync orchestration (sync_service.py)
+- Durable sync job queue for background workers (job_queue.py)
+- Memory-mapped columnar price store for fast reads (price_store.py)
+- Process-wide versioned price series cache (price_cache.py)
 
 Usage:
     # Provider interface and data classes
@@ -20,6 +25,12 @@ Usage:
     # Yahoo Finance provider
     from app.services.market_data import YahooFinanceProvider
 
+    # Yahoo with a recorded snapshot as hedge/fallback
+    from app.services.market_data import (
+        CompositeMarketDataProvider,
+        ReplayMarketDataProvider,
+    )
+
     # Sync service
     from app.services.market_data import (
         MarketDataSyncService,
@@ -27,15 +38,38 @@ Usage:
         PortfolioAnalysis,
     )
 
+    # Sync job queue
+    from app.services.market_data import SyncJobQueue
+
+    # Local columnar price store
+    from app.services.market_data import ColumnarPriceStore
+
+    # Shared in-process price series cache
+    from app.services.market_data import PriceSeriesCache, bump_price_versions
+
 Architecture:
     MarketDataProvider (ABC)
     └── YahooFinanceProvider (concrete)
+    └── ReplayMarketDataProvider (recorded files)
+    └── CompositeMarketDataProvider (hedges/falls back across the above)
     └── BloombergProvider (future)
 
     MarketDataSyncService
     └── Orchestrates price fetching
     └── Uses FXRateService for FX rates
     └── Updates SyncStatus
+
+    SyncJobQueue
+    └── Queues sync requests from the API (sync_jobs table)
+    └── Claimed and run by app.worker processes
+
+    ColumnarPriceStore
+    └── Rewritten by MarketDataSyncService after each sync
+    └── Read by history and analytics before falling back to the database
+
+    PriceSeriesCache
+    └── Read through by PortfolioDataContext for assets not in the store
+    └── Invalidated by assets.price_version, bumped on every price write
 """
 
 # Base provider interface and data classes
@@ -55,8 +89,19 @@ from app.services.market_data.sync_service import (
     PortfolioAnalysis,
     AssetSyncInfo,
 )
+# Sync job queue
+from app.services.market_data.job_queue import SyncJobQueue
+# Local price store
+from app.services.market_data.price_store import ColumnarPriceStore
+# Shared price series cache
+from app.services.market_data.price_cache import PriceSeriesCache, bump_price_versions
 # Concrete implementations
 from app.services.market_data.yahoo import YahooFinanceProvider
+from app.services.market_data.replay import ReplayMarketDataProvider
+from app.services.market_data.composite import (
+    CompositeMarketDataProvider,
+    CompositeProviderStats,
+)
 
 __all__ = [
     # Abstract interface
@@ -70,10 +115,20 @@ __all__ = [
     "BatchPricesResult",
     # Concrete implementations
     "YahooFinanceProvider",
+    "ReplayMarketDataProvider",
+    "CompositeMarketDataProvider",
+    "CompositeProviderStats",
     # Sync service
     "MarketDataSyncService",
     "SyncResult",
     "AssetSyncResult",
     "PortfolioAnalysis",
     "AssetSyncInfo",
+    # Sync job queue
+    "SyncJobQueue",
+    # Local price store
+    "ColumnarPriceStore",
+    # Shared price series cache
+    "PriceSeriesCache",
+    "bump_price_versions",
 ]
@@ -18,7 +18,7 @@ Design Principles:
 
 import logging
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import date
 from decimal import Decimal
 from typing import TypeVar, Callable, Any
@@ -32,18 +32,25 @@ from tenacity import (
 )
 
 from app.models import AssetClass
-from app.services.circuit_breaker import CircuitBreaker, CircuitBreakerOpen
+from app.services.circuit_breaker import CircuitBreaker, CircuitBreakerOpen, CircuitBreakerStats
 from app.services.constants import (
     CIRCUIT_BREAKER_FAILURE_THRESHOLD,
     CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
     CIRCUIT_BREAKER_HALF_OPEN_MAX_CALLS,
     CIRCUIT_BREAKER_FAILURE_WINDOW,
+    MARKET_DATA_RATE_LIMIT_PER_SECOND,
+    MARKET_DATA_RATE_LIMIT_BURST,
+    MARKET_DATA_RATE_LIMIT_MIN_PER_SECOND,
+    MARKET_DATA_RATE_LIMIT_BACKOFF_FACTOR,
+    MARKET_DATA_RATE_LIMIT_RECOVERY_STEP,
+    MARKET_DATA_RATE_LIMIT_RECOVERY_INTERVAL,
 )
 from app.services.exceptions import (
     ProviderUnavailableError,
     RateLimitError,
     TickerNotFoundError,
 )
+from app.services.rate_limiter import TokenBucket
 
 logger = logging.getLogger(__name__)
 
@@ -181,6 +188,8 @@ class HistoricalPricesResult:
         to_date: Requested end date
         actual_from_date: Actual earliest date in returned data
         actual_to_date: Actual latest date in returned data
+        provider: Name of the provider that supplied the prices, if it is
+                  not the one called (set by CompositeMarketDataProvider)
     """
 
     ticker: str
@@ -192,6 +201,7 @@ class HistoricalPricesResult:
     to_date: date | None = None
     actual_from_date: date | None = None
     actual_to_date: date | None = None
+    provider: str | None = None
 
     def __post_init__(self) -> None:
         """Set actual date range from prices if not provided."""
@@ -248,6 +258,14 @@ class MarketDataProvider(ABC):
     Resilience Features:
         1. Circuit Breaker: Stops requests to failing services, allowing recovery
         2. Retry with Backoff: Automatic retries for transient failures
+        3. Request Pacing: Token bucket spaces out requests before they are sent
+
+    Request Pacing:
+        Every attempt (including retries) takes a token from a per-provider
+        bucket, so all services sharing the singleton provider share one
+        request budget. A RateLimitError halves the rate; successful calls
+        restore it gradually. Override RATE_LIMIT_* class attributes to tune
+        per provider (RATE_LIMIT_PER_SECOND = None disables pacing).
 
     Circuit Breaker Behavior:
         - Opens after CIRCUIT_BREAKER_FAILURE_THRESHOLD failures
@@ -290,10 +308,19 @@ class MarketDataProvider(ABC):
     MAX_BATCH_SIZE: int = 100
 
     # =========================================================================
-    # CIRCUIT BREAKER (initialized per-provider instance)
+    # REQUEST PACING CONFIGURATION (can be overridden by subclasses)
+    # =========================================================================
+
+    RATE_LIMIT_PER_SECOND: float | None = MARKET_DATA_RATE_LIMIT_PER_SECOND
+    RATE_LIMIT_BURST: float = MARKET_DATA_RATE_LIMIT_BURST
+    RATE_LIMIT_MIN_PER_SECOND: float = MARKET_DATA_RATE_LIMIT_MIN_PER_SECOND
+
+    # =========================================================================
+    # CIRCUIT BREAKER AND RATE LIMITER (initialized per-provider instance)
     # =========================================================================
 
     _circuit_breaker: CircuitBreaker | None = None
+    _rate_limiter: TokenBucket | None = None
 
     def _get_circuit_breaker(self) -> CircuitBreaker:
         """
@@ -314,10 +341,38 @@ class MarketDataProvider(ABC):
             )
         return self._circuit_breaker
 
+    def _get_rate_limiter(self) -> TokenBucket | None:
+        """
+        Get or create the request pacer for this provider.
+
+        Lazily initialized like the circuit breaker. Returns None when
+        RATE_LIMIT_PER_SECOND is None (pacing disabled).
+        """
+        if self._rate_limiter is None and self.RATE_LIMIT_PER_SECOND is not None:
+            self._rate_limiter = TokenBucket(
+                name=f"market-data-{self.name}",
+                max_rate=self.RATE_LIMIT_PER_SECOND,
+                capacity=self.RATE_LIMIT_BURST,
+                min_rate=min(self.RATE_LIMIT_MIN_PER_SECOND, self.RATE_LIMIT_PER_SECOND),
+                backoff_factor=MARKET_DATA_RATE_LIMIT_BACKOFF_FACTOR,
+                recovery_step=MARKET_DATA_RATE_LIMIT_RECOVERY_STEP,
+                recovery_interval=MARKET_DATA_RATE_LIMIT_RECOVERY_INTERVAL,
+            )
+        return self._rate_limiter
+
     @property
-    def circuit_breaker_stats(self):
-        """Get circuit breaker statistics for monitoring."""
-        return self._get_circuit_breaker().stats
+    def circuit_breaker_stats(self) -> CircuitBreakerStats:
+        """
+        Get circuit breaker statistics for monitoring.
+
+        Includes request pacing stats (current rate, queue depth) in
+        `rate_limiter` when pacing is enabled.
+        """
+        stats = self._get_circuit_breaker().stats
+        rate_limiter = self._get_rate_limiter()
+        if rate_limiter is not None:
+            stats = replace(stats, rate_limiter=rate_limiter.stats)
+        return stats
 
     # =========================================================================
     # ABSTRACT PROPERTIES AND METHODS
@@ -455,6 +510,7 @@ class MarketDataProvider(ABC):
         Protection layers (outer to inner):
         1. Circuit Breaker - Blocks requests when service is failing
         2. Retry with Backoff - Retries transient failures
+        3. Token Bucket - Paces each attempt; slows down on RateLimitError
 
         Uses exponential backoff for retryable exceptions:
         - ProviderUnavailableError
@@ -478,6 +534,7 @@ class MarketDataProvider(ABC):
             The last exception if all retries fail
         """
         circuit_breaker = self._get_circuit_breaker()
+        rate_limiter = self._get_rate_limiter()
 
         @retry(
             stop=stop_after_attempt(self.MAX_RETRY_ATTEMPTS),
@@ -491,7 +548,17 @@ class MarketDataProvider(ABC):
             reraise=True,
         )
         def _inner_with_retry() -> T:
-            return func(*args, **kwargs)
+            if rate_limiter is None:
+                return func(*args, **kwargs)
+
+            rate_limiter.acquire()
+            try:
+                result = func(*args, **kwargs)
+            except RateLimitError:
+                rate_limiter.throttled()
+                raise
+            rate_limiter.succeeded()
+            return result
 
         # Circuit breaker wraps the retry logic
         with circuit_breaker:
@@ -0,0 +1,422 @@
+# backend/app/services/market_data/composite.py
+"""
+Composite market data provider with hedged requests and fallback.
+
+Wraps an ordered list of providers (e.g. Yahoo Finance, then a local
+replay snapshot) behind the MarketDataProvider interface:
+
+Fallback:
+    Providers are tried in order. A provider whose circuit breaker is open
+    is skipped; an error (or an empty answer) moves on to the next one.
+
+Hedging:
+    If the provider being waited on has not answered within its own p95
+    latency (tracked per provider in a LatencyHistogram), a second request
+    is sent to the next provider and whichever usable answer arrives first
+    wins. Only the slowest few percent of calls are duplicated, which cuts
+    tail latency without doubling load on the backup.
+
+Each child provider keeps its own circuit breaker, retry policy and
+request pacing (its _execute_with_retry), so the composite adds no pacing
+of its own. The composite reports the primary provider's name, but price
+results carry the name of the provider that actually answered
+(HistoricalPricesResult.provider): rows and coverage from a fallback are
+stored under the fallback's name, so the primary is asked for those
+dates again on the next sync.
+
+Usage:
+    provider = CompositeMarketDataProvider([
+        YahooFinanceProvider(),
+        ReplayMarketDataProvider("/data/market-replay"),
+    ])
+    result = provider.get_historical_prices("NVDA", "NASDAQ", start, end)
+    provider.latency_stats  # {"yahoo": LatencyHistogramStats, "replay": ...}
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import date
+from typing import Callable, TypeVar
+
+from app.services.circuit_breaker import CircuitBreaker, CircuitBreakerStats
+from app.services.constants import (
+    MARKET_DATA_HEDGE_PERCENTILE,
+    MARKET_DATA_HEDGE_MIN_SAMPLES,
+    MARKET_DATA_HEDGE_DEFAULT_DELAY,
+    MARKET_DATA_HEDGE_MIN_DELAY,
+    MARKET_DATA_HEDGE_MAX_DELAY,
+    MARKET_DATA_HEDGE_MAX_WORKERS,
+)
+from app.services.exceptions import ProviderUnavailableError, TickerNotFoundError
+from app.services.latency_histogram import LatencyHistogram, LatencyHistogramStats
+from app.services.market_data.base import (
+    MarketDataProvider,
+    AssetInfo,
+    BatchResult,
+    HistoricalPricesResult,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+@dataclass
+class CompositeProviderStats:
+    """
+    Statistics for monitoring hedging and fallback.
+
+    Attributes:
+        calls: Calls made through the composite
+        hedges_sent: Hedged requests sent because a provider was slow
+        hedges_won: Calls answered by a hedged request before the original
+        fallbacks: Calls moved to the next provider after an error or
+                   empty answer
+        skipped_open: Providers skipped because their circuit was open
+    """
+    calls: int = 0
+    hedges_sent: int = 0
+    hedges_won: int = 0
+    fallbacks: int = 0
+    skipped_open: int = 0
+
+
+class CompositeMarketDataProvider(MarketDataProvider):
+    """
+    MarketDataProvider that hedges and falls back across several providers.
+
+    Args:
+        providers: Providers in order of preference (first = primary)
+        name: Reported provider name (defaults to the primary's name)
+        hedging: Send hedged requests to slow providers (False = fallback only)
+        hedge_percentile: Latency percentile after which to hedge
+        hedge_min_samples: Samples needed before the percentile is used
+        hedge_default_delay: Hedge delay while samples are insufficient
+        hedge_min_delay: Lower bound for the hedge delay (seconds)
+        hedge_max_delay: Upper bound for the hedge delay (seconds)
+        max_workers: Threads shared by in-flight provider calls
+
+    Example:
+        provider = CompositeMarketDataProvider(
+            [YahooFinanceProvider(), ReplayMarketDataProvider(path)],
+        )
+    """
+
+    # Children pace their own requests
+    RATE_LIMIT_PER_SECOND = None
+
+    def __init__(
+            self,
+            providers: list[MarketDataProvider],
+            name: str | None = None,
+            hedging: bool = True,
+            hedge_percentile: float = MARKET_DATA_HEDGE_PERCENTILE,
+            hedge_min_samples: int = MARKET_DATA_HEDGE_MIN_SAMPLES,
+            hedge_default_delay: float = MARKET_DATA_HEDGE_DEFAULT_DELAY,
+            hedge_min_delay: float = MARKET_DATA_HEDGE_MIN_DELAY,
+            hedge_max_delay: float = MARKET_DATA_HEDGE_MAX_DELAY,
+            max_workers: int = MARKET_DATA_HEDGE_MAX_WORKERS,
+    ) -> None:
+        if not providers:
+            raise ValueError("at least one provider is required")
+        names = [p.name for p in providers]
+        if len(set(names)) != len(names):
+            raise ValueError(f"provider names must be unique, got {names}")
+        if not 0 < hedge_percentile <= 1:
+            raise ValueError("hedge_percentile must be in (0, 1]")
+        if not 0 <= hedge_min_delay <= hedge_max_delay:
+            raise ValueError("hedge_min_delay must be between 0 and hedge_max_delay")
+
+        self._providers = list(providers)
+        self._name = name or providers[0].name
+        self._hedging = hedging
+        self._hedge_percentile = hedge_percentile
+        self._hedge_min_samples = hedge_min_samples
+        self._hedge_default_delay = hedge_default_delay
+        self._hedge_min_delay = hedge_min_delay
+        self._hedge_max_delay = hedge_max_delay
+
+        self._latency = {p.name: LatencyHistogram(name=p.name) for p in providers}
+        self._stats = CompositeProviderStats()
+        self._stats_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="market-data",
+        )
+
+        logger.info(
+            f"CompositeMarketDataProvider initialized: providers={names}, "
+            f"hedging={'p' + str(round(hedge_percentile * 100)) if hedging else 'off'}"
+        )
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def providers(self) -> list[MarketDataProvider]:
+        """Wrapped providers in order of preference."""
+        return list(self._providers)
+
+    # =========================================================================
+    # MONITORING
+    # =========================================================================
+
+    def _get_circuit_breaker(self) -> CircuitBreaker:
+        """The primary provider's circuit breaker (used by health checks)."""
+        return self._providers[0]._get_circuit_breaker()
+
+    @property
+    def circuit_breaker_stats(self) -> CircuitBreakerStats:
+        """Circuit breaker and pacing stats of the primary provider."""
+        return self._providers[0].circuit_breaker_stats
+
+    @property
+    def latency_stats(self) -> dict[str, LatencyHistogramStats]:
+        """Latency distribution per provider name."""
+        return {name: h.stats for name, h in self._latency.items()}
+
+    @property
+    def stats(self) -> CompositeProviderStats:
+        """Snapshot of hedging and fallback counters."""
+        with self._stats_lock:
+            return CompositeProviderStats(**vars(self._stats))
+
+    def _count(self, counter: str) -> None:
+        with self._stats_lock:
+            setattr(self._stats, counter, getattr(self._stats, counter) + 1)
+
+    def close(self) -> None:
+        """Stop accepting work (in-flight calls are left to finish)."""
+        self._executor.shutdown(wait=False)
+
+    # =========================================================================
+    # HEDGING
+    # =========================================================================
+
+    def _hedge_delay(self, provider: MarketDataProvider) -> float:
+        """Seconds to wait on a provider before sending a hedged request."""
+        histogram = self._latency[provider.name]
+        delay = None
+        if histogram.count >= self._hedge_min_samples:
+            delay = histogram.percentile(self._hedge_percentile)
+        if delay is None:
+            delay = self._hedge_default_delay
+        return min(self._hedge_max_delay, max(self._hedge_min_delay, delay))
+
+    def _available_providers(self) -> list[MarketDataProvider]:
+        """Providers whose circuit breaker is not open, in order."""
+        available = []
+        for provider in self._providers:
+            if provider._get_circuit_breaker().is_open:
+                logger.debug(f"Skipping {provider.name}: circuit breaker open")
+                self._count("skipped_open")
+                continue
+            available.append(provider)
+        return available
+
+    def _timed_call(
+            self,
+            provider: MarketDataProvider,
+            call: Callable[[MarketDataProvider], T],
+    ) -> T:
+        """Run call(provider) and record its latency."""
+        histogram = self._latency[provider.name]
+        started = time.monotonic()
+        try:
+            result = call(provider)
+        except TickerNotFoundError:
+            # A definite answer - counts towards the latency distribution
+            histogram.record(time.monotonic() - started)
+            raise
+        except Exception:
+            histogram.record_error()
+            raise
+        histogram.record(time.monotonic() - started)
+        return result
+
+    def _first_usable(
+            self,
+            operation: str,
+            call: Callable[[MarketDataProvider], T],
+            is_usable: Callable[[T], bool] = lambda _: True,
+    ) -> T:
+        """
+        Return the first usable answer across providers.
+
+        Args:
+            operation: Description for logs
+            call: Invokes the operation on one provider
+            is_usable: Whether an answer can be returned without waiting
+                       for other providers (e.g. non-empty prices)
+
+        Returns:
+            The first usable answer; otherwise the first answer received
+
+        Raises:
+            ProviderUnavailableError: Every provider's circuit is open
+            Exception: The most relevant provider error if all failed
+        """
+        self._count("calls")
+        remaining = deque(self._available_providers())
+        if not remaining:
+            raise ProviderUnavailableError(
+                provider=self.name,
+                reason="all market data providers are unavailable (circuit breakers open)",
+            )
+
+        primary = remaining[0]
+        pending: dict[Future, tuple[MarketDataProvider, float, bool]] = {}
+        errors: list[Exception] = []
+        fallback_answer: tuple[T] | None = None
+
+        def launch(hedged: bool) -> None:
+            provider = remaining.popleft()
+            future = self._executor.submit(self._timed_call, provider, call)
+            pending[future] = (provider, time.monotonic(), hedged)
+
+        launch(hedged=False)
+
+        while pending:
+            timeout = None
+            if self._hedging and remaining and len(pending) == 1:
+                provider, started, _ = next(iter(pending.values()))
+                deadline = started + self._hedge_delay(provider)
+                timeout = max(0.0, deadline - time.monotonic())
+
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+            if not done:
+                slow_provider = next(iter(pending.values()))[0]
+                logger.info(
+                    f"Hedging {operation}: {slow_provider.name} slow, "
+                    f"also asking {remaining[0].name}"
+                )
+                self._count("hedges_sent")
+                launch(hedged=True)
+                continue
+
+            for future in done:
+                provider, _, hedged = pending.pop(future)
+                try:
+                    answer = future.result()
+                except Exception as e:
+                    logger.info(f"{provider.name} failed for {operation}: {e}")
+                    errors.append(e)
+                    continue
+
+                if is_usable(answer):
+                    if hedged and pending:
+                        self._count("hedges_won")
+                    if provider is not primary:
+                        logger.info(f"{operation} answered by {provider.name}")
+                    return answer
+                if fallback_answer is None:
+                    fallback_answer = (answer,)
+
+            if not pending and remaining:
+                logger.info(f"Falling back to {remaining[0].name} for {operation}")
+                self._count("fallbacks")
+                launch(hedged=False)
+
+        if fallback_answer is not None:
+            return fallback_answer[0]
+        raise self._select_error(errors)
+
+    @staticmethod
+    def _select_error(errors: list[Exception]) -> Exception:
+        """
+        Pick the error to surface when every provider failed.
+
+        A provider failure beats "ticker not found": if the primary was
+        down and the backup simply did not know the ticker, callers should
+        treat the fetch as retryable rather than the ticker as invalid.
+        """
+        for error in errors:
+            if not isinstance(error, TickerNotFoundError):
+                return error
+        return errors[0]
+
+    # =========================================================================
+    # MARKET DATA PROVIDER INTERFACE
+    # =========================================================================
+
+    def get_asset_info(self, ticker: str, exchange: str) -> AssetInfo:
+        """Fetch asset metadata from the fastest healthy provider."""
+        return self._first_usable(
+            f"asset info {ticker}/{exchange}",
+            lambda p: p.get_asset_info(ticker, exchange),
+        )
+
+    def get_asset_info_batch(self, tickers: list[tuple[str, str]]) -> BatchResult:
+        """
+        Fetch metadata for several assets with per-ticker fallback.
+
+        Batches are not hedged (their latency depends on batch size); instead
+        tickers that fail on one provider are retried on the next. A ticker
+        that failed everywhere keeps the first provider-level error, or the
+        primary's not-found error.
+        """
+        result = BatchResult()
+        missing = list(tickers)
+
+        for provider in self._available_providers():
+            if not missing:
+                break
+            try:
+                batch = self._timed_call(provider, lambda p: p.get_asset_info_batch(missing))
+            except Exception as e:
+                logger.warning(f"{provider.name} batch lookup failed: {e}")
+                for key in missing:
+                    normalized = (key[0].strip().upper(), key[1].strip().upper())
+                    self._keep_relevant_error(result, normalized, e)
+                continue
+
+            result.successful.update(batch.successful)
+            for key, error in batch.failed.items():
+                self._keep_relevant_error(result, key, error)
+            for key in batch.successful:
+                result.failed.pop(key, None)
+            missing = list(batch.failed.keys())
+
+        return result
+
+    @staticmethod
+    def _keep_relevant_error(result: BatchResult, key: tuple[str, str], error: Exception) -> None:
+        existing = result.failed.get(key)
+        if existing is None or (
+            isinstance(existing, TickerNotFoundError)
+            and not isinstance(error, TickerNotFoundError)
+        ):
+            result.failed[key] = error
+
+    def get_historical_prices(
+            self,
+            ticker: str,
+            exchange: str,
+            start_date: date,
+            end_date: date,
+    ) -> HistoricalPricesResult:
+        """
+        Fetch prices from the fastest healthy provider.
+
+        An empty (or unsuccessful) result is only returned when no provider
+        has rows for the range, so a stale snapshot answering quickly with
+        nothing cannot hide data the primary would return. The result's
+        provider names the child that answered.
+        """
+        def fetch(provider: MarketDataProvider) -> HistoricalPricesResult:
+            result = provider.get_historical_prices(ticker, exchange, start_date, end_date)
+            result.provider = result.provider or provider.name
+            return result
+
+        return self._first_usable(
+            f"prices {ticker}/{exchange} {start_date}..{end_date}",
+            fetch,
+            is_usable=lambda r: r.success and bool(r.prices),
+        )
+
@@ -0,0 +1,451 @@
+# backend/app/services/market_data/job_queue.py
+"""
+Durable sync job queue backed by the sync_jobs table.
+
+API requests enqueue a job and return immediately; separate worker
+processes (see app/worker.py) claim and run jobs. Because the queue lives
+in the database, sync throughput scales by starting more workers,
+independently of the number of API replicas.
+
+Claiming:
+    PostgreSQL: SELECT ... FOR UPDATE SKIP LOCKED picks the oldest queued
+    job that no other worker has locked, so concurrent workers never
+    block on each other.
+
+    SQLite (tests): FOR UPDATE is not supported and is omitted by the
+    dialect. A conditional UPDATE (status = QUEUED) still guarantees that
+    only one claimer wins.
+
+Coalescing:
+    At most one QUEUED job exists per portfolio. Enqueuing while a job is
+    waiting returns that job (upgraded to a forced or full re-sync if the
+    new request asks for more), so repeated clicks do not pile up work.
+    Jobs for a portfolio that already has a RUNNING job are not claimed
+    until it finishes.
+
+Progress:
+    SyncStatus moves to PENDING when a job is queued; the sync service
+    then drives IN_PROGRESS → COMPLETED / PARTIAL / FAILED as before.
+    A finished sync updates SyncStatus.last_sync_completed, which is the
+    data version the analytics cache checks, so API processes drop cached
+    results without the worker having to reach them.
+
+Liveness:
+    While a job runs, a background thread refreshes heartbeat_at every
+    SYNC_JOB_HEARTBEAT_SECONDS through its own session. requeue_stale()
+    only recovers jobs whose heartbeat stopped, so long syncs are never
+    run twice concurrently.
+"""
+
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone, timedelta
+from typing import Any, Iterator
+
+from sqlalchemy import func, select, update, exists
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, aliased
+
+from app.config import settings
+from app.models import (
+    SyncJob,
+    SyncJobStatus,
+    SyncJobType,
+    SyncStatus,
+    SyncStatusEnum,
+)
+from app.services.constants import SYNC_JOB_HEARTBEAT_SECONDS
+from app.services.market_data.sync_service import MarketDataSyncService, SyncResult
+
+logger = logging.getLogger(__name__)
+
+# Error recorded on SyncStatus when a worker died mid-sync
+ORPHANED_SYNC_ERROR = "Sync worker stopped before completing; the job was requeued"
+
+
+class SyncJobQueue:
+    """
+    Enqueue, claim and execute portfolio sync jobs.
+
+    Stateless apart from configuration, so a single instance can be
+    shared by the API (enqueue side) and by worker loops (claim side).
+
+    Attributes:
+        _max_attempts: Attempts before a job that keeps raising is FAILED
+        _stale_after: Heartbeat age after which a RUNNING job is considered orphaned
+        _heartbeat_interval: Seconds between heartbeats of a running job
+    """
+
+    def __init__(
+            self,
+            max_attempts: int | None = None,
+            stale_after: timedelta | None = None,
+            heartbeat_interval: float = SYNC_JOB_HEARTBEAT_SECONDS,
+    ):
+        """
+        Initialize the queue.
+
+        Args:
+            max_attempts: Override settings.sync_job_max_attempts
+            stale_after: Override settings.sync_job_stale_after_minutes
+            heartbeat_interval: Seconds between heartbeats of a running job
+        """
+        self._max_attempts = max_attempts or settings.sync_job_max_attempts
+        self._stale_after = stale_after or timedelta(
+            minutes=settings.sync_job_stale_after_minutes
+        )
+        self._heartbeat_interval = heartbeat_interval
+
+    # =========================================================================
+    # API SIDE
+    # =========================================================================
+
+    def enqueue(
+            self,
+            db: Session,
+            portfolio_id: int,
+            job_type: SyncJobType = SyncJobType.SYNC,
+            force: bool = False,
+    ) -> SyncJob:
+        """
+        Queue a sync for a portfolio, coalescing with a waiting job.
+
+        Args:
+            db: Database session
+            portfolio_id: Portfolio to sync
+            job_type: SYNC or FULL_RESYNC
+            force: Re-fetch all data (implied by FULL_RESYNC)
+
+        Returns:
+            The queued SyncJob (new or existing)
+        """
+        force = force or job_type == SyncJobType.FULL_RESYNC
+
+        existing = self._get_queued_job(db, portfolio_id)
+        if existing is not None:
+            if job_type == SyncJobType.FULL_RESYNC:
+                existing.job_type = SyncJobType.FULL_RESYNC
+            if force:
+                existing.force = True
+            db.commit()
+            logger.info(
+                f"Sync job {existing.id} already queued for portfolio {portfolio_id}"
+            )
+            return existing
+
+        job = SyncJob(
+            portfolio_id=portfolio_id,
+            job_type=job_type,
+            status=SyncJobStatus.QUEUED,
+            force=force,
+            attempts=0,
+        )
+        db.add(job)
+
+        try:
+            db.flush()
+            self._mark_pending(db, portfolio_id)
+            db.commit()
+        except IntegrityError:
+            # A concurrent request queued a job (or created the status row) first
+            db.rollback()
+            existing = self._get_queued_job(db, portfolio_id)
+            if existing is None:
+                raise
+            return existing
+
+        db.refresh(job)
+        logger.info(
+            f"Queued sync job {job.id} ({job_type.value}, force={force}) "
+            f"for portfolio {portfolio_id}"
+        )
+        return job
+
+    def get_job(self, db: Session, portfolio_id: int, job_id: int) -> SyncJob | None:
+        """Get a job by ID, scoped to its portfolio."""
+        return db.scalar(
+            select(SyncJob).where(
+                SyncJob.id == job_id,
+                SyncJob.portfolio_id == portfolio_id,
+            )
+        )
+
+    def get_latest_job(self, db: Session, portfolio_id: int) -> SyncJob | None:
+        """Get the most recently created job for a portfolio."""
+        return db.scalar(
+            select(SyncJob)
+            .where(SyncJob.portfolio_id == portfolio_id)
+            .order_by(SyncJob.created_at.desc(), SyncJob.id.desc())
+            .limit(1)
+        )
+
+    # =========================================================================
+    # WORKER SIDE
+    # =========================================================================
+
+    def claim_next(self, db: Session, worker_id: str) -> SyncJob | None:
+        """
+        Claim the oldest runnable job for this worker.
+
+        Args:
+            db: Database session
+            worker_id: Identifier stored on the job (host:pid)
+
+        Returns:
+            The claimed job (now RUNNING), or None if nothing is runnable
+        """
+        running = aliased(SyncJob)
+        candidate = db.scalar(
+            select(SyncJob)
+            .where(
+                SyncJob.status == SyncJobStatus.QUEUED,
+                ~exists().where(
+                    running.portfolio_id == SyncJob.portfolio_id,
+                    running.status == SyncJobStatus.RUNNING,
+                ),
+            )
+            .order_by(SyncJob.created_at, SyncJob.id)
+            .limit(1)
+            .with_for_update(skip_locked=True, of=SyncJob)
+        )
+
+        if candidate is None:
+            db.commit()
+            return None
+
+        # Conditional update: on PostgreSQL the row lock already makes this
+        # ours; on SQLite it is what prevents two claimers from both winning.
+        now = datetime.now(timezone.utc)
+        claimed = db.execute(
+            update(SyncJob)
+            .where(
+                SyncJob.id == candidate.id,
+                SyncJob.status == SyncJobStatus.QUEUED,
+            )
+            .values(
+                status=SyncJobStatus.RUNNING,
+                worker_id=worker_id,
+                started_at=now,
+                heartbeat_at=now,
+                attempts=SyncJob.attempts + 1,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+
+        if claimed.rowcount == 0:
+            return None
+
+        db.refresh(candidate)
+        logger.info(
+            f"Worker {worker_id} claimed sync job {candidate.id} "
+            f"for portfolio {candidate.portfolio_id} (attempt {candidate.attempts})"
+        )
+        return candidate
+
+    def run_job(
+            self,
+            db: Session,
+            job: SyncJob,
+            sync_service: MarketDataSyncService,
+    ) -> SyncJob:
+        """
+        Execute a claimed job and record its outcome.
+
+        A sync that completes with status "failed" is a finished job
+        (the failure is recorded in SyncStatus). Only unexpected
+        exceptions, or finding another sync still in progress, are
+        retried up to max_attempts.
+
+        Args:
+            db: Database session
+            job: Job returned by claim_next()
+            sync_service: Service that performs the sync
+
+        Returns:
+            The updated job
+        """
+        try:
+            with self._heartbeat(db, job.id):
+                result = sync_service.sync_portfolio(
+                    db=db,
+                    portfolio_id=job.portfolio_id,
+                    force=job.force,
+                )
+        except Exception as e:
+            logger.exception(f"Sync job {job.id} raised: {e}")
+            db.rollback()
+            return self._retry_or_fail(db, job, str(e))
+
+        if result.status == "already_running":
+            return self._retry_or_fail(
+                db, job, "Another sync is already in progress for this portfolio"
+            )
+
+        finished = datetime.now(timezone.utc)
+
+        if job.job_type == SyncJobType.FULL_RESYNC:
+            db.execute(
+                update(SyncStatus)
+                .where(SyncStatus.portfolio_id == job.portfolio_id)
+                .values(last_full_sync=finished)
+            )
+
+        job.status = (
+            SyncJobStatus.FAILED if result.status == "failed" else SyncJobStatus.SUCCEEDED
+        )
+        job.result = self._summarize(result)
+        job.error = result.error
+        job.finished_at = finished
+        db.commit()
+
+        logger.info(
+            f"Sync job {job.id} for portfolio {job.portfolio_id} "
+            f"finished with status {result.status}"
+        )
+        return job
+
+    def requeue_stale(self, db: Session, now: datetime | None = None) -> int:
+        """
+        Recover jobs left RUNNING by a worker that died.
+
+        A job is orphaned once its heartbeat is older than stale_after
+        (jobs claimed before heartbeats existed fall back to started_at).
+        Jobs with attempts left go back to QUEUED; the rest are FAILED.
+        The portfolio's SyncStatus is released from IN_PROGRESS so the
+        retried sync can acquire it.
+
+        Args:
+            db: Database session
+            now: Current time (for testing)
+
+        Returns:
+            Number of jobs recovered
+        """
+        now = now or datetime.now(timezone.utc)
+        cutoff = now - self._stale_after
+
+        stale_jobs = db.scalars(
+            select(SyncJob)
+            .where(
+                SyncJob.status == SyncJobStatus.RUNNING,
+                func.coalesce(SyncJob.heartbeat_at, SyncJob.started_at) < cutoff,
+            )
+            .with_for_update(skip_locked=True)
+        ).all()
+
+        for job in stale_jobs:
+            logger.warning(
+                f"Sync job {job.id} for portfolio {job.portfolio_id} on {job.worker_id} "
+                f"has not sent a heartbeat since {job.heartbeat_at or job.started_at}; recovering"
+            )
+            db.execute(
+                update(SyncStatus)
+                .where(
+                    SyncStatus.portfolio_id == job.portfolio_id,
+                    SyncStatus.status == SyncStatusEnum.IN_PROGRESS,
+                )
+                .values(status=SyncStatusEnum.FAILED, last_error=ORPHANED_SYNC_ERROR)
+            )
+            self._retry_or_fail(db, job, ORPHANED_SYNC_ERROR, commit=False)
+
+        db.commit()
+        return len(stale_jobs)
+
+    # =========================================================================
+    # PRIVATE HELPERS
+    # =========================================================================
+
+    @contextmanager
+    def _heartbeat(self, db: Session, job_id: int) -> Iterator[None]:
+        """Refresh the job's heartbeat_at from a background thread while the body runs."""
+        stop = threading.Event()
+
+        def beat() -> None:
+            while not stop.wait(self._heartbeat_interval):
+                try:
+                    with Session(db.get_bind()) as heartbeat_db:
+                        heartbeat_db.execute(
+                            update(SyncJob)
+                            .where(SyncJob.id == job_id)
+                            .values(heartbeat_at=datetime.now(timezone.utc))
+                        )
+                        heartbeat_db.commit()
+                except Exception as e:
+                    # A missed beat only matters if it lasts stale_after
+                    logger.warning(f"Could not record heartbeat of sync job {job_id}: {e}")
+
+        thread = threading.Thread(target=beat, name=f"sync-job-{job_id}-heartbeat", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    def _get_queued_job(self, db: Session, portfolio_id: int) -> SyncJob | None:
+        """Get the waiting job for a portfolio, if any."""
+        return db.scalar(
+            select(SyncJob).where(
+                SyncJob.portfolio_id == portfolio_id,
+                SyncJob.status == SyncJobStatus.QUEUED,
+            )
+        )
+
+    def _mark_pending(self, db: Session, portfolio_id: int) -> None:
+        """Move SyncStatus to PENDING unless a sync is already running."""
+        sync_status = db.scalar(
+            select(SyncStatus).where(SyncStatus.portfolio_id == portfolio_id)
+        )
+        if sync_status is None:
+            db.add(SyncStatus(
+                portfolio_id=portfolio_id,
+                status=SyncStatusEnum.PENDING,
+                coverage_summary={},
+            ))
+            db.flush()
+        elif sync_status.status != SyncStatusEnum.IN_PROGRESS:
+            sync_status.status = SyncStatusEnum.PENDING
+
+    def _retry_or_fail(
+            self,
+            db: Session,
+            job: SyncJob,
+            error: str,
+            commit: bool = True,
+    ) -> SyncJob:
+        """Put a job back in the queue, or fail it once attempts run out."""
+        # A newer request may already be waiting; fold this one into it
+        waiting = self._get_queued_job(db, job.portfolio_id)
+
+        if job.attempts < self._max_attempts and waiting is None:
+            job.status = SyncJobStatus.QUEUED
+            job.worker_id = None
+            logger.warning(
+                f"Sync job {job.id} attempt {job.attempts}/{self._max_attempts} "
+                f"failed, requeued: {error}"
+            )
+        else:
+            job.status = SyncJobStatus.FAILED
+            job.finished_at = datetime.now(timezone.utc)
+            logger.error(f"Sync job {job.id} failed: {error}")
+
+        job.error = error
+        if commit:
+            db.commit()
+        return job
+
+    @staticmethod
+    def _summarize(result: SyncResult) -> dict[str, Any]:
+        """JSON-serializable summary of a SyncResult for SyncJob.result."""
+        return {
+            "status": result.status,
+            "assets_synced": result.assets_synced,
+            "assets_failed": result.assets_failed,
+            "prices_fetched": result.prices_fetched,
+            "fx_pairs_synced": result.fx_pairs_synced,
+            "fx_rates_fetched": result.fx_rates_fetched,
+            "warnings": list(result.warnings),
+            "error": result.error,
+        }
@@ -0,0 +1,220 @@
+# backend/app/services/market_data/price_cache.py
+"""
+Process-wide cache of per-asset close price series.
+
+Many portfolios hold the same assets (broad ETFs, benchmarks), and every
+history or valuation request used to scan market_data for them again.
+PriceSeriesCache keeps each asset's loaded series (sorted dates plus
+close / synthetic flag / proxy source) shared by all requests in the
+process. A request only queries the database for the part of its date
+window the cached series does not cover yet.
+
+Invalidation:
+    Entries are keyed by asset ID and the asset's price_version column.
+    Every writer of market_data bumps price_version in the same
+    transaction (MarketDataSyncService._store_prices_batch,
+    _backcast_with_proxy, _carry_at_cost, ...), so a reader that sees the
+    new version misses and reloads, in this and every other process.
+    Code that writes market_data directly must call bump_price_versions()
+    before committing too.
+
+Memory:
+    Bounded by an estimated byte size (PRICE_CACHE_ROW_BYTES per row);
+    least recently used assets are evicted first.
+
+Usage:
+    cache = PriceSeriesCache(max_bytes=256 * 1024 * 1024)
+
+    cached = cache.get(asset_id, version)
+    gaps = cached.missing(start, end) if cached else [(start, end)]
+    ...  # query gaps
+    series = cache.merge(asset_id, version, cached, gaps, fetched_rows)
+    rows = series.window(start, end)
+"""
+
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from collections.abc import Iterable
+from datetime import date, timedelta
+from decimal import Decimal
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.models import Asset
+
+# (close_price, is_synthetic, proxy_source_id)
+PriceValue = tuple[Decimal, bool, int | None]
+
+# Estimated memory per cached row: date, Decimal, value tuple, list slots
+PRICE_CACHE_ROW_BYTES = 240
+
+
+class PriceSeries:
+    """
+    Immutable price series for one asset over one contiguous covered range.
+
+    Covered means every stored row in [start, end] is present; dates in
+    the range without a row had no price in the database.
+    """
+
+    __slots__ = ("version", "start", "end", "dates", "values")
+
+    def __init__(
+            self,
+            version: int,
+            start: date,
+            end: date,
+            dates: list[date],
+            values: list[PriceValue],
+    ) -> None:
+        self.version = version
+        self.start = start
+        self.end = end
+        self.dates = dates
+        self.values = values
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated memory footprint."""
+        return PRICE_CACHE_ROW_BYTES * (len(self.dates) + 1)
+
+    def missing(self, start: date, end: date) -> list[tuple[date, date]]:
+        """
+        Date ranges to load so the series covers [start, end].
+
+        A window disjoint from the covered range also loads the span in
+        between, keeping coverage contiguous.
+        """
+        if start > self.end + timedelta(days=1) or end < self.start - timedelta(days=1):
+            return [(min(start, self.start), max(end, self.end))]
+
+        gaps = []
+        if start < self.start:
+            gaps.append((start, self.start - timedelta(days=1)))
+        if end > self.end:
+            gaps.append((self.end + timedelta(days=1), end))
+        return gaps
+
+    def window(self, start: date, end: date) -> list[tuple[date, PriceValue]]:
+        """Rows with start <= date <= end, by date."""
+        low = bisect_left(self.dates, start)
+        high = bisect_right(self.dates, end)
+        return list(zip(self.dates[low:high], self.values[low:high]))
+
+
+class PriceSeriesCache:
+    """
+    Thread-safe LRU of PriceSeries bounded by estimated byte size.
+
+    Attributes:
+        max_bytes: Size budget; the least recently used series are evicted
+                   once the total exceeds it
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[int, PriceSeries] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, asset_id: int, version: int) -> PriceSeries | None:
+        """Cached series for asset_id at version, or None."""
+        with self._lock:
+            series = self._entries.get(asset_id)
+            if series is None or series.version != version:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(asset_id)
+            self.hits += 1
+            return series
+
+    def merge(
+            self,
+            asset_id: int,
+            version: int,
+            base: PriceSeries | None,
+            ranges: list[tuple[date, date]],
+            rows: Iterable[tuple[date, PriceValue]],
+    ) -> PriceSeries:
+        """
+        Extend base with rows loaded for ranges, cache and return the result.
+
+        ranges must be base.missing() for the caller's window (or the whole
+        window when base is None), so the merged coverage stays contiguous.
+        The result replaces whatever is cached for asset_id, and stays
+        valid for the caller even if it is evicted right away.
+        """
+        if base is not None and base.version != version:
+            base = None
+
+        by_date = dict(zip(base.dates, base.values)) if base is not None else {}
+        by_date.update(rows)
+        dates = sorted(by_date)
+
+        bounds = list(ranges)
+        if base is not None:
+            bounds.append((base.start, base.end))
+        series = PriceSeries(
+            version=version,
+            start=min(start for start, _ in bounds),
+            end=max(end for _, end in bounds),
+            dates=dates,
+            values=[by_date[d] for d in dates],
+        )
+
+        with self._lock:
+            previous = self._entries.pop(asset_id, None)
+            if previous is not None:
+                self._bytes -= previous.nbytes
+            if series.nbytes <= self.max_bytes:
+                self._entries[asset_id] = series
+                self._bytes += series.nbytes
+                self._evict()
+        return series
+
+    def invalidate(self, asset_id: int) -> None:
+        """Drop asset_id's series."""
+        with self._lock:
+            series = self._entries.pop(asset_id, None)
+            if series is not None:
+                self._bytes -= series.nbytes
+
+    def clear(self) -> None:
+        """Drop every series."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    @property
+    def size_bytes(self) -> int:
+        """Estimated bytes currently held."""
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self) -> None:
+        while self._bytes > self.max_bytes and self._entries:
+            _, series = self._entries.popitem(last=False)
+            self._bytes -= series.nbytes
+
+
+def bump_price_versions(db: Session, asset_ids: Iterable[int]) -> None:
+    """
+    Mark asset_ids' cached price series stale in every process.
+
+    Call in the same transaction as the market_data write, before commit.
+    updated_at is left alone: a price write does not change the asset.
+    """
+    asset_ids = set(asset_ids)
+    if not asset_ids:
+        return
+    db.execute(
+        update(Asset)
+        .where(Asset.id.in_(asset_ids))
+        .values(price_version=Asset.price_version + 1, updated_at=Asset.updated_at)
+    )
@@ -0,0 +1,335 @@
+# backend/app/services/market_data/price_store.py
+"""
+Columnar, memory-mapped local copy of daily close prices.
+
+History and analytics read thousands of close prices per request. From
+PostgreSQL each one is a Numeric(18,8) value parsed into a Decimal. This
+store keeps the same data as flat arrays in one file per asset, which
+readers memory-map and binary-search without copying or parsing. Only
+the rows inside a requested window are turned into Decimals.
+
+The database stays the source of truth:
+- MarketDataSyncService rewrites the files of the assets it synced
+- PortfolioDataContext reads assets that have a file and queries the
+  database for the rest
+- The whole store can be rebuilt from the database at any time:
+
+      cd backend
+      python -m scripts.rebuild_price_store
+
+Files are replaced atomically (write to a temp file, then rename), so a
+reader sees either the old or the new version, never a partial one. All
+uvicorn workers map the same files, so they share one copy in the OS page
+cache instead of each holding prices in its own heap.
+
+Each file records the assets.price_version it was built from, and readers
+pass the version they expect. A file written before the latest price write
+(by a process without the store, or a sync whose refresh failed) no
+longer matches and the database is read instead. Assets without prices
+get no file.
+
+File layout ({root}/{asset_id}.prices, native byte order):
+    header      16 bytes: magic b"IAPS", format version (u32), row count n (u32),
+                assets.price_version (u32)
+    closes      int64[n]  close price scaled by 10^8 (exact for Numeric(18,8))
+    days        int32[n]  days since 1970-01-01, ascending
+    proxy_ids   int32[n]  proxy_source_id, 0 when not synthetic
+    synthetic   uint8[n]  1 if the price was generated by backcasting
+
+No-data markers are not stored. The store is a per-machine cache and is
+not meant to be copied between hosts.
+
+Usage:
+    store = ColumnarPriceStore("/var/lib/investment-analyzer/prices")
+    store.rebuild(db)
+
+    rows = store.read_window(asset_id, date(2024, 1, 1), date(2024, 12, 31), asset.price_version)
+    if rows is None:
+        ...  # asset not in store (or stale): read the database
+"""
+
+import logging
+import mmap
+import os
+import struct
+import threading
+import uuid
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models import Asset, MarketData
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"IAPS"
+FORMAT_VERSION = 2
+FILE_SUFFIX = ".prices"
+
+# Close prices are stored as integers scaled by 10^PRICE_DECIMALS
+PRICE_DECIMALS = 8
+
+_HEADER = struct.Struct("=4sIII")
+_EPOCH = date(1970, 1, 1)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+
+# (date, close_price, is_synthetic, proxy_source_id)
+PriceRow = tuple[date, Decimal, bool, int | None]
+
+# (date, (close_price, is_synthetic, proxy_source_id)), the PriceMap value shape
+StoredPrice = tuple[date, tuple[Decimal, bool, int | None]]
+
+
+@dataclass(frozen=True)
+class _MappedFile:
+    """An open mapping plus the file identity it was opened for."""
+
+    mapping: mmap.mmap
+    count: int
+    price_version: int
+    identity: tuple[int, int, int]  # (st_ino, st_mtime_ns, st_size)
+
+
+class ColumnarPriceStore:
+    """
+    Memory-mapped per-asset close price arrays.
+
+    Thread-safe: mappings are cached per asset and reopened when the file
+    is replaced. A replaced mapping is not closed explicitly (another
+    thread may still be reading it); it is released once unreferenced.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        """
+        Args:
+            root: Directory holding the .prices files (created if missing)
+        """
+        self._root = Path(root)
+        self._root.mkdir(parents=True, exist_ok=True)
+        self._mapped: dict[int, _MappedFile] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    # =========================================================================
+    # READING
+    # =========================================================================
+
+    def read_window(
+            self,
+            asset_id: int,
+            start_date: date,
+            end_date: date,
+            price_version: int,
+    ) -> list[StoredPrice] | None:
+        """
+        Prices for asset_id with start_date <= date <= end_date, by date.
+
+        Args:
+            asset_id: Asset to read
+            start_date: First date (inclusive)
+            end_date: Last date (inclusive)
+            price_version: The asset's current assets.price_version
+
+        Returns:
+            List of (date, (close_price, is_synthetic, proxy_source_id)),
+            or None if the asset is not in the store, its file was built
+            from another price_version, or the file holds no prices
+        """
+        mapped = self._open(asset_id)
+        if mapped is None or mapped.price_version != price_version or mapped.count == 0:
+            return None
+
+        n = mapped.count
+        closes_at = _HEADER.size
+        days_at = closes_at + 8 * n
+        proxies_at = days_at + 4 * n
+        synthetic_at = proxies_at + 4 * n
+
+        with memoryview(mapped.mapping) as buffer, \
+                buffer[closes_at:days_at].cast("q") as closes, \
+                buffer[days_at:proxies_at].cast("i") as days, \
+                buffer[proxies_at:synthetic_at].cast("i") as proxies, \
+                buffer[synthetic_at:synthetic_at + n] as synthetic:
+            low = bisect_left(days, _day_number(start_date))
+            high = bisect_right(days, _day_number(end_date))
+            return [
+                (
+                    _EPOCH + timedelta(days=days[i]),
+                    (
+                        Decimal(closes[i]).scaleb(-PRICE_DECIMALS),
+                        bool(synthetic[i]),
+                        proxies[i] or None,
+                    ),
+                )
+                for i in range(low, high)
+            ]
+
+    def _open(self, asset_id: int) -> _MappedFile | None:
+        path = self._path(asset_id)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            with self._lock:
+                self._mapped.pop(asset_id, None)
+            return None
+        identity = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            mapped = self._mapped.get(asset_id)
+            if mapped is not None and mapped.identity == identity:
+                return mapped
+
+            try:
+                with open(path, "rb") as f:
+                    mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (FileNotFoundError, ValueError):
+                # Removed between stat and open, or empty
+                self._mapped.pop(asset_id, None)
+                return None
+
+            magic, version, count, price_version = (
+                _HEADER.unpack_from(mapping) if len(mapping) >= _HEADER.size else (None, None, 0, 0)
+            )
+            if magic != MAGIC or version != FORMAT_VERSION or len(mapping) != _file_size(count):
+                logger.warning(f"Ignoring invalid price store file {path}")
+                mapping.close()
+                self._mapped.pop(asset_id, None)
+                return None
+
+            mapped = _MappedFile(
+                mapping=mapping, count=count, price_version=price_version, identity=identity,
+            )
+            self._mapped[asset_id] = mapped
+            return mapped
+
+    # =========================================================================
+    # WRITING
+    # =========================================================================
+
+    def write_asset(self, asset_id: int, rows: Iterable[PriceRow], price_version: int) -> int:
+        """
+        Replace asset_id's file with rows (atomic).
+
+        Rows may come in any order; rows without a close price are skipped.
+        Without any rows the file is removed instead.
+
+        Args:
+            asset_id: Asset the rows belong to
+            rows: Price rows
+            price_version: assets.price_version read before the rows
+
+        Returns:
+            Number of rows written
+        """
+        ordered = sorted((row for row in rows if row[1] is not None), key=lambda row: row[0])
+        if not ordered:
+            self.remove_asset(asset_id)
+            return 0
+
+        closes = array("q")
+        days = array("i")
+        proxies = array("i")
+        synthetic = bytearray()
+        for price_date, close_price, is_synthetic, proxy_source_id in ordered:
+            closes.append(int(close_price.scaleb(PRICE_DECIMALS).to_integral_value()))
+            days.append(_day_number(price_date))
+            proxies.append(proxy_source_id or 0)
+            synthetic.append(1 if is_synthetic else 0)
+
+        path = self._path(asset_id)
+        tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(ordered), price_version))
+                f.write(closes.tobytes())
+                f.write(days.tobytes())
+                f.write(proxies.tobytes())
+                f.write(synthetic)
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        return len(ordered)
+
+    def remove_asset(self, asset_id: int) -> None:
+        """Drop asset_id from the store; readers fall back to the database."""
+        self._path(asset_id).unlink(missing_ok=True)
+        with self._lock:
+            self._mapped.pop(asset_id, None)
+
+    # =========================================================================
+    # REBUILD FROM DATABASE
+    # =========================================================================
+
+    def rebuild(self, db: Session, asset_ids: Iterable[int] | None = None) -> int:
+        """
+        Rewrite files for asset_ids (default: every asset) from market_data.
+
+        Each file is stamped with the asset's price_version, read before
+        its prices, so a file is never newer than the version it claims.
+        Assets without prices (or that no longer exist) lose their file.
+
+        Returns:
+            Number of price rows written
+        """
+        if asset_ids is None:
+            asset_ids = db.scalars(select(Asset.id)).all()
+        asset_ids = sorted(set(asset_ids))
+
+        total = 0
+        for start in range(0, len(asset_ids), _REBUILD_BATCH_ASSETS):
+            batch = asset_ids[start:start + _REBUILD_BATCH_ASSETS]
+            rows_by_asset: dict[int, list[PriceRow]] = {asset_id: [] for asset_id in batch}
+            versions = dict(db.execute(
+                select(Asset.id, Asset.price_version).where(Asset.id.in_(batch))
+            ).all())
+
+            query = (
+                select(
+                    MarketData.asset_id,
+                    MarketData.date,
+                    MarketData.close_price,
+                    MarketData.is_synthetic,
+                    MarketData.proxy_source_id,
+                )
+                .where(
+                    MarketData.asset_id.in_(batch),
+                    MarketData.no_data_available == False,  # Exclude no-data markers
+                )
+            )
+            for asset_id, price_date, close_price, is_synthetic, proxy_source_id in db.execute(query):
+                rows_by_asset[asset_id].append((price_date, close_price, is_synthetic, proxy_source_id))
+
+            for asset_id, rows in rows_by_asset.items():
+                if asset_id in versions:
+                    total += self.write_asset(asset_id, rows, versions[asset_id])
+                else:
+                    self.remove_asset(asset_id)
+
+        logger.info(f"Price store rebuilt: {len(asset_ids)} assets, {total} prices")
+        return total
+
+    def _path(self, asset_id: int) -> Path:
+        return self._root / f"{asset_id}{FILE_SUFFIX}"
+
+
+# Assets whose prices are loaded per query during rebuild (bounds memory)
+_REBUILD_BATCH_ASSETS = 50
+
+
+def _day_number(value: date) -> int:
+    return value.toordinal() - _EPOCH_ORDINAL
+
+
+def _file_size(count: int) -> int:
+    return _HEADER.size + count * (8 + 4 + 4 + 1)
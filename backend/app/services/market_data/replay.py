@@ -0,0 +1,255 @@
+# backend/app/services/market_data/replay.py
+"""
+Local file market data provider (record / replay).
+
+Serves asset metadata and daily prices from files on disk instead of a
+remote API. Useful as:
+- A fallback behind Yahoo Finance in CompositeMarketDataProvider, so syncs
+  keep working from a recorded snapshot when Yahoo is slow or down
+- A deterministic provider for local development and tests
+
+Directory layout:
+    {root}/{EXCHANGE}/{TICKER}.csv    Daily prices
+    {root}/{EXCHANGE}/{TICKER}.json   Asset metadata (AssetInfo fields)
+
+    An empty exchange (FX pairs such as "USDEUR=X") is stored under "_".
+
+CSV columns:
+    date,open,high,low,close,adjusted_close,volume
+    (adjusted_close and volume may be empty)
+
+Recording:
+    save_prices() and save_asset_info() write results fetched from another
+    provider into the same layout, merging with what is already on disk.
+"""
+
+import csv
+import json
+import logging
+import threading
+from dataclasses import asdict
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+from app.models import AssetClass
+from app.services.exceptions import TickerNotFoundError
+from app.services.market_data.base import (
+    MarketDataProvider,
+    AssetInfo,
+    BatchResult,
+    OHLCVData,
+    HistoricalPricesResult,
+)
+
+logger = logging.getLogger(__name__)
+
+# Directory used for symbols without an exchange (FX pairs)
+NO_EXCHANGE_DIR = "_"
+
+PRICE_COLUMNS = ("date", "open", "high", "low", "close", "adjusted_close", "volume")
+
+
+class ReplayMarketDataProvider(MarketDataProvider):
+    """
+    MarketDataProvider backed by recorded files.
+
+    Reads are local, so request pacing is disabled. A ticker without a
+    file raises TickerNotFoundError, like an unknown symbol on a remote
+    provider; a known ticker with no rows in the range returns an empty
+    successful result.
+
+    Example:
+        provider = ReplayMarketDataProvider("/data/market-replay")
+        result = provider.get_historical_prices(
+            "NVDA", "NASDAQ", date(2024, 1, 1), date(2024, 1, 31)
+        )
+    """
+
+    RATE_LIMIT_PER_SECOND = None
+
+    def __init__(self, root: str | Path, name: str = "replay") -> None:
+        """
+        Initialize the provider.
+
+        Args:
+            root: Directory holding recorded files (created on first save)
+            name: Provider name used in logs and stored data
+        """
+        self._root = Path(root)
+        self._name = name
+        self._write_lock = threading.Lock()
+        logger.info(f"ReplayMarketDataProvider initialized (root={self._root})")
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def root(self) -> Path:
+        """Directory holding the recorded files."""
+        return self._root
+
+    # =========================================================================
+    # FILE LAYOUT
+    # =========================================================================
+
+    @staticmethod
+    def _normalize(ticker: str, exchange: str) -> tuple[str, str]:
+        return ticker.strip().upper(), (exchange or "").strip().upper()
+
+    def _path(self, ticker: str, exchange: str, suffix: str) -> Path:
+        return self._root / (exchange or NO_EXCHANGE_DIR) / f"{ticker}{suffix}"
+
+    # =========================================================================
+    # ASSET INFO
+    # =========================================================================
+
+    def get_asset_info(self, ticker: str, exchange: str) -> AssetInfo:
+        """
+        Load recorded asset metadata.
+
+        Raises:
+            TickerNotFoundError: No metadata recorded for the ticker
+        """
+        ticker, exchange = self._normalize(ticker, exchange)
+        path = self._path(ticker, exchange, ".json")
+        if not path.is_file():
+            raise TickerNotFoundError(ticker=ticker, exchange=exchange, provider=self.name)
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return AssetInfo(
+            ticker=ticker,
+            exchange=exchange,
+            name=data.get("name"),
+            asset_class=AssetClass(data["asset_class"]),
+            currency=data["currency"],
+            sector=data.get("sector"),
+            region=data.get("region"),
+            isin=data.get("isin"),
+        )
+
+    def get_asset_info_batch(self, tickers: list[tuple[str, str]]) -> BatchResult:
+        """Load recorded metadata for several assets (partial success allowed)."""
+        result = BatchResult()
+        for ticker, exchange in tickers:
+            key = self._normalize(ticker, exchange)
+            try:
+                result.successful[key] = self.get_asset_info(*key)
+            except Exception as e:
+                result.failed[key] = e
+        return result
+
+    def save_asset_info(self, info: AssetInfo) -> Path:
+        """
+        Record asset metadata.
+
+        Returns:
+            Path of the written file
+        """
+        ticker, exchange = self._normalize(info.ticker, info.exchange)
+        path = self._path(ticker, exchange, ".json")
+        data = asdict(info)
+        data["asset_class"] = info.asset_class.value
+
+        with self._write_lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        return path
+
+    # =========================================================================
+    # HISTORICAL PRICES
+    # =========================================================================
+
+    def get_historical_prices(
+            self,
+            ticker: str,
+            exchange: str,
+            start_date: date,
+            end_date: date,
+    ) -> HistoricalPricesResult:
+        """
+        Load recorded prices between start_date and end_date (inclusive).
+
+        Raises:
+            TickerNotFoundError: No prices recorded for the ticker
+        """
+        ticker, exchange = self._normalize(ticker, exchange)
+        path = self._path(ticker, exchange, ".csv")
+        if not path.is_file():
+            raise TickerNotFoundError(ticker=ticker, exchange=exchange, provider=self.name)
+
+        prices = [
+            p for p in self._read_prices(path).values()
+            if start_date <= p.date <= end_date
+        ]
+        prices.sort(key=lambda p: p.date)
+
+        logger.debug(
+            f"Replayed {len(prices)} days for {ticker}/{exchange or '-'}: "
+            f"{start_date} to {end_date}"
+        )
+
+        return HistoricalPricesResult(
+            ticker=ticker,
+            exchange=exchange,
+            prices=prices,
+            success=True,
+            from_date=start_date,
+            to_date=end_date,
+        )
+
+    def save_prices(self, result: HistoricalPricesResult) -> Path:
+        """
+        Record fetched prices, merging with rows already on disk.
+
+        Rows for the same date are replaced by the newer values.
+
+        Returns:
+            Path of the written file
+        """
+        ticker, exchange = self._normalize(result.ticker, result.exchange)
+        path = self._path(ticker, exchange, ".csv")
+
+        with self._write_lock:
+            rows = self._read_prices(path) if path.is_file() else {}
+            for price in result.prices:
+                rows[price.date] = price
+
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".csv.tmp")
+            with tmp_path.open("w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(PRICE_COLUMNS)
+                for price in sorted(rows.values(), key=lambda p: p.date):
+                    writer.writerow([
+                        price.date.isoformat(),
+                        price.open,
+                        price.high,
+                        price.low,
+                        price.close,
+                        "" if price.adjusted_close is None else price.adjusted_close,
+                        "" if price.volume is None else price.volume,
+                    ])
+            tmp_path.replace(path)
+
+        return path
+
+    @staticmethod
+    def _read_prices(path: Path) -> dict[date, OHLCVData]:
+        """Parse a recorded price file, keyed by date."""
+        rows: dict[date, OHLCVData] = {}
+        with path.open(newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                price_date = date.fromisoformat(row["date"])
+                close = Decimal(row["close"])
+                rows[price_date] = OHLCVData(
+                    date=price_date,
+                    open=Decimal(row.get("open") or close),
+                    high=Decimal(row.get("high") or close),
+                    low=Decimal(row.get("low") or close),
+                    close=close,
+                    adjusted_close=Decimal(row["adjusted_close"]) if row.get("adjusted_close") else None,
+                    volume=int(row["volume"]) if row.get("volume") else None,
+                )
+        return rows
@@ -38,12 +38,13 @@ from dataclasses import dataclass, field
 from datetime import date, datetime, timezone, timedelta
 from typing import Any
 
-from sqlalchemy import select, func, and_, update, text
+from sqlalchemy import select, func, and_, update, text, literal, null
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from app.models import (
     Asset,
+    AssetCoverage,
     Transaction,
     TransactionType,
     Portfolio,
@@ -53,15 +54,21 @@ from app.models import (
 )
 from app.services.fx_rate_service import FXRateService
 from app.services.market_data.base import (
+    HistoricalPricesResult,
     MarketDataProvider,
     OHLCVData,
 )
+from app.services.market_data.price_cache import bump_price_versions
+from app.services.market_data.price_store import ColumnarPriceStore
 from app.services.market_data.yahoo import YahooFinanceProvider
 from app.services.portfolio_settings_service import PortfolioSettingsService
 from app.schemas.portfolio_settings import BackcastingMethod
 from app.services.proxy_mapping_service import ProxyMappingService, ProxyMappingResult
-from app.services.constants import DEFAULT_STALENESS_HOURS
-from app.utils.date_utils import get_business_days
+from app.services.transaction_records import load_transaction_records
+from app.services.constants import DEFAULT_STALENESS_HOURS, MARKET_DATA_COPY_THRESHOLD
+from app.utils.bulk_load import copy_into_staging, supports_copy
+from app.utils.date_utils import merge_date_ranges, subtract_date_ranges
+from app.utils.trading_calendar import get_trading_calendar
 
 logger = logging.getLogger(__name__)
 
@@ -162,6 +169,7 @@ class MarketDataSyncService:
         _provider: Market data provider for fetching prices
         _fx_service: FX rate service for fetching exchange rates
         _staleness_threshold_hours: Hours after which data is considered stale
+        _price_store: Local columnar price store refreshed after each sync
 
     Example:
         service = MarketDataSyncService()
@@ -183,6 +191,7 @@ class MarketDataSyncService:
             settings_service: PortfolioSettingsService | None = None,
             proxy_mapping_service: ProxyMappingService | None = None,
             staleness_threshold_hours: int | None = None,
+            price_store: ColumnarPriceStore | None = None,
     ) -> None:
         """
         Initialize the market data sync service.
@@ -193,6 +202,8 @@ class MarketDataSyncService:
             settings_service: Portfolio settings service (defaults to new instance)
             proxy_mapping_service: Proxy mapping service (defaults to new instance)
             staleness_threshold_hours: Hours after which data is stale (default: 24)
+            price_store: Columnar price store to rewrite for synced assets
+                         (None = no local store)
         """
         self._provider = provider or YahooFinanceProvider()
         self._fx_service = fx_service or FXRateService(provider=self._provider)
@@ -201,6 +212,7 @@ class MarketDataSyncService:
         self._staleness_threshold_hours = (
                 staleness_threshold_hours or DEFAULT_STALENESS_HOURS
         )
+        self._price_store = price_store
 
         logger.info(
             f"MarketDataSyncService initialized "
@@ -311,7 +323,7 @@ class MarketDataSyncService:
             # 3. Sync price data for each asset (with batched commits)
             # Accumulate all prices first, then commit in batches for efficiency
             # This reduces database round-trips while still allowing partial success
-            accumulated_prices: list[tuple[int, list[OHLCVData]]] = []
+            accumulated_prices: list[tuple[int, list[OHLCVData], str]] = []
 
             for asset_info in analysis.assets:
                 asset_result = self._sync_asset_prices_no_commit(
@@ -397,8 +409,11 @@ class MarketDataSyncService:
                     # Check if any asset has a gap
                     for asset_info in analysis.assets:
                         first_price = first_price_map.get(asset_info.asset_id)
-                        # Gap exists if: no price at all, OR first price is after first transaction
-                        if first_price is None or first_price > asset_info.first_transaction_date:
+                        # Gap exists if: no price at all, OR first price is after the
+                        # first trading session on/after the first transaction
+                        if self._has_price_gap(
+                                asset_info.first_transaction_date, first_price, asset_info.exchange
+                        ):
                             should_backcast = True
                             logger.info(
                                 f"Running backcast (gap detected: {asset_info.ticker} "
@@ -432,6 +447,11 @@ class MarketDataSyncService:
                         + " and ".join(parts)
                     )
 
+            # 4c. Refresh the local price store before the sync is marked
+            # complete, so readers never see a newer sync with older prices
+            if self._price_store is not None:
+                self._refresh_price_store(db, [a.asset_id for a in analysis.assets])
+
             # 5. Determine final status  (was step 5, now renumbered)
             result.sync_completed = datetime.now(timezone.utc)
 
@@ -485,6 +505,20 @@ class MarketDataSyncService:
 
             return result
 
+    def _refresh_price_store(self, db: Session, asset_ids: list[int]) -> None:
+        """
+        Rewrite the price store files of asset_ids from the database.
+
+        On failure the assets are dropped from the store instead, so
+        readers fall back to the database rather than stale files.
+        """
+        try:
+            self._price_store.rebuild(db, asset_ids)
+        except Exception as e:
+            logger.warning(f"Price store refresh failed, dropping {len(asset_ids)} assets: {e}")
+            for asset_id in asset_ids:
+                self._price_store.remove_asset(asset_id)
+
     # =========================================================================
     # STATUS METHODS
     # =========================================================================
@@ -624,6 +658,9 @@ class MarketDataSyncService:
         if status.status == SyncStatusEnum.IN_PROGRESS:
             return False, "sync_in_progress"
 
+        if status.status == SyncStatusEnum.PENDING:
+            return False, "sync_queued"
+
         # Check time since last successful sync
         if status.last_sync_completed is None:
             return True, "never_completed"
@@ -748,7 +785,7 @@ class MarketDataSyncService:
             asset_info: AssetSyncInfo,
             end_date: date,
             force: bool = False,
-            accumulated_prices: list[tuple[int, list[OHLCVData]]] | None = None,
+            accumulated_prices: list[tuple[int, list[OHLCVData], str]] | None = None,
     ) -> AssetSyncResult:
         """
         Fetch prices for a single asset without committing.
@@ -756,15 +793,17 @@ class MarketDataSyncService:
         Accumulates prices in the provided list for batch commit later.
         This is more efficient than committing after each asset.
 
-        Also stores "no data" markers for dates that have no market data
-        (holidays, weekends, etc.) to prevent repeated API calls.
+        Each successfully fetched range is recorded in asset_coverage
+        (flushed with the price batch) so that dates without market data
+        (holidays, pre-listing days) are not requested again. Prices and
+        coverage are recorded under the provider that answered each range.
 
         Args:
             db: Database session
             asset_info: Asset to sync
             end_date: End date for sync
-            force: If True, re-fetch all data (clears no-data markers first)
-            accumulated_prices: List to accumulate (asset_id, prices) tuples
+            force: If True, re-fetch the full range regardless of coverage
+            accumulated_prices: List to accumulate (asset_id, prices, provider) tuples
 
         Returns:
             AssetSyncResult with sync outcome
@@ -778,14 +817,8 @@ class MarketDataSyncService:
         )
 
         try:
-            # For force sync, clear existing no-data markers to allow re-fetching
+            # Force sync ignores recorded coverage and re-fetches everything
             if force:
-                self._clear_no_data_markers(
-                    db,
-                    asset_info.asset_id,
-                    asset_info.first_transaction_date,
-                    end_date,
-                )
                 date_ranges = [(asset_info.first_transaction_date, end_date)]
             else:
                 date_ranges = self._get_missing_date_ranges(
@@ -793,6 +826,7 @@ class MarketDataSyncService:
                     asset_info.asset_id,
                     asset_info.first_transaction_date,
                     end_date,
+                    exchange=asset_info.exchange,
                 )
 
             if not date_ranges:
@@ -802,14 +836,10 @@ class MarketDataSyncService:
                 result.success = True
                 return result
 
-            # Track all requested dates to identify dates with no data
-            all_requested_dates: set[date] = set()
-            for start, end in date_ranges:
-                all_requested_dates.update(get_business_days(start, end))
-
             # Fetch prices for each missing range
             total_prices = 0
-            all_prices: list[OHLCVData] = []
+            prices_by_provider: dict[str, list[OHLCVData]] = {}
+            ranges_by_provider: dict[str, list[tuple[date, date]]] = {}
 
             for start, end in date_ranges:
                 logger.debug(
@@ -829,36 +859,35 @@ class MarketDataSyncService:
                     result.error = prices_result.error
                     return result
 
+                provider_name = self._get_answering_provider_name(prices_result)
+                ranges_by_provider.setdefault(provider_name, []).append((start, end))
                 if prices_result.prices:
-                    all_prices.extend(prices_result.prices)
+                    prices_by_provider.setdefault(provider_name, []).extend(prices_result.prices)
                     total_prices += len(prices_result.prices)
 
-            # Accumulate for batch commit (if accumulator provided)
-            if all_prices:
+            # Record fetched ranges (committed together with the price batch)
+            for provider_name, ranges in ranges_by_provider.items():
+                self._record_coverage(
+                    db, asset_info.asset_id, ranges,
+                    exchange=asset_info.exchange, provider_name=provider_name,
+                )
+
+            for provider_name, prices in prices_by_provider.items():
                 if accumulated_prices is not None:
-                    accumulated_prices.append((asset_info.asset_id, all_prices))
+                    # Accumulate for batch commit
+                    accumulated_prices.append((asset_info.asset_id, prices, provider_name))
                 else:
                     # Fallback: commit immediately if no accumulator
-                    self._store_prices(db, asset_info.asset_id, all_prices)
-
-            # Identify dates that were requested but had no data returned
-            dates_with_data = {p.date for p in all_prices}
-            dates_with_no_data = sorted(all_requested_dates - dates_with_data)
-
-            # Store "no data" markers to prevent re-fetching these dates
-            if dates_with_no_data:
-                self._store_no_data_markers(db, asset_info.asset_id, dates_with_no_data)
-                logger.debug(
-                    f"Marked {len(dates_with_no_data)} dates as no-data for "
-                    f"{asset_info.ticker}/{asset_info.exchange}"
-                )
+                    self._store_prices(
+                        db, asset_info.asset_id, prices, provider_name=provider_name
+                    )
 
             result.prices_fetched = total_prices
             result.success = True
 
             logger.info(
                 f"Fetched {asset_info.ticker}/{asset_info.exchange}: "
-                f"{total_prices} prices, {len(dates_with_no_data)} no-data markers"
+                f"{total_prices} prices across {len(date_ranges)} range(s)"
             )
 
             return result
@@ -874,16 +903,19 @@ class MarketDataSyncService:
     def _store_prices_batch(
             self,
             db: Session,
-            accumulated_prices: list[tuple[int, list[OHLCVData]]],
+            accumulated_prices: list[tuple[int, list[OHLCVData], str]],
     ) -> int:
         """
         Store accumulated prices for multiple assets in a single transaction.
 
-        More efficient than individual commits per asset.
+        More efficient than individual commits per asset. Batches of at
+        least MARKET_DATA_COPY_THRESHOLD rows on PostgreSQL are streamed
+        with COPY (see _copy_prices_batch); smaller batches and SQLite use
+        a single multi-row upsert.
 
         Args:
             db: Database session
-            accumulated_prices: List of (asset_id, prices) tuples
+            accumulated_prices: List of (asset_id, prices, provider) tuples
 
         Returns:
             Total number of records stored
@@ -896,12 +928,13 @@ class MarketDataSyncService:
 
         # Check if OHLC columns exist
         has_ohlc = hasattr(MarketData, 'open_price')
-        provider_name = getattr(self._provider, 'name', 'unknown')
-        if not isinstance(provider_name, str):
-            provider_name = str(provider_name) if provider_name else 'unknown'
+
+        row_count = sum(len(prices) for _, prices, _ in accumulated_prices)
+        if row_count >= MARKET_DATA_COPY_THRESHOLD and supports_copy(db):
+            return self._copy_prices_batch(db, accumulated_prices, has_ohlc)
 
         # Build all records for bulk insert
-        for asset_id, prices in accumulated_prices:
+        for asset_id, prices, provider_name in accumulated_prices:
             for p in prices:
                 record = {
                     "asset_id": asset_id,
@@ -946,6 +979,7 @@ class MarketDataSyncService:
             )
 
             db.execute(upsert_stmt)
+            bump_price_versions(db, (asset_id for asset_id, _, _ in accumulated_prices))
             db.commit()
 
             total_stored = len(all_records)
@@ -958,109 +992,188 @@ class MarketDataSyncService:
             db.rollback()
             raise
 
-    def _store_no_data_markers(
+    def _copy_prices_batch(
             self,
             db: Session,
-            asset_id: int,
-            dates_with_no_data: list[date],
+            accumulated_prices: list[tuple[int, list[OHLCVData], str]],
+            has_ohlc: bool,
     ) -> int:
         """
-        Store markers for dates where no market data is available.
+        Store a large price batch via COPY into a staging table.
 
-        These markers prevent repeated API calls for holidays, weekends,
-        and dates where assets weren't trading.
+        Rows are streamed into a temporary table, then merged into
+        market_data with one INSERT ... SELECT ... ON CONFLICT that has the
+        same update semantics as the multi-row upsert in _store_prices_batch.
 
         Args:
-            db: Database session
-            asset_id: Asset ID
-            dates_with_no_data: Dates that had no data from API
+            db: Database session (PostgreSQL)
+            accumulated_prices: List of (asset_id, prices, provider) tuples
+            has_ohlc: Whether to write open/high/low columns
 
         Returns:
-            Number of markers stored
+            Total number of records stored
         """
-        if not dates_with_no_data:
-            return 0
+        columns = ["asset_id", "date", "close_price", "adjusted_close", "volume", "provider"]
+        if has_ohlc:
+            columns += ["open_price", "high_price", "low_price"]
+
+        def rows():
+            for asset_id, prices, provider_name in accumulated_prices:
+                for p in prices:
+                    row = (asset_id, p.date, p.close, p.adjusted_close, p.volume, provider_name)
+                    if has_ohlc:
+                        row += (p.open, p.high, p.low)
+                    yield row
 
-        provider_name = getattr(self._provider, 'name', 'unknown')
-        if not isinstance(provider_name, str):
-            provider_name = str(provider_name) if provider_name else 'unknown'
+        try:
+            stage = copy_into_staging(db, MarketData.__tablename__, columns, rows())
+
+            select_stmt = select(
+                *(stage.c[name] for name in columns),
+                literal(False),
+                null(),
+                literal(False),
+                func.now(),
+            )
+            stmt = pg_insert(MarketData).from_select(
+                columns + ["is_synthetic", "proxy_source_id", "no_data_available", "created_at"],
+                select_stmt,
+            )
 
-        records = [
-            {
-                "asset_id": asset_id,
-                "date": d,
-                "close_price": None,
-                "no_data_available": True,
-                "provider": provider_name,
-                "is_synthetic": False,
+            update_columns = {
+                name: stmt.excluded[name]
+                for name in columns
+                if name not in ("asset_id", "date")
             }
-            for d in dates_with_no_data
-        ]
 
-        try:
-            stmt = pg_insert(MarketData).values(records)
-            # On conflict, update to mark as no_data_available
-            # (in case a previous sync stored partial data)
-            upsert_stmt = stmt.on_conflict_do_update(
+            result = db.execute(stmt.on_conflict_do_update(
                 index_elements=["asset_id", "date"],
-                set_={
-                    "no_data_available": True,
-                    "close_price": None,
-                },
-            )
-            db.execute(upsert_stmt)
+                set_=update_columns,
+            ))
+            bump_price_versions(db, (asset_id for asset_id, _, _ in accumulated_prices))
             db.commit()
 
-            logger.debug(f"Stored {len(records)} no-data markers for asset {asset_id}")
-            return len(records)
+            total_stored = result.rowcount
+            logger.info(
+                f"Bulk loaded {total_stored} prices for {len(accumulated_prices)} assets via COPY"
+            )
+
+            return total_stored
 
         except Exception as e:
-            logger.error(f"Error storing no-data markers: {e}")
+            logger.error(f"Error bulk loading prices: {e}")
             db.rollback()
-            return 0
+            raise
 
-    def _clear_no_data_markers(
+    def _get_provider_name(self) -> str:
+        """Get the provider name as a string (mocks may not define one)."""
+        provider_name = getattr(self._provider, 'name', 'unknown')
+        if not isinstance(provider_name, str):
+            provider_name = str(provider_name) if provider_name else 'unknown'
+        return provider_name
+
+    def _get_answering_provider_name(self, prices_result: HistoricalPricesResult) -> str:
+        """Name of the provider that supplied a result (a composite's fallback, or ours)."""
+        if isinstance(prices_result.provider, str):
+            return prices_result.provider
+        return self._get_provider_name()
+
+    def _get_coverage_intervals(
             self,
             db: Session,
             asset_id: int,
             start_date: date,
             end_date: date,
-    ) -> int:
+    ) -> list[tuple[date, date]]:
         """
-        Clear no-data markers for an asset to allow re-fetching.
-
-        Used during full re-sync to retry dates that previously had no data.
+        Get fetched intervals for an asset that overlap a date range.
 
         Args:
             db: Database session
             asset_id: Asset ID
-            start_date: Start of range to clear
-            end_date: End of range to clear
+            start_date: Start of range
+            end_date: End of range
 
         Returns:
-            Number of markers cleared
+            List of (start, end) intervals from asset_coverage for the
+            current provider, ordered by start date
         """
-        try:
-            result = db.execute(
-                MarketData.__table__.delete().where(
-                    and_(
-                        MarketData.asset_id == asset_id,
-                        MarketData.date >= start_date,
-                        MarketData.date <= end_date,
-                        MarketData.no_data_available == True,
-                    )
+        rows = db.execute(
+            select(AssetCoverage.start_date, AssetCoverage.end_date)
+            .where(
+                and_(
+                    AssetCoverage.asset_id == asset_id,
+                    AssetCoverage.provider == self._get_provider_name(),
+                    AssetCoverage.start_date <= end_date,
+                    AssetCoverage.end_date >= start_date,
                 )
             )
-            db.commit()
-            deleted = result.rowcount
-            if deleted > 0:
-                logger.debug(f"Cleared {deleted} no-data markers for asset {asset_id}")
-            return deleted
+            .order_by(AssetCoverage.start_date)
+        ).all()
 
-        except Exception as e:
-            logger.error(f"Error clearing no-data markers: {e}")
-            db.rollback()
-            return 0
+        return [(row.start_date, row.end_date) for row in rows]
+
+    def _record_coverage(
+            self,
+            db: Session,
+            asset_id: int,
+            fetched_ranges: list[tuple[date, date]],
+            exchange: str | None = None,
+            provider_name: str | None = None,
+    ) -> None:
+        """
+        Record date ranges that were fetched from the provider for an asset.
+
+        New ranges are merged with the existing intervals they overlap or
+        touch (ignoring weekends and exchange holidays in between), so each
+        asset keeps a handful of rows no matter how many incremental syncs
+        have run. Concurrent syncs may leave overlapping rows; they are
+        harmless and get merged on the next write.
+
+        Does not commit - the caller commits together with the prices.
+
+        Args:
+            db: Database session
+            asset_id: Asset ID
+            fetched_ranges: Inclusive (start, end) ranges fetched successfully
+            exchange: Asset exchange code, selects the trading calendar
+            provider_name: Provider that supplied the ranges (default: ours)
+        """
+        if not fetched_ranges:
+            return
+
+        provider_name = provider_name or self._get_provider_name()
+        window_start = min(start for start, _ in fetched_ranges) - timedelta(days=7)
+        window_end = max(end for _, end in fetched_ranges) + timedelta(days=7)
+
+        existing = db.scalars(
+            select(AssetCoverage).where(
+                and_(
+                    AssetCoverage.asset_id == asset_id,
+                    AssetCoverage.provider == provider_name,
+                    AssetCoverage.start_date <= window_end,
+                    AssetCoverage.end_date >= window_start,
+                )
+            )
+        ).all()
+
+        merged = merge_date_ranges(
+            [(row.start_date, row.end_date) for row in existing] + list(fetched_ranges),
+            get_trading_calendar(exchange).is_trading_day,
+        )
+
+        for row in existing:
+            db.delete(row)
+        db.add_all([
+            AssetCoverage(
+                asset_id=asset_id,
+                provider=provider_name,
+                start_date=start,
+                end_date=end,
+            )
+            for start, end in merged
+        ])
+        db.flush()
 
     def _sync_asset_prices(
             self,
@@ -1099,6 +1212,7 @@ class MarketDataSyncService:
                     asset_info.asset_id,
                     asset_info.first_transaction_date,
                     end_date,
+                    exchange=asset_info.exchange,
                 )
 
             if not date_ranges:
@@ -1129,14 +1243,24 @@ class MarketDataSyncService:
                     result.error = prices_result.error
                     return result
 
+                # Record coverage first so it commits with the prices
+                provider_name = self._get_answering_provider_name(prices_result)
+                self._record_coverage(
+                    db, asset_info.asset_id, [(start, end)],
+                    exchange=asset_info.exchange, provider_name=provider_name,
+                )
+
                 if prices_result.prices:
                     # Store prices in database
                     self._store_prices(
                         db,
                         asset_info.asset_id,
                         prices_result.prices,
+                        provider_name=provider_name,
                     )
                     total_prices += len(prices_result.prices)
+                else:
+                    db.commit()
 
             result.prices_fetched = total_prices
             result.success = True
@@ -1196,68 +1320,43 @@ class MarketDataSyncService:
             asset_id: int,
             start_date: date,
             end_date: date,
+            exchange: str | None = None,
     ) -> list[tuple[date, date]]:
         """
-        Find date ranges that don't have price data.
+        Find date ranges that have not been fetched from the provider yet.
 
-        Returns ranges that need to be fetched, collapsing consecutive
-        missing dates into single ranges for efficiency.
+        Subtracts the asset's coverage intervals from the requested range,
+        drops gaps that contain only weekends or exchange holidays, then
+        collapses gaps separated by only a few days into single ranges
+        to keep the number of provider calls low.
 
         Args:
             db: Database session
             asset_id: Asset to check
             start_date: Start of range
             end_date: End of range
+            exchange: Asset exchange code, selects the trading calendar
 
         Returns:
             List of (start, end) date ranges to fetch
         """
-        # Get existing dates (INCLUDE no_data_available markers - we already tried those dates)
-        # This prevents re-fetching dates we know have no data from the provider
-        query = (
-            select(MarketData.date)
-            .where(
-                and_(
-                    MarketData.asset_id == asset_id,
-                    MarketData.date >= start_date,
-                    MarketData.date <= end_date,
-                    # Include ALL records - both real prices and no_data markers
-                )
-            )
+        calendar = get_trading_calendar(exchange)
+        covered = self._get_coverage_intervals(db, asset_id, start_date, end_date)
+        missing = subtract_date_ranges(
+            start_date, end_date, covered, calendar.is_trading_day
         )
 
-        existing_dates = set()
-        for row in db.execute(query).scalars():
-            if hasattr(row, 'date'):
-                existing_dates.add(row.date())
-            else:
-                existing_dates.add(row)
-
-        # Generate all business days in range
-        all_dates = get_business_days(start_date, end_date)
-
-        # Find missing dates
-        missing_dates = sorted([d for d in all_dates if d not in existing_dates])
-
-        if not missing_dates:
+        if not missing:
             return []
 
-        # Collapse consecutive dates into ranges
-        ranges = []
-        range_start = missing_dates[0]
-        range_end = missing_dates[0]
-
-        for d in missing_dates[1:]:
-            # Check if consecutive (allowing for weekends)
-            days_diff = (d - range_end).days
-            if days_diff <= 3:  # Allow gaps up to 3 days (weekend + 1)
-                range_end = d
+        # Collapse nearby ranges (allowing for weekends)
+        ranges = [missing[0]]
+        for range_start, range_end in missing[1:]:
+            prev_start, prev_end = ranges[-1]
+            if (range_start - prev_end).days <= 3:  # Allow gaps up to 3 days (weekend + 1)
+                ranges[-1] = (prev_start, range_end)
             else:
                 ranges.append((range_start, range_end))
-                range_start = d
-                range_end = d
-
-        ranges.append((range_start, range_end))
 
         return ranges
 
@@ -1266,6 +1365,7 @@ class MarketDataSyncService:
             db: Session,
             asset_id: int,
             prices: list[OHLCVData],
+            provider_name: str | None = None,
     ) -> int:
         """
         Store OHLCV prices in the database using bulk upsert.
@@ -1278,6 +1378,7 @@ class MarketDataSyncService:
             db: Database session
             asset_id: Asset ID
             prices: List of OHLCV data to store
+            provider_name: Provider that supplied the prices (default: ours)
 
         Returns:
             Number of records stored
@@ -1289,9 +1390,7 @@ class MarketDataSyncService:
         has_ohlc = hasattr(MarketData, 'open_price')
 
         # Get provider name safely
-        provider_name = getattr(self._provider, 'name', 'unknown')
-        if not isinstance(provider_name, str):
-            provider_name = str(provider_name) if provider_name else 'unknown'
+        provider_name = provider_name or self._get_provider_name()
 
         # Build list of records for bulk upsert
         records = []
@@ -1340,6 +1439,7 @@ class MarketDataSyncService:
             )
 
             db.execute(upsert_stmt)
+            bump_price_versions(db, [asset_id])
             db.commit()
 
             return len(records)
@@ -1466,6 +1566,32 @@ class MarketDataSyncService:
 
         return summary
 
+    @staticmethod
+    def _has_price_gap(
+            first_transaction_date: date,
+            first_price_date: date | None,
+            exchange: str | None,
+    ) -> bool:
+        """
+        Check if real prices start after the asset's first trading session.
+
+        A first transaction dated on a weekend or exchange holiday is not a
+        gap: the first price can only exist on the next trading day.
+
+        Args:
+            first_transaction_date: Date of the asset's first transaction
+            first_price_date: Date of the first real price (None if none)
+            exchange: Asset exchange code, selects the trading calendar
+
+        Returns:
+            True if there are trading days without real prices to backcast
+        """
+        if first_price_date is None:
+            return True
+        calendar = get_trading_calendar(exchange)
+        first_session = calendar.next_trading_day(first_transaction_date - timedelta(days=1))
+        return first_price_date > first_session
+
     def _backcast_assets_batch(
             self,
             db: Session,
@@ -1560,7 +1686,9 @@ class MarketDataSyncService:
                 # No prices at all - gap is entire history
                 gap_start = asset_info.first_transaction_date
                 gap_end = date.today()
-            elif first_real_date > asset_info.first_transaction_date:
+            elif self._has_price_gap(
+                    asset_info.first_transaction_date, first_real_date, asset.exchange
+            ):
                 # Gap exists
                 gap_start = asset_info.first_transaction_date
                 gap_end = first_real_date - timedelta(days=1)
@@ -1625,7 +1753,10 @@ class MarketDataSyncService:
                             end_date=overall_end,
                         )
                         if result.success and result.prices:
-                            self._store_prices(db, proxy_id, result.prices)
+                            self._store_prices(
+                                db, proxy_id, result.prices,
+                                provider_name=self._get_answering_provider_name(result),
+                            )
 
         # Step 6: Process proxy backcasting for assets with proxies
         # Track which assets fail proxy backcasting (for cost-carry fallback)
@@ -1661,7 +1792,9 @@ class MarketDataSyncService:
                 # No prices at all - gap is entire history
                 gap_start = asset_info.first_transaction_date
                 gap_end = date.today()
-            elif first_real_date > asset_info.first_transaction_date:
+            elif self._has_price_gap(
+                    asset_info.first_transaction_date, first_real_date, asset.exchange
+            ):
                 # Gap exists
                 gap_start = asset_info.first_transaction_date
                 gap_end = first_real_date - timedelta(days=1)
@@ -1908,6 +2041,8 @@ class MarketDataSyncService:
                 index_elements=["asset_id", "date"]
             )
             result = db.execute(stmt)
+            if result.rowcount != 0:
+                bump_price_versions(db, [asset_id])
             db.commit()
 
             # rowcount reflects actual inserts (excludes conflicts)
@@ -1964,7 +2099,12 @@ class MarketDataSyncService:
             )
 
             if result.success and result.prices:
-                self._store_prices(db, proxy_asset_id, result.prices)
+                provider_name = self._get_answering_provider_name(result)
+                self._record_coverage(
+                    db, proxy_asset_id, [(start_date, end_date)],
+                    exchange=proxy_asset.exchange, provider_name=provider_name,
+                )
+                self._store_prices(db, proxy_asset_id, result.prices, provider_name=provider_name)
                 return True
             else:
                 logger.error(f"Failed to fetch proxy data: {result.error}")
@@ -2043,23 +2183,19 @@ class MarketDataSyncService:
         from sqlalchemy import delete
 
         # Get all BUY transactions for this asset in this portfolio, sorted by date
-        buy_transactions = db.execute(
-            select(Transaction)
-            .where(
-                Transaction.portfolio_id == portfolio_id,
-                Transaction.asset_id == asset_id,
-                Transaction.transaction_type == TransactionType.BUY,
-            )
-            .order_by(Transaction.date)
-        ).scalars().all()
+        buy_transactions = load_transaction_records(
+            db,
+            Transaction.portfolio_id == portfolio_id,
+            Transaction.asset_id == asset_id,
+            Transaction.transaction_type == TransactionType.BUY,
+        )
 
         if not buy_transactions:
             logger.debug(f"No BUY transactions for asset {asset_id} in portfolio {portfolio_id}")
             return 0
 
         # Find the first buy date - we only create synthetic prices from this date
-        first_buy = buy_transactions[0]
-        first_buy_date = first_buy.date.date() if hasattr(first_buy.date, 'date') else first_buy.date
+        first_buy_date = buy_transactions[0].date
 
         # Adjust gap_start to not be before first buy
         effective_start = max(gap_start, first_buy_date)
@@ -2075,15 +2211,14 @@ class MarketDataSyncService:
         running_cost = Decimal("0")
 
         for txn in buy_transactions:
-            txn_date = txn.date.date() if hasattr(txn.date, 'date') else txn.date
             running_shares += txn.quantity
             # Calculate total cost as quantity * price_per_share (+ fee if applicable)
-            txn_total = txn.quantity * txn.price_per_share + (txn.fee or Decimal("0"))
+            txn_total = txn.quantity * txn.price_per_share + txn.fee
             running_cost += txn_total
 
             if running_shares > Decimal("0"):
                 avg_cost = running_cost / running_shares
-                cost_timeline.append((txn_date, avg_cost))
+                cost_timeline.append((txn.date, avg_cost))
 
         if not cost_timeline:
             return 0
@@ -2172,6 +2307,8 @@ class MarketDataSyncService:
                 index_elements=["asset_id", "date"]
             )
             result = db.execute(stmt)
+            if result.rowcount != 0:
+                bump_price_versions(db, [asset_id])
             db.commit()
 
             created = result.rowcount if result.rowcount >= 0 else len(records)
@@ -10,7 +10,7 @@ Key features:
 - Quote type mapping (Yahoo's types → our AssetClass)
 - Comprehensive error handling
 - Retry mechanism inherited from base class
-- Batch fetching for efficient bulk operations
+- Batch fetching for efficient bulk operations (per-symbol lookups run concurrently)
 - Historical OHLCV price data fetching
 
 Limitations:
@@ -24,6 +24,7 @@ like Bloomberg, Refinitiv, or Alpha Vantage Premium.
 
 import logging
 import math
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
 from decimal import Decimal
 from typing import Any
@@ -32,6 +33,7 @@ import yfinance as yf
 
 from app.models import AssetClass
 from app.services.constants import (
+    ASSET_INFO_FETCH_MAX_WORKERS,
     EXTERNAL_API_TIMEOUT_SECONDS,
     EXTERNAL_API_HISTORY_TIMEOUT_SECONDS,
 )
@@ -67,6 +69,11 @@ class YahooFinanceProvider(MarketDataProvider):
         - Uses exponential backoff: 1s → 2s → 4s
         - Maximum 3 attempts (configurable via class attributes)
 
+    Request Pacing (inherited from MarketDataProvider):
+        - Token bucket: 2 requests/second sustained, bursts of 5
+        - Halves the rate on "too many requests", recovers gradually
+        - Batch lookups pace and retry each symbol's request individually
+
     Example:
         provider = YahooFinanceProvider(timeout=15)
 
@@ -349,43 +356,33 @@ class YahooFinanceProvider(MarketDataProvider):
             ticker_map: dict[str, tuple[str, str]],
             result: BatchResult,
     ) -> None:
-        """Fetch a chunk of symbols."""
+        """
+        Fetch a chunk of symbols.
+
+        Each `info` read is its own HTTP request, so they run on a bounded
+        thread pool instead of one after another, each paced and retried
+        on its own (see _fetch_chunk_symbol).
+        """
         try:
             yf_tickers = yf.Tickers(" ".join(symbols))
 
-            for yahoo_symbol in symbols:
-                ticker, exchange = ticker_map[yahoo_symbol]
-                key = (ticker, exchange)
-
-                try:
-                    yf_ticker = yf_tickers.tickers.get(yahoo_symbol)
-                    if yf_ticker is None:
-                        result.failed[key] = TickerNotFoundError(
-                            ticker=ticker,
-                            exchange=exchange,
-                            provider=self.name,
-                        )
-                        continue
-
-                    info = yf_ticker.info
-                    if not self._is_valid_ticker_info(info):
-                        result.failed[key] = TickerNotFoundError(
-                            ticker=ticker,
-                            exchange=exchange,
-                            provider=self.name,
-                        )
-                        continue
-
-                    result.successful[key] = self._map_to_asset_info(
-                        info, ticker, exchange
-                    )
-
-                except Exception as e:
-                    error_str = str(e).lower()
-                    # Re-raise rate limit errors
-                    if "rate limit" in error_str or "too many requests" in error_str:
-                        raise RateLimitError(provider=self.name)
-                    result.failed[key] = e
+            executor = ThreadPoolExecutor(
+                max_workers=min(ASSET_INFO_FETCH_MAX_WORKERS, len(symbols)),
+                thread_name_prefix="yahoo-info",
+            )
+            try:
+                futures = [
+                    executor.submit(self._fetch_chunk_symbol, yf_tickers, yahoo_symbol, ticker_map[yahoo_symbol])
+                    for yahoo_symbol in symbols
+                ]
+                for future in futures:
+                    key, outcome = future.result()
+                    if isinstance(outcome, AssetInfo):
+                        result.successful[key] = outcome
+                    else:
+                        result.failed[key] = outcome
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
 
         except RateLimitError:
             # Re-raise rate limit errors directly
@@ -407,6 +404,53 @@ class YahooFinanceProvider(MarketDataProvider):
                         reason=str(e),
                     )
 
+    def _fetch_chunk_symbol(
+            self,
+            yf_tickers: Any,
+            yahoo_symbol: str,
+            key: tuple[str, str],
+    ) -> tuple[tuple[str, str], AssetInfo | Exception]:
+        """
+        Look up one symbol of a batch chunk (runs on a worker thread).
+
+        Every `info` read takes a token from the provider's rate limiter.
+        A rate-limited read slows the limiter down and is retried (up to
+        MAX_RETRY_ATTEMPTS) at the reduced rate; only this symbol is
+        retried, and if it stays limited it is recorded as failed with a
+        RateLimitError instead of restarting the whole batch.
+        """
+        ticker, exchange = key
+        yf_ticker = yf_tickers.tickers.get(yahoo_symbol)
+        if yf_ticker is None:
+            return key, TickerNotFoundError(ticker=ticker, exchange=exchange, provider=self.name)
+
+        rate_limiter = self._get_rate_limiter()
+        attempts = self.MAX_RETRY_ATTEMPTS if rate_limiter is not None else 1
+        for _ in range(attempts):
+            if rate_limiter is not None:
+                rate_limiter.acquire()
+            try:
+                info = yf_ticker.info
+            except Exception as e:
+                error_str = str(e).lower()
+                if "rate limit" not in error_str and "too many requests" not in error_str:
+                    return key, e
+                logger.warning(f"Rate limit hit looking up {yahoo_symbol}: {e}")
+                if rate_limiter is not None:
+                    rate_limiter.throttled()
+                continue
+
+            if rate_limiter is not None:
+                rate_limiter.succeeded()
+            if not self._is_valid_ticker_info(info):
+                return key, TickerNotFoundError(ticker=ticker, exchange=exchange, provider=self.name)
+            try:
+                return key, self._map_to_asset_info(info, ticker, exchange)
+            except Exception as e:
+                return key, e
+
+        return key, RateLimitError(provider=self.name)
+
     # =========================================================================
     # HISTORICAL PRICE METHODS
     # =========================================================================
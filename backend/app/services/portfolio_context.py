@@ -0,0 +1,544 @@
+# backend/app/services/portfolio_context.py
+"""
+Request-scoped data context for one portfolio.
+
+A single API request often runs several calculations over the same
+portfolio: the valuation endpoint values today and yesterday, and full
+analytics runs history, valuation, cash flow extraction and a benchmark
+comparison. Each of those used to load the portfolio row, its
+transactions, their assets and overlapping price/FX windows on its own.
+
+PortfolioDataContext loads each of these lazily on first use and memoizes
+it for the lifetime of the context, so every service handed the same
+context shares one copy:
+
+- portfolio: loaded once
+- transactions: ALL transactions loaded once, then sliced by date in memory
+- assets: loaded by ID, only IDs not seen before are queried
+- prices / FX rates: a covered date window is kept per asset / currency
+  pair; later requests only query the part of their window not yet covered
+- prices are read from the columnar price store instead of the database
+  for assets it holds, when a store is configured
+- other assets' prices go through the process-wide price series cache,
+  when one is configured, so only windows no request has loaded since the
+  asset's last price write reach the database
+- point FX lookups (valuation): memoized per currency pair and date, so
+  holdings sharing a currency cost one lookup instead of one each
+
+Routers get one context per request from the get_portfolio_data_context
+dependency. Services accept an optional context and create a private one
+when none is given, so direct callers keep working unchanged.
+
+Usage:
+    context = PortfolioDataContext(db, portfolio_id)
+
+    valuation = valuation_service.get_valuation(db, portfolio_id, today, context=context)
+    previous = valuation_service.get_valuation(db, portfolio_id, yesterday, context=context)
+    # Second call reuses transactions, assets and most of the price window
+
+The context is not thread-safe and must not outlive its session.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Hashable, Iterable
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models import Asset, ExchangeRate, MarketData, Portfolio, Transaction
+from app.services.transaction_records import (
+    TRANSACTION_RECORD_COLUMNS,
+    TransactionRecord,
+)
+
+if TYPE_CHECKING:
+    from app.services.fx_rate_service import FXRateResult
+    from app.services.market_data.price_cache import PriceSeries, PriceSeriesCache
+    from app.services.market_data.price_store import ColumnarPriceStore
+    from app.services.protocols import FXRateServiceProtocol
+
+# (asset_id, date) -> (close_price, is_synthetic, proxy_source_id)
+PriceMap = dict[tuple[int, date], tuple[Decimal, bool, int | None]]
+
+# (base_currency, quote_currency, date) -> rate
+FXRateMap = dict[tuple[str, str, date], Decimal]
+
+
+def _as_timestamp(value: date) -> datetime:
+    """
+    Timestamp a date compares as against Transaction.date (a DateTime).
+
+    Mirrors the database: `Transaction.date <= some_date` promotes the date
+    to midnight, so in-memory slicing selects exactly the rows SQL would.
+    """
+    if isinstance(value, datetime):
+        return value
+    return datetime.combine(value, time.min)
+
+
+class _WindowStore:
+    """
+    Date-window memo for time series keyed by asset ID or currency.
+
+    Tracks one contiguous covered range per key. Requests that extend a
+    key's range only fetch the uncovered edges, so consecutive or
+    overlapping windows (today's and yesterday's valuation) share rows.
+    """
+
+    def __init__(self) -> None:
+        self.coverage: dict[Hashable, tuple[date, date]] = {}
+        self.rows: dict[Hashable, dict[date, Any]] = {}
+
+    def missing(
+            self,
+            keys: Iterable[Hashable],
+            start: date,
+            end: date,
+    ) -> dict[tuple[date, date], list[Hashable]]:
+        """Group keys by the (start, end) range still to fetch for them."""
+        pending: dict[tuple[date, date], list[Hashable]] = {}
+        for key in keys:
+            covered = self.coverage.get(key)
+            if covered is None:
+                gaps = [(start, end)]
+            else:
+                low, high = covered
+                if start > high + timedelta(days=1) or end < low - timedelta(days=1):
+                    # Disjoint window: refetch the span between so coverage stays contiguous
+                    gaps = [(min(start, low), max(end, high))]
+                else:
+                    gaps = []
+                    if start < low:
+                        gaps.append((start, low - timedelta(days=1)))
+                    if end > high:
+                        gaps.append((high + timedelta(days=1), end))
+            for gap in gaps:
+                pending.setdefault(gap, []).append(key)
+        return pending
+
+    def extend(self, keys: Iterable[Hashable], start: date, end: date) -> None:
+        """Record that [start, end] has been fetched for keys."""
+        for key in keys:
+            covered = self.coverage.get(key)
+            if covered is None:
+                self.coverage[key] = (start, end)
+            else:
+                self.coverage[key] = (min(start, covered[0]), max(end, covered[1]))
+            self.rows.setdefault(key, {})
+
+    def add(self, key: Hashable, row_date: date, value: Any) -> None:
+        self.rows.setdefault(key, {})[row_date] = value
+
+    def window(self, key: Hashable, start: date, end: date) -> Iterable[tuple[date, Any]]:
+        """Rows for key within [start, end]."""
+        for row_date, value in self.rows.get(key, {}).items():
+            if start <= row_date <= end:
+                yield row_date, value
+
+
+class _MemoizedFXRates:
+    """
+    FXRateServiceProtocol wrapper that memoizes get_rate_or_none() results.
+
+    Misses (None) are memoized too: a missing rate stays missing for the
+    rest of the request.
+    """
+
+    def __init__(
+            self,
+            fx_service: FXRateServiceProtocol,
+            memo: dict[tuple[str, str, date, bool], FXRateResult | None],
+    ) -> None:
+        self._fx_service = fx_service
+        self._memo = memo
+
+    def get_rate_or_none(
+            self,
+            db: Session,
+            base_currency: str,
+            quote_currency: str,
+            target_date: date,
+            allow_fallback: bool = True,
+    ) -> FXRateResult | None:
+        key = (base_currency.upper(), quote_currency.upper(), target_date, allow_fallback)
+        if key not in self._memo:
+            self._memo[key] = self._fx_service.get_rate_or_none(
+                db=db,
+                base_currency=base_currency,
+                quote_currency=quote_currency,
+                target_date=target_date,
+                allow_fallback=allow_fallback,
+            )
+        return self._memo[key]
+
+
+class PortfolioDataContext:
+    """
+    Lazily loaded, memoized data for one portfolio within one request.
+
+    Attributes:
+        db: Session every load goes through
+        portfolio_id: Portfolio this context serves
+    """
+
+    def __init__(
+            self,
+            db: Session,
+            portfolio_id: int,
+            portfolio: Portfolio | None = None,
+            price_store: ColumnarPriceStore | None = None,
+            price_cache: PriceSeriesCache | None = None,
+    ) -> None:
+        """
+        Args:
+            db: Database session (request-scoped)
+            portfolio_id: Portfolio to load data for
+            portfolio: Already loaded portfolio row (e.g. from the owner
+                       check), saves the first lookup
+            price_store: Local price store consulted before the database
+            price_cache: Process-wide price series cache read through for
+                         assets not in the price store
+        """
+        self.db = db
+        self.portfolio_id = portfolio_id
+        self._price_store = price_store
+        self._price_cache = price_cache
+        self._portfolio = portfolio
+        self._portfolio_loaded = portfolio is not None
+
+        self._transactions: list[TransactionRecord] | None = None
+        self._transaction_times: list[datetime] = []
+
+        self._assets: dict[int, Asset] = {}
+        self._missing_asset_ids: set[int] = set()
+
+        self._prices = _WindowStore()
+        self._fx_rates: dict[str, _WindowStore] = {}
+        self._fx_point_rates: dict[tuple[str, str, date, bool], FXRateResult | None] = {}
+
+    # =========================================================================
+    # PORTFOLIO & TRANSACTIONS
+    # =========================================================================
+
+    @property
+    def portfolio(self) -> Portfolio | None:
+        """The portfolio row, or None if it does not exist."""
+        if not self._portfolio_loaded:
+            self._portfolio = self.db.get(Portfolio, self.portfolio_id)
+            self._portfolio_loaded = True
+        return self._portfolio
+
+    def get_transactions(
+            self,
+            start_date: date | None = None,
+            end_date: date | None = None,
+    ) -> list[TransactionRecord]:
+        """
+        Transactions with start_date <= date <= end_date, ordered by date, ID.
+
+        All of the portfolio's transactions are loaded on first call; every
+        later call slices the same list. Bounds compare like the equivalent
+        SQL filter on Transaction.date (dates mean midnight).
+
+        Args:
+            start_date: Inclusive lower bound (None = from the first transaction)
+            end_date: Inclusive upper bound (None = up to the last transaction)
+        """
+        if self._transactions is None:
+            self._load_transactions()
+
+        low = 0 if start_date is None else bisect_left(
+            self._transaction_times, _as_timestamp(start_date)
+        )
+        high = len(self._transactions) if end_date is None else bisect_right(
+            self._transaction_times, _as_timestamp(end_date)
+        )
+        return self._transactions[low:high]
+
+    def _load_transactions(self) -> None:
+        query = (
+            select(*TRANSACTION_RECORD_COLUMNS)
+            .where(Transaction.portfolio_id == self.portfolio_id)
+            .order_by(Transaction.date, Transaction.id)
+        )
+        records = []
+        times = []
+        for row in self.db.execute(query):
+            records.append(TransactionRecord.from_row(row))
+            times.append(_as_timestamp(row.date))
+        self._transactions = records
+        self._transaction_times = times
+
+    # =========================================================================
+    # ASSETS
+    # =========================================================================
+
+    def get_assets(self, asset_ids: Iterable[int]) -> dict[int, Asset]:
+        """
+        Assets by ID; IDs not loaded earlier in this context are queried.
+
+        IDs with no matching asset are left out of the result.
+        """
+        wanted = set(asset_ids)
+        to_load = wanted - self._assets.keys() - self._missing_asset_ids
+        if to_load:
+            for asset in self.db.scalars(select(Asset).where(Asset.id.in_(to_load))).all():
+                self._assets[asset.id] = asset
+            self._missing_asset_ids |= to_load - self._assets.keys()
+
+        return {asset_id: self._assets[asset_id] for asset_id in wanted if asset_id in self._assets}
+
+    # =========================================================================
+    # PRICES & FX RATES
+    # =========================================================================
+
+    def get_prices(
+            self,
+            asset_ids: Iterable[int],
+            start_date: date,
+            end_date: date,
+            memoize: bool = True,
+    ) -> PriceMap:
+        """
+        Close prices for asset_ids in [start_date, end_date].
+
+        No-data markers are excluded. Only the part of the window not
+        already covered for each asset is queried.
+
+        Args:
+            asset_ids: Assets to fetch
+            start_date: Inclusive window start
+            end_date: Inclusive window end
+            memoize: False fetches without keeping rows in the context, for
+                     callers that stream through large ranges chunk by chunk
+
+        Returns:
+            Dict mapping (asset_id, date) -> (close_price, is_synthetic, proxy_source_id)
+        """
+        asset_ids = set(asset_ids)
+        if not asset_ids:
+            return {}
+
+        if not memoize:
+            return {
+                (asset_id, price_date): value
+                for asset_id, price_date, value in self._query_prices(asset_ids, start_date, end_date)
+            }
+
+        self._fill(self._prices, asset_ids, start_date, end_date, self._query_prices)
+        return {
+            (asset_id, price_date): value
+            for asset_id in asset_ids
+            for price_date, value in self._prices.window(asset_id, start_date, end_date)
+        }
+
+    def get_fx_rates(
+            self,
+            base_currencies: Iterable[str],
+            quote_currency: str,
+            start_date: date,
+            end_date: date,
+            memoize: bool = True,
+    ) -> FXRateMap:
+        """
+        FX rates for base_currencies -> quote_currency in [start_date, end_date].
+
+        Args:
+            base_currencies: Currencies to convert from
+            quote_currency: Currency to convert to (portfolio currency)
+            start_date: Inclusive window start
+            end_date: Inclusive window end
+            memoize: False fetches without keeping rows in the context
+
+        Returns:
+            Dict mapping (BASE, QUOTE, date) -> rate, currency codes upper-cased
+        """
+        base_currencies = set(base_currencies)
+        if not base_currencies:
+            return {}
+        quote = quote_currency.upper()
+
+        def query(currencies, start, end):
+            return self._query_fx_rates(currencies, quote, start, end)
+
+        if not memoize:
+            return {
+                (base.upper(), quote, rate_date): rate
+                for base, rate_date, rate in query(base_currencies, start_date, end_date)
+            }
+
+        store = self._fx_rates.setdefault(quote, _WindowStore())
+        self._fill(store, base_currencies, start_date, end_date, query)
+        return {
+            (base.upper(), quote, rate_date): rate
+            for base in base_currencies
+            for rate_date, rate in store.window(base, start_date, end_date)
+        }
+
+    def memoized_fx(self, fx_service: FXRateServiceProtocol) -> FXRateServiceProtocol:
+        """
+        Wrap fx_service so point lookups are memoized in this context.
+
+        Every wrapper returned by the same context shares one memo.
+        """
+        return _MemoizedFXRates(fx_service, self._fx_point_rates)
+
+    @staticmethod
+    def _fill(
+            store: _WindowStore,
+            keys: set,
+            start_date: date,
+            end_date: date,
+            query: Callable[[set, date, date], Iterable[tuple[Hashable, date, Any]]],
+    ) -> None:
+        """Query the uncovered parts of [start_date, end_date] into store."""
+        for (gap_start, gap_end), gap_keys in store.missing(keys, start_date, end_date).items():
+            for key, row_date, value in query(set(gap_keys), gap_start, gap_end):
+                store.add(key, row_date, value)
+            store.extend(gap_keys, gap_start, gap_end)
+
+    def _query_prices(
+            self,
+            asset_ids: set[int],
+            start_date: date,
+            end_date: date,
+    ) -> Iterable[tuple[int, date, tuple[Decimal, bool, int | None]]]:
+        if self._price_store is not None:
+            in_database = set()
+            assets = self.get_assets(asset_ids)
+            for asset_id in asset_ids:
+                asset = assets.get(asset_id)
+                stored = (
+                    self._price_store.read_window(asset_id, start_date, end_date, asset.price_version)
+                    if asset is not None else None
+                )
+                if stored is None:
+                    in_database.add(asset_id)
+                    continue
+                for price_date, value in stored:
+                    yield asset_id, price_date, value
+            if not in_database:
+                return
+            asset_ids = in_database
+
+        if self._price_cache is not None:
+            yield from self._query_cached_prices(asset_ids, start_date, end_date)
+        else:
+            yield from self._select_prices(asset_ids, start_date, end_date)
+
+    def _query_cached_prices(
+            self,
+            asset_ids: set[int],
+            start_date: date,
+            end_date: date,
+    ) -> Iterable[tuple[int, date, tuple[Decimal, bool, int | None]]]:
+        """
+        Read prices through the shared cache, selecting only uncached ranges.
+
+        The version stamp comes from the asset row, read before any price
+        row, so a series is never cached under a newer version than its data.
+        """
+        assets = self.get_assets(asset_ids)
+        unknown = asset_ids - assets.keys()
+        if unknown:
+            yield from self._select_prices(unknown, start_date, end_date)
+
+        cached: dict[int, PriceSeries | None] = {}
+        gaps: dict[int, list[tuple[date, date]]] = {}
+        pending: dict[tuple[date, date], list[int]] = {}
+        for asset_id, asset in assets.items():
+            series = self._price_cache.get(asset_id, asset.price_version)
+            cached[asset_id] = series
+            gaps[asset_id] = series.missing(start_date, end_date) if series else [(start_date, end_date)]
+            for gap in gaps[asset_id]:
+                pending.setdefault(gap, []).append(asset_id)
+
+        loaded: dict[int, list[tuple[date, tuple[Decimal, bool, int | None]]]] = {}
+        for (gap_start, gap_end), gap_ids in pending.items():
+            for asset_id, price_date, value in self._select_prices(set(gap_ids), gap_start, gap_end):
+                loaded.setdefault(asset_id, []).append((price_date, value))
+
+        for asset_id, asset in assets.items():
+            series = cached[asset_id]
+            if gaps[asset_id]:
+                series = self._price_cache.merge(
+                    asset_id, asset.price_version, series, gaps[asset_id], loaded.get(asset_id, ()),
+                )
+            for price_date, value in series.window(start_date, end_date):
+                yield asset_id, price_date, value
+
+    def _select_prices(
+            self,
+            asset_ids: set[int],
+            start_date: date,
+            end_date: date,
+    ) -> Iterable[tuple[int, date, tuple[Decimal, bool, int | None]]]:
+        # Plain column tuples, not ORM entities: no identity map or unused
+        # OHLC/volume columns, and PostgreSQL can serve the query from
+        # ix_market_data_asset_date_covering with an index-only scan
+        query = select(
+            MarketData.asset_id,
+            MarketData.date,
+            MarketData.close_price,
+            MarketData.is_synthetic,
+            MarketData.proxy_source_id,
+        ).where(
+            MarketData.asset_id.in_(asset_ids),
+            MarketData.date >= start_date,
+            MarketData.date <= end_date,
+            MarketData.no_data_available == False,  # Exclude no-data markers
+        )
+        for asset_id, price_date, close_price, is_synthetic, proxy_source_id in self.db.execute(query):
+            yield asset_id, price_date, (close_price, is_synthetic, proxy_source_id)
+
+    def _query_fx_rates(
+            self,
+            base_currencies: set[str],
+            quote_currency: str,
+            start_date: date,
+            end_date: date,
+    ) -> Iterable[tuple[str, date, Decimal]]:
+        # Column tuples served by ix_exchange_rate_quote_base_date_covering
+        query = select(
+            ExchangeRate.base_currency,
+            ExchangeRate.date,
+            ExchangeRate.rate,
+        ).where(
+            ExchangeRate.base_currency.in_(base_currencies),
+            ExchangeRate.quote_currency == quote_currency,
+            ExchangeRate.date >= start_date,
+            ExchangeRate.date <= end_date,
+            ExchangeRate.no_data_available == False,  # Exclude no-data markers
+        )
+        yield from self.db.execute(query)
+
+
+def resolve_context(
+        db: Session,
+        portfolio_id: int,
+        context: PortfolioDataContext | None,
+        price_store: ColumnarPriceStore | None = None,
+        price_cache: PriceSeriesCache | None = None,
+) -> PortfolioDataContext:
+    """
+    Return context, or a fresh one (reading from price_store and
+    price_cache) when None.
+
+    Raises:
+        ValueError: If context belongs to a different portfolio
+    """
+    if context is None:
+        return PortfolioDataContext(
+            db, portfolio_id, price_store=price_store, price_cache=price_cache,
+        )
+    if context.portfolio_id != portfolio_id:
+        raise ValueError(
+            f"PortfolioDataContext is for portfolio {context.portfolio_id}, "
+            f"not {portfolio_id}"
+        )
+    return context
@@ -0,0 +1,312 @@
+# backend/app/services/position_ledger.py
+"""
+Materialized position ledger (portfolio_positions).
+
+Keeps one PortfolioPosition row per (portfolio, asset) with the running
+BUY/SELL aggregates HoldingsCalculator would compute from the full
+transaction history. Every code path that inserts, updates or deletes a
+Transaction applies the matching delta in the same database transaction,
+before it commits:
+
+    record_transactions(db, [txn])           # after creating txn
+    remove_transactions(db, [txn])           # before deleting txn
+    before = transaction_delta(txn)          # before changing txn
+    ...apply changes...
+    apply_deltas(db, [-before, transaction_delta(txn)])
+
+Deltas are applied with one INSERT ... ON CONFLICT (portfolio_id,
+asset_id) DO UPDATE SET column = column + excluded.column, so a missing
+row is created and an existing one incremented atomically, and
+concurrent writers never overwrite each other's totals.
+
+Reads:
+- quantity_held(): current quantity is one primary-key lookup; a
+  quantity as of a past date subtracts only the transactions dated after
+  it (an index range scan on ix_transaction_portfolio_asset_date), so
+  recent backdated sells stay cheap however long the history is.
+- get_positions(): all rows of a portfolio, the fast path for today's
+  valuation.
+
+rebuild_positions() recomputes rows from the transactions table (after
+imports that bypassed the service layer, or to repair drift).
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Iterable
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models import PortfolioPosition, Transaction, TransactionType
+from app.utils.fx_conversion import convert_using_broker_rate
+
+ZERO = Decimal("0")
+
+# Columns apply_deltas adds to
+_AGGREGATE_COLUMNS = (
+    "quantity",
+    "total_bought_qty",
+    "total_sold_qty",
+    "total_bought_cost_local",
+    "total_bought_cost_portfolio",
+    "total_sold_proceeds_portfolio",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class PositionDelta:
+    """
+    Change one transaction makes to a position's aggregates.
+
+    Attributes:
+        portfolio_id: Portfolio of the position
+        asset_id: Asset of the position
+        bought_qty: Added to total_bought_qty
+        sold_qty: Added to total_sold_qty
+        bought_cost_local: Added to total_bought_cost_local
+        bought_cost_portfolio: Added to total_bought_cost_portfolio
+        sold_proceeds_portfolio: Added to total_sold_proceeds_portfolio
+    """
+
+    portfolio_id: int
+    asset_id: int
+    bought_qty: Decimal = ZERO
+    sold_qty: Decimal = ZERO
+    bought_cost_local: Decimal = ZERO
+    bought_cost_portfolio: Decimal = ZERO
+    sold_proceeds_portfolio: Decimal = ZERO
+
+    def __neg__(self) -> "PositionDelta":
+        return PositionDelta(
+            portfolio_id=self.portfolio_id,
+            asset_id=self.asset_id,
+            bought_qty=-self.bought_qty,
+            sold_qty=-self.sold_qty,
+            bought_cost_local=-self.bought_cost_local,
+            bought_cost_portfolio=-self.bought_cost_portfolio,
+            sold_proceeds_portfolio=-self.sold_proceeds_portfolio,
+        )
+
+    def __add__(self, other: "PositionDelta") -> "PositionDelta":
+        return PositionDelta(
+            portfolio_id=self.portfolio_id,
+            asset_id=self.asset_id,
+            bought_qty=self.bought_qty + other.bought_qty,
+            sold_qty=self.sold_qty + other.sold_qty,
+            bought_cost_local=self.bought_cost_local + other.bought_cost_local,
+            bought_cost_portfolio=self.bought_cost_portfolio + other.bought_cost_portfolio,
+            sold_proceeds_portfolio=self.sold_proceeds_portfolio + other.sold_proceeds_portfolio,
+        )
+
+
+def transaction_delta(txn: Transaction) -> PositionDelta | None:
+    """
+    Delta a transaction contributes to its position.
+
+    Accepts a Transaction or a row with the same columns. Uses the same
+    cost / proceeds formulas as HoldingsCalculator.
+
+    Returns:
+        The delta, or None for transactions that don't affect a position
+        (DEPOSIT, WITHDRAWAL, ... or no asset)
+    """
+    if txn.asset_id is None:
+        return None
+
+    exchange_rate = txn.exchange_rate or Decimal("1")
+    fee = txn.fee or ZERO
+
+    if txn.transaction_type == TransactionType.BUY:
+        cost_local = (txn.quantity * txn.price_per_share) + fee
+        return PositionDelta(
+            portfolio_id=txn.portfolio_id,
+            asset_id=txn.asset_id,
+            bought_qty=txn.quantity,
+            bought_cost_local=cost_local,
+            bought_cost_portfolio=convert_using_broker_rate(cost_local, exchange_rate),
+        )
+
+    if txn.transaction_type == TransactionType.SELL:
+        proceeds_local = (txn.quantity * txn.price_per_share) - fee
+        return PositionDelta(
+            portfolio_id=txn.portfolio_id,
+            asset_id=txn.asset_id,
+            sold_qty=txn.quantity,
+            sold_proceeds_portfolio=convert_using_broker_rate(proceeds_local, exchange_rate),
+        )
+
+    return None
+
+
+def apply_deltas(db: Session, deltas: Iterable[PositionDelta | None]) -> None:
+    """
+    Add deltas to their positions, creating rows as needed. Does not commit.
+
+    Deltas for the same position are merged first, then all positions
+    are upserted in a single INSERT ... ON CONFLICT DO UPDATE (PostgreSQL,
+    or SQLite's equivalent in tests). Rows are sent in key order so
+    concurrent batches lock positions in the same order. None entries
+    are ignored.
+    """
+    merged: dict[tuple[int, int], PositionDelta] = {}
+    for delta in deltas:
+        if delta is None:
+            continue
+        key = (delta.portfolio_id, delta.asset_id)
+        merged[key] = merged[key] + delta if key in merged else delta
+
+    if not merged:
+        return
+
+    upsert = pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+    stmt = upsert(PortfolioPosition).values([
+        {
+            "portfolio_id": portfolio_id,
+            "asset_id": asset_id,
+            "quantity": delta.bought_qty - delta.sold_qty,
+            "total_bought_qty": delta.bought_qty,
+            "total_sold_qty": delta.sold_qty,
+            "total_bought_cost_local": delta.bought_cost_local,
+            "total_bought_cost_portfolio": delta.bought_cost_portfolio,
+            "total_sold_proceeds_portfolio": delta.sold_proceeds_portfolio,
+        }
+        for (portfolio_id, asset_id), delta in sorted(merged.items())
+    ])
+    set_ = {
+        column: getattr(PortfolioPosition, column) + stmt.excluded[column]
+        for column in _AGGREGATE_COLUMNS
+    }
+    set_["updated_at"] = stmt.excluded.updated_at
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=["portfolio_id", "asset_id"],
+        set_=set_,
+    ))
+
+
+def record_transactions(db: Session, transactions: Iterable[Transaction]) -> None:
+    """Add new transactions to their positions. Does not commit."""
+    apply_deltas(db, (transaction_delta(txn) for txn in transactions))
+
+
+def remove_transactions(db: Session, transactions: Iterable[Transaction]) -> None:
+    """Take deleted transactions out of their positions. Does not commit."""
+    apply_deltas(db, (
+        -delta for delta in map(transaction_delta, transactions) if delta is not None
+    ))
+
+
+# =============================================================================
+# READS
+# =============================================================================
+
+def quantity_held(
+        db: Session,
+        portfolio_id: int,
+        asset_id: int,
+        as_of: datetime | None = None,
+) -> tuple[Decimal, Decimal, Decimal]:
+    """
+    Quantity of an asset held in a portfolio, now or as of a date.
+
+    The current totals come from the ledger row. For as_of, transactions
+    dated after it are subtracted again, scanning only that tail of the
+    asset's history.
+
+    Args:
+        db: Database session
+        portfolio_id: Portfolio to check
+        asset_id: Asset to check
+        as_of: Include transactions up to this timestamp (inclusive);
+               None = all transactions
+
+    Returns:
+        Tuple of (net_quantity, total_bought, total_sold)
+    """
+    row = db.execute(
+        select(PortfolioPosition.total_bought_qty, PortfolioPosition.total_sold_qty)
+        .where(
+            PortfolioPosition.portfolio_id == portfolio_id,
+            PortfolioPosition.asset_id == asset_id,
+        )
+    ).first()
+    if row is None:
+        return ZERO, ZERO, ZERO
+
+    total_bought = Decimal(str(row.total_bought_qty))
+    total_sold = Decimal(str(row.total_sold_qty))
+
+    if as_of is not None:
+        later = db.execute(
+            select(Transaction.transaction_type, func.sum(Transaction.quantity).label("total_qty"))
+            .where(
+                Transaction.portfolio_id == portfolio_id,
+                Transaction.asset_id == asset_id,
+                Transaction.date > as_of,
+                Transaction.transaction_type.in_([TransactionType.BUY, TransactionType.SELL]),
+            )
+            .group_by(Transaction.transaction_type)
+        ).all()
+        for transaction_type, total_qty in later:
+            if transaction_type == TransactionType.BUY:
+                total_bought -= Decimal(str(total_qty))
+            else:
+                total_sold -= Decimal(str(total_qty))
+
+    return total_bought - total_sold, total_bought, total_sold
+
+
+def get_positions(db: Session, portfolio_id: int) -> list[PortfolioPosition]:
+    """All ledger rows of a portfolio (open and closed), freshly loaded."""
+    return list(db.scalars(
+        select(PortfolioPosition)
+        .where(PortfolioPosition.portfolio_id == portfolio_id)
+        .order_by(PortfolioPosition.asset_id)
+        .execution_options(populate_existing=True)
+    ).all())
+
+
+# =============================================================================
+# REBUILD
+# =============================================================================
+
+def rebuild_positions(db: Session, portfolio_id: int | None = None) -> int:
+    """
+    Recompute ledger rows from the transactions table. Does not commit.
+
+    Args:
+        db: Database session
+        portfolio_id: Only rebuild this portfolio (None = all portfolios)
+
+    Returns:
+        Number of position rows written
+    """
+    clear = delete(PortfolioPosition)
+    query = select(
+        Transaction.portfolio_id,
+        Transaction.asset_id,
+        Transaction.transaction_type,
+        Transaction.quantity,
+        Transaction.price_per_share,
+        Transaction.fee,
+        Transaction.exchange_rate,
+    ).where(
+        Transaction.asset_id.is_not(None),
+        Transaction.transaction_type.in_([TransactionType.BUY, TransactionType.SELL]),
+    )
+    if portfolio_id is not None:
+        clear = clear.where(PortfolioPosition.portfolio_id == portfolio_id)
+        query = query.where(Transaction.portfolio_id == portfolio_id)
+
+    db.execute(clear)
+    totals: dict[tuple[int, int], PositionDelta] = {}
+    for row in db.execute(query.execution_options(yield_per=1000)):
+        delta = transaction_delta(row)
+        key = (delta.portfolio_id, delta.asset_id)
+        totals[key] = totals[key] + delta if key in totals else delta
+
+    apply_deltas(db, totals.values())
+    return len(totals)
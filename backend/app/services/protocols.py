@@ -10,13 +10,15 @@ Using typing.Protocol enables structural subtyping:
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import date
 from typing import Protocol, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
     from app.services.fx_rate_service import FXRateResult
-    from app.services.valuation.types import PortfolioValuation, PortfolioHistory
+    from app.services.portfolio_context import PortfolioDataContext
+    from app.services.valuation.types import HistoryPoint, PortfolioValuation, PortfolioHistory
 
 
 class FXRateServiceProtocol(Protocol):
@@ -34,13 +36,14 @@ class FXRateServiceProtocol(Protocol):
 
 
 class ValuationServiceProtocol(Protocol):
-    """Interface required by AnalyticsService."""
+    """Interface required by AnalyticsService and ExportService."""
 
     def get_valuation(
         self,
         db: Session,
         portfolio_id: int,
         valuation_date: date | None = None,
+        context: PortfolioDataContext | None = None,
     ) -> PortfolioValuation:
         ...
 
@@ -51,5 +54,17 @@ class ValuationServiceProtocol(Protocol):
         start_date: date,
         end_date: date,
         interval: str = "daily",
+        context: PortfolioDataContext | None = None,
     ) -> PortfolioHistory:
         ...
+
+    def iter_history(
+        self,
+        db: Session,
+        portfolio_id: int,
+        start_date: date,
+        end_date: date,
+        interval: str = "daily",
+        context: PortfolioDataContext | None = None,
+    ) -> Iterator[HistoryPoint]:
+        ...
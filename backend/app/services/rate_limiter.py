@@ -0,0 +1,227 @@
+# backend/app/services/rate_limiter.py
+"""
+Adaptive token-bucket rate limiter for outbound API calls.
+
+The circuit breaker reacts after a provider starts failing; this limiter
+paces requests up front so a full resync does not trip rate limits in the
+first place. When the provider still answers with "too many requests",
+the rate is cut multiplicatively and then recovered additively (AIMD),
+the same scheme TCP uses for congestion control.
+
+Pacing:
+    Tokens refill continuously at `rate` per second up to `capacity`.
+    Each call reserves one token. If none is available, the caller is
+    given a slot in the future and sleeps until then, so concurrent
+    callers are served in arrival order without a thundering herd.
+
+Adaptation:
+    throttled() - rate *= backoff_factor (not below min_rate)
+    succeeded() - rate += recovery_step (not above max_rate), at most once
+                  per recovery_interval and only after recovery_interval
+                  has passed since the last throttle
+
+Usage:
+    from app.services.rate_limiter import TokenBucket
+
+    bucket = TokenBucket(name="yahoo", max_rate=2.0, capacity=5)
+
+    bucket.acquire()            # blocks until the request may be sent
+    try:
+        response = call_external_service()
+    except RateLimitError:
+        bucket.throttled()
+        raise
+    bucket.succeeded()
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TokenBucketStats:
+    """
+    Statistics for monitoring request pacing.
+
+    Attributes:
+        current_rate: Requests per second currently allowed
+        max_rate: Configured ceiling the rate recovers towards
+        tokens_available: Tokens in the bucket (negative = reserved ahead)
+        queue_depth: Callers currently waiting for a token
+        total_acquired: Tokens handed out since start
+        total_wait_seconds: Cumulative time callers spent waiting
+        throttle_events: Number of rate reductions after rate-limit errors
+    """
+    current_rate: float
+    max_rate: float
+    tokens_available: float
+    queue_depth: int = 0
+    total_acquired: int = 0
+    total_wait_seconds: float = 0.0
+    throttle_events: int = 0
+
+
+@dataclass
+class TokenBucket:
+    """
+    Thread-safe token bucket with adaptive rate.
+
+    Attributes:
+        name: Identifier used in logs
+        max_rate: Maximum (and initial) tokens per second
+        capacity: Burst size - tokens that can accumulate while idle
+        min_rate: Floor for the rate after repeated throttling
+        backoff_factor: Multiplier applied to the rate on throttling (0-1)
+        recovery_step: Tokens/second added back per recovery step
+        recovery_interval: Seconds between recovery steps
+
+    Example:
+        bucket = TokenBucket(name="market-data-yahoo", max_rate=2.0, capacity=5)
+        bucket.acquire()
+    """
+
+    name: str
+    max_rate: float = 2.0
+    capacity: float = 5.0
+    min_rate: float = 0.1
+    backoff_factor: float = 0.5
+    recovery_step: float = 0.1
+    recovery_interval: float = 5.0
+
+    # Internal state (not part of constructor)
+    _rate: float = field(default=0.0, init=False)
+    _tokens: float = field(default=0.0, init=False)
+    _last_refill: float = field(default=0.0, init=False)
+    _last_recovery: float = field(default=0.0, init=False)
+    _waiting: int = field(default=0, init=False)
+    _total_acquired: int = field(default=0, init=False)
+    _total_wait: float = field(default=0.0, init=False)
+    _throttle_events: int = field(default=0, init=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False)
+
+    def __post_init__(self) -> None:
+        """Validate configuration and start with a full bucket."""
+        if self.max_rate <= 0:
+            raise ValueError("max_rate must be positive")
+        if self.capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if not 0 < self.min_rate <= self.max_rate:
+            raise ValueError("min_rate must be positive and not exceed max_rate")
+        if not 0 < self.backoff_factor < 1:
+            raise ValueError("backoff_factor must be between 0 and 1")
+
+        self._rate = self.max_rate
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+
+        logger.info(
+            f"TokenBucket '{self.name}' initialized: "
+            f"rate={self.max_rate}/s, burst={self.capacity}"
+        )
+
+    @property
+    def rate(self) -> float:
+        """Requests per second currently allowed."""
+        with self._lock:
+            return self._rate
+
+    @property
+    def stats(self) -> TokenBucketStats:
+        """Get a snapshot of current statistics."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return TokenBucketStats(
+                current_rate=self._rate,
+                max_rate=self.max_rate,
+                tokens_available=self._tokens,
+                queue_depth=self._waiting,
+                total_acquired=self._total_acquired,
+                total_wait_seconds=self._total_wait,
+                throttle_events=self._throttle_events,
+            )
+
+    def _refill(self, now: float) -> None:
+        """Add tokens earned since the last refill. Must hold the lock."""
+        elapsed = now - self._last_refill
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self._rate)
+            self._last_refill = now
+
+    def acquire(self) -> float:
+        """
+        Take one token, sleeping until it is available.
+
+        Returns:
+            Seconds spent waiting (0.0 if a token was immediately available)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            # Reserve a token; a negative balance is the queue of callers
+            # ahead of us, each of which will be paid back at self._rate.
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+            self._total_acquired += 1
+            self._total_wait += wait
+            if wait > 0:
+                self._waiting += 1
+
+        if wait > 0:
+            logger.debug(f"TokenBucket '{self.name}' pacing request: waiting {wait:.2f}s")
+            try:
+                time.sleep(wait)
+            finally:
+                with self._lock:
+                    self._waiting -= 1
+
+        return wait
+
+    def throttled(self) -> None:
+        """
+        Record a rate-limit response and slow down.
+
+        Also drains any accumulated burst so the next requests are paced
+        at the reduced rate immediately.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            old_rate = self._rate
+            self._rate = max(self.min_rate, self._rate * self.backoff_factor)
+            self._tokens = min(self._tokens, 0.0)
+            # Recovery starts counting from the throttle
+            self._last_recovery = now
+            self._throttle_events += 1
+            new_rate = self._rate
+
+        logger.warning(
+            f"TokenBucket '{self.name}' throttled: "
+            f"rate {old_rate:.2f}/s -> {new_rate:.2f}/s"
+        )
+
+    def succeeded(self) -> None:
+        """Record a successful call and recover the rate gradually."""
+        with self._lock:
+            if self._rate >= self.max_rate:
+                return
+            now = time.monotonic()
+            if now - self._last_recovery < self.recovery_interval:
+                return
+            self._refill(now)
+            self._rate = min(self.max_rate, self._rate + self.recovery_step)
+            self._last_recovery = now
+            new_rate = self._rate
+
+        logger.debug(f"TokenBucket '{self.name}' recovering: rate {new_rate:.2f}/s")
+
+    def reset(self) -> None:
+        """Restore the maximum rate and a full bucket."""
+        with self._lock:
+            self._rate = self.max_rate
+            self._tokens = self.capacity
+            self._last_refill = time.monotonic()
+            logger.info(f"TokenBucket '{self.name}' reset")
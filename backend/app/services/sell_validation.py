@@ -0,0 +1,178 @@
+# backend/app/services/sell_validation.py
+"""
+Batch SELL validation by in-memory ledger replay.
+
+Checks a whole batch of new transactions against what each portfolio
+holds, with a fixed number of queries however many SELLs the batch has:
+
+1. The current quantity of every (portfolio, asset) pair that has a SELL
+   in the batch, from the portfolio_positions ledger (one query).
+2. The recorded BUY/SELL transactions of those pairs dated on or after
+   the earliest batch date (one query), taken back out of the current
+   quantity to get the opening balance.
+3. Recorded and new transactions replayed in date order in memory.
+
+A new SELL fails when it sells more than is held at its date, with the
+same inclusive rule as quantity_held(as_of=...): transactions recorded
+at the same timestamp count before it. Replaying the recorded tail also
+catches backdated SELLs that leave a later, already recorded SELL short;
+that shortfall is charged to the last new SELL before it.
+
+Usage:
+    shortfalls = find_sell_shortfalls(db, rows)
+    for shortfall in shortfalls:
+        row = rows[shortfall.position]
+"""
+
+from collections import defaultdict
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Session
+
+from app.models import PortfolioPosition, Transaction, TransactionType
+
+ZERO = Decimal("0")
+
+# Replay order at equal timestamps: recorded transactions first
+_RECORDED = 0
+_NEW = 1
+
+
+@dataclass(frozen=True, slots=True)
+class SellShortfall:
+    """
+    A new SELL that sells more than the portfolio holds.
+
+    Attributes:
+        position: Index of the SELL in the rows passed in
+        available: Quantity held just before the SELL (or, for a recorded
+                   SELL left short, just before that SELL)
+        recorded_sell_date: Set when the shortfall shows up at a later,
+                            already recorded SELL instead of at this one
+        recorded_sell_quantity: Quantity of that recorded SELL
+    """
+
+    position: int
+    available: Decimal
+    recorded_sell_date: datetime | None = None
+    recorded_sell_quantity: Decimal | None = None
+
+
+def find_sell_shortfalls(
+        db: Session,
+        rows: Sequence[Mapping[str, Any]],
+) -> list[SellShortfall]:
+    """
+    Find the new SELLs in rows that oversell their position at any point.
+
+    Args:
+        db: Database session
+        rows: New transactions (dicts with portfolio_id, asset_id,
+              transaction_type, date and quantity), not yet inserted
+
+    Returns:
+        Shortfalls ordered by position (empty when every SELL is covered)
+    """
+    pairs = {
+        (row["portfolio_id"], row["asset_id"])
+        for row in rows
+        if row["transaction_type"] == TransactionType.SELL
+    }
+    if not pairs:
+        return []
+
+    # Events per pair: (date, source, sequence, type, quantity)
+    events: dict[tuple[int, int], list[tuple]] = defaultdict(list)
+    for position, row in enumerate(rows):
+        pair = (row["portfolio_id"], row["asset_id"])
+        if pair in pairs and row["transaction_type"] in (TransactionType.BUY, TransactionType.SELL):
+            events[pair].append((
+                _naive_utc(row["date"]), _NEW, position, row["transaction_type"], Decimal(row["quantity"]),
+            ))
+    start = min(event[0] for pair_events in events.values() for event in pair_events)
+
+    pair_filter = tuple_(PortfolioPosition.portfolio_id, PortfolioPosition.asset_id).in_(list(pairs))
+    opening: dict[tuple[int, int], Decimal] = {
+        (portfolio_id, asset_id): Decimal(str(bought)) - Decimal(str(sold))
+        for portfolio_id, asset_id, bought, sold in db.execute(
+            select(
+                PortfolioPosition.portfolio_id,
+                PortfolioPosition.asset_id,
+                PortfolioPosition.total_bought_qty,
+                PortfolioPosition.total_sold_qty,
+            ).where(pair_filter)
+        )
+    }
+
+    recorded = db.execute(
+        select(
+            Transaction.portfolio_id,
+            Transaction.asset_id,
+            Transaction.date,
+            Transaction.transaction_type,
+            Transaction.quantity,
+        )
+        .where(
+            tuple_(Transaction.portfolio_id, Transaction.asset_id).in_(list(pairs)),
+            Transaction.transaction_type.in_([TransactionType.BUY, TransactionType.SELL]),
+            Transaction.date >= start,
+        )
+        .order_by(Transaction.date, Transaction.id)
+    )
+    for sequence, (portfolio_id, asset_id, txn_date, transaction_type, quantity) in enumerate(recorded):
+        pair = (portfolio_id, asset_id)
+        quantity = Decimal(str(quantity))
+        events[pair].append((_naive_utc(txn_date), _RECORDED, sequence, transaction_type, quantity))
+        # The recorded tail is replayed, so it comes out of the opening balance
+        signed = quantity if transaction_type == TransactionType.BUY else -quantity
+        opening[pair] = opening.get(pair, ZERO) - signed
+
+    shortfalls: list[SellShortfall] = []
+    for pair, pair_events in events.items():
+        shortfalls.extend(_replay(opening.get(pair, ZERO), sorted(pair_events, key=lambda e: e[:3])))
+    return sorted(shortfalls, key=lambda s: s.position)
+
+
+def _replay(balance: Decimal, events: list[tuple]) -> list[SellShortfall]:
+    """Walk one position's events in order and collect the shortfalls."""
+    shortfalls: list[SellShortfall] = []
+    last_new_sell: int | None = None
+    new_net_sold = ZERO  # new SELLs minus new BUYs replayed so far
+
+    for txn_date, source, sequence, transaction_type, quantity in events:
+        if transaction_type == TransactionType.BUY:
+            balance += quantity
+            if source == _NEW:
+                new_net_sold -= quantity
+        elif source == _NEW:
+            if quantity > balance:
+                shortfalls.append(SellShortfall(position=sequence, available=balance))
+                continue
+            balance -= quantity
+            new_net_sold += quantity
+            last_new_sell = sequence
+        else:
+            # Recorded SELL: only a shortfall the new rows caused counts
+            if quantity > balance and quantity <= balance + new_net_sold and last_new_sell is not None:
+                shortfalls.append(SellShortfall(
+                    position=last_new_sell,
+                    available=balance,
+                    recorded_sell_date=txn_date,
+                    recorded_sell_quantity=quantity,
+                ))
+                last_new_sell = None
+            balance -= quantity
+
+    return shortfalls
+
+
+def _naive_utc(value: datetime) -> datetime:
+    """Compare request dates (often aware) with stored ones (naive UTC)."""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
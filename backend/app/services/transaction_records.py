@@ -0,0 +1,123 @@
+# backend/app/services/transaction_records.py
+"""
+Lightweight transaction read model for calculators.
+
+Valuation, history, analytics and cost-carry calculations only read a
+handful of transaction columns, but loading full Transaction entities
+costs ORM hydration, identity-map bookkeeping and lazy `asset`
+relationships on every row. For portfolios with tens of thousands of
+transactions that overhead dominates the arithmetic.
+
+TransactionRecord is an immutable, slotted snapshot of exactly the
+columns the calculators use, loaded with a single projected query. Its
+`date` is already a `date` (Transaction.date is a DateTime column), so
+callers no longer normalize it on every comparison.
+
+Usage:
+    from app.services.transaction_records import load_transaction_records
+
+    records = load_transaction_records(
+        db,
+        Transaction.portfolio_id == portfolio_id,
+        Transaction.date <= end_date,
+    )
+    for txn in records:
+        txn.date, txn.transaction_type, txn.quantity, ...
+
+Records are duck-type compatible with Transaction for every attribute
+they carry, so calculators accept either.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import ColumnElement, Row, select
+from sqlalchemy.orm import Session
+
+from app.models import Transaction, TransactionType
+
+
+@dataclass(frozen=True, slots=True)
+class TransactionRecord:
+    """
+    Read-only view of one transaction.
+
+    Attributes:
+        id: Transaction ID
+        asset_id: Asset ID (None for DEPOSIT/WITHDRAWAL)
+        transaction_type: BUY, SELL, DEPOSIT, WITHDRAWAL, ...
+        date: Trade date (time component stripped)
+        quantity: Shares (or cash amount for DEPOSIT/WITHDRAWAL)
+        price_per_share: Price in transaction currency
+        fee: Fee in transaction currency (0 when not recorded)
+        currency: Transaction currency (ISO 4217)
+        exchange_rate: Broker rate "1 portfolio_currency = X currency"
+                       (None when not recorded; callers default to 1)
+    """
+
+    id: int
+    asset_id: int | None
+    transaction_type: TransactionType
+    date: date
+    quantity: Decimal
+    price_per_share: Decimal
+    fee: Decimal
+    currency: str
+    exchange_rate: Decimal | None
+
+    @classmethod
+    def from_row(cls, row: Row[Any]) -> "TransactionRecord":
+        """Build a record from a row selected with TRANSACTION_RECORD_COLUMNS."""
+        (txn_id, asset_id, transaction_type, txn_date, quantity,
+         price_per_share, fee, currency, exchange_rate) = row
+        if isinstance(txn_date, datetime):
+            txn_date = txn_date.date()
+        return cls(
+            id=txn_id,
+            asset_id=asset_id,
+            transaction_type=transaction_type,
+            date=txn_date,
+            quantity=quantity,
+            price_per_share=price_per_share,
+            fee=fee if fee is not None else Decimal("0"),
+            currency=currency,
+            exchange_rate=exchange_rate,
+        )
+
+
+# Columns selected for TransactionRecord, in from_row() order
+TRANSACTION_RECORD_COLUMNS = (
+    Transaction.id,
+    Transaction.asset_id,
+    Transaction.transaction_type,
+    Transaction.date,
+    Transaction.quantity,
+    Transaction.price_per_share,
+    Transaction.fee,
+    Transaction.currency,
+    Transaction.exchange_rate,
+)
+
+
+def load_transaction_records(
+        db: Session,
+        *criteria: ColumnElement[bool],
+) -> list[TransactionRecord]:
+    """
+    Load transactions matching criteria as TransactionRecords.
+
+    Args:
+        db: Database session
+        *criteria: WHERE clauses on Transaction columns
+
+    Returns:
+        Records ordered by date, then ID (stable for same-day trades)
+    """
+    query = (
+        select(*TRANSACTION_RECORD_COLUMNS)
+        .where(*criteria)
+        .order_by(Transaction.date, Transaction.id)
+    )
+    return [TransactionRecord.from_row(row) for row in db.execute(query)]
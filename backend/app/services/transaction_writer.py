@@ -0,0 +1,184 @@
+# backend/app/services/transaction_writer.py
+"""
+Bulk transaction inserts and duplicate detection.
+
+Creating one Transaction entity per row and reading ids back with
+db.refresh() costs ORM unit-of-work bookkeeping plus one SELECT per row
+after the commit. For uploads and batch creates of thousands of rows
+that dominates the request.
+
+insert_transactions() sends the rows as plain dicts through an ORM bulk
+INSERT ... RETURNING id (SQLAlchemy "insertmanyvalues"), in batches of
+TRANSACTION_INSERT_BATCH_ROWS, and applies the position ledger deltas in
+the same database transaction. The caller commits (or rolls back), so
+a multi-batch insert is still all-or-nothing.
+
+Duplicates:
+    Every transaction stores a fingerprint: a hash of portfolio, asset,
+    type, date, quantity, price and fee (see transaction_fingerprint()).
+    split_new_transactions() looks the fingerprints of a batch of rows up
+    with one indexed IN query per TRANSACTION_INSERT_BATCH_ROWS rows and
+    drops rows already recorded, so re-uploading a full broker export
+    only adds what is new. Identical rows are matched by count: a file
+    with two identical trades against a portfolio holding one of them
+    inserts the second.
+
+Usage:
+    from app.services.transaction_writer import insert_transactions, split_new_transactions
+
+    new_rows, skipped_rows = split_new_transactions(db, rows)
+    try:
+        ids = insert_transactions(db, new_rows)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+"""
+
+import hashlib
+from collections.abc import Sequence
+from datetime import timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+
+from app.models import Transaction, TransactionType
+from app.services.constants import TRANSACTION_INSERT_BATCH_ROWS
+from app.services.position_ledger import record_transactions
+
+# Keys every row passed to insert_transactions() must have
+TRANSACTION_INSERT_COLUMNS: tuple[str, ...] = (
+    "portfolio_id",
+    "asset_id",
+    "transaction_type",
+    "date",
+    "quantity",
+    "price_per_share",
+    "currency",
+    "fee",
+    "fee_currency",
+    "exchange_rate",
+)
+
+# Scale of the quantity / price / fee columns (Numeric(18, 8))
+_AMOUNT_QUANTUM = Decimal("1e-8")
+
+
+def transaction_fingerprint(txn: Any) -> str:
+    """
+    Content hash identifying a transaction for duplicate detection.
+
+    Accepts a Transaction or any object with the same attributes.
+    asset_id stands for the normalized (ticker, exchange) pair, which is
+    unique in assets. The date is taken in UTC without time zone and
+    amounts at the 8 decimal places they are stored with, so a row hashes
+    the same before insert and after being read back.
+
+    Returns:
+        64-character hex SHA-256 digest
+    """
+    txn_date = txn.date
+    if txn_date.tzinfo is not None:
+        txn_date = txn_date.astimezone(timezone.utc).replace(tzinfo=None)
+
+    parts = (
+        str(txn.portfolio_id),
+        str(txn.asset_id),
+        TransactionType(txn.transaction_type).value,
+        txn_date.isoformat(),
+        _amount_text(txn.quantity),
+        _amount_text(txn.price_per_share),
+        _amount_text(txn.fee),
+    )
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def _amount_text(value: Decimal | None) -> str:
+    """Canonical text of an amount: 8 decimal places, trailing zeros stripped."""
+    amount = Decimal(value or 0).quantize(_AMOUNT_QUANTUM).normalize()
+    return format(amount or Decimal(0), "f")
+
+
+def split_new_transactions(
+        db: Session,
+        rows: Sequence[dict[str, Any]],
+        batch_size: int = TRANSACTION_INSERT_BATCH_ROWS,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """
+    Separate rows already recorded from new ones.
+
+    Each row gets its "fingerprint" key set. A fingerprint recorded k
+    times in the database skips the first k rows carrying it.
+
+    Args:
+        db: Database session
+        rows: Transaction rows (TRANSACTION_INSERT_COLUMNS keys)
+        batch_size: Rows whose fingerprints are looked up per query
+
+    Returns:
+        Tuple of (new_rows, skipped_rows), both in input order
+    """
+    new_rows: list[dict[str, Any]] = []
+    skipped_rows: list[dict[str, Any]] = []
+    recorded: dict[str, int] = {}
+
+    for start in range(0, len(rows), batch_size):
+        batch = rows[start:start + batch_size]
+        for row in batch:
+            row["fingerprint"] = transaction_fingerprint(SimpleNamespace(**row))
+
+        lookup = {row["fingerprint"] for row in batch} - recorded.keys()
+        if lookup:
+            recorded.update(dict.fromkeys(lookup, 0))
+            recorded.update(db.execute(
+                select(Transaction.fingerprint, func.count())
+                .where(Transaction.fingerprint.in_(lookup))
+                .group_by(Transaction.fingerprint)
+            ).tuples().all())
+
+        for row in batch:
+            if recorded[row["fingerprint"]] > 0:
+                recorded[row["fingerprint"]] -= 1
+                skipped_rows.append(row)
+            else:
+                new_rows.append(row)
+
+    return new_rows, skipped_rows
+
+
+def insert_transactions(
+        db: Session,
+        rows: Sequence[dict[str, Any]],
+        batch_size: int = TRANSACTION_INSERT_BATCH_ROWS,
+) -> list[int]:
+    """
+    Insert transactions and record them in the position ledger. Does not commit.
+
+    Args:
+        db: Database session
+        rows: One dict per transaction with the TRANSACTION_INSERT_COLUMNS keys
+              and optionally "fingerprint" (computed when missing; other
+              keys are ignored)
+        batch_size: Rows per INSERT statement
+
+    Returns:
+        New transaction ids, in the order of rows
+    """
+    values = []
+    for row in rows:
+        row_values = {column: row[column] for column in TRANSACTION_INSERT_COLUMNS}
+        row_values["fingerprint"] = row.get("fingerprint") or transaction_fingerprint(SimpleNamespace(**row_values))
+        values.append(row_values)
+
+    ids: list[int] = []
+    for start in range(0, len(values), batch_size):
+        ids.extend(db.scalars(
+            insert(Transaction).returning(Transaction.id, sort_by_parameter_order=True),
+            values[start:start + batch_size],
+        ).all())
+
+    record_transactions(db, (SimpleNamespace(**row) for row in values))
+    return ids
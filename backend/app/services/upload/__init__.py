@@ -3,7 +3,7 @@
 Upload service package.
 
 This package provides file upload and processing capabilities:
-- Multi-format support (CSV, JSON, Excel - extensible)
+- Multi-format support (CSV, Parquet/Arrow, JSON, Excel - extensible)
 - Explicit date format specification (no ambiguity)
 - Batch asset resolution
 - Atomic transaction creation
@@ -33,9 +33,11 @@ Architecture:
     upload/
     ├── __init__.py          # This file - main exports
     ├── service.py           # UploadService (orchestration)
+    ├── job_queue.py         # UploadJobQueue (background uploads)
     └── parsers/             # File format parsers
         ├── base.py          # Abstract interface + DateFormat enum
         ├── csv_parser.py    # CSV implementation
+        ├── arrow_parser.py  # Parquet / Arrow IPC (columnar, needs pyarrow)
         ├── json_parser.py   # JSON implementation (future)
         └── excel_parser.py  # Excel implementation (future)
 """
@@ -47,6 +49,7 @@ from app.services.upload.parsers import (
     get_supported_content_types,
     TransactionFileParser,
     ParsedTransactionRow,
+    ParseChunk,
     ParseError,
     ParseResult,
     UnsupportedFileTypeError,
@@ -55,13 +58,17 @@ from app.services.upload.service import (
     UploadService,
     UploadResult,
     UploadError,
+    UploadProgress,
 )
+from app.services.upload.job_queue import UploadJobQueue
 
 __all__ = [
     # Service
     "UploadService",
     "UploadResult",
     "UploadError",
+    "UploadProgress",
+    "UploadJobQueue",
     # Enums
     "DateFormat",
     # Parser factory
@@ -71,6 +78,7 @@ __all__ = [
     # Parser base
     "TransactionFileParser",
     "ParsedTransactionRow",
+    "ParseChunk",
     "ParseError",
     "ParseResult",
     # Exceptions
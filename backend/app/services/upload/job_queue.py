@@ -0,0 +1,345 @@
+# backend/app/services/upload/job_queue.py
+"""
+Durable background upload queue backed by the upload_jobs table.
+
+Large files can take longer to parse, resolve and insert than a proxy
+lets a request run. The background upload endpoint stores the file in a
+QUEUED job and returns immediately; worker processes (app/worker.py)
+claim the job and run UploadService.process_file on it, so parsing,
+validation, asset resolution and the all-or-nothing commit are exactly
+those of a synchronous upload.
+
+Claiming:
+    Same scheme as SyncJobQueue: SELECT ... FOR UPDATE SKIP LOCKED on
+    PostgreSQL plus a conditional UPDATE (status = QUEUED). Jobs for a
+    portfolio with a RUNNING upload wait until it finishes.
+
+Progress:
+    process_file reports after every parsed chunk and every later step.
+    Counters and the errors found so far are written through a separate
+    session and committed at once, so status polls see them while the
+    upload's own database transaction is still open.
+
+    Every report also refreshes heartbeat_at.
+
+Completion:
+    A successful job increments portfolios.data_version in the same
+    commit that marks it SUCCEEDED. The analytics cache includes that
+    version in its key, so API processes drop results computed before
+    the import.
+
+Failures:
+    Jobs are not retried. A job left RUNNING by a worker that died is
+    FAILED by fail_stale() once its heartbeat is older than
+    upload_job_stale_after_minutes: the worker may have committed the
+    transactions before dying, and running the file again would import
+    them twice.
+"""
+
+import io
+import logging
+from datetime import datetime, timezone, timedelta
+from typing import Any, BinaryIO
+
+from sqlalchemy import exists, func, select, update
+from sqlalchemy.orm import Session, aliased
+
+from app.config import settings
+from app.models import Portfolio, UploadJob, UploadJobStatus
+from app.services.constants import UPLOAD_JOB_MAX_STORED_ERRORS
+from app.services.upload.parsers import DateFormat
+from app.services.upload.service import (
+    UploadError,
+    UploadProgress,
+    UploadResult,
+    UploadService,
+)
+
+logger = logging.getLogger(__name__)
+
+# Error recorded on a job whose worker died mid-upload
+ORPHANED_UPLOAD_ERROR = (
+    "Upload worker stopped before the job finished; "
+    "check the portfolio's transactions before uploading the file again"
+)
+
+
+class UploadJobQueue:
+    """
+    Enqueue, claim and execute background upload jobs.
+
+    Stateless apart from configuration, so a single instance can be
+    shared by the API (enqueue side) and by worker loops (claim side).
+
+    Attributes:
+        _stale_after: Heartbeat age after which a RUNNING job is considered orphaned
+    """
+
+    def __init__(self, stale_after: timedelta | None = None):
+        """
+        Initialize the queue.
+
+        Args:
+            stale_after: Override settings.upload_job_stale_after_minutes
+        """
+        self._stale_after = stale_after or timedelta(
+            minutes=settings.upload_job_stale_after_minutes
+        )
+
+    # =========================================================================
+    # API SIDE
+    # =========================================================================
+
+    def enqueue(
+            self,
+            db: Session,
+            portfolio_id: int,
+            file: BinaryIO,
+            filename: str,
+            content_type: str | None,
+            date_format: DateFormat,
+    ) -> UploadJob:
+        """
+        Store an uploaded file as a QUEUED job.
+
+        Args:
+            db: Database session
+            portfolio_id: Target portfolio
+            file: Uploaded file (read from the current position)
+            filename: Original filename
+            content_type: Optional MIME type
+            date_format: Resolved date format of the file
+
+        Returns:
+            The new UploadJob
+        """
+        job = UploadJob(
+            portfolio_id=portfolio_id,
+            status=UploadJobStatus.QUEUED,
+            filename=filename,
+            content_type=content_type,
+            date_format=date_format.value,
+            content=file.read(),
+        )
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+
+        logger.info(f"Queued upload job {job.id} ({filename}) for portfolio {portfolio_id}")
+        return job
+
+    def get_job(self, db: Session, job_id: int) -> UploadJob | None:
+        """Get a job by ID (without its file content), re-read from the database."""
+        return db.get(UploadJob, job_id, populate_existing=True)
+
+    # =========================================================================
+    # WORKER SIDE
+    # =========================================================================
+
+    def claim_next(self, db: Session, worker_id: str) -> UploadJob | None:
+        """
+        Claim the oldest runnable job for this worker.
+
+        Args:
+            db: Database session
+            worker_id: Identifier stored on the job (host:pid)
+
+        Returns:
+            The claimed job (now RUNNING), or None if nothing is runnable
+        """
+        running = aliased(UploadJob)
+        candidate = db.scalar(
+            select(UploadJob)
+            .where(
+                UploadJob.status == UploadJobStatus.QUEUED,
+                ~exists().where(
+                    running.portfolio_id == UploadJob.portfolio_id,
+                    running.status == UploadJobStatus.RUNNING,
+                ),
+            )
+            .order_by(UploadJob.created_at, UploadJob.id)
+            .limit(1)
+            .with_for_update(skip_locked=True, of=UploadJob)
+        )
+
+        if candidate is None:
+            db.commit()
+            return None
+
+        # Conditional update: on PostgreSQL the row lock already makes this
+        # ours; on SQLite it is what prevents two claimers from both winning.
+        now = datetime.now(timezone.utc)
+        claimed = db.execute(
+            update(UploadJob)
+            .where(
+                UploadJob.id == candidate.id,
+                UploadJob.status == UploadJobStatus.QUEUED,
+            )
+            .values(
+                status=UploadJobStatus.RUNNING,
+                worker_id=worker_id,
+                started_at=now,
+                heartbeat_at=now,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+
+        if claimed.rowcount == 0:
+            return None
+
+        db.refresh(candidate)
+        logger.info(
+            f"Worker {worker_id} claimed upload job {candidate.id} "
+            f"for portfolio {candidate.portfolio_id}"
+        )
+        return candidate
+
+    def run_job(
+            self,
+            db: Session,
+            job: UploadJob,
+            upload_service: UploadService,
+    ) -> UploadJob:
+        """
+        Process a claimed job's file and record the outcome.
+
+        Args:
+            db: Database session
+            job: Job returned by claim_next()
+            upload_service: Service that processes the file
+
+        Returns:
+            The updated job
+        """
+        content = db.scalar(select(UploadJob.content).where(UploadJob.id == job.id)) or b""
+
+        try:
+            result = upload_service.process_file(
+                db=db,
+                file=io.BytesIO(content),
+                filename=job.filename,
+                portfolio_id=job.portfolio_id,
+                content_type=job.content_type,
+                date_format=DateFormat(job.date_format),
+                progress=lambda state: self._report_progress(db, job.id, state),
+            )
+        except Exception as e:
+            logger.exception(f"Upload job {job.id} raised: {e}")
+            db.rollback()
+            job.status = UploadJobStatus.FAILED
+            job.error = str(e)
+            job.content = None
+            job.finished_at = datetime.now(timezone.utc)
+            db.commit()
+            return job
+
+        job.status = UploadJobStatus.SUCCEEDED if result.success else UploadJobStatus.FAILED
+        job.total_rows = result.total_rows
+        job.rows_skipped = result.skipped_count
+        job.rows_inserted = result.created_count
+        job.created_transaction_ids = result.created_transaction_ids
+        for column, value in self._message_values(result).items():
+            setattr(job, column, value)
+        job.content = None
+        job.finished_at = datetime.now(timezone.utc)
+        if result.success and result.created_count:
+            # Cached analytics in API processes are keyed on this version
+            db.execute(
+                update(Portfolio)
+                .where(Portfolio.id == job.portfolio_id)
+                .values(data_version=Portfolio.data_version + 1, updated_at=Portfolio.updated_at)
+            )
+        db.commit()
+
+        logger.info(
+            f"Upload job {job.id} for portfolio {job.portfolio_id} finished: "
+            f"{result.created_count} created, {result.error_count} errors"
+        )
+        return job
+
+    def fail_stale(self, db: Session, now: datetime | None = None) -> int:
+        """
+        Fail jobs left RUNNING by a worker that died.
+
+        A job is orphaned once its last progress report (heartbeat_at,
+        falling back to started_at) is older than stale_after.
+
+        Args:
+            db: Database session
+            now: Current time (for testing)
+
+        Returns:
+            Number of jobs failed
+        """
+        now = now or datetime.now(timezone.utc)
+        cutoff = now - self._stale_after
+
+        stale_jobs = db.scalars(
+            select(UploadJob)
+            .where(
+                UploadJob.status == UploadJobStatus.RUNNING,
+                func.coalesce(UploadJob.heartbeat_at, UploadJob.started_at) < cutoff,
+            )
+            .with_for_update(skip_locked=True)
+        ).all()
+
+        for job in stale_jobs:
+            logger.warning(
+                f"Upload job {job.id} for portfolio {job.portfolio_id} on {job.worker_id} "
+                f"has not reported progress since {job.heartbeat_at or job.started_at}; failing it"
+            )
+            job.status = UploadJobStatus.FAILED
+            job.error = ORPHANED_UPLOAD_ERROR
+            job.content = None
+            job.finished_at = now
+
+        db.commit()
+        return len(stale_jobs)
+
+    # =========================================================================
+    # PRIVATE HELPERS
+    # =========================================================================
+
+    def _report_progress(self, db: Session, job_id: int, state: UploadProgress) -> None:
+        """Write progress counters and the heartbeat in their own committed transaction."""
+        try:
+            with Session(db.get_bind()) as progress_db:
+                progress_db.execute(
+                    update(UploadJob)
+                    .where(UploadJob.id == job_id)
+                    .values(
+                        stage=state.stage,
+                        total_rows=state.rows_parsed,
+                        rows_validated=state.rows_validated,
+                        rows_resolved=state.rows_resolved,
+                        rows_skipped=state.rows_skipped,
+                        rows_inserted=state.rows_inserted,
+                        heartbeat_at=datetime.now(timezone.utc),
+                        **self._message_values(state.result),
+                    )
+                )
+                progress_db.commit()
+        except Exception as e:
+            # Progress is informational; never fail the upload over it
+            logger.warning(f"Could not record progress of upload job {job_id}: {e}")
+
+    @staticmethod
+    def _message_values(result: UploadResult) -> dict[str, Any]:
+        """Error count and (capped) errors and warnings as UploadJob column values."""
+        return {
+            "error_count": result.error_count,
+            "errors": [_error_dict(e) for e in result.errors[:UPLOAD_JOB_MAX_STORED_ERRORS]],
+            "warnings": [_error_dict(w) for w in result.warnings[:UPLOAD_JOB_MAX_STORED_ERRORS]],
+        }
+
+
+def _error_dict(error: UploadError) -> dict[str, Any]:
+    """JSON-serializable form of an UploadError (without raw row data)."""
+    return {
+        "row_number": error.row_number,
+        "stage": error.stage,
+        "error_type": error.error_type,
+        "message": error.message,
+        "field": error.field,
+    }
@@ -4,6 +4,7 @@ Transaction file parsers package.
 
 This package contains parsers for different file formats:
 - CSV (implemented)
+- Parquet / Arrow IPC (implemented, needs pyarrow)
 - JSON (future)
 - Excel (future)
 
@@ -28,6 +29,7 @@ Date Format Handling:
 """
 
 import logging
+from importlib.util import find_spec
 from pathlib import Path
 
 from app.services.upload.parsers.base import (
@@ -37,10 +39,12 @@ from app.services.upload.parsers.base import (
     DateDetectionResult,
     TransactionFileParser,
     ParsedTransactionRow,
+    ParseChunk,
     ParseError,
     ParseResult,
 )
 from app.services.upload.parsers.csv_parser import CSVTransactionParser
+from app.services.upload.parsers.arrow_parser import ArrowTransactionParser
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +59,11 @@ _PARSERS: list[TransactionFileParser] = [
     # ExcelTransactionParser(),  # Future
 ]
 
+# Parquet / Arrow need pyarrow. It is a declared dependency; the check
+# keeps CSV uploads working in an environment installed without it.
+if find_spec("pyarrow") is not None:
+    _PARSERS.append(ArrowTransactionParser())
+
 
 # =============================================================================
 # EXCEPTIONS
@@ -183,10 +192,12 @@ __all__ = [
     # Base classes
     "TransactionFileParser",
     "ParsedTransactionRow",
+    "ParseChunk",
     "ParseError",
     "ParseResult",
     # Concrete parsers
     "CSVTransactionParser",
+    "ArrowTransactionParser",
     # Exceptions
     "UnsupportedFileTypeError",
 ]
@@ -0,0 +1,577 @@
+# backend/app/services/upload/parsers/arrow_parser.py
+"""
+Parquet / Arrow IPC transaction file parser.
+
+Meant for bulk imports such as migrating years of history. The file is
+read one record batch at a time, and each batch is converted and checked
+column by column with pyarrow.compute. No row goes through per-row
+string parsing, so a million-row file costs a few dozen vectorized
+operations per batch. The only per-row work left is building the output
+dicts.
+
+Accepted files (detected from the magic bytes, not the extension):
+    Parquet              .parquet
+    Arrow IPC file       .arrow, .feather (v2)
+    Arrow IPC stream     .arrows
+
+Columns:
+    Same names as the CSV parser (CSVTransactionParser.COLUMN_MAPPING),
+    so a Parquet / Arrow transactions export of this app can be imported
+    as is.
+
+    date                 timestamp (naive values are UTC), date, or text
+                         in the declared date format (CSV rules)
+    quantity, price, fee, exchange_rate
+                         decimal, integer, float or text
+    other columns        text (any string or dictionary type)
+
+Output:
+    Valid rows come back as ParseChunk.typed_rows: already typed, with
+    the same checks UploadService applies to parsed CSV rows (required
+    values, BUY/SELL, valid and not future dates, positive quantity and
+    price, non-negative fee). Failing rows become ParseErrors with the
+    same error types, one per row. Row numbers are 1-based record
+    positions (there is no header row).
+
+pyarrow is a declared dependency (pyproject.toml). It is imported lazily,
+and the parser is only registered when it is installed (see
+parsers/__init__.py).
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Iterator
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal, InvalidOperation
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+from app.services.constants import UPLOAD_PARSE_CHUNK_ROWS
+from app.services.upload.parsers.base import (
+    TransactionFileParser,
+    ParseChunk,
+    ParseError,
+    ParseResult,
+    DateFormat,
+    DateDetectionStatus,
+    DateDetectionResult,
+)
+from app.services.upload.parsers.csv_parser import CSVTransactionParser
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+# Amounts read from text or floats are converted to this decimal type
+_DECIMAL_PRECISION = 38
+_DECIMAL_SCALE = 18
+_DECIMAL_QUANTUM = Decimal(1).scaleb(-_DECIMAL_SCALE)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+_PARQUET_MAGIC = b"PAR1"
+_ARROW_FILE_MAGIC = b"ARROW1"
+
+_DATE_FORMAT_EXAMPLES: dict[DateFormat, str] = {
+    DateFormat.ISO: "YYYY-MM-DD (e.g., 2021-01-22)",
+    DateFormat.US: "M/D/YYYY (e.g., 1/22/2021)",
+    DateFormat.EU: "D/M/YYYY (e.g., 22/01/2021)",
+}
+
+
+class ArrowTransactionParser(TransactionFileParser):
+    """
+    Parser for Parquet and Arrow IPC transaction files.
+
+    Column names, transaction type spellings and text date rules are the
+    CSV parser's, so both formats accept the same data. Text dates are
+    parsed once per distinct value (a file has far fewer distinct dates
+    than rows) and mapped back onto the column.
+
+    Example:
+        parser = ArrowTransactionParser()
+
+        with open("history.parquet", "rb") as f:
+            for chunk in parser.iter_chunks(f, "history.parquet"):
+                print(len(chunk.typed_rows), len(chunk.errors))
+    """
+
+    DECIMAL_FIELDS: tuple[str, ...] = ("quantity", "price_per_share", "fee", "exchange_rate")
+
+    # Fields read from typed (temporal / numeric) columns when not text
+    TYPED_FIELDS: tuple[str, ...] = ("date",) + DECIMAL_FIELDS
+
+    # Checked in this order; a row reports the first field it is missing
+    REQUIRED_FIELD_ORDER: tuple[str, ...] = (
+        "date", "transaction_type", "ticker", "exchange", "quantity", "price_per_share", "currency",
+    )
+
+    def __init__(self) -> None:
+        self._text_parser = CSVTransactionParser()
+
+    # =========================================================================
+    # INTERFACE IMPLEMENTATION
+    # =========================================================================
+
+    @property
+    def name(self) -> str:
+        return "Parquet/Arrow"
+
+    @property
+    def supported_extensions(self) -> set[str]:
+        return {".parquet", ".arrow", ".arrows", ".feather"}
+
+    @property
+    def supported_content_types(self) -> set[str]:
+        return {
+            "application/vnd.apache.parquet",
+            "application/x-parquet",
+            "application/vnd.apache.arrow.file",
+            "application/vnd.apache.arrow.stream",
+        }
+
+    def parse(
+            self,
+            file: BinaryIO,
+            filename: str,
+            date_format: DateFormat = DateFormat.ISO,
+    ) -> ParseResult:
+        """
+        Parse a Parquet / Arrow file into typed transaction rows.
+
+        Collects every chunk of iter_chunks() into one result.
+        """
+        result = ParseResult()
+        for chunk in self.iter_chunks(file, filename, date_format):
+            result.typed_rows.extend(chunk.typed_rows)
+            result.errors.extend(chunk.errors)
+            result.total_rows += chunk.total_rows
+        return result
+
+    def iter_chunks(
+            self,
+            file: BinaryIO,
+            filename: str,
+            date_format: DateFormat = DateFormat.ISO,
+            chunk_rows: int = UPLOAD_PARSE_CHUNK_ROWS,
+    ) -> Iterator[ParseChunk]:
+        """
+        Parse the file one record batch (at most chunk_rows rows) at a time.
+
+        Args:
+            file: Binary file object (must be seekable)
+            filename: Original filename for error messages
+            date_format: Date format of text date columns (ignored for
+                         timestamp and date columns)
+            chunk_rows: Maximum number of rows per chunk
+
+        Yields:
+            ParseChunk objects in file order, valid rows in typed_rows
+        """
+        logger.info(f"Parsing Parquet/Arrow file: {filename} (date_format={date_format.value})")
+
+        parsed_count = 0
+        error_count = 0
+        row_offset = 0
+
+        try:
+            schema, batches = self._open(file, chunk_rows)
+            column_map = self._text_parser._build_column_map(schema.names)
+
+            missing_columns = [f for f in self.REQUIRED_FIELD_ORDER if f not in column_map]
+            if missing_columns:
+                yield ParseChunk(errors=[ParseError(
+                    row_number=0,
+                    error_type="missing_columns",
+                    message=f"Missing required columns: {', '.join(missing_columns)}",
+                )])
+                return
+
+            for batch in batches:
+                chunk = self._parse_batch(batch, row_offset, column_map, date_format)
+                row_offset += batch.num_rows
+                parsed_count += len(chunk.typed_rows)
+                error_count += len(chunk.errors)
+                yield chunk
+
+        except Exception as e:
+            logger.error(f"Failed to read file {filename}: {e}", exc_info=True)
+            error_count += 1
+            yield ParseChunk(errors=[ParseError(
+                row_number=0,
+                error_type="file_read_error",
+                message=f"Could not read file: {e}",
+            )])
+
+        logger.info(
+            f"Parsed {filename}: {parsed_count} rows OK, "
+            f"{error_count} errors"
+        )
+
+    def detect_date_format(
+            self,
+            file: BinaryIO,
+            filename: str,
+            max_samples: int = 5,
+    ) -> DateDetectionResult:
+        """
+        Detect the date format of the file's date column.
+
+        Timestamp and date columns carry no format, so they are reported
+        as ISO. Text columns are analyzed like CSV dates, once per
+        distinct value.
+
+        Args:
+            file: Binary file object (must be seekable)
+            filename: Original filename for error messages
+            max_samples: Maximum number of sample dates to return
+
+        Returns:
+            DateDetectionResult with status, detected format, and samples
+        """
+        import pyarrow as pa
+
+        logger.info(f"Detecting date format for: {filename}")
+
+        try:
+            schema, batches = self._open(file, UPLOAD_PARSE_CHUNK_ROWS)
+            column_map = self._text_parser._build_column_map(schema.names)
+
+            if "date" not in column_map:
+                return DateDetectionResult(
+                    status=DateDetectionStatus.ERROR,
+                    reason="File has no date column",
+                )
+
+            date_column = column_map["date"]
+            date_type = schema.field(date_column).type
+            if pa.types.is_timestamp(date_type) or pa.types.is_date(date_type):
+                return DateDetectionResult(
+                    status=DateDetectionStatus.UNAMBIGUOUS,
+                    detected_format=DateFormat.ISO,
+                    reason=f"Dates are stored as typed {date_type} values.",
+                )
+
+            # First row number of each distinct date text
+            first_rows: dict[str, int] = {}
+            row_offset = 0
+            for batch in batches:
+                for index, value in enumerate(self._as_text(batch.column(date_column)).to_pylist()):
+                    if value is not None and value not in first_rows:
+                        first_rows[value] = row_offset + index + 1
+                row_offset += batch.num_rows
+
+            if not first_rows:
+                return DateDetectionResult(
+                    status=DateDetectionStatus.ERROR,
+                    reason="No dates found in file",
+                )
+
+            date_values = sorted((row, value) for value, row in first_rows.items())
+            return self._text_parser._analyze_dates(date_values, max_samples)
+
+        except Exception as e:
+            logger.error(f"Failed to read file {filename}: {e}", exc_info=True)
+            return DateDetectionResult(
+                status=DateDetectionStatus.ERROR,
+                reason=f"Could not read file: {e}",
+            )
+
+    # =========================================================================
+    # READING
+    # =========================================================================
+
+    def _open(self, file: BinaryIO, chunk_rows: int) -> tuple[pa.Schema, Iterator[pa.RecordBatch]]:
+        """Return the file's schema and an iterator of batches of at most chunk_rows rows."""
+        import pyarrow.ipc
+        import pyarrow.parquet
+
+        magic = file.read(len(_ARROW_FILE_MAGIC))
+        file.seek(0)
+
+        if magic.startswith(_PARQUET_MAGIC):
+            parquet_file = pyarrow.parquet.ParquetFile(file)
+            return parquet_file.schema_arrow, parquet_file.iter_batches(batch_size=chunk_rows)
+
+        if magic == _ARROW_FILE_MAGIC:
+            reader = pyarrow.ipc.open_file(file)
+            batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+        else:
+            reader = pyarrow.ipc.open_stream(file)
+            batches = iter(reader)
+        return reader.schema, _split_batches(batches, chunk_rows)
+
+    # =========================================================================
+    # COLUMN-WISE CONVERSION AND CHECKS
+    # =========================================================================
+
+    def _parse_batch(
+            self,
+            batch: pa.RecordBatch,
+            row_offset: int,
+            column_map: dict[str, str],
+            date_format: DateFormat,
+    ) -> ParseChunk:
+        """Convert and check one record batch; valid rows become typed_rows."""
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        checks = _RowChecks(batch, row_offset, column_map)
+        columns = {field: batch.column(name) for field, name in column_map.items()}
+        size = batch.num_rows
+
+        # Text columns trimmed (empty -> null); typed dates and amounts as they are
+        values = {
+            field: column if field in self.TYPED_FIELDS and not _is_text(column.type) else self._as_text(column)
+            for field, column in columns.items()
+        }
+
+        # 1. Required values
+        for field in self.REQUIRED_FIELD_ORDER:
+            checks.require(
+                pc.is_valid(values[field]), "missing_value", field,
+                f"Missing required value for '{field}'",
+            )
+
+        # 2. Transaction type (BUY / SELL spellings of the CSV parser)
+        spellings = list(self._text_parser.TYPE_MAPPING)
+        transaction_types = pc.take(
+            pa.array([self._text_parser.TYPE_MAPPING[s] for s in spellings]),
+            pc.index_in(pc.utf8_lower(values["transaction_type"]), value_set=pa.array(spellings)),
+        )
+        checks.require(
+            pc.is_valid(transaction_types), "invalid_transaction_type", "transaction_type",
+            "Invalid transaction type: '{value}'. Expected: BUY or SELL",
+        )
+
+        # 3. Date
+        dates = self._to_timestamps(values["date"], date_format)
+        checks.require(
+            pc.is_valid(dates), "invalid_date", "date",
+            f"Invalid date: '{{value}}'. Expected format: {_DATE_FORMAT_EXAMPLES[date_format]}",
+        )
+
+        # 4. Amounts (optional ones default like UploadService does)
+        amounts: dict[str, pa.Array] = {}
+        for field in self.DECIMAL_FIELDS:
+            if field not in columns:
+                continue
+            amounts[field] = self._to_decimals(values[field])
+            checks.require(
+                pc.or_(pc.is_null(values[field]), pc.is_valid(amounts[field])), "invalid_number", field,
+                "Invalid numeric value: '{value}'",
+            )
+        for field, default in (("fee", Decimal("0")), ("exchange_rate", Decimal("1"))):
+            if field in amounts:
+                amounts[field] = pc.fill_null(amounts[field], pa.scalar(default, amounts[field].type))
+            else:
+                amounts[field] = pa.array([default] * size, _decimal_type())
+
+        # 5. Business rules
+        now = pa.scalar(datetime.now(timezone.utc), pa.timestamp("us", tz="UTC"))
+        checks.require(
+            pc.less_equal(dates, now), "invalid_date", "date",
+            "Transaction date cannot be in the future",
+        )
+        checks.require(
+            pc.greater(amounts["quantity"], _zero(amounts["quantity"])), "invalid_quantity", "quantity",
+            "Quantity must be positive",
+        )
+        checks.require(
+            pc.greater(amounts["price_per_share"], _zero(amounts["price_per_share"])), "invalid_price",
+            "price_per_share", "Price must be positive",
+        )
+        checks.require(
+            pc.greater_equal(amounts["fee"], _zero(amounts["fee"])), "invalid_fee", "fee",
+            "Fee cannot be negative",
+        )
+
+        currency = pc.utf8_upper(values["currency"])
+        fee_currency = pc.utf8_upper(values["fee_currency"]) if "fee_currency" in values else None
+        typed = pa.table({
+            "row_number": pa.array(range(row_offset + 1, row_offset + size + 1), pa.int64()),
+            "date": dates,
+            "transaction_type": transaction_types,
+            "ticker": pc.utf8_upper(values["ticker"]),
+            "exchange": pc.utf8_upper(values["exchange"]),
+            "quantity": amounts["quantity"],
+            "price_per_share": amounts["price_per_share"],
+            "currency": currency,
+            "fee": amounts["fee"],
+            "fee_currency": currency if fee_currency is None else pc.coalesce(fee_currency, currency),
+            "exchange_rate": amounts["exchange_rate"],
+        }).filter(checks.valid)
+
+        return ParseChunk(
+            typed_rows=_to_rows(typed),
+            errors=sorted(checks.errors, key=lambda e: e.row_number),
+            total_rows=size,
+        )
+
+    @staticmethod
+    def _as_text(column: pa.Array) -> pa.Array:
+        """Column as trimmed strings, with empty values as null."""
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        if not pa.types.is_string(column.type):
+            column = pc.cast(column, pa.string())
+        column = pc.utf8_trim_whitespace(column)
+        return pc.if_else(pc.equal(column, ""), pa.scalar(None, pa.string()), column)
+
+    def _to_timestamps(self, column: pa.Array, date_format: DateFormat) -> pa.Array:
+        """Dates as UTC timestamps; null where missing or unparseable."""
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        utc = pa.timestamp("us", tz="UTC")
+        if pa.types.is_timestamp(column.type) or pa.types.is_date(column.type):
+            return pc.cast(column, utc, safe=False)
+
+        # Text: parse each distinct value once with the CSV rules
+        text = column if pa.types.is_string(column.type) else self._as_text(column)
+        distinct = pc.unique(text)
+        parsed = []
+        for value in distinct.to_pylist():
+            iso = self._text_parser._parse_date(value, date_format) if value is not None else None
+            parsed.append(datetime.fromisoformat(iso.replace("Z", "+00:00")) if iso else None)
+        return pc.take(pa.array(parsed, utc), pc.index_in(text, value_set=distinct))
+
+    def _to_decimals(self, column: pa.Array) -> pa.Array:
+        """Amounts as decimals; null where missing or not a finite number."""
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        if pa.types.is_decimal(column.type):
+            return column
+        if pa.types.is_integer(column.type):
+            return pc.cast(column, _decimal_type())
+        if not (pa.types.is_floating(column.type) or pa.types.is_string(column.type)):
+            return pa.nulls(len(column), _decimal_type())
+
+        # Floats go through their shortest text form, so 0.1 stays 0.1
+        text = column if pa.types.is_string(column.type) else self._as_text(column)
+        try:
+            return pc.cast(text, _decimal_type())
+        except pa.ArrowInvalid:
+            # Some value is not a number (or has too many decimals):
+            # convert value by value, keeping nulls for the invalid ones
+            return pa.array([_decimal_or_none(value) for value in text.to_pylist()], _decimal_type())
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+class _RowChecks:
+    """
+    Validity mask for one record batch.
+
+    Each check only reports rows that passed every earlier check, so a
+    row gets at most one error, like a CSV row.
+    """
+
+    def __init__(self, batch: pa.RecordBatch, row_offset: int, column_map: dict[str, str]) -> None:
+        import pyarrow as pa
+
+        self.valid = pa.array([True] * batch.num_rows, pa.bool_())
+        self.errors: list[ParseError] = []
+        self._batch = batch
+        self._row_offset = row_offset
+        self._column_map = column_map
+
+    def require(self, ok: pa.Array, error_type: str, field: str, message: str) -> None:
+        """Record an error for valid rows where ok is false (or null); message may use {value}."""
+        import pyarrow.compute as pc
+
+        ok = pc.fill_null(ok, False)
+        failed = pc.and_(self.valid, pc.invert(ok))
+        for index in pc.indices_nonzero(failed).to_pylist():
+            raw_data = self._raw_data(index)
+            self.errors.append(ParseError(
+                row_number=self._row_offset + index + 1,
+                error_type=error_type,
+                message=message.format(value=raw_data.get(self._column_map[field])),
+                field=field,
+                raw_data=raw_data,
+            ))
+        self.valid = pc.and_(self.valid, ok)
+
+    def _raw_data(self, index: int) -> dict[str, Any]:
+        """Original values of one row, as text (errors are stored as JSON)."""
+        row = self._batch.slice(index, 1).to_pylist()[0]
+        return {key: None if value is None else str(value) for key, value in row.items()}
+
+
+def _to_rows(table: pa.Table) -> list[dict[str, Any]]:
+    """
+    table.to_pylist(), several times faster.
+
+    pyarrow builds timezone-aware datetimes and Decimals slowly, so they
+    are built here from the integer microseconds and the decimal text.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    columns = []
+    for column in table.columns:
+        if pa.types.is_timestamp(column.type):
+            values = _map_distinct(column, lambda c: [
+                None if micros is None else _EPOCH + timedelta(microseconds=micros)
+                for micros in pc.cast(c, pa.int64()).to_pylist()
+            ])
+        elif pa.types.is_decimal(column.type):
+            values = _map_distinct(column, lambda c: [
+                None if text is None else Decimal(text) for text in pc.cast(c, pa.string()).to_pylist()
+            ])
+        else:
+            values = column.to_pylist()
+        columns.append(values)
+
+    names = table.column_names
+    return [dict(zip(names, row)) for row in zip(*columns)]
+
+
+def _map_distinct(column: pa.ChunkedArray, convert: Callable[[pa.Array], list]) -> list:
+    """Convert each distinct value of column once (dates and prices repeat a lot)."""
+    import pyarrow.compute as pc
+
+    encoded = pc.dictionary_encode(column.combine_chunks())
+    distinct = convert(encoded.dictionary)
+    return [None if index is None else distinct[index] for index in encoded.indices.to_pylist()]
+
+
+def _is_text(data_type: pa.DataType) -> bool:
+    import pyarrow as pa
+
+    return pa.types.is_string(data_type) or pa.types.is_large_string(data_type) or pa.types.is_dictionary(data_type)
+
+
+def _split_batches(batches: Iterator[pa.RecordBatch], chunk_rows: int) -> Iterator[pa.RecordBatch]:
+    """Slice record batches larger than chunk_rows (slices share memory)."""
+    for batch in batches:
+        for offset in range(0, batch.num_rows, chunk_rows):
+            yield batch.slice(offset, chunk_rows)
+
+
+def _decimal_type() -> pa.DataType:
+    import pyarrow as pa
+
+    return pa.decimal128(_DECIMAL_PRECISION, _DECIMAL_SCALE)
+
+
+def _zero(column: pa.Array) -> pa.Scalar:
+    import pyarrow as pa
+
+    return pa.scalar(Decimal(0), column.type)
+
+
+def _decimal_or_none(text: str | None) -> Decimal | None:
+    if text is None:
+        return None
+    try:
+        value = Decimal(text)
+        return value.quantize(_DECIMAL_QUANTUM) if value.is_finite() else None
+    except InvalidOperation:
+        return None
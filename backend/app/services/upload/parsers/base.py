@@ -18,6 +18,7 @@ import dataclasses
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
+from collections.abc import Iterator
 from typing import BinaryIO, Any
 
 
@@ -199,18 +200,21 @@ class ParseResult:
     
     Attributes:
         rows: Successfully parsed transaction rows
+        typed_rows: Rows already converted and checked by a columnar parser
+                    (see ParseChunk.typed_rows)
         errors: Parsing errors (malformed rows, missing fields, etc.)
         total_rows: Total number of rows attempted
     """
 
     rows: list[ParsedTransactionRow] = field(default_factory=list)
+    typed_rows: list[dict[str, Any]] = field(default_factory=list)
     errors: list[ParseError] = field(default_factory=list)
     total_rows: int = 0
 
     @property
     def success_count(self) -> int:
         """Number of successfully parsed rows."""
-        return len(self.rows)
+        return len(self.rows) + len(self.typed_rows)
 
     @property
     def error_count(self) -> int:
@@ -228,6 +232,28 @@ class ParseResult:
         return self.success_count > 0
 
 
+@dataclass
+class ParseChunk:
+    """
+    A block of consecutive rows produced by TransactionFileParser.iter_chunks().
+
+    Attributes:
+        rows: Successfully parsed rows in this block
+        typed_rows: Rows a columnar parser already converted to Python
+                    types and checked column-wise, as dicts with the
+                    ParsedTransactionRow field names (date as an aware UTC
+                    datetime, amounts as Decimal, fee and exchange_rate
+                    defaulted, fee_currency falling back to currency)
+        errors: Errors in this block (file-level errors use row_number 0)
+        total_rows: Number of data rows this block covered
+    """
+
+    rows: list[ParsedTransactionRow] = field(default_factory=list)
+    typed_rows: list[dict[str, Any]] = field(default_factory=list)
+    errors: list[ParseError] = field(default_factory=list)
+    total_rows: int = 0
+
+
 # =============================================================================
 # ABSTRACT BASE CLASS
 # =============================================================================
@@ -248,6 +274,11 @@ class TransactionFileParser(ABC):
     - Validate data types or business rules (Pydantic does this)
     - Resolve assets (UploadService does this)
     - Create database records (UploadService does this)
+
+    Columnar formats are the exception to the first point: converting and
+    checking whole typed columns at once is what makes them fast, so their
+    parser returns ParseChunk.typed_rows and UploadService only completes
+    them (see ArrowTransactionParser).
     
     Example:
         parser = CSVTransactionParser()
@@ -332,6 +363,37 @@ class TransactionFileParser(ABC):
         """
         pass
 
+    def iter_chunks(
+            self,
+            file: BinaryIO,
+            filename: str,
+            date_format: DateFormat = DateFormat.ISO,
+            chunk_rows: int = 1000,
+    ) -> Iterator[ParseChunk]:
+        """
+        Parse file contents incrementally, chunk_rows rows at a time.
+
+        Lets callers validate and discard rows while the rest of the file
+        is still unread. The default implementation parses the whole file
+        and yields it as one chunk; parsers that can stream override it.
+
+        Args:
+            file: File-like object (binary mode) to read from
+            filename: Original filename (for error messages)
+            date_format: User-specified date format for parsing dates
+            chunk_rows: Maximum number of data rows per chunk
+
+        Yields:
+            ParseChunk objects in file order
+        """
+        result = self.parse(file, filename, date_format)
+        yield ParseChunk(
+            rows=result.rows,
+            typed_rows=result.typed_rows,
+            errors=result.errors,
+            total_rows=result.total_rows,
+        )
+
     def supports_file(self, filename: str, content_type: str | None = None) -> bool:
         """
         Check if this parser can handle the given file.
@@ -34,15 +34,18 @@ Date Format Handling:
     All dates are converted to ISO format internally.
 """
 
+import codecs
 import csv
-import io
 import logging
+from collections.abc import Iterator
 from datetime import datetime
 from typing import BinaryIO
 
+from app.services.constants import UPLOAD_PARSE_CHUNK_ROWS, UPLOAD_READ_BLOCK_BYTES
 from app.services.upload.parsers.base import (
     TransactionFileParser,
     ParsedTransactionRow,
+    ParseChunk,
     ParseError,
     ParseResult,
     DateFormat,
@@ -63,6 +66,7 @@ class CSVTransactionParser(TransactionFileParser):
     - Explicit date format specification (no ambiguity)
     - Graceful error handling per row
     - Encoding detection (UTF-8, Latin-1)
+    - Streaming: decodes and parses block by block (iter_chunks)
     
     Example:
         parser = CSVTransactionParser()
@@ -162,6 +166,8 @@ class CSVTransactionParser(TransactionFileParser):
         """
         Parse CSV file into transaction rows.
         
+        Collects every chunk of iter_chunks() into one result.
+
         Args:
             file: Binary file object containing CSV data
             filename: Original filename for error messages
@@ -170,34 +176,54 @@ class CSVTransactionParser(TransactionFileParser):
         Returns:
             ParseResult with parsed rows and errors
         """
-        logger.info(f"Parsing CSV file: {filename} (date_format={date_format.value})")
-
         result = ParseResult()
+        for chunk in self.iter_chunks(file, filename, date_format):
+            result.rows.extend(chunk.rows)
+            result.errors.extend(chunk.errors)
+            result.total_rows += chunk.total_rows
+        return result
 
-        # Read and decode file content
-        try:
-            content = self._read_file_content(file)
-        except Exception as e:
-            logger.error(f"Failed to read file {filename}: {e}", exc_info=True)
-            result.errors.append(ParseError(
-                row_number=0,
-                error_type="file_read_error",
-                message=f"Could not read file: {e}",
-            ))
-            return result
+    def iter_chunks(
+            self,
+            file: BinaryIO,
+            filename: str,
+            date_format: DateFormat = DateFormat.ISO,
+            chunk_rows: int = UPLOAD_PARSE_CHUNK_ROWS,
+    ) -> Iterator[ParseChunk]:
+        """
+        Parse CSV file incrementally into chunks of rows.
+
+        The file is read and decoded one block at a time (see _iter_lines),
+        so memory holds one block plus one chunk of rows, whatever the
+        file size. Row numbers count the header as row 1.
+
+        Args:
+            file: Binary file object containing CSV data
+            filename: Original filename for error messages
+            date_format: User-specified date format (ISO, US, or EU)
+            chunk_rows: Maximum number of data rows per chunk
+
+        Yields:
+            ParseChunk objects in file order
+        """
+        logger.info(f"Parsing CSV file: {filename} (date_format={date_format.value})")
+
+        chunk = ParseChunk()
+        parsed_count = 0
+        error_count = 0
 
-        # Parse CSV
         try:
-            reader = csv.DictReader(io.StringIO(content))
+            reader = csv.DictReader(self._iter_lines(file))
 
             # Validate headers
             if not reader.fieldnames:
-                result.errors.append(ParseError(
+                chunk.errors.append(ParseError(
                     row_number=0,
                     error_type="missing_headers",
                     message="CSV file has no headers",
                 ))
-                return result
+                yield chunk
+                return
 
             # Build column mapping for this file
             column_map = self._build_column_map(reader.fieldnames)
@@ -205,41 +231,58 @@ class CSVTransactionParser(TransactionFileParser):
             # Check for missing required columns
             missing_columns = self._get_missing_columns(column_map)
             if missing_columns:
-                result.errors.append(ParseError(
+                chunk.errors.append(ParseError(
                     row_number=0,
                     error_type="missing_columns",
                     message=f"Missing required columns: {', '.join(missing_columns)}",
                 ))
-                return result
+                yield chunk
+                return
 
             # Parse each row
             for row_num, row in enumerate(reader, start=2):  # Start at 2 (header is row 1)
-                result.total_rows += 1
+                chunk.total_rows += 1
 
                 parsed_row, error = self._parse_row(
                     row_num, row, column_map, date_format
                 )
 
                 if error:
-                    result.errors.append(error)
+                    chunk.errors.append(error)
                 elif parsed_row:
-                    result.rows.append(parsed_row)
+                    chunk.rows.append(parsed_row)
+
+                if chunk.total_rows >= chunk_rows:
+                    parsed_count += len(chunk.rows)
+                    error_count += len(chunk.errors)
+                    yield chunk
+                    chunk = ParseChunk()
 
         except csv.Error as e:
             logger.error(f"CSV parsing error in {filename}: {e}")
-            result.errors.append(ParseError(
+            chunk.errors.append(ParseError(
                 row_number=0,
                 error_type="csv_format_error",
                 message=f"Invalid CSV format: {e}",
             ))
+        except Exception as e:
+            logger.error(f"Failed to read file {filename}: {e}", exc_info=True)
+            chunk.errors.append(ParseError(
+                row_number=0,
+                error_type="file_read_error",
+                message=f"Could not read file: {e}",
+            ))
+
+        if chunk.total_rows or chunk.errors:
+            parsed_count += len(chunk.rows)
+            error_count += len(chunk.errors)
+            yield chunk
 
         logger.info(
-            f"Parsed {filename}: {result.success_count} rows OK, "
-            f"{result.error_count} errors"
+            f"Parsed {filename}: {parsed_count} rows OK, "
+            f"{error_count} errors"
         )
 
-        return result
-
     def detect_date_format(
             self,
             file: BinaryIO,
@@ -267,19 +310,9 @@ class CSVTransactionParser(TransactionFileParser):
         """
         logger.info(f"Detecting date format for: {filename}")
 
-        # Read and decode file content
+        # Parse CSV to extract dates (file is decoded block by block)
         try:
-            content = self._read_file_content(file)
-        except Exception as e:
-            logger.error(f"Failed to read file {filename}: {e}", exc_info=True)
-            return DateDetectionResult(
-                status=DateDetectionStatus.ERROR,
-                reason=f"Could not read file: {e}",
-            )
-
-        # Parse CSV to extract dates
-        try:
-            reader = csv.DictReader(io.StringIO(content))
+            reader = csv.DictReader(self._iter_lines(file))
 
             if not reader.fieldnames:
                 return DateDetectionResult(
@@ -320,6 +353,12 @@ class CSVTransactionParser(TransactionFileParser):
                 status=DateDetectionStatus.ERROR,
                 reason=f"Invalid CSV format: {e}",
             )
+        except Exception as e:
+            logger.error(f"Failed to read file {filename}: {e}", exc_info=True)
+            return DateDetectionResult(
+                status=DateDetectionStatus.ERROR,
+                reason=f"Could not read file: {e}",
+            )
 
     def _analyze_dates(
             self,
@@ -543,29 +582,55 @@ class CSVTransactionParser(TransactionFileParser):
     # PRIVATE METHODS
     # =========================================================================
 
-    def _read_file_content(self, file: BinaryIO) -> str:
+    def _iter_lines(self, file: BinaryIO) -> Iterator[str]:
         """
-        Read and decode file content, handling different encodings.
-        
-        Tries UTF-8 first, falls back to Latin-1.
+        Decode file content block by block and yield lines (with "\\n").
+
+        The encoding is sniffed from the first block: a UTF-8 BOM selects
+        utf-8-sig, valid UTF-8 selects utf-8, anything else falls back to
+        Latin-1 (never fails, but may produce garbage). An incremental
+        decoder carries multi-byte characters split across blocks. If a
+        later block turns out not to be UTF-8, decoding continues in
+        Latin-1 from that block on.
         """
-        raw_content = file.read()
+        block = file.read(UPLOAD_READ_BLOCK_BYTES)
+        encoding = self._sniff_encoding(block)
+        decoder = codecs.getincrementaldecoder(encoding)()
+        pending = ""
 
-        # Try UTF-8 first
-        try:
-            return raw_content.decode("utf-8")
-        except UnicodeDecodeError:
-            pass
+        while block:
+            state = decoder.getstate()
+            try:
+                text = decoder.decode(block)
+            except UnicodeDecodeError:
+                logger.warning("File is not UTF-8 past the first block, continuing with Latin-1 encoding")
+                text = (state[0] + block).decode("latin-1")
+                decoder = codecs.getincrementaldecoder("latin-1")()
+
+            lines = (pending + text).split("\n")
+            pending = lines.pop()
+            for line in lines:
+                yield line + "\n"
+
+            block = file.read(UPLOAD_READ_BLOCK_BYTES)
+
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            yield pending
+
+    @staticmethod
+    def _sniff_encoding(first_block: bytes) -> str:
+        """Pick the decoding for a file from its first block."""
+        if first_block.startswith(codecs.BOM_UTF8):
+            return "utf-8-sig"
 
-        # Try UTF-8 with BOM
         try:
-            return raw_content.decode("utf-8-sig")
+            # final=False: a character cut off at the block end is not an error
+            codecs.getincrementaldecoder("utf-8")().decode(first_block, final=False)
+            return "utf-8"
         except UnicodeDecodeError:
-            pass
-
-        # Fall back to Latin-1 (never fails, but may produce garbage)
-        logger.warning("File is not UTF-8, falling back to Latin-1 encoding")
-        return raw_content.decode("latin-1")
+            logger.warning("File is not UTF-8, falling back to Latin-1 encoding")
+            return "latin-1"
 
     def _build_column_map(
             self,
@@ -3,7 +3,7 @@
 Upload service for processing transaction files.
 
 This service orchestrates the complete upload flow:
-1. Parse file using appropriate parser (CSV, JSON, Excel)
+1. Parse file using appropriate parser (CSV, Parquet/Arrow, JSON, Excel)
 2. Validate rows using Pydantic schemas
 3. Resolve assets via AssetResolutionService
 4. Create transactions atomically
@@ -38,13 +38,16 @@ import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from decimal import Decimal, InvalidOperation
-from typing import BinaryIO, Any
+from typing import BinaryIO, Any, Callable
 
 from sqlalchemy.orm import Session
 
-from app.models import Transaction, Portfolio, TransactionType
+from app.models import Portfolio, TransactionType
 from app.services.asset_resolution import AssetResolutionService, BatchResolutionResult
+from app.services.constants import UPLOAD_PARSE_CHUNK_ROWS
 from app.services.exceptions import RateLimitError
+from app.services.sell_validation import find_sell_shortfalls
+from app.services.transaction_writer import insert_transactions, split_new_transactions
 from app.services.upload.parsers import (
     get_parser,
     ParsedTransactionRow,
@@ -91,7 +94,8 @@ class UploadResult:
         filename: Original filename
         total_rows: Total rows in file
         created_count: Number of transactions created
-        skipped_count: Number of rows skipped (duplicates, etc.)
+        skipped_count: Number of rows skipped because the portfolio already
+                       has an identical transaction (re-uploaded rows)
         error_count: Number of rows with errors
         errors: Detailed error information
         created_transaction_ids: IDs of created transactions
@@ -131,6 +135,34 @@ class UploadResult:
         self.warnings.append(UploadError(row_number, stage, error_type, message, field, raw_data or {}))
 
 
+@dataclass
+class UploadProgress:
+    """
+    Progress of a running upload, reported after each processing step.
+
+    Attributes:
+        stage: Step just completed ("parsing", "asset_resolution", "persistence")
+        rows_parsed: Rows read from the file so far
+        rows_validated: Rows that passed parsing and validation so far
+        rows_resolved: Rows mapped to an asset
+        rows_skipped: Rows skipped as already recorded (set with rows_inserted)
+        rows_inserted: Transactions created (set once committed)
+        result: The result being built (errors and warnings so far)
+    """
+
+    stage: str
+    rows_parsed: int = 0
+    rows_validated: int = 0
+    rows_resolved: int = 0
+    rows_skipped: int = 0
+    rows_inserted: int = 0
+    result: UploadResult = field(default_factory=UploadResult)
+
+
+# Called with the progress after each chunk parsed and each later step
+UploadProgressCallback = Callable[[UploadProgress], None]
+
+
 # =============================================================================
 # UPLOAD SERVICE
 # =============================================================================
@@ -190,14 +222,15 @@ class UploadService:
             portfolio_id: int,
             content_type: str | None = None,
             date_format: DateFormat = DateFormat.ISO,
+            progress: UploadProgressCallback | None = None,
     ) -> UploadResult:
         """
         Process an uploaded transaction file.
 
         This is the main entry point. It handles the complete flow:
         1. Validate portfolio exists
-        2. Parse file (using specified date format)
-        3. Validate all rows
+        2. Parse file (using specified date format) in chunks
+        3. Validate each chunk as it is parsed
         4. Resolve all assets (batch)
         5. Create all transactions (atomic)
 
@@ -208,11 +241,19 @@ class UploadService:
             portfolio_id: Target portfolio ID
             content_type: Optional MIME type
             date_format: Date format used in the file (ISO, US, or EU)
+            progress: Optional callback receiving progress after each chunk
+                      and each later step (used by background upload jobs)
 
         Returns:
             UploadResult with success status and details
         """
         result = UploadResult(filename=filename)
+        state = UploadProgress(stage="parsing", result=result)
+
+        def report(stage: str) -> None:
+            if progress is not None:
+                state.stage = stage
+                progress(state)
         logger.info(f"Processing upload: {filename} for portfolio {portfolio_id}")
 
         # 1. Validate Portfolio
@@ -221,10 +262,26 @@ class UploadService:
             result.add_error(0, "validation", "portfolio_not_found", f"Portfolio {portfolio_id} not found")
             return result
 
-        # 2. Parse File
+        # 2-3. Parse and Validate File, chunk by chunk
+        # Each chunk of parsed rows is validated and dropped before the next
+        # one is read, so only the validated rows stay in memory.
+        validated_rows: list[dict[str, Any]] = []
         try:
             parser = get_parser(filename, content_type)
-            parse_result = parser.parse(file, filename, date_format)
+            for chunk in parser.iter_chunks(file, filename, date_format, UPLOAD_PARSE_CHUNK_ROWS):
+                result.total_rows += chunk.total_rows
+                for error in chunk.errors:
+                    result.add_error(error.row_number, "parsing", error.error_type, error.message, error.field, error.raw_data)
+
+                chunk_validated, validation_errors = self._validate_rows(chunk.rows, portfolio_id)
+                validated_rows.extend(chunk_validated)
+                validated_rows.extend(self._complete_typed_rows(chunk.typed_rows, portfolio_id))
+                for error in validation_errors:
+                    result.add_error(**error)
+
+                state.rows_parsed = result.total_rows
+                state.rows_validated = len(validated_rows)
+                report("parsing")
         except UnsupportedFileTypeError as e:
             result.add_error(0, "parsing", "unsupported_file_type", str(e))
             return result
@@ -233,19 +290,8 @@ class UploadService:
             result.add_error(0, "parsing", "parse_error", str(e))
             return result
 
-        result.total_rows = parse_result.total_rows
-        for error in parse_result.errors:
-            result.add_error(error.row_number, "parsing", error.error_type, error.message, error.field, error.raw_data)
-
-        if not parse_result.has_data:
-            if not result.errors:
-                result.add_error(0, "parsing", "empty_file", "No valid rows found")
-            return result
-
-        # 3. Validate Rows
-        validated_rows, validation_errors = self._validate_rows(parse_result.rows, portfolio_id)
-        for error in validation_errors:
-            result.add_error(**error)
+        if not validated_rows and not result.errors:
+            result.add_error(0, "parsing", "empty_file", "No valid rows found")
 
         if result.errors:
             return result
@@ -294,7 +340,7 @@ class UploadService:
                 ticker_fallback_map[asset.ticker].append(asset)
 
         # 6. Map Rows to Assets (with Warning Logic)
-        transactions_db: list[Transaction] = []
+        transaction_rows: list[dict[str, Any]] = []
 
         for row in validated_rows:
             key = (row["ticker"], row["exchange"])
@@ -344,38 +390,54 @@ class UploadService:
                                          "Asset not resolved", field="ticker")
                     continue
 
-            # Create Transaction Object
-            txn = Transaction(
-                portfolio_id=portfolio_id,
-                asset_id=asset.id,
-                transaction_type=row["transaction_type"],
-                date=row["date"],
-                quantity=row["quantity"],
-                price_per_share=row["price_per_share"],
-                currency=row["currency"],
-                fee=row["fee"],
-                fee_currency=row["fee_currency"],
-                exchange_rate=row["exchange_rate"],
-            )
-            transactions_db.append(txn)
+            # Collect Transaction Values (inserted in bulk below)
+            transaction_rows.append({**row, "asset_id": asset.id})
+
+        state.rows_resolved = len(transaction_rows)
+        report("asset_resolution")
 
         # 7. Atomic Commit (Only if no blocking errors)
         if result.error_count == 0:
             try:
-                db.add_all(transactions_db)
+                # Rows recorded by an earlier upload of the same export are skipped
+                new_rows, skipped_rows = split_new_transactions(db, transaction_rows)
+                result.skipped_count = len(skipped_rows)
+                state.rows_skipped = result.skipped_count
+
+                # SELLs are checked against the holdings at their date in one replay
+                for shortfall in find_sell_shortfalls(db, new_rows):
+                    row = new_rows[shortfall.position]
+                    if shortfall.recorded_sell_date is None:
+                        message = (f"Cannot sell {row['quantity']} shares of {row['ticker']}. "
+                                   f"Only {shortfall.available} shares available as of {row['date'].date()}.")
+                    else:
+                        message = (f"Selling {row['quantity']} shares of {row['ticker']} on {row['date'].date()} "
+                                   f"leaves only {shortfall.available} shares for the SELL of "
+                                   f"{shortfall.recorded_sell_quantity} already recorded on "
+                                   f"{shortfall.recorded_sell_date.date()}.")
+                    result.add_error(row["row_number"], "validation", "insufficient_quantity", message,
+                                     field="quantity")
+                if result.errors:
+                    return result
+
+                created_ids = insert_transactions(db, new_rows)
                 db.commit()
-                for txn in transactions_db:
-                    db.refresh(txn)
 
                 result.success = True
-                result.created_count = len(transactions_db)
-                result.created_transaction_ids = [t.id for t in transactions_db]
-                logger.info(f"Upload complete. Created: {result.created_count}, Warnings: {len(result.warnings)}")
+                result.created_count = len(created_ids)
+                result.created_transaction_ids = created_ids
+                logger.info(
+                    f"Upload complete. Created: {result.created_count}, "
+                    f"Skipped: {result.skipped_count}, Warnings: {len(result.warnings)}"
+                )
             except Exception as e:
                 db.rollback()
                 logger.error(f"Save failed: {e}", exc_info=True)
                 result.add_error(0, "persistence", "database_error", str(e))
 
+            state.rows_inserted = result.created_count
+            report("persistence")
+
         return result
 
     # =========================================================================
@@ -492,6 +554,29 @@ class UploadService:
 
         return validated, errors
 
+    def _complete_typed_rows(
+            self,
+            typed_rows: list[dict[str, Any]],
+            portfolio_id: int,
+    ) -> list[dict[str, Any]]:
+        """
+        Complete rows a columnar parser already converted and checked.
+
+        The parser applied the checks of _validate_rows column-wise, so
+        only the portfolio and the TransactionType enum are added here.
+
+        Args:
+            typed_rows: ParseChunk.typed_rows (completed in place)
+            portfolio_id: Target portfolio ID
+
+        Returns:
+            The same rows, in the shape of _validate_rows output
+        """
+        for row in typed_rows:
+            row["portfolio_id"] = portfolio_id
+            row["transaction_type"] = TransactionType(row["transaction_type"])
+        return typed_rows
+
     def _add_resolution_errors(
             self,
             result: UploadResult,
@@ -562,32 +647,17 @@ class UploadService:
         Returns:
             List of created transaction IDs
         """
-        transactions: list[Transaction] = []
-
-        for row in validated_rows:
-            key = (row["ticker"], row["exchange"])
-            asset = resolved_assets[key]
-
-            txn = Transaction(
-                portfolio_id=portfolio_id,
-                asset_id=asset.id,
-                transaction_type=row["transaction_type"],
-                date=row["date"],
-                quantity=row["quantity"],
-                price_per_share=row["price_per_share"],
-                currency=row["currency"],
-                fee=row["fee"],
-                fee_currency=row["fee_currency"],
-                exchange_rate=row["exchange_rate"],
-            )
-            transactions.append(txn)
-
-        # Atomic commit
-        db.add_all(transactions)
+        rows = [
+            {
+                **row,
+                "portfolio_id": portfolio_id,
+                "asset_id": resolved_assets[(row["ticker"], row["exchange"])].id,
+            }
+            for row in validated_rows
+        ]
+
+        # Atomic commit (ids come back from INSERT ... RETURNING)
+        created_ids = insert_transactions(db, rows)
         db.commit()
 
-        # Refresh to get IDs
-        for txn in transactions:
-            db.refresh(txn)
-
-        return [txn.id for txn in transactions]
+        return created_ids
@@ -7,7 +7,7 @@ This service handles:
 - Retrieving settings with auto-creation of defaults
 - Updating settings (display, defaults, regional)
 - User profile management (view, update name)
-- Password changes
+- Password changes (bcrypt on a dedicated pool for async handlers)
 - Account deletion
 
 Design Principles:
@@ -33,9 +33,11 @@ from datetime import datetime, timezone
 
 from sqlalchemy import select, delete
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.models import User, UserSettings, Portfolio, RefreshToken
 from app.services.auth.password import PasswordService
+from app.services.auth.password_pool import PasswordHashingPool
 from app.services.exceptions import (
     InvalidCredentialsError,
     UserNotFoundError,
@@ -99,8 +101,15 @@ class UserSettingsService:
     settings with automatic default creation.
     """
 
-    def __init__(self) -> None:
-        """Initialize the user settings service."""
+    def __init__(self, password_pool: PasswordHashingPool | None = None) -> None:
+        """
+        Initialize the user settings service.
+
+        Args:
+            password_pool: Executor used by change_password_async for bcrypt.
+                          If not provided, a new instance will be created.
+        """
+        self._password_pool = password_pool or PasswordHashingPool()
         logger.info("UserSettingsService initialized")
 
     # =========================================================================
@@ -294,6 +303,35 @@ class UserSettingsService:
             UserNotFoundError: If user doesn't exist
             InvalidCredentialsError: If current password is wrong or user has no password
         """
+        user = self._get_password_user(db, user_id)
+
+        # Verify current password
+        if not PasswordService.verify_password(current_password, user.hashed_password):
+            raise InvalidCredentialsError("Current password is incorrect")
+
+        return self._store_password(db, user, PasswordService.hash_password(new_password))
+
+    async def change_password_async(
+            self,
+            db: Session,
+            user_id: int,
+            current_password: str,
+            new_password: str,
+    ) -> bool:
+        """
+        change_password() with bcrypt on the password pool.
+
+        Database work runs on the Starlette threadpool.
+        """
+        user = await run_in_threadpool(self._get_password_user, db, user_id)
+
+        if not await self._password_pool.verify_password(current_password, user.hashed_password):
+            raise InvalidCredentialsError("Current password is incorrect")
+
+        hashed_password = await self._password_pool.hash_password(new_password)
+        return await run_in_threadpool(self._store_password, db, user, hashed_password)
+
+    def _get_password_user(self, db: Session, user_id: int) -> User:
         user = self.get_profile(db, user_id)
 
         # Check if user has a password (not OAuth-only)
@@ -302,17 +340,16 @@ class UserSettingsService:
                 "Cannot change password for OAuth-only accounts"
             )
 
-        # Verify current password
-        if not PasswordService.verify_password(current_password, user.hashed_password):
-            raise InvalidCredentialsError("Current password is incorrect")
+        return user
 
+    def _store_password(self, db: Session, user: User, hashed_password: str) -> bool:
         # Update password
-        user.hashed_password = PasswordService.hash_password(new_password)
+        user.hashed_password = hashed_password
         user.password_reset_at = datetime.now(timezone.utc)
         user.updated_at = datetime.now(timezone.utc)
         db.commit()
 
-        logger.info(f"User {user_id} changed password")
+        logger.info(f"User {user.id} changed password")
         return True
 
     def user_has_password(
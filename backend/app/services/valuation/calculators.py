@@ -34,7 +34,8 @@ from typing import TYPE_CHECKING
 
 from sqlalchemy.orm import Session
 
-from app.models import Asset, Transaction, TransactionType
+from app.models import Asset, PortfolioPosition, TransactionType
+from app.services.transaction_records import TransactionRecord
 from app.services.valuation.types import (
     HoldingPosition,
     HoldingsResult,
@@ -73,7 +74,7 @@ class HoldingsCalculator:
 
     def calculate(
             self,
-            transactions_by_asset: dict[int, list[Transaction]],
+            transactions_by_asset: dict[int, list[TransactionRecord]],
             assets: dict[int, Asset],
             portfolio_currency: str,
     ) -> HoldingsResult:
@@ -104,31 +105,83 @@ class HoldingsCalculator:
                 transactions=transactions,
                 portfolio_currency=portfolio_currency,
             )
+            self._collect(position, positions, warnings)
 
-            # Data integrity check: can't have sales without buys
-            # This would cause division by zero in cost basis calculation
-            if position.total_bought_qty == Decimal("0") and position.total_sold_qty > Decimal("0"):
-                warning_msg = (
-                    f"Data integrity issue: {asset.ticker} has {position.total_sold_qty} shares sold "
-                    f"but no BUY transactions recorded. This position has been excluded from calculations. "
-                    f"Please check if BUY transactions are missing."
-                )
+        return HoldingsResult(positions=positions, warnings=warnings)
+
+    def calculate_from_ledger(
+            self,
+            ledger_rows: list[PortfolioPosition],
+            assets: dict[int, Asset],
+    ) -> HoldingsResult:
+        """
+        Build holdings from position ledger rows instead of transactions.
+
+        Ledger rows hold the same aggregates _calculate_position() sums
+        up over all of an asset's transactions, so the result equals
+        calculate() over every transaction in the portfolio.
+
+        Args:
+            ledger_rows: portfolio_positions rows of one portfolio
+            assets: Asset objects keyed by asset_id
+
+        Returns:
+            HoldingsResult containing positions and data integrity warnings
+        """
+        positions: list[HoldingPosition] = []
+        warnings: list[str] = []
+
+        for row in ledger_rows:
+            asset = assets.get(row.asset_id)
+            if asset is None:
+                warning_msg = f"Asset ID {row.asset_id} not found in database - transactions for this asset were skipped"
                 logger.warning(warning_msg)
                 warnings.append(warning_msg)
                 continue
 
-            # Include positions that are either:
-            # 1. Open (quantity > 0) - for current holdings display
-            # 2. Closed but have sales (total_sold_qty > 0) - for realized P&L
-            if position.has_position or position.total_sold_qty > 0:
-                positions.append(position)
+            position = HoldingPosition(
+                asset_id=asset.id,
+                asset=asset,
+                quantity=row.total_bought_qty - row.total_sold_qty,
+                total_bought_qty=row.total_bought_qty,
+                total_bought_cost_local=row.total_bought_cost_local,
+                total_bought_cost_portfolio=row.total_bought_cost_portfolio,
+                total_sold_qty=row.total_sold_qty,
+                total_sold_proceeds_portfolio=row.total_sold_proceeds_portfolio,
+            )
+            self._collect(position, positions, warnings)
 
         return HoldingsResult(positions=positions, warnings=warnings)
 
+    @staticmethod
+    def _collect(
+            position: HoldingPosition,
+            positions: list[HoldingPosition],
+            warnings: list[str],
+    ) -> None:
+        """Append position to positions if it is valid and has activity."""
+        # Data integrity check: can't have sales without buys
+        # This would cause division by zero in cost basis calculation
+        if position.total_bought_qty == Decimal("0") and position.total_sold_qty > Decimal("0"):
+            warning_msg = (
+                f"Data integrity issue: {position.asset.ticker} has {position.total_sold_qty} shares sold "
+                f"but no BUY transactions recorded. This position has been excluded from calculations. "
+                f"Please check if BUY transactions are missing."
+            )
+            logger.warning(warning_msg)
+            warnings.append(warning_msg)
+            return
+
+        # Include positions that are either:
+        # 1. Open (quantity > 0) - for current holdings display
+        # 2. Closed but have sales (total_sold_qty > 0) - for realized P&L
+        if position.has_position or position.total_sold_qty > 0:
+            positions.append(position)
+
     def _calculate_position(
             self,
             asset: Asset,
-            transactions: list[Transaction],
+            transactions: list[TransactionRecord],
             portfolio_currency: str,
     ) -> HoldingPosition:
         """
@@ -194,7 +247,7 @@ class HoldingsCalculator:
     def apply_transaction(
             self,
             holdings_state: dict[int, dict],
-            transaction: Transaction,
+            transaction: TransactionRecord,
             asset: Asset,
     ) -> None:
         """
@@ -412,6 +465,7 @@ class ValueCalculator:
             price: Decimal | None,
             price_date: date | None,
             portfolio_currency: str,
+            fx_service: FXRateServiceProtocol | None = None,
     ) -> ValueResult:
         """
         Calculate current value for a position.
@@ -422,6 +476,8 @@ class ValueCalculator:
             price: Market price per share (None if unavailable)
             price_date: Date of the price
             portfolio_currency: Portfolio's base currency
+            fx_service: Overrides the injected FX service for this call
+                        (e.g. a request-scoped memoizing lookup)
 
         Returns:
             ValueResult with value in both local and portfolio currency
@@ -462,7 +518,7 @@ class ValueCalculator:
             )
 
         # Different currency → need FX conversion
-        fx_result = self._fx_service.get_rate_or_none(
+        fx_result = (fx_service or self._fx_service).get_rate_or_none(
             db=db,
             base_currency=asset_currency,
             quote_currency=portfolio_currency,
@@ -663,7 +719,7 @@ class CashCalculator:
     """
 
     @staticmethod
-    def has_cash_transactions(transactions: list[Transaction]) -> bool:
+    def has_cash_transactions(transactions: list[TransactionRecord]) -> bool:
         """
         Detect if portfolio tracks cash.
 
@@ -682,7 +738,7 @@ class CashCalculator:
         )
 
     @staticmethod
-    def _get_transaction_cash_delta(txn: Transaction) -> Decimal:
+    def _get_transaction_cash_delta(txn: TransactionRecord) -> Decimal:
         """
         Calculate the cash balance change for a transaction.
 
@@ -715,7 +771,7 @@ class CashCalculator:
 
     def calculate(
             self,
-            transactions: list[Transaction],
+            transactions: list[TransactionRecord],
             portfolio_currency: str,
     ) -> dict[str, Decimal]:
         """
@@ -749,7 +805,7 @@ class CashCalculator:
     def calculate_with_state(
             self,
             current_cash: dict[str, Decimal],
-            transaction: Transaction,
+            transaction: TransactionRecord,
     ) -> None:
         """
         Apply a single transaction to cash state (mutates current_cash).
@@ -14,6 +14,9 @@ Performance Optimization:
     - 1 query for all FX rates in date range
     Then iterate in memory.
 
+    Loads go through a PortfolioDataContext, so data another calculation
+    already loaded in the same request is reused instead of queried again.
+
 Design Principles:
 - Batch operations where possible
 - Graceful handling of missing data
@@ -25,21 +28,14 @@ from __future__ import annotations
 
 import calendar
 import logging
+from collections.abc import Iterator
 from datetime import date, timedelta
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from sqlalchemy import select, and_
 from sqlalchemy.orm import Session
 
-from app.models import (
-    Asset,
-    Transaction,
-    TransactionType,
-    MarketData,
-    ExchangeRate,
-    Portfolio,
-)
+from app.models import Asset, TransactionType
 from app.services.valuation.calculators import (
     HoldingsCalculator,
     CostBasisCalculator,
@@ -57,9 +53,14 @@ from app.services.constants import (
     MAX_PRICE_RECORDS_BEFORE_CHUNKING,
 )
 from app.services.exceptions import PortfolioNotFoundError, InvalidIntervalError
+from app.services.portfolio_context import PortfolioDataContext, resolve_context
+from app.services.transaction_records import TransactionRecord
+from app.utils.trading_calendar import get_trading_calendar, max_lookback_days
 
 if TYPE_CHECKING:
     from app.services.fx_rate_service import FXRateService
+    from app.services.market_data.price_cache import PriceSeriesCache
+    from app.services.market_data.price_store import ColumnarPriceStore
 
 logger = logging.getLogger(__name__)
 
@@ -86,6 +87,8 @@ class HistoryCalculator:
         _cost_calc: Calculator for cost basis
         _realized_pnl_calc: Calculator for realized P&L
         _fx_service: Service for FX rate lookups (used for batch fetch)
+        _price_store: Optional local price store for batch price reads
+        _price_cache: Optional process-wide price series cache
     """
 
     def __init__(
@@ -94,6 +97,8 @@ class HistoryCalculator:
             cost_calc: CostBasisCalculator,
             realized_pnl_calc: RealizedPnLCalculator,
             fx_service: FXRateService,
+            price_store: ColumnarPriceStore | None = None,
+            price_cache: PriceSeriesCache | None = None,
     ) -> None:
         """
         Initialize with calculator dependencies.
@@ -105,6 +110,8 @@ class HistoryCalculator:
         self._cost_calc = cost_calc
         self._realized_pnl_calc = realized_pnl_calc
         self._fx_service = fx_service
+        self._price_store = price_store
+        self._price_cache = price_cache
 
     def calculate(
             self,
@@ -113,6 +120,7 @@ class HistoryCalculator:
             start_date: date,
             end_date: date,
             interval: str = "daily",
+            context: PortfolioDataContext | None = None,
     ) -> PortfolioHistory:
         """
         Calculate portfolio valuation history using the Rolling State pattern.
@@ -131,21 +139,24 @@ class HistoryCalculator:
             start_date: First date in the series
             end_date: Last date in the series
             interval: "daily", "weekly", or "monthly"
+            context: Request-scoped data shared with other calls
+                     (default: a fresh context for this call)
 
         Returns:
             PortfolioHistory with time series data
         """
         warnings: list[str] = []
+        context = resolve_context(db, portfolio_id, context, self._price_store, self._price_cache)
 
         # Step 0: Get portfolio
-        portfolio = db.get(Portfolio, portfolio_id)
+        portfolio = context.portfolio
         if portfolio is None:
             raise PortfolioNotFoundError(portfolio_id)
 
         portfolio_currency = portfolio.currency
 
         # Step 1: Get ALL transactions up to end_date, SORTED BY DATE
-        transactions = self._fetch_transactions(db, portfolio_id, end_date)
+        transactions = context.get_transactions(end_date=end_date)
 
         if not transactions:
             return PortfolioHistory(
@@ -181,7 +192,7 @@ class HistoryCalculator:
                 f"~{estimated_records:,} estimated records"
             )
             return self._calculate_chunked(
-                db=db,
+                context=context,
                 portfolio_id=portfolio_id,
                 portfolio_currency=portfolio_currency,
                 transactions=transactions,
@@ -195,7 +206,7 @@ class HistoryCalculator:
         # Standard (non-chunked) processing for smaller date ranges
 
         # Step 4: Batch fetch ALL prices in date range
-        price_map = self._fetch_prices_batch(db, asset_ids, start_date, end_date)
+        price_map = self._fetch_prices_batch(context, asset_ids, start_date, end_date)
 
         # Step 4b: Collect proxy asset IDs from synthetic prices and add to asset fetch
         proxy_asset_ids = {
@@ -204,7 +215,7 @@ class HistoryCalculator:
             if is_synthetic and proxy_id is not None
         }
         all_asset_ids = set(asset_ids) | proxy_asset_ids
-        assets = self._fetch_assets(db, list(all_asset_ids))
+        assets = context.get_assets(all_asset_ids)
 
         # Step 5: Batch fetch ALL FX rates in date range
         currencies_needed = {
@@ -213,7 +224,7 @@ class HistoryCalculator:
             if asset.currency.upper() != portfolio_currency.upper()
         }
         fx_map = self._fetch_fx_rates_batch(
-            db, currencies_needed, portfolio_currency, start_date, end_date
+            context, currencies_needed, portfolio_currency, start_date, end_date
         )
 
         # Step 6: Generate target dates based on interval (SORTED)
@@ -328,12 +339,70 @@ class HistoryCalculator:
             synthetic_details=synthetic_details,
         )
 
-    def _calculate_chunked(
+    def iter_points(
             self,
             db: Session,
             portfolio_id: int,
+            start_date: date,
+            end_date: date,
+            interval: str = "daily",
+            context: PortfolioDataContext | None = None,
+    ) -> Iterator[HistoryPoint]:
+        """
+        Stream the points calculate() would return, one at a time.
+
+        Always uses chunked processing and keeps no aggregate statistics,
+        so memory stays bounded by one chunk of prices however long the
+        range is. Used by the streaming export endpoints.
+
+        The portfolio and interval are checked before this returns, so
+        errors surface before the first point is consumed.
+
+        Args:
+            db: Database session (must stay open while iterating)
+            portfolio_id: Portfolio to calculate history for
+            start_date: First date in the series
+            end_date: Last date in the series
+            interval: "daily", "weekly", or "monthly"
+            context: Request-scoped data shared with other calls
+
+        Returns:
+            Iterator of HistoryPoint in date order
+
+        Raises:
+            PortfolioNotFoundError: If the portfolio does not exist
+            InvalidIntervalError: If interval is not supported
+        """
+        context = resolve_context(db, portfolio_id, context, self._price_store, self._price_cache)
+
+        portfolio = context.portfolio
+        if portfolio is None:
+            raise PortfolioNotFoundError(portfolio_id)
+
+        target_dates = self._generate_dates(start_date, end_date, interval)
+        transactions = context.get_transactions(end_date=end_date)
+        if not transactions:
+            return iter(())
+
+        from app.services.valuation.calculators import CashCalculator
+
+        return self._iter_chunked_points(
+            context=context,
+            portfolio_currency=portfolio.currency,
+            transactions=transactions,
+            asset_ids=list({txn.asset_id for txn in transactions if txn.asset_id is not None}),
+            start_date=start_date,
+            end_date=end_date,
+            date_chunks=self._split_dates_into_chunks(target_dates, HISTORY_CHUNK_SIZE_DAYS),
+            tracks_cash=CashCalculator.has_cash_transactions(transactions),
+        )
+
+    def _calculate_chunked(
+            self,
+            context: PortfolioDataContext,
+            portfolio_id: int,
             portfolio_currency: str,
-            transactions: list[Transaction],
+            transactions: list[TransactionRecord],
             asset_ids: list[int],
             start_date: date,
             end_date: date,
@@ -349,13 +418,14 @@ class HistoryCalculator:
         3. For each chunk: fetch prices/FX, process, discard
 
         This trades slightly more DB queries for bounded memory usage.
+        Chunk windows are deliberately not memoized in the context.
 
         Memory Footprint:
             - Standard: O(assets × days × 2) for prices + FX
             - Chunked: O(assets × chunk_days × 2) - bounded to ~4MB per chunk
 
         Args:
-            db: Database session
+            context: Data context for this portfolio
             portfolio_id: Portfolio ID
             portfolio_currency: Portfolio's base currency
             transactions: All transactions (already fetched)
@@ -370,11 +440,146 @@ class HistoryCalculator:
         """
         warnings: list[str] = []
 
+        # Generate all target dates and split them into chunks
+        target_dates = self._generate_dates(start_date, end_date, interval)
+        date_chunks = self._split_dates_into_chunks(target_dates, HISTORY_CHUNK_SIZE_DAYS)
+
+        logger.debug(
+            f"Processing {len(target_dates)} dates in {len(date_chunks)} chunks "
+            f"(chunk size: {HISTORY_CHUNK_SIZE_DAYS} days)"
+        )
+
+        all_data_points = list(self._iter_chunked_points(
+            context=context,
+            portfolio_currency=portfolio_currency,
+            transactions=transactions,
+            asset_ids=asset_ids,
+            start_date=start_date,
+            end_date=end_date,
+            date_chunks=date_chunks,
+            tracks_cash=tracks_cash,
+        ))
+
+        # Aggregate statistics across all data points
+        # (Same aggregation logic as non-chunked version)
+        incomplete_count = sum(1 for p in all_data_points if not p.has_complete_data)
+        if incomplete_count > 0:
+            warnings.append(
+                f"{incomplete_count} of {len(all_data_points)} data points have "
+                f"incomplete price or FX data"
+            )
+
+        has_synthetic = any(point.has_synthetic_data for point in all_data_points)
+        all_synthetic_holdings: dict[str, str | None] = {}
+        synthetic_dates: list[date] = []
+        total_lookups = 0
+        synthetic_lookups = 0
+        asset_tracking: dict[str, dict] = {}
+
+        for point in all_data_points:
+            total_lookups += point.holdings_count
+            synthetic_lookups += len(point.synthetic_holdings)
+
+            for ticker, proxy in point.synthetic_holdings.items():
+                if ticker not in asset_tracking:
+                    asset_tracking[ticker] = {
+                        "proxy": proxy,
+                        "synthetic_dates": [],
+                        "total_dates": [],
+                    }
+                asset_tracking[ticker]["synthetic_dates"].append(point.date)
+                asset_tracking[ticker]["total_dates"].append(point.date)
+
+                if ticker not in all_synthetic_holdings:
+                    all_synthetic_holdings[ticker] = proxy
+
+            if point.has_synthetic_data:
+                synthetic_dates.append(point.date)
+
+        synthetic_date_range: tuple[date, date] | None = None
+        if synthetic_dates:
+            synthetic_date_range = (min(synthetic_dates), max(synthetic_dates))
+
+        from app.services.valuation.types import SyntheticAssetDetail
+        synthetic_details: dict[str, SyntheticAssetDetail] = {}
+
+        for ticker, tracking in asset_tracking.items():
+            if tracking["synthetic_dates"]:
+                # Determine synthetic method:
+                # - If proxy_ticker is None, it's cost-carry (valued at purchase price)
+                # - If proxy_ticker is set, it's proxy-backcast (modeled from correlated asset)
+                proxy = tracking["proxy"]
+                method = "cost_carry" if proxy is None else "proxy_backcast"
+
+                synthetic_details[ticker] = SyntheticAssetDetail(
+                    ticker=ticker,
+                    proxy_ticker=proxy,
+                    first_synthetic_date=min(tracking["synthetic_dates"]),
+                    last_synthetic_date=max(tracking["synthetic_dates"]),
+                    synthetic_days=len(tracking["synthetic_dates"]),
+                    total_days_held=len(tracking["synthetic_dates"]),
+                    synthetic_method=method,
+                )
+
+        warnings.append(
+            f"Used chunked processing ({len(date_chunks)} chunks) for memory efficiency"
+        )
+
+        return PortfolioHistory(
+            portfolio_id=portfolio_id,
+            portfolio_currency=portfolio_currency,
+            start_date=start_date,
+            end_date=end_date,
+            interval=interval,
+            tracks_cash=tracks_cash,
+            data=all_data_points,
+            warnings=warnings,
+            has_synthetic_data=has_synthetic,
+            synthetic_holdings=all_synthetic_holdings,
+            synthetic_date_range=synthetic_date_range,
+            synthetic_lookups=synthetic_lookups,
+            total_lookups=total_lookups,
+            synthetic_details=synthetic_details,
+        )
+
+    def _iter_chunked_points(
+            self,
+            context: PortfolioDataContext,
+            portfolio_currency: str,
+            transactions: list[TransactionRecord],
+            asset_ids: list[int],
+            start_date: date,
+            end_date: date,
+            date_chunks: list[list[date]],
+            tracks_cash: bool,
+    ) -> Iterator[HistoryPoint]:
+        """
+        Yield history points chunk by chunk (see _calculate_chunked).
+
+        Only one chunk's prices and FX rates are held at a time, and points
+        are produced as they are calculated, so a caller that consumes them
+        incrementally (streaming export) runs in bounded memory.
+
+        Args:
+            context: Data context for this portfolio
+            portfolio_currency: Portfolio's base currency
+            transactions: All transactions up to end_date, by date
+            asset_ids: Asset IDs in the portfolio
+            start_date: Start of date range
+            end_date: End of date range
+            date_chunks: Target dates split by _split_dates_into_chunks
+            tracks_cash: Whether portfolio tracks cash
+
+        Yields:
+            HistoryPoint per target date, in order
+        """
         # Step 1: Fetch all assets once (small memory footprint)
         # We need to do an initial price fetch to get proxy asset IDs
         # Use first chunk to discover proxy assets
         first_chunk_end = min(start_date + timedelta(days=HISTORY_CHUNK_SIZE_DAYS), end_date)
-        initial_prices = self._fetch_prices_batch(db, asset_ids, start_date, first_chunk_end)
+        initial_prices = self._fetch_prices_batch(
+            context, asset_ids, start_date, first_chunk_end, memoize=False
+        )
 
         proxy_asset_ids = {
             proxy_id
@@ -382,7 +587,7 @@ class HistoryCalculator:
             if is_synthetic and proxy_id is not None
         }
         all_asset_ids = set(asset_ids) | proxy_asset_ids
-        assets = self._fetch_assets(db, list(all_asset_ids))
+        assets = context.get_assets(all_asset_ids)
 
         # Determine currencies needed for FX
         currencies_needed = {
@@ -391,20 +596,7 @@ class HistoryCalculator:
             if asset.currency.upper() != portfolio_currency.upper()
         }
 
-        # Step 2: Generate all target dates
-        target_dates = self._generate_dates(start_date, end_date, interval)
-
-        # Step 3: Split dates into chunks
-        date_chunks = self._split_dates_into_chunks(target_dates, HISTORY_CHUNK_SIZE_DAYS)
-
-        logger.debug(
-            f"Processing {len(target_dates)} dates in {len(date_chunks)} chunks "
-            f"(chunk size: {HISTORY_CHUNK_SIZE_DAYS} days)"
-        )
-
-        # Step 4: Process each chunk with rolling state preserved across chunks
-        all_data_points: list[HistoryPoint] = []
-
+        # Step 2: Process each chunk with rolling state preserved across chunks
         # Rolling state - maintained across chunks
         holdings_state: dict[int, dict] = {}
         cash_state: dict[str, Decimal] = {}
@@ -441,11 +633,12 @@ class HistoryCalculator:
                 chunk_prices = initial_prices
             else:
                 chunk_prices = self._fetch_prices_batch(
-                    db, asset_ids, chunk_start, chunk_end
+                    context, asset_ids, chunk_start, chunk_end, memoize=False
                 )
 
             chunk_fx = self._fetch_fx_rates_batch(
-                db, currencies_needed, portfolio_currency, chunk_start, chunk_end
+                context, currencies_needed, portfolio_currency, chunk_start, chunk_end,
+                memoize=False,
             )
 
             # Process dates in this chunk
@@ -498,93 +691,12 @@ class HistoryCalculator:
                 else:
                     point.drawdown = None
 
-                all_data_points.append(point)
+                yield point
 
             # Clear chunk data to free memory (Python GC will reclaim)
             del chunk_prices
             del chunk_fx
 
-        # Step 5: Aggregate statistics across all data points
-        # (Same aggregation logic as non-chunked version)
-        incomplete_count = sum(1 for p in all_data_points if not p.has_complete_data)
-        if incomplete_count > 0:
-            warnings.append(
-                f"{incomplete_count} of {len(all_data_points)} data points have "
-                f"incomplete price or FX data"
-            )
-
-        has_synthetic = any(point.has_synthetic_data for point in all_data_points)
-        all_synthetic_holdings: dict[str, str | None] = {}
-        synthetic_dates: list[date] = []
-        total_lookups = 0
-        synthetic_lookups = 0
-        asset_tracking: dict[str, dict] = {}
-
-        for point in all_data_points:
-            total_lookups += point.holdings_count
-            synthetic_lookups += len(point.synthetic_holdings)
-
-            for ticker, proxy in point.synthetic_holdings.items():
-                if ticker not in asset_tracking:
-                    asset_tracking[ticker] = {
-                        "proxy": proxy,
-                        "synthetic_dates": [],
-                        "total_dates": [],
-                    }
-                asset_tracking[ticker]["synthetic_dates"].append(point.date)
-                asset_tracking[ticker]["total_dates"].append(point.date)
-
-                if ticker not in all_synthetic_holdings:
-                    all_synthetic_holdings[ticker] = proxy
-
-            if point.has_synthetic_data:
-                synthetic_dates.append(point.date)
-
-        synthetic_date_range: tuple[date, date] | None = None
-        if synthetic_dates:
-            synthetic_date_range = (min(synthetic_dates), max(synthetic_dates))
-
-        from app.services.valuation.types import SyntheticAssetDetail
-        synthetic_details: dict[str, SyntheticAssetDetail] = {}
-
-        for ticker, tracking in asset_tracking.items():
-            if tracking["synthetic_dates"]:
-                # Determine synthetic method:
-                # - If proxy_ticker is None, it's cost-carry (valued at purchase price)
-                # - If proxy_ticker is set, it's proxy-backcast (modeled from correlated asset)
-                proxy = tracking["proxy"]
-                method = "cost_carry" if proxy is None else "proxy_backcast"
-
-                synthetic_details[ticker] = SyntheticAssetDetail(
-                    ticker=ticker,
-                    proxy_ticker=proxy,
-                    first_synthetic_date=min(tracking["synthetic_dates"]),
-                    last_synthetic_date=max(tracking["synthetic_dates"]),
-                    synthetic_days=len(tracking["synthetic_dates"]),
-                    total_days_held=len(tracking["synthetic_dates"]),
-                    synthetic_method=method,
-                )
-
-        warnings.append(
-            f"Used chunked processing ({len(date_chunks)} chunks) for memory efficiency"
-        )
-
-        return PortfolioHistory(
-            portfolio_id=portfolio_id,
-            portfolio_currency=portfolio_currency,
-            start_date=start_date,
-            end_date=end_date,
-            interval=interval,
-            tracks_cash=tracks_cash,
-            data=all_data_points,
-            warnings=warnings,
-            has_synthetic_data=has_synthetic,
-            synthetic_holdings=all_synthetic_holdings,
-            synthetic_date_range=synthetic_date_range,
-            synthetic_lookups=synthetic_lookups,
-            total_lookups=total_lookups,
-            synthetic_details=synthetic_details,
-        )
 
     def _split_dates_into_chunks(
             self,
@@ -632,7 +744,7 @@ class HistoryCalculator:
 
     def _apply_transactions_until_date(
             self,
-            transactions: list[Transaction],
+            transactions: list[TransactionRecord],
             txn_index: int,
             target_date: date,
             holdings_state: dict[int, dict],
@@ -667,9 +779,7 @@ class HistoryCalculator:
 
         while txn_index < num_txns:
             txn = transactions[txn_index]
-            txn_date = self._transaction_date(txn)
-
-            if txn_date > target_date:
+            if txn.date > target_date:
                 break  # This transaction is in the future
 
             # Apply transaction to holdings state
@@ -707,7 +817,7 @@ class HistoryCalculator:
 
     def _calculate_history_rolling(
             self,
-            transactions: list[Transaction],
+            transactions: list[TransactionRecord],
             assets: dict[int, Asset],
             portfolio_currency: str,
             target_dates: list[date],
@@ -887,7 +997,7 @@ class HistoryCalculator:
 
             # Current value (using batch-fetched data with synthetic info)
             price, price_date, is_synthetic, proxy_source_id = self._lookup_price_with_fallback(
-                price_map, position.asset_id, target_date
+                price_map, position.asset_id, target_date, exchange=position.asset.exchange
             )
 
             if price is None or price_date is None:
@@ -982,57 +1092,19 @@ class HistoryCalculator:
     # DATA FETCHING (Batch Operations)
     # =========================================================================
 
-    def _fetch_transactions(
-            self,
-            db: Session,
-            portfolio_id: int,
-            end_date: date,
-    ) -> list[Transaction]:
-        """
-        Fetch all transactions for portfolio up to end_date.
-
-        Returns transactions ordered by date for correct processing.
-        """
-        query = (
-            select(Transaction)
-            .where(
-                and_(
-                    Transaction.portfolio_id == portfolio_id,
-                    Transaction.date <= end_date,
-                )
-            )
-            .order_by(Transaction.date)
-        )
-        return list(db.scalars(query).all())
-
-    def _fetch_assets(
-            self,
-            db: Session,
-            asset_ids: list[int],
-    ) -> dict[int, Asset]:
-        """
-        Fetch all assets by ID.
-
-        Returns dict mapping asset_id -> Asset.
-        """
-        if not asset_ids:
-            return {}
-
-        query = select(Asset).where(Asset.id.in_(asset_ids))
-        assets = db.scalars(query).all()
-        return {asset.id: asset for asset in assets}
-
     def _fetch_prices_batch(
             self,
-            db: Session,
+            context: PortfolioDataContext,
             asset_ids: list[int],
             start_date: date,
             end_date: date,
+            memoize: bool = True,
     ) -> dict[tuple[int, date], tuple[Decimal, bool, int | None]]:
         """
         Batch fetch all prices for given assets in date range.
 
         IMPORTANT: Extends the fetch range backwards by PRICE_FALLBACK_DAYS
+        (or further if an exchange closure before start_date is longer)
         to enable fallback lookups for weekends/holidays at the start of
         the requested range.
 
@@ -1043,33 +1115,11 @@ class HistoryCalculator:
 
         # Extend range backwards to include potential fallback prices
         # This ensures we have data for weekends/holidays at range start
-        extended_start = start_date - timedelta(days=PRICE_FALLBACK_DAYS)
-
-        query = (
-            select(MarketData)
-            .where(
-                and_(
-                    MarketData.asset_id.in_(asset_ids),
-                    MarketData.date >= extended_start,
-                    MarketData.date <= end_date,
-                    MarketData.no_data_available == False,  # Exclude no-data markers
-                )
-            )
+        extended_start = start_date - timedelta(
+            days=max(PRICE_FALLBACK_DAYS, max_lookback_days(start_date))
         )
 
-        price_map: dict[tuple[int, date], tuple[Decimal, bool, int | None]] = {}
-        for record in db.scalars(query).all():
-            # Handle both date and datetime
-            record_date = (
-                record.date.date()
-                if hasattr(record.date, 'date')
-                else record.date
-            )
-            price_map[(record.asset_id, record_date)] = (
-                record.close_price,
-                record.is_synthetic,
-                record.proxy_source_id,
-            )
+        price_map = context.get_prices(asset_ids, extended_start, end_date, memoize=memoize)
 
         logger.debug(
             f"Fetched {len(price_map)} price records for {len(asset_ids)} assets "
@@ -1079,11 +1129,12 @@ class HistoryCalculator:
 
     def _fetch_fx_rates_batch(
             self,
-            db: Session,
+            context: PortfolioDataContext,
             currencies: set[str],
             portfolio_currency: str,
             start_date: date,
             end_date: date,
+            memoize: bool = True,
     ) -> dict[tuple[str, str, date], Decimal]:
         """
         Batch fetch all FX rates for given currencies in date range.
@@ -1100,33 +1151,10 @@ class HistoryCalculator:
         # Extend range backwards to include potential fallback rates
         extended_start = start_date - timedelta(days=FX_FALLBACK_DAYS)
 
-        query = (
-            select(ExchangeRate)
-            .where(
-                and_(
-                    ExchangeRate.base_currency.in_(currencies),
-                    ExchangeRate.quote_currency == portfolio_currency.upper(),
-                    ExchangeRate.date >= extended_start,  # CHANGED
-                    ExchangeRate.date <= end_date,
-                    ExchangeRate.no_data_available == False,  # Exclude no-data markers
-                )
-            )
+        fx_map = context.get_fx_rates(
+            currencies, portfolio_currency, extended_start, end_date, memoize=memoize
         )
 
-        fx_map: dict[tuple[str, str, date], Decimal] = {}
-        for record in db.scalars(query).all():
-            # Handle both date and datetime
-            record_date = (
-                record.date.date()
-                if hasattr(record.date, 'date')
-                else record.date
-            )
-            fx_map[(
-                record.base_currency.upper(),
-                record.quote_currency.upper(),
-                record_date
-            )] = record.rate
-
         logger.debug(
             f"Fetched {len(fx_map)} FX rate records for {len(currencies)} currencies "
             f"(extended range: {extended_start} to {end_date})"
@@ -1252,30 +1280,30 @@ class HistoryCalculator:
     # HELPER METHODS
     # =========================================================================
 
-    def _transaction_date(self, txn: Transaction) -> date:
-        """Extract date from transaction (handles datetime vs date)."""
-        if hasattr(txn.date, 'date'):
-            return txn.date.date()
-        return txn.date
-
     def _lookup_price_with_fallback(
             self,
             price_map: dict[tuple[int, date], tuple[Decimal, bool, int | None]],
             asset_id: int,
             target_date: date,
             max_fallback_days: int | None = None,
+            exchange: str | None = None,
     ) -> tuple[Decimal | None, date | None, bool, int | None]:
         """
         Look up price with fallback to recent dates.
 
-        For weekends/holidays, looks back up to max_fallback_days.
+        For weekends/holidays, looks back up to max_fallback_days. The
+        default window is PRICE_FALLBACK_DAYS, widened when the exchange's
+        calendar shows a longer closure before target_date.
 
         Returns:
             Tuple of (price, actual_date, is_synthetic, proxy_source_id).
             Price and date are None if no price found within fallback window.
         """
         if max_fallback_days is None:
-            max_fallback_days = PRICE_FALLBACK_DAYS
+            max_fallback_days = max(
+                PRICE_FALLBACK_DAYS,
+                get_trading_calendar(exchange).lookback_days(target_date),
+            )
 
         # Try exact date first
         price_data = price_map.get((asset_id, target_date))
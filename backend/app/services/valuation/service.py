@@ -36,20 +36,15 @@ Usage:
 from __future__ import annotations
 
 import logging
-from datetime import date, timedelta
+from collections.abc import Iterator
+from datetime import date, datetime, time, timedelta
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from sqlalchemy import select, and_, func
+from sqlalchemy import exists, or_, select
 from sqlalchemy.orm import Session
 
-from app.models import (
-    Asset,
-    Transaction,
-    TransactionType,
-    Portfolio,
-    MarketData,
-)
+from app.models import Asset, Transaction, TransactionType
 from app.services.valuation.calculators import (
     HoldingsCalculator,
     CostBasisCalculator,
@@ -61,16 +56,24 @@ from app.services.valuation.calculators import (
 from app.services.valuation.history_calculator import HistoryCalculator
 from app.services.valuation.types import (
     HoldingPosition,
+    HoldingsResult,
     PnLResult,
     HoldingValuation,
     PortfolioValuation,
     CashBalance,
+    HistoryPoint,
     PortfolioHistory,
 )
 from app.services.constants import PRICE_FALLBACK_DAYS
 from app.services.exceptions import PortfolioNotFoundError
+from app.services.portfolio_context import PortfolioDataContext, resolve_context
+from app.services.position_ledger import get_positions
+from app.services.transaction_records import TransactionRecord
+from app.utils.trading_calendar import get_trading_calendar, max_lookback_days
 
 if TYPE_CHECKING:
+    from app.services.market_data.price_cache import PriceSeriesCache
+    from app.services.market_data.price_store import ColumnarPriceStore
     from app.services.protocols import FXRateServiceProtocol
 
 logger = logging.getLogger(__name__)
@@ -93,15 +96,26 @@ class ValuationService:
         _unrealized_pnl_calc: Calculator for unrealized P&L
         _realized_pnl_calc: Calculator for realized P&L
         _history_calc: Calculator for time series
+        _price_store: Optional local price store for price reads
+        _price_cache: Optional process-wide price series cache
     """
 
-    def __init__(self, fx_service: FXRateServiceProtocol | None = None) -> None:
+    def __init__(
+            self,
+            fx_service: FXRateServiceProtocol | None = None,
+            price_store: ColumnarPriceStore | None = None,
+            price_cache: PriceSeriesCache | None = None,
+    ) -> None:
         """
         Initialize the valuation service.
 
         Args:
             fx_service: FX rate service for currency conversions.
                        If None, creates a new instance.
+            price_store: Local price store read before the database
+                         (None = database only)
+            price_cache: Shared price series cache read through before the
+                         database (None = no caching across requests)
         """
         # Lazy import to avoid circular dependencies
         if fx_service is None:
@@ -110,6 +124,8 @@ class ValuationService:
             fx_service = FXRateService(provider=YahooFinanceProvider())
 
         self._fx_service: FXRateServiceProtocol = fx_service
+        self._price_store = price_store
+        self._price_cache = price_cache
 
         # Initialize point-in-time calculators
         self._holdings_calc = HoldingsCalculator()
@@ -125,6 +141,8 @@ class ValuationService:
             cost_calc=self._cost_calc,
             realized_pnl_calc=self._realized_pnl_calc,
             fx_service=self._fx_service,
+            price_store=price_store,
+            price_cache=price_cache,
         )
 
         logger.info("ValuationService initialized")
@@ -138,6 +156,7 @@ class ValuationService:
             db: Session,
             portfolio_id: int,
             valuation_date: date | None = None,
+            context: PortfolioDataContext | None = None,
     ) -> PortfolioValuation:
         """
         Calculate complete portfolio valuation for a single date.
@@ -148,6 +167,8 @@ class ValuationService:
             db: Database session
             portfolio_id: Portfolio to value
             valuation_date: Date to calculate (default: today)
+            context: Request-scoped data shared with other calls
+                     (default: a fresh context for this call)
 
         Returns:
             PortfolioValuation with holdings breakdown, cash, and totals
@@ -164,72 +185,84 @@ class ValuationService:
             f"as of {valuation_date}"
         )
 
+        context = resolve_context(db, portfolio_id, context, self._price_store, self._price_cache)
+
         # Step 1: Get portfolio
-        portfolio = db.get(Portfolio, portfolio_id)
+        portfolio = context.portfolio
         if portfolio is None:
             raise PortfolioNotFoundError(portfolio_id)
 
         portfolio_currency = portfolio.currency
 
-        # Step 2: Get ALL transactions up to valuation date
-        all_transactions = self._fetch_all_transactions(db, portfolio_id, valuation_date)
-
-        # Handle empty portfolio
-        if not all_transactions:
-            return PortfolioValuation(
-                portfolio_id=portfolio_id,
-                portfolio_name=portfolio.name,
-                portfolio_currency=portfolio_currency,
-                valuation_date=valuation_date,
-                holdings=[],
-                tracks_cash=False,
-                cash_balances=[],
-                total_cost_basis=Decimal("0"),
-                total_net_invested=Decimal("0"),
-                total_value=Decimal("0"),
-                total_cash=None,
-                total_equity=Decimal("0"),
-                total_unrealized_pnl=Decimal("0"),
-                total_realized_pnl=Decimal("0"),
-                total_pnl=Decimal("0"),
-                warnings=["No transactions found for this portfolio"],
-                has_complete_data=True,
-            )
+        # Step 2: Positions. Today's valuation of a portfolio without cash
+        # tracking reads the position ledger (one row per asset); any other
+        # date replays the transactions up to valuation_date.
+        ledger = self._ledger_holdings(db, context, valuation_date)
+        if ledger is not None:
+            holdings_result, assets = ledger
+            tracks_cash = False
+            cash_by_currency = {}
+            total_net_invested = Decimal("0")
+        else:
+            # Get ALL transactions up to valuation date
+            all_transactions = context.get_transactions(end_date=valuation_date)
+
+            # Handle empty portfolio
+            if not all_transactions:
+                return PortfolioValuation(
+                    portfolio_id=portfolio_id,
+                    portfolio_name=portfolio.name,
+                    portfolio_currency=portfolio_currency,
+                    valuation_date=valuation_date,
+                    holdings=[],
+                    tracks_cash=False,
+                    cash_balances=[],
+                    total_cost_basis=Decimal("0"),
+                    total_net_invested=Decimal("0"),
+                    total_value=Decimal("0"),
+                    total_cash=None,
+                    total_equity=Decimal("0"),
+                    total_unrealized_pnl=Decimal("0"),
+                    total_realized_pnl=Decimal("0"),
+                    total_pnl=Decimal("0"),
+                    warnings=["No transactions found for this portfolio"],
+                    has_complete_data=True,
+                )
 
-        # Step 3: Detect if portfolio tracks cash (has DEPOSIT/WITHDRAWAL)
-        tracks_cash = CashCalculator.has_cash_transactions(all_transactions)
+            # Step 3: Detect if portfolio tracks cash (has DEPOSIT/WITHDRAWAL)
+            tracks_cash = CashCalculator.has_cash_transactions(all_transactions)
 
-        # Step 3b: Calculate total_net_invested
-        total_net_invested = Decimal("0")
+            # Step 3b: Calculate total_net_invested
+            total_net_invested = Decimal("0")
 
-        if tracks_cash:
-            # For cash-tracking portfolios: DEPOSIT - WITHDRAWAL
-            for txn in all_transactions:
-                exchange_rate = txn.exchange_rate or Decimal("1")
-                if txn.transaction_type == TransactionType.DEPOSIT:
-                    total_net_invested += txn.quantity / exchange_rate
-                elif txn.transaction_type == TransactionType.WITHDRAWAL:
-                    total_net_invested -= txn.quantity / exchange_rate
-        # Note: For non-cash tracking, total_net_invested will be calculated
-        # from positions after holdings calculation
-
-        # Step 4: Calculate cash balances (only if tracking)
-        if tracks_cash:
-            cash_by_currency = self._cash_calc.calculate(all_transactions, portfolio_currency)
-        else:
-            cash_by_currency = {}
+            if tracks_cash:
+                # For cash-tracking portfolios: DEPOSIT - WITHDRAWAL
+                for txn in all_transactions:
+                    exchange_rate = txn.exchange_rate or Decimal("1")
+                    if txn.transaction_type == TransactionType.DEPOSIT:
+                        total_net_invested += txn.quantity / exchange_rate
+                    elif txn.transaction_type == TransactionType.WITHDRAWAL:
+                        total_net_invested -= txn.quantity / exchange_rate
+            # Note: For non-cash tracking, total_net_invested will be calculated
+            # from positions after holdings calculation
+
+            # Step 4: Calculate cash balances (only if tracking)
+            if tracks_cash:
+                cash_by_currency = self._cash_calc.calculate(all_transactions, portfolio_currency)
+            else:
+                cash_by_currency = {}
 
-        # Step 5: Get transactions by asset (for holdings calculation)
-        transactions_by_asset, assets = self._fetch_transactions_and_assets(
-            db, portfolio_id, valuation_date
-        )
+            # Step 5: Get transactions by asset (for holdings calculation)
+            transactions_by_asset, assets = self._group_transactions_by_asset(
+                context, all_transactions
+            )
 
-        # Step 5: Calculate holdings
-        holdings_result = self._holdings_calc.calculate(
-            transactions_by_asset=transactions_by_asset,
-            assets=assets,
-            portfolio_currency=portfolio_currency,
-        )
+            # Step 5: Calculate holdings
+            holdings_result = self._holdings_calc.calculate(
+                transactions_by_asset=transactions_by_asset,
+                assets=assets,
+                portfolio_currency=portfolio_currency,
+            )
         positions = holdings_result.positions
 
         # Step 5a: Calculate total_net_invested for non-cash tracking portfolios
@@ -240,7 +273,7 @@ class ValuationService:
 
         # Step 5b: Batch fetch prices for all open positions (avoids N+1 queries)
         open_asset_ids = {p.asset_id for p in positions if p.quantity > Decimal("0")}
-        price_map = self._fetch_prices_batch(db, open_asset_ids, valuation_date)
+        price_map = self._fetch_prices_batch(context, open_asset_ids, valuation_date)
 
         # Step 5c: Fetch any proxy assets referenced in synthetic prices
         proxy_asset_ids = {
@@ -249,11 +282,11 @@ class ValuationService:
             if is_synthetic and proxy_id is not None and proxy_id not in assets
         }
         if proxy_asset_ids:
-            proxy_query = select(Asset).where(Asset.id.in_(proxy_asset_ids))
-            for proxy_asset in db.scalars(proxy_query).all():
-                assets[proxy_asset.id] = proxy_asset
+            assets.update(context.get_assets(proxy_asset_ids))
 
         # Step 6: Value each holding
+        # FX lookups are memoized per currency/date for the whole request
+        fx_service = context.memoized_fx(self._fx_service)
         holdings: list[HoldingValuation] = []
         total_cost_basis = Decimal("0")
         total_value = Decimal("0")
@@ -279,6 +312,7 @@ class ValuationService:
                 portfolio_currency=portfolio_currency,
                 price_map=price_map,
                 assets=assets,
+                fx_service=fx_service,
             )
             holdings.append(holding)
 
@@ -312,7 +346,7 @@ class ValuationService:
                     total_cash += amount
                 else:
                     # Need FX conversion
-                    fx_result = self._fx_service.get_rate_or_none(
+                    fx_result = fx_service.get_rate_or_none(
                         db=db,
                         base_currency=currency,
                         quote_currency=portfolio_currency,
@@ -406,6 +440,7 @@ class ValuationService:
             db: Session,
             portfolio_id: int,
             as_of_date: date | None = None,
+            context: PortfolioDataContext | None = None,
     ) -> list[HoldingPosition]:
         """
         Get open positions (quantity > 0) as of a date.
@@ -417,6 +452,7 @@ class ValuationService:
             db: Database session
             portfolio_id: Portfolio to query
             as_of_date: Date to calculate holdings (default: today)
+            context: Request-scoped data shared with other calls
 
         Returns:
             List of HoldingPosition for open positions
@@ -428,14 +464,16 @@ class ValuationService:
         if as_of_date is None:
             as_of_date = date.today()
 
+        context = resolve_context(db, portfolio_id, context, self._price_store, self._price_cache)
+
         # Verify portfolio exists
-        portfolio = db.get(Portfolio, portfolio_id)
+        portfolio = context.portfolio
         if portfolio is None:
             raise PortfolioNotFoundError(portfolio_id)
 
         # Fetch data
-        transactions_by_asset, assets = self._fetch_transactions_and_assets(
-            db, portfolio_id, as_of_date
+        transactions_by_asset, assets = self._group_transactions_by_asset(
+            context, context.get_transactions(end_date=as_of_date)
         )
 
         # Calculate and return holdings
@@ -455,6 +493,7 @@ class ValuationService:
             start_date: date,
             end_date: date,
             interval: str = "daily",
+            context: PortfolioDataContext | None = None,
     ) -> PortfolioHistory:
         """
         Get portfolio valuation history (time series).
@@ -467,6 +506,7 @@ class ValuationService:
             start_date: First date in series
             end_date: Last date in series
             interval: "daily", "weekly", or "monthly"
+            context: Request-scoped data shared with other calls
 
         Returns:
             PortfolioHistory with time series data
@@ -485,91 +525,127 @@ class ValuationService:
             start_date=start_date,
             end_date=end_date,
             interval=interval,
+            context=context,
+        )
+
+    def iter_history(
+            self,
+            db: Session,
+            portfolio_id: int,
+            start_date: date,
+            end_date: date,
+            interval: str = "daily",
+            context: PortfolioDataContext | None = None,
+    ) -> Iterator[HistoryPoint]:
+        """
+        Stream portfolio valuation history point by point.
+
+        Same points as get_history(), without the aggregate statistics and
+        in bounded memory (see HistoryCalculator.iter_points).
+
+        Raises:
+            PortfolioNotFoundError: If portfolio not found
+            InvalidIntervalError: If interval is invalid
+        """
+        logger.info(
+            f"Streaming history for portfolio {portfolio_id} "
+            f"from {start_date} to {end_date} ({interval})"
+        )
+
+        return self._history_calc.iter_points(
+            db=db,
+            portfolio_id=portfolio_id,
+            start_date=start_date,
+            end_date=end_date,
+            interval=interval,
+            context=context,
         )
 
     # =========================================================================
     # PRIVATE METHODS
     # =========================================================================
 
-    def _fetch_all_transactions(
+    def _ledger_holdings(
             self,
             db: Session,
-            portfolio_id: int,
-            as_of_date: date,
-    ) -> list[Transaction]:
+            context: PortfolioDataContext,
+            valuation_date: date,
+    ) -> tuple[HoldingsResult, dict[int, Asset]] | None:
         """
-        Fetch ALL transactions for a portfolio up to a date.
+        Holdings from the position ledger, when it answers valuation_date.
 
-        Includes DEPOSIT, WITHDRAWAL, BUY, SELL - everything needed
-        for both holdings and cash calculations.
+        Ledger rows total every transaction of the portfolio, so they only
+        stand in for the transaction replay when valuing today, no
+        transaction is dated after the start of today (the replay compares
+        dates as midnight), and the portfolio has no DEPOSIT / WITHDRAWAL
+        transactions (cash balances still need the replay). Both checks
+        are index probes.
+
+        Args:
+            db: Database session
+            context: Data context the assets are loaded through
+            valuation_date: Date being valued
 
         Returns:
-            List of transactions ordered by date
+            Tuple of (holdings_result, assets_by_id), or None when the
+            transactions have to be replayed
         """
-        query = (
-            select(Transaction)
-            .where(
-                and_(
-                    Transaction.portfolio_id == portfolio_id,
-                    Transaction.date <= as_of_date,
-                )
-            )
-            .order_by(Transaction.date)
-        )
-        return list(db.scalars(query).all())
+        if valuation_date != date.today():
+            return None
+
+        portfolio_id = context.portfolio_id
+        needs_replay = db.scalar(select(or_(
+            exists().where(
+                Transaction.portfolio_id == portfolio_id,
+                Transaction.date > datetime.combine(valuation_date, time.min),
+            ),
+            exists().where(
+                Transaction.portfolio_id == portfolio_id,
+                Transaction.transaction_type.in_([TransactionType.DEPOSIT, TransactionType.WITHDRAWAL]),
+            ),
+        )))
+        if needs_replay:
+            return None
+
+        rows = get_positions(db, portfolio_id)
+        if not rows:
+            # Empty portfolio (or ledger not built yet): the replay handles it
+            return None
+
+        assets = context.get_assets(row.asset_id for row in rows)
+        return self._holdings_calc.calculate_from_ledger(rows, assets), assets
 
-    def _fetch_transactions_and_assets(
+    def _group_transactions_by_asset(
             self,
-            db: Session,
-            portfolio_id: int,
-            as_of_date: date,
-    ) -> tuple[dict[int, list[Transaction]], dict[int, Asset]]:
+            context: PortfolioDataContext,
+            transactions: list[TransactionRecord],
+    ) -> tuple[dict[int, list[TransactionRecord]], dict[int, Asset]]:
         """
-        Fetch transactions and related assets for a portfolio.
+        Group transactions by asset and load the assets they reference.
+
+        Args:
+            context: Data context the assets are loaded through
+            transactions: Records from context.get_transactions()
 
         Returns:
             Tuple of (transactions_by_asset, assets_by_id)
         """
-        # Fetch transactions
-        query = (
-            select(Transaction)
-            .where(
-                and_(
-                    Transaction.portfolio_id == portfolio_id,
-                    Transaction.date <= as_of_date,
-                )
-            )
-            .order_by(Transaction.date)
-        )
-        transactions = list(db.scalars(query).all())
-
-        if not transactions:
-            return {}, {}
-
         # Group by asset (skip non-asset transactions)
-        transactions_by_asset: dict[int, list[Transaction]] = {}
-        asset_ids: set[int] = set()
+        transactions_by_asset: dict[int, list[TransactionRecord]] = {}
 
         for txn in transactions:
             if txn.asset_id is None:
                 continue
-            if txn.asset_id not in transactions_by_asset:
-                transactions_by_asset[txn.asset_id] = []
-            transactions_by_asset[txn.asset_id].append(txn)
-            asset_ids.add(txn.asset_id)
+            transactions_by_asset.setdefault(txn.asset_id, []).append(txn)
 
-        if not asset_ids:
+        if not transactions_by_asset:
             return {}, {}
 
-        # Fetch assets
-        assets_query = select(Asset).where(Asset.id.in_(asset_ids))
-        assets = {asset.id: asset for asset in db.scalars(assets_query).all()}
-
-        return transactions_by_asset, assets
+        return transactions_by_asset, context.get_assets(transactions_by_asset.keys())
 
     def _fetch_prices_batch(
             self,
-            db: Session,
+            context: PortfolioDataContext,
             asset_ids: set[int],
             target_date: date,
     ) -> dict[tuple[int, date], tuple[Decimal, bool, int | None]]:
@@ -577,10 +653,11 @@ class ValuationService:
         Batch fetch prices for multiple assets with fallback date range.
 
         Fetches all prices from (target_date - PRICE_FALLBACK_DAYS) to target_date
-        for all given asset_ids in a single query.
+        for all given asset_ids in a single query. The window is widened when
+        an exchange calendar shows a longer closure before target_date.
 
         Args:
-            db: Database session
+            context: Data context (shares the window with other valuations)
             asset_ids: Set of asset IDs to fetch prices for
             target_date: The target valuation date
 
@@ -591,41 +668,18 @@ class ValuationService:
             return {}
 
         # Calculate extended date range for fallback
-        start_date = target_date - timedelta(days=PRICE_FALLBACK_DAYS)
-
-        query = (
-            select(MarketData)
-            .where(
-                and_(
-                    MarketData.asset_id.in_(asset_ids),
-                    MarketData.date >= start_date,
-                    MarketData.date <= target_date,
-                    MarketData.no_data_available == False,  # Exclude no-data markers
-                )
-            )
+        start_date = target_date - timedelta(
+            days=max(PRICE_FALLBACK_DAYS, max_lookback_days(target_date))
         )
 
-        price_map: dict[tuple[int, date], tuple[Decimal, bool, int | None]] = {}
-        for record in db.scalars(query).all():
-            # Handle both date and datetime
-            record_date = (
-                record.date.date()
-                if hasattr(record.date, 'date')
-                else record.date
-            )
-            price_map[(record.asset_id, record_date)] = (
-                record.close_price,
-                record.is_synthetic,
-                record.proxy_source_id,
-            )
-
-        return price_map
+        return context.get_prices(asset_ids, start_date, target_date)
 
     def _lookup_price_with_fallback(
             self,
             price_map: dict[tuple[int, date], tuple[Decimal, bool, int | None]],
             asset_id: int,
             target_date: date,
+            exchange: str | None = None,
     ) -> tuple[Decimal | None, date | None, bool, int | None]:
         """
         Look up price from pre-fetched map with fallback for weekends/holidays.
@@ -634,12 +688,18 @@ class ValuationService:
             price_map: Pre-fetched prices from _fetch_prices_batch
             asset_id: Asset to look up
             target_date: Target date
+            exchange: Asset exchange code, used to widen the fallback window
+                      past long exchange closures
 
         Returns:
             Tuple of (price, price_date, is_synthetic, proxy_source_id)
             All None if not found within fallback window.
         """
-        for days_back in range(PRICE_FALLBACK_DAYS + 1):
+        max_fallback_days = max(
+            PRICE_FALLBACK_DAYS,
+            get_trading_calendar(exchange).lookback_days(target_date),
+        )
+        for days_back in range(max_fallback_days + 1):
             check_date = target_date - timedelta(days=days_back)
             price_data = price_map.get((asset_id, check_date))
             if price_data is not None:
@@ -655,6 +715,7 @@ class ValuationService:
             portfolio_currency: str,
             price_map: dict[tuple[int, date], tuple[Decimal, bool, int | None]],
             assets: dict[int, Asset],
+            fx_service: FXRateServiceProtocol | None = None,
     ) -> HoldingValuation:
         """
         Calculate complete valuation for a single holding.
@@ -668,6 +729,7 @@ class ValuationService:
             portfolio_currency: Portfolio's base currency
             price_map: Pre-fetched prices from _fetch_prices_batch
             assets: Pre-fetched assets dict (includes proxy assets)
+            fx_service: FX lookup to use instead of the injected service
         """
         warnings: list[str] = []
 
@@ -676,7 +738,7 @@ class ValuationService:
 
         # Get price (with fallback for weekends/holidays) - uses pre-fetched data
         price, price_date, is_synthetic, proxy_source_id = self._lookup_price_with_fallback(
-            price_map, position.asset_id, valuation_date
+            price_map, position.asset_id, valuation_date, exchange=position.asset.exchange
         )
 
         # Get proxy ticker if synthetic - uses pre-fetched assets
@@ -695,6 +757,7 @@ class ValuationService:
             price=price,
             price_date=price_date,
             portfolio_currency=portfolio_currency,
+            fx_service=fx_service,
         )
         warnings.extend(current_value.warnings)
 
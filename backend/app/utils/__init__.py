@@ -5,7 +5,8 @@ Utility modules for the Investment Portfolio Analyzer.
 This package contains cross-cutting utilities used throughout the application:
 - logging: Logging configuration and setup with correlation ID support
 - context: Request context management for correlation IDs
-- date_utils: Date manipulation helpers (business days, etc.)
+- date_utils: Date manipulation helpers (business days, date range arithmetic)
+- trading_calendar: Offline exchange holiday calendars
 - sql: SQL query construction helpers (LIKE escaping, etc.)
 
 Usage:
@@ -13,6 +14,7 @@ Usage:
     from app.utils import get_correlation_id, set_correlation_id
     from app.utils import escape_like_pattern
     from app.utils.date_utils import get_business_days
+    from app.utils.trading_calendar import get_trading_calendar
 """
 
 from app.utils.context import (
@@ -0,0 +1,130 @@
+# backend/app/utils/bulk_load.py
+"""
+PostgreSQL COPY helpers for large bulk writes.
+
+A multi-row INSERT ... VALUES binds every value as a parameter: at 100k+
+rows that means a huge statement to build, send and parse. COPY streams
+rows in a compact text format instead, so large backfills go through a
+temporary staging table:
+
+    1. CREATE TEMP TABLE ... ON COMMIT DROP (shaped like the target columns)
+    2. COPY rows into it from a lazily generated CSV stream
+    3. INSERT INTO target SELECT ... FROM staging ON CONFLICT ... (caller)
+
+The staging table disappears when the transaction commits or rolls back.
+
+Usage:
+    from app.utils.bulk_load import copy_into_staging, supports_copy
+
+    if supports_copy(db):
+        stage = copy_into_staging(db, "market_data", ["asset_id", "date"], rows)
+        db.execute(pg_insert(MarketData).from_select([...], select(stage.c.asset_id, ...)))
+        db.commit()
+"""
+
+import uuid
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
+
+from sqlalchemy import column, table, text
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import TableClause
+
+
+def supports_copy(db: Session) -> bool:
+    """Whether the session's database supports COPY (PostgreSQL only)."""
+    return db.get_bind().dialect.name == "postgresql"
+
+
+def format_csv_value(value: Any) -> str:
+    """
+    Format one value for COPY ... (FORMAT csv).
+
+    None becomes an unquoted empty field (NULL); empty strings and values
+    containing delimiters, quotes or newlines are quoted.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    text_value = str(value)
+    if text_value == "" or any(c in text_value for c in ',"\n\r'):
+        return '"' + text_value.replace('"', '""') + '"'
+    return text_value
+
+
+class CsvRowStream:
+    """
+    File-like object producing CSV lines from an iterable of rows on demand.
+
+    Passed to psycopg2's copy_expert(), which pulls it with read(size), so
+    rows are formatted as COPY consumes them instead of being rendered into
+    one large buffer up front.
+    """
+
+    def __init__(self, rows: Iterable[Sequence[Any]]) -> None:
+        self._lines: Iterator[str] = (
+            ",".join(format_csv_value(v) for v in row) + "\n" for row in rows
+        )
+        self._buffer = ""
+        self.rows_written = 0
+
+    def read(self, size: int = -1) -> str:
+        """Return up to size characters (all remaining if size < 0)."""
+        parts = [self._buffer]
+        length = len(self._buffer)
+        while size < 0 or length < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            self.rows_written += 1
+            parts.append(line)
+            length += len(line)
+
+        data = "".join(parts)
+        if size < 0:
+            self._buffer = ""
+            return data
+        self._buffer = data[size:]
+        return data[:size]
+
+
+def copy_into_staging(
+        db: Session,
+        source_table: str,
+        columns: Sequence[str],
+        rows: Iterable[Sequence[Any]],
+) -> TableClause:
+    """
+    COPY rows into a temporary table with the given columns of source_table.
+
+    The staging table copies the column types of source_table (no
+    constraints, defaults or indexes) and is dropped on commit.
+
+    Args:
+        db: Database session (PostgreSQL)
+        source_table: Table whose column types the staging table copies
+        columns: Column names, in the order values appear in each row
+        rows: Row tuples; consumed lazily while COPY runs
+
+    Returns:
+        Lightweight table construct for selecting from the staging table
+    """
+    stage_name = f"_stage_{source_table}_{uuid.uuid4().hex[:8]}"
+    column_list = ", ".join(columns)
+
+    db.execute(text(
+        f"CREATE TEMP TABLE {stage_name} ON COMMIT DROP AS "
+        f"SELECT {column_list} FROM {source_table} WITH NO DATA"
+    ))
+
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {stage_name} ({column_list}) FROM STDIN WITH (FORMAT csv)",
+            CsvRowStream(rows),
+        )
+    finally:
+        cursor.close()
+
+    return table(stage_name, *(column(name) for name in columns))
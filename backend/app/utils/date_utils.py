@@ -10,8 +10,13 @@ Usage:
     from app.utils.date_utils import get_business_days
 
     days = get_business_days(start_date, end_date)
+
+    # Interval arithmetic for fetched-range tracking
+    merged = merge_date_ranges([(d1, d2), (d3, d4)])
+    missing = subtract_date_ranges(start_date, end_date, merged)
 """
 
+from collections.abc import Callable, Iterable
 from datetime import date, timedelta
 
 
@@ -20,7 +25,8 @@ def get_business_days(start_date: date, end_date: date) -> list[date]:
     Get list of business days (weekdays) in a date range.
 
     Business days are Monday through Friday (weekday() < 5).
-    This is a simplified check that doesn't account for market holidays.
+    This is a simplified check that doesn't account for market holidays;
+    use app.utils.trading_calendar for exchange-aware trading days.
 
     Args:
         start_date: First date in range (inclusive)
@@ -94,3 +100,112 @@ def previous_business_day(d: date) -> date:
     while prev_day.weekday() >= 5:  # Skip weekend
         prev_day -= timedelta(days=1)
     return prev_day
+
+
+# =============================================================================
+# DATE RANGE ARITHMETIC
+# =============================================================================
+
+def _has_trading_day_between(
+        earlier: date,
+        later: date,
+        is_trading_day: Callable[[date], bool],
+) -> bool:
+    """Check for a trading day strictly between two dates."""
+    current = earlier + timedelta(days=1)
+    while current < later:
+        if is_trading_day(current):
+            return True
+        current += timedelta(days=1)
+    return False
+
+
+def merge_date_ranges(
+        ranges: Iterable[tuple[date, date]],
+        is_trading_day: Callable[[date], bool] = is_business_day,
+) -> list[tuple[date, date]]:
+    """
+    Merge overlapping or adjacent inclusive date ranges.
+
+    Ranges separated only by non-trading days (e.g. Friday-ending and
+    Monday-starting ranges) are treated as adjacent, since there is
+    nothing between them to fetch.
+
+    Args:
+        ranges: Inclusive (start, end) ranges in any order
+        is_trading_day: Predicate for open days (default: weekdays);
+                        pass TradingCalendar.is_trading_day to bridge holidays
+
+    Returns:
+        Sorted, non-overlapping list of merged ranges
+
+    Example:
+        >>> merge_date_ranges([(date(2024, 1, 8), date(2024, 1, 12)),
+        ...                    (date(2024, 1, 1), date(2024, 1, 5))])
+        [(date(2024, 1, 1), date(2024, 1, 12))]  # Weekend bridged
+    """
+    merged: list[tuple[date, date]] = []
+
+    for start, end in sorted(ranges):
+        if merged:
+            last_start, last_end = merged[-1]
+            if start <= last_end or not _has_trading_day_between(last_end, start, is_trading_day):
+                merged[-1] = (last_start, max(last_end, end))
+                continue
+        merged.append((start, end))
+
+    return merged
+
+
+def subtract_date_ranges(
+        start_date: date,
+        end_date: date,
+        covered: Iterable[tuple[date, date]],
+        is_trading_day: Callable[[date], bool] = is_business_day,
+) -> list[tuple[date, date]]:
+    """
+    Find the parts of [start_date, end_date] not covered by any range.
+
+    Each returned range is trimmed to begin and end on a trading day;
+    gaps containing only closed days are dropped.
+
+    Args:
+        start_date: First date of the requested range (inclusive)
+        end_date: Last date of the requested range (inclusive)
+        covered: Inclusive (start, end) ranges already covered
+        is_trading_day: Predicate for open days (default: weekdays)
+
+    Returns:
+        Sorted list of uncovered (start, end) ranges
+
+    Example:
+        >>> subtract_date_ranges(date(2024, 1, 1), date(2024, 1, 31),
+        ...                      [(date(2024, 1, 1), date(2024, 1, 19))])
+        [(date(2024, 1, 22), date(2024, 1, 31))]
+    """
+    gaps: list[tuple[date, date]] = []
+    cursor = start_date
+
+    for cov_start, cov_end in merge_date_ranges(covered, is_trading_day):
+        if cov_end < cursor:
+            continue
+        if cov_start > end_date:
+            break
+        if cov_start > cursor:
+            gaps.append((cursor, cov_start - timedelta(days=1)))
+        cursor = max(cursor, cov_end + timedelta(days=1))
+
+    if cursor <= end_date:
+        gaps.append((cursor, end_date))
+
+    trimmed: list[tuple[date, date]] = []
+    for gap_start, gap_end in gaps:
+        first, last = gap_start, gap_end
+        while first <= last and not is_trading_day(first):
+            first += timedelta(days=1)
+        while last >= first and not is_trading_day(last):
+            last -= timedelta(days=1)
+        if first <= last:
+            trimmed.append((first, last))
+
+    return trimmed
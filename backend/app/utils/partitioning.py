@@ -0,0 +1,119 @@
+# backend/app/utils/partitioning.py
+"""
+Yearly range partitioning helpers for the time-series tables.
+
+market_data and exchange_rates grow by one row per asset / currency pair
+per day, and every hot read filters on a date window. On PostgreSQL both
+tables are declaratively partitioned by RANGE (date), one partition per
+calendar year (migration 005), so a window read only touches the
+partitions it overlaps and each partition gets its own small BRIN index
+on date. Migration 005 builds that layout with its own frozen DDL; this
+module only keeps partitions ahead of the data at runtime.
+
+Layout (for market_data, no data before 2000):
+    market_data_historic  MINVALUE    .. 2000-01-01
+    market_data_y2000     2000-01-01  .. 2001-01-01
+    ...
+    market_data_y2028     2028-01-01  .. 2029-01-01   (current year + ahead)
+
+There is no DEFAULT partition: a row dated beyond the last partition is
+rejected, so future partitions must exist before the data arrives. The
+background worker (app/worker.py) creates them at startup; the same can
+be done by hand or from cron:
+
+    cd backend
+    python -m scripts.create_partitions
+
+Usage:
+    from app.utils.partitioning import ensure_future_partitions
+
+    with engine.begin() as conn:
+        created = ensure_future_partitions(conn, "market_data")
+
+SQLite and unpartitioned tables are left untouched.
+"""
+
+from datetime import date
+
+from sqlalchemy import Connection, text
+
+# Tables partitioned by RANGE (date) on PostgreSQL
+PARTITIONED_TABLES: tuple[str, ...] = ("market_data", "exchange_rates")
+
+# Partitions kept ready beyond the current year
+PARTITION_YEARS_AHEAD: int = 2
+
+
+def year_partition_name(table_name: str, year: int) -> str:
+    """Name of the partition holding table_name rows dated in year."""
+    return f"{table_name}_y{year}"
+
+
+def year_partition_ddl(table_name: str, year: int) -> str:
+    """CREATE TABLE statement for one yearly partition (idempotent)."""
+    return (
+        f"CREATE TABLE IF NOT EXISTS {year_partition_name(table_name, year)} "
+        f"PARTITION OF {table_name} "
+        f"FOR VALUES FROM ('{date(year, 1, 1)}') TO ('{date(year + 1, 1, 1)}')"
+    )
+
+
+def is_partitioned(conn: Connection, table_name: str) -> bool:
+    """Whether table_name is a partitioned table (always False off PostgreSQL)."""
+    if conn.dialect.name != "postgresql":
+        return False
+    return conn.execute(
+        text(
+            "SELECT 1 FROM pg_partitioned_table p "
+            "JOIN pg_class c ON c.oid = p.partrelid "
+            "WHERE c.relname = :table_name AND c.relnamespace = current_schema()::regnamespace"
+        ),
+        {"table_name": table_name},
+    ).first() is not None
+
+
+def create_year_partitions(
+        conn: Connection,
+        table_name: str,
+        first_year: int,
+        last_year: int,
+) -> list[str]:
+    """
+    Create yearly partitions first_year..last_year (inclusive) if missing.
+
+    Returns:
+        Names of the partitions in the range (existing ones included)
+    """
+    names = []
+    for year in range(first_year, last_year + 1):
+        conn.execute(text(year_partition_ddl(table_name, year)))
+        names.append(year_partition_name(table_name, year))
+    return names
+
+
+def ensure_future_partitions(
+        conn: Connection,
+        table_name: str,
+        years_ahead: int = PARTITION_YEARS_AHEAD,
+        today: date | None = None,
+) -> list[str]:
+    """
+    Make sure partitions exist from the current year through years_ahead.
+
+    No-op (returns []) when table_name is not partitioned, so it is safe to
+    run against SQLite or a database that has not been migrated yet.
+
+    Args:
+        conn: Connection (caller commits)
+        table_name: Partitioned table
+        years_ahead: Years beyond the current one to create
+        today: Reference date (default: today)
+
+    Returns:
+        Names of the partitions now covering current..current + years_ahead
+    """
+    if not is_partitioned(conn, table_name):
+        return []
+
+    current_year = (today or date.today()).year
+    return create_year_partitions(conn, table_name, current_year, current_year + years_ahead)
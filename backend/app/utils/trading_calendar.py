@@ -0,0 +1,338 @@
+# backend/app/utils/trading_calendar.py
+"""
+Offline exchange trading calendars.
+
+Rule-based holiday calendars for the exchanges used in Asset.exchange,
+so sync planning and price fallback can tell an exchange holiday from
+genuinely missing data without asking the provider.
+
+Supported calendars:
+- XNYS: NYSE / NASDAQ and other US venues
+- XETR: Xetra and Frankfurt (Deutsche Boerse)
+- XLON: London Stock Exchange
+- XPAR: Euronext (Paris, Amsterdam, Brussels, Lisbon)
+- FX: Currency markets (closed only on New Year's Day and Christmas)
+- WEEKDAYS: Fallback for unknown exchanges (Monday-Friday)
+
+Each calendar's trading days for a year are computed once and cached as
+an integer bitmap (bit N = day-of-year N+1 is a trading day), so lookups
+are a dict hit and a bit test.
+
+Usage:
+    from app.utils.trading_calendar import get_trading_calendar
+
+    calendar = get_trading_calendar("XETRA")
+    calendar.is_trading_day(date(2024, 12, 24))   # False
+    days = calendar.trading_days(start_date, end_date)
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from functools import lru_cache
+
+
+# =============================================================================
+# DATE RULE HELPERS
+# =============================================================================
+
+def _easter_sunday(year: int) -> date:
+    """Gregorian Easter Sunday (anonymous Gregorian algorithm)."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """The n-th given weekday of a month (Monday = 0)."""
+    first = date(year, month, 1)
+    offset = (weekday - first.weekday()) % 7
+    return first + timedelta(days=offset + 7 * (n - 1))
+
+
+def _last_weekday(year: int, month: int, weekday: int) -> date:
+    """The last given weekday of a month (Monday = 0)."""
+    next_month = date(year + month // 12, month % 12 + 1, 1)
+    last = next_month - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _observed_us(d: date) -> date:
+    """US observance: Saturday holidays move to Friday, Sunday to Monday."""
+    if d.weekday() == 5:
+        return d - timedelta(days=1)
+    if d.weekday() == 6:
+        return d + timedelta(days=1)
+    return d
+
+
+# =============================================================================
+# HOLIDAY RULES
+# =============================================================================
+
+_NYSE_SPECIAL_CLOSURES = frozenset({
+    date(2001, 9, 11), date(2001, 9, 12), date(2001, 9, 13), date(2001, 9, 14),
+    date(2004, 6, 11),   # President Reagan
+    date(2007, 1, 2),    # President Ford
+    date(2012, 10, 29), date(2012, 10, 30),  # Hurricane Sandy
+    date(2018, 12, 5),   # President G.H.W. Bush
+    date(2025, 1, 9),    # President Carter
+})
+
+_LSE_SPECIAL_CLOSURES = frozenset({
+    date(1999, 12, 31),  # Millennium
+    date(2002, 6, 3),    # Golden Jubilee
+    date(2011, 4, 29),   # Royal wedding
+    date(2012, 6, 5),    # Diamond Jubilee
+    date(2022, 6, 3),    # Platinum Jubilee
+    date(2022, 9, 19),   # State funeral
+    date(2023, 5, 8),    # Coronation
+})
+
+
+def _nyse_holidays(year: int) -> set[date]:
+    """NYSE full-day closures."""
+    easter = _easter_sunday(year)
+    holidays = {
+        _nth_weekday(year, 2, 0, 3),               # Washington's Birthday
+        easter - timedelta(days=2),                # Good Friday
+        _last_weekday(year, 5, 0),                 # Memorial Day
+        _observed_us(date(year, 7, 4)),            # Independence Day
+        _nth_weekday(year, 9, 0, 1),               # Labor Day
+        _nth_weekday(year, 11, 3, 4),              # Thanksgiving
+        _observed_us(date(year, 12, 25)),          # Christmas
+    }
+
+    # New Year's Day: Sunday moves to Monday, Saturday is not observed
+    new_year = date(year, 1, 1)
+    if new_year.weekday() == 6:
+        holidays.add(new_year + timedelta(days=1))
+    elif new_year.weekday() < 5:
+        holidays.add(new_year)
+
+    if year >= 1998:
+        holidays.add(_nth_weekday(year, 1, 0, 3))  # Martin Luther King Jr. Day
+    if year >= 2022:
+        holidays.add(_observed_us(date(year, 6, 19)))  # Juneteenth
+
+    holidays.update(d for d in _NYSE_SPECIAL_CLOSURES if d.year == year)
+    return holidays
+
+
+def _xetra_holidays(year: int) -> set[date]:
+    """Xetra / Frankfurt full-day closures."""
+    easter = _easter_sunday(year)
+    return {
+        date(year, 1, 1),
+        easter - timedelta(days=2),    # Good Friday
+        easter + timedelta(days=1),    # Easter Monday
+        date(year, 5, 1),              # Labour Day
+        date(year, 12, 24),
+        date(year, 12, 25),
+        date(year, 12, 26),
+        date(year, 12, 31),
+    }
+
+
+def _lse_holidays(year: int) -> set[date]:
+    """London Stock Exchange closures (England & Wales bank holidays)."""
+    easter = _easter_sunday(year)
+    holidays = {
+        easter - timedelta(days=2),    # Good Friday
+        easter + timedelta(days=1),    # Easter Monday
+        _last_weekday(year, 8, 0),     # Summer bank holiday
+    }
+
+    # New Year's Day, substituted to the following Monday
+    new_year = date(year, 1, 1)
+    while new_year.weekday() >= 5:
+        new_year += timedelta(days=1)
+    holidays.add(new_year)
+
+    # Early May bank holiday (moved to VE Day in 1995 and 2020)
+    if year in (1995, 2020):
+        holidays.add(date(year, 5, 8))
+    else:
+        holidays.add(_nth_weekday(year, 5, 0, 1))
+
+    # Spring bank holiday (moved for jubilees)
+    spring_moves = {2002: date(2002, 6, 4), 2012: date(2012, 6, 4), 2022: date(2022, 6, 2)}
+    holidays.add(spring_moves.get(year, _last_weekday(year, 5, 0)))
+
+    # Christmas and Boxing Day with weekend substitutes
+    christmas = date(year, 12, 25)
+    if christmas.weekday() == 5:      # Sat -> Mon 27, Tue 28
+        holidays.update({date(year, 12, 27), date(year, 12, 28)})
+    elif christmas.weekday() == 6:    # Sun -> Boxing Mon 26, Tue 27
+        holidays.update({date(year, 12, 26), date(year, 12, 27)})
+    elif christmas.weekday() == 4:    # Fri, Boxing Sat -> Mon 28
+        holidays.update({christmas, date(year, 12, 28)})
+    else:
+        holidays.update({christmas, date(year, 12, 26)})
+
+    holidays.update(d for d in _LSE_SPECIAL_CLOSURES if d.year == year)
+    return holidays
+
+
+def _euronext_holidays(year: int) -> set[date]:
+    """Euronext cash market closures (harmonised across venues)."""
+    easter = _easter_sunday(year)
+    return {
+        date(year, 1, 1),
+        easter - timedelta(days=2),    # Good Friday
+        easter + timedelta(days=1),    # Easter Monday
+        date(year, 5, 1),              # Labour Day
+        date(year, 12, 25),
+        date(year, 12, 26),
+    }
+
+
+def _fx_holidays(year: int) -> set[date]:
+    """Days with no FX fixing in practice."""
+    return {date(year, 1, 1), date(year, 12, 25)}
+
+
+def _no_holidays(year: int) -> set[date]:
+    """Weekday-only calendar for exchanges without rules."""
+    return set()
+
+
+# =============================================================================
+# CALENDAR
+# =============================================================================
+
+@dataclass(frozen=True)
+class TradingCalendar:
+    """
+    Trading-day calendar for one exchange.
+
+    Attributes:
+        code: Calendar identifier (e.g., "XNYS")
+        name: Human-readable name
+    """
+
+    code: str
+    name: str
+    _holiday_rule: Callable[[int], set[date]] = field(repr=False, compare=False)
+
+    def holidays(self, year: int) -> frozenset[date]:
+        """Weekday closures for a year (weekends are always closed)."""
+        return frozenset(d for d in self._holiday_rule(year) if d.weekday() < 5)
+
+    def is_trading_day(self, d: date) -> bool:
+        """Check if the exchange is open on a date."""
+        return bool(_year_bitmap(self.code, d.year) >> (d.timetuple().tm_yday - 1) & 1)
+
+    def trading_days(self, start_date: date, end_date: date) -> list[date]:
+        """List trading days in [start_date, end_date], sorted."""
+        days = []
+        current = start_date
+        while current <= end_date:
+            if self.is_trading_day(current):
+                days.append(current)
+            current += timedelta(days=1)
+        return days
+
+    def next_trading_day(self, d: date) -> date:
+        """First trading day strictly after d."""
+        current = d + timedelta(days=1)
+        while not self.is_trading_day(current):
+            current += timedelta(days=1)
+        return current
+
+    def previous_trading_day(self, d: date) -> date:
+        """Last trading day strictly before d."""
+        current = d - timedelta(days=1)
+        while not self.is_trading_day(current):
+            current -= timedelta(days=1)
+        return current
+
+    def lookback_days(self, d: date) -> int:
+        """
+        Calendar days from d back to the previous trading day.
+
+        Used to size price fallback windows so they always reach the last
+        session, however long the preceding closure was.
+        """
+        return (d - self.previous_trading_day(d)).days
+
+
+_CALENDARS: dict[str, TradingCalendar] = {
+    calendar.code: calendar
+    for calendar in (
+        TradingCalendar("XNYS", "New York Stock Exchange", _nyse_holidays),
+        TradingCalendar("XETR", "Xetra", _xetra_holidays),
+        TradingCalendar("XLON", "London Stock Exchange", _lse_holidays),
+        TradingCalendar("XPAR", "Euronext", _euronext_holidays),
+        TradingCalendar("FX", "Foreign exchange", _fx_holidays),
+        TradingCalendar("WEEKDAYS", "Weekdays", _no_holidays),
+    )
+}
+
+# Asset.exchange codes -> calendar code (same spellings as YahooFinanceProvider)
+_EXCHANGE_CALENDARS: dict[str, str] = {
+    # US
+    "NASDAQ": "XNYS", "NYSE": "XNYS", "NYSEARCA": "XNYS", "NYSEMKT": "XNYS",
+    "BATS": "XNYS", "AMEX": "XNYS", "NMS": "XNYS", "ARCA": "XNYS",
+    # Germany
+    "XETRA": "XETR", "IBIS": "XETR", "IBIS2": "XETR", "FRA": "XETR",
+    "FRANKFURT": "XETR", "TGATE": "XETR", "GER": "XETR", "ETR": "XETR",
+    # UK
+    "LSE": "XLON", "LONDON": "XLON", "LON": "XLON",
+    # Euronext
+    "EURONEXT": "XPAR", "EPA": "XPAR", "SBF": "XPAR", "PARIS": "XPAR",
+    "AMS": "XPAR", "AEB": "XPAR", "AMSTERDAM": "XPAR",
+    "BRU": "XPAR", "EBR": "XPAR", "ELI": "XPAR",
+}
+
+
+@lru_cache(maxsize=512)
+def _year_bitmap(code: str, year: int) -> int:
+    """Trading days of a year as a bitmap (bit N = day-of-year N+1)."""
+    calendar = _CALENDARS[code]
+    closed = calendar.holidays(year)
+    bitmap = 0
+    current = date(year, 1, 1)
+    while current.year == year:
+        if current.weekday() < 5 and current not in closed:
+            bitmap |= 1 << (current.timetuple().tm_yday - 1)
+        current += timedelta(days=1)
+    return bitmap
+
+
+def get_trading_calendar(exchange: str | None) -> TradingCalendar:
+    """
+    Get the trading calendar for an Asset.exchange code.
+
+    Args:
+        exchange: Exchange code (case-insensitive); None or unknown codes
+                  fall back to a weekday-only calendar
+
+    Returns:
+        TradingCalendar for the exchange
+    """
+    code = _EXCHANGE_CALENDARS.get((exchange or "").upper().strip(), "WEEKDAYS")
+    return _CALENDARS[code]
+
+
+def get_fx_calendar() -> TradingCalendar:
+    """Get the calendar used for FX rate fetching."""
+    return _CALENDARS["FX"]
+
+
+def max_lookback_days(d: date) -> int:
+    """
+    Longest lookback_days() across all calendars for a date.
+
+    Used where a fetch window must cover fallback for assets whose
+    exchanges are not known yet.
+    """
+    return max(calendar.lookback_days(d) for calendar in _CALENDARS.values())
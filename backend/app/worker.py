@@ -0,0 +1,177 @@
+# backend/app/worker.py
+"""
+Background worker entry point.
+
+Runs queued portfolio sync jobs and background uploads outside the API
+process. Start as many workers as needed; they coordinate only through
+the sync_jobs and upload_jobs tables.
+
+Usage:
+    cd backend
+    python -m app.worker            # run until SIGINT/SIGTERM
+    python -m app.worker --once     # drain the queue, then exit
+
+On startup the worker creates any missing yearly partitions of
+market_data and exchange_rates through PARTITION_YEARS_AHEAD (the tables
+have no DEFAULT partition, so rows dated past the last one are rejected).
+
+Each loop iteration:
+1. Requeues sync jobs orphaned by workers that died mid-sync (orphaned
+   upload jobs are failed instead, see UploadJobQueue)
+2. Claims the oldest runnable sync job (FOR UPDATE SKIP LOCKED) and runs
+   it with the shared MarketDataSyncService
+3. Claims the oldest runnable upload job and runs it with UploadService
+4. Sleeps for SYNC_WORKER_POLL_INTERVAL_SECONDS when both queues are empty
+"""
+
+import argparse
+import logging
+import os
+import signal
+import socket
+import threading
+
+from app.config import settings
+from app.database import SessionLocal, engine
+from app.dependencies import (
+    get_asset_resolution_service,
+    get_sync_service,
+    get_sync_job_queue,
+    get_upload_job_queue,
+)
+from app.services.upload import UploadService
+from app.utils import setup_logging
+from app.utils.partitioning import PARTITIONED_TABLES, ensure_future_partitions
+
+logger = logging.getLogger(__name__)
+
+
+def default_worker_id() -> str:
+    """Identify this worker in sync_jobs/upload_jobs.worker_id (host:pid)."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def create_future_partitions() -> None:
+    """Create missing upcoming yearly partitions (no-op on SQLite)."""
+    try:
+        with engine.begin() as conn:
+            for table_name in PARTITIONED_TABLES:
+                partitions = ensure_future_partitions(conn, table_name)
+                if partitions:
+                    logger.info(f"{table_name}: partitions ready through {partitions[-1]}")
+    except Exception as e:
+        # Existing partitions still cover the next PARTITION_YEARS_AHEAD years
+        logger.exception(f"Could not create future partitions: {e}")
+
+
+def run_once(worker_id: str) -> bool:
+    """
+    Recover stale jobs, then claim and run at most one sync job and one
+    upload job.
+
+    Args:
+        worker_id: Identifier stored on claimed jobs
+
+    Returns:
+        True if a job was run, False if both queues had nothing runnable
+    """
+    ran_sync = run_sync_job(worker_id)
+    ran_upload = run_upload_job(worker_id)
+    return ran_sync or ran_upload
+
+
+def run_sync_job(worker_id: str) -> bool:
+    """Recover stale sync jobs, then claim and run at most one."""
+    queue = get_sync_job_queue()
+
+    with SessionLocal() as db:
+        recovered = queue.requeue_stale(db)
+        if recovered:
+            logger.warning(f"Recovered {recovered} orphaned sync job(s)")
+
+        job = queue.claim_next(db, worker_id)
+        if job is None:
+            return False
+
+        queue.run_job(db, job, get_sync_service())
+        return True
+
+
+def run_upload_job(worker_id: str) -> bool:
+    """Fail orphaned upload jobs, then claim and run at most one."""
+    queue = get_upload_job_queue()
+
+    with SessionLocal() as db:
+        failed = queue.fail_stale(db)
+        if failed:
+            logger.warning(f"Failed {failed} orphaned upload job(s)")
+
+        job = queue.claim_next(db, worker_id)
+        if job is None:
+            return False
+
+        queue.run_job(db, job, UploadService(asset_service=get_asset_resolution_service()))
+        return True
+
+
+def run_forever(worker_id: str, stop_event: threading.Event) -> None:
+    """
+    Process jobs until stop_event is set.
+
+    A job in progress always finishes before the loop exits, so SIGTERM
+    during deploys does not leave jobs orphaned.
+    """
+    poll_interval = settings.sync_worker_poll_interval_seconds
+    logger.info(f"Worker {worker_id} started (poll interval {poll_interval}s)")
+
+    while not stop_event.is_set():
+        try:
+            ran_job = run_once(worker_id)
+        except Exception as e:
+            # Database unavailable etc. - back off and keep the worker alive
+            logger.exception(f"Worker iteration failed: {e}")
+            ran_job = False
+
+        if not ran_job:
+            stop_event.wait(poll_interval)
+
+    logger.info(f"Worker {worker_id} stopped")
+
+
+def main() -> None:
+    """Parse arguments and run the worker."""
+    parser = argparse.ArgumentParser(description="Run queued portfolio sync and upload jobs.")
+    parser.add_argument(
+        "--once",
+        action="store_true",
+        help="Process queued jobs until the queue is empty, then exit",
+    )
+    parser.add_argument(
+        "--worker-id",
+        default=default_worker_id(),
+        help="Identifier recorded on claimed jobs (default: host:pid)",
+    )
+    args = parser.parse_args()
+
+    setup_logging()
+    create_future_partitions()
+
+    if args.once:
+        while run_once(args.worker_id):
+            pass
+        return
+
+    stop_event = threading.Event()
+
+    def _request_stop(signum, frame):
+        logger.info(f"Received signal {signum}, stopping after current job")
+        stop_event.set()
+
+    signal.signal(signal.SIGINT, _request_stop)
+    signal.signal(signal.SIGTERM, _request_stop)
+
+    run_forever(args.worker_id, stop_event)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# backend/scripts/benchmark_price_fetch.py
+"""
+Benchmark ORM-entity vs column-tuple price fetches.
+
+Compares the two ways of building the (asset_id, date) -> (close_price,
+is_synthetic, proxy_source_id) map used by HistoryCalculator and
+ValuationService:
+
+    orm    select(MarketData) and read attributes off hydrated entities
+           (the previous implementation)
+    tuple  select the five needed columns and read plain rows
+           (the current implementation)
+
+Rows are written to a throwaway database: in-memory SQLite by default, or
+a temporary schema (dropped afterwards) when --database-url points at
+PostgreSQL, where the tuple query can use the covering index.
+
+Usage:
+    python scripts/benchmark_price_fetch.py
+    python scripts/benchmark_price_fetch.py --rows 500000 --repeat 5
+    python scripts/benchmark_price_fetch.py --database-url postgresql://user:pw@localhost/bench
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+# Setup path to import app modules
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import and_, create_engine, insert, select, text
+from sqlalchemy.orm import Session
+
+from app.models import Asset, AssetClass, Base, MarketData
+
+START_DATE = date(2000, 1, 3)
+
+
+def _engine(database_url: str, schema: str | None):
+    if schema is None:
+        return create_engine(database_url)
+    return create_engine(
+        database_url,
+        connect_args={"options": f"-csearch_path={schema}"},
+    )
+
+
+def seed(db: Session, asset_count: int, days: int) -> list[int]:
+    """Insert asset_count assets with `days` consecutive prices each."""
+    db.execute(insert(Asset), [
+        {
+            "ticker": f"BENCH{i}",
+            "exchange": "NYSE",
+            "name": f"Benchmark asset {i}",
+            "asset_class": AssetClass.STOCK,
+            "currency": "USD",
+            "is_active": True,
+        }
+        for i in range(asset_count)
+    ])
+    asset_ids = list(db.scalars(select(Asset.id)).all())
+
+    batch = []
+    for asset_id in asset_ids:
+        for day in range(days):
+            price = Decimal(100 + (asset_id * 7 + day) % 50)
+            batch.append({
+                "asset_id": asset_id,
+                "date": START_DATE + timedelta(days=day),
+                "open_price": price,
+                "high_price": price,
+                "low_price": price,
+                "close_price": price,
+                "adjusted_close": price,
+                "volume": 1_000_000,
+                "provider": "yahoo",
+                "is_synthetic": False,
+                "no_data_available": False,
+            })
+            if len(batch) >= 50_000:
+                db.execute(insert(MarketData), batch)
+                batch.clear()
+    if batch:
+        db.execute(insert(MarketData), batch)
+    db.commit()
+    return asset_ids
+
+
+def _where(asset_ids: list[int], end_date: date):
+    return and_(
+        MarketData.asset_id.in_(asset_ids),
+        MarketData.date >= START_DATE,
+        MarketData.date <= end_date,
+        MarketData.no_data_available == False,  # noqa: E712
+    )
+
+
+def fetch_orm(db: Session, asset_ids: list[int], end_date: date) -> dict:
+    """Previous implementation: hydrate full MarketData entities."""
+    price_map = {}
+    for record in db.scalars(select(MarketData).where(_where(asset_ids, end_date))).all():
+        price_map[(record.asset_id, record.date)] = (
+            record.close_price,
+            record.is_synthetic,
+            record.proxy_source_id,
+        )
+    return price_map
+
+
+def fetch_tuples(db: Session, asset_ids: list[int], end_date: date) -> dict:
+    """Current implementation: project the needed columns as plain rows."""
+    query = select(
+        MarketData.asset_id,
+        MarketData.date,
+        MarketData.close_price,
+        MarketData.is_synthetic,
+        MarketData.proxy_source_id,
+    ).where(_where(asset_ids, end_date))
+    return {
+        (asset_id, price_date): (close_price, is_synthetic, proxy_source_id)
+        for asset_id, price_date, close_price, is_synthetic, proxy_source_id
+        in db.execute(query)
+    }
+
+
+def measure(engine, fetch, asset_ids: list[int], end_date: date, repeat: int) -> tuple[float, float, int]:
+    """Return (best seconds, peak MiB, row count) over `repeat` fresh sessions."""
+    timings = []
+    rows = 0
+    for _ in range(repeat):
+        with Session(engine) as db:
+            started = time.perf_counter()
+            rows = len(fetch(db, asset_ids, end_date))
+            timings.append(time.perf_counter() - started)
+
+    with Session(engine) as db:
+        tracemalloc.start()
+        fetch(db, asset_ids, end_date)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return min(timings), peak / (1024 * 1024), rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default="sqlite://", help="Throwaway database (default: in-memory SQLite)")
+    parser.add_argument("--rows", type=int, default=500_000, help="Price rows to fetch (default: 500000)")
+    parser.add_argument("--assets", type=int, default=100, help="Assets the rows are spread over (default: 100)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per method; best is reported (default: 3)")
+    args = parser.parse_args()
+
+    days = max(1, args.rows // args.assets)
+    is_postgres = args.database_url.startswith("postgresql")
+    schema = f"bench_price_fetch_{os.getpid()}" if is_postgres else None
+
+    if schema:
+        with create_engine(args.database_url).begin() as conn:
+            conn.execute(text(f"CREATE SCHEMA {schema}"))
+    engine = _engine(args.database_url, schema)
+
+    try:
+        Base.metadata.create_all(engine, tables=[Asset.__table__, MarketData.__table__])
+
+        print(f"Seeding {args.assets} assets x {days} days = {args.assets * days:,} rows ...")
+        with Session(engine) as db:
+            asset_ids = seed(db, args.assets, days)
+            if is_postgres:
+                db.execute(text("ANALYZE market_data"))
+                db.commit()
+        if is_postgres:
+            # Index-only scans need the visibility map set
+            with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                conn.execute(text("VACUUM market_data"))
+
+        end_date = START_DATE + timedelta(days=days)
+
+        print(f"{'method':<8} {'best (s)':>10} {'peak MiB':>10} {'rows':>10}")
+        results = {}
+        for label, fetch in (("orm", fetch_orm), ("tuple", fetch_tuples)):
+            seconds, peak_mib, rows = measure(engine, fetch, asset_ids, end_date, args.repeat)
+            results[label] = seconds
+            print(f"{label:<8} {seconds:>10.3f} {peak_mib:>10.1f} {rows:>10,}")
+
+        print(f"speedup  {results['orm'] / results['tuple']:>10.2f}x")
+    finally:
+        engine.dispose()
+        if schema:
+            with create_engine(args.database_url).begin() as conn:
+                conn.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# backend/scripts/benchmark_transaction_insert.py
+"""
+Benchmark ORM-entity vs bulk transaction inserts.
+
+Compares the two ways of saving an upload or batch create:
+
+    orm    one Transaction entity per row, db.add_all(), commit, then
+           db.refresh() per row to read its id (the previous implementation)
+    bulk   insert_transactions(): INSERT ... RETURNING id in batches of
+           TRANSACTION_INSERT_BATCH_ROWS, then commit (the current
+           implementation)
+
+Both paths update the position ledger in the same database transaction.
+Rows are written to a throwaway database: in-memory SQLite by default, or
+a temporary schema (dropped afterwards) when --database-url points at
+PostgreSQL. Each measurement starts from empty transaction tables.
+
+Usage:
+    python scripts/benchmark_transaction_insert.py
+    python scripts/benchmark_transaction_insert.py --rows 1000 --rows 200000 --repeat 5
+    python scripts/benchmark_transaction_insert.py --database-url postgresql://user:pw@localhost/bench
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+# Setup path to import app modules
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import create_engine, delete, insert, select, text
+from sqlalchemy.orm import Session
+
+from app.models import (
+    Asset,
+    AssetClass,
+    Base,
+    Portfolio,
+    PortfolioPosition,
+    Transaction,
+    TransactionType,
+    User,
+)
+from app.services.position_ledger import record_transactions
+from app.services.transaction_writer import insert_transactions
+
+DEFAULT_ROWS = [1_000, 10_000, 50_000]
+ASSET_COUNT = 50
+START_DATE = datetime(2010, 1, 4)
+
+
+def _engine(database_url: str, schema: str | None):
+    if schema is None:
+        return create_engine(database_url)
+    return create_engine(
+        database_url,
+        connect_args={"options": f"-csearch_path={schema}"},
+    )
+
+
+def seed(db: Session) -> tuple[int, list[int]]:
+    """Insert one user, one portfolio and ASSET_COUNT assets."""
+    user_id = db.scalar(insert(User).values(email="bench@example.com").returning(User.id))
+    portfolio_id = db.scalar(
+        insert(Portfolio).values(user_id=user_id, name="Benchmark", currency="USD").returning(Portfolio.id)
+    )
+    db.execute(insert(Asset), [
+        {
+            "ticker": f"BENCH{i}",
+            "exchange": "NYSE",
+            "name": f"Benchmark asset {i}",
+            "asset_class": AssetClass.STOCK,
+            "currency": "USD",
+            "is_active": True,
+        }
+        for i in range(ASSET_COUNT)
+    ])
+    db.commit()
+    return portfolio_id, list(db.scalars(select(Asset.id)).all())
+
+
+def build_rows(portfolio_id: int, asset_ids: list[int], count: int) -> list[dict]:
+    """Upload-shaped transaction values, BUYs spread over assets and days."""
+    return [
+        {
+            "portfolio_id": portfolio_id,
+            "asset_id": asset_ids[i % len(asset_ids)],
+            "transaction_type": TransactionType.BUY,
+            "date": START_DATE + timedelta(days=i // len(asset_ids)),
+            "quantity": Decimal(1 + i % 10),
+            "price_per_share": Decimal("100.25"),
+            "currency": "USD",
+            "fee": Decimal("1.50"),
+            "fee_currency": "USD",
+            "exchange_rate": Decimal("1"),
+        }
+        for i in range(count)
+    ]
+
+
+def save_orm(db: Session, rows: list[dict]) -> list[int]:
+    """Previous implementation: entities, add_all, refresh each for its id."""
+    transactions = [Transaction(**row) for row in rows]
+    db.add_all(transactions)
+    record_transactions(db, transactions)
+    db.commit()
+    for txn in transactions:
+        db.refresh(txn)
+    return [txn.id for txn in transactions]
+
+
+def save_bulk(db: Session, rows: list[dict]) -> list[int]:
+    """Current implementation: batched INSERT ... RETURNING id."""
+    ids = insert_transactions(db, rows)
+    db.commit()
+    return ids
+
+
+def measure(engine, save, rows: list[dict], repeat: int) -> float:
+    """Return the best seconds over `repeat` runs into empty tables."""
+    timings = []
+    for _ in range(repeat):
+        with Session(engine) as db:
+            db.execute(delete(Transaction))
+            db.execute(delete(PortfolioPosition))
+            db.commit()
+
+        with Session(engine) as db:
+            started = time.perf_counter()
+            ids = save(db, rows)
+            timings.append(time.perf_counter() - started)
+
+        assert len(ids) == len(rows)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default="sqlite://", help="Throwaway database (default: in-memory SQLite)")
+    parser.add_argument(
+        "--rows", type=int, action="append",
+        help="Rows per insert, repeatable (default: 1000, 10000, 50000)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per method; best is reported (default: 3)")
+    args = parser.parse_args()
+
+    is_postgres = args.database_url.startswith("postgresql")
+    schema = f"bench_transaction_insert_{os.getpid()}" if is_postgres else None
+
+    if schema:
+        with create_engine(args.database_url).begin() as conn:
+            conn.execute(text(f"CREATE SCHEMA {schema}"))
+    engine = _engine(args.database_url, schema)
+
+    try:
+        Base.metadata.create_all(engine, tables=[
+            User.__table__,
+            Portfolio.__table__,
+            Asset.__table__,
+            Transaction.__table__,
+            PortfolioPosition.__table__,
+        ])
+        with Session(engine) as db:
+            portfolio_id, asset_ids = seed(db)
+
+        print(f"{'rows':>8} {'orm (s)':>10} {'bulk (s)':>10} {'speedup':>9}")
+        for count in args.rows or DEFAULT_ROWS:
+            rows = build_rows(portfolio_id, asset_ids, count)
+            orm_seconds = measure(engine, save_orm, rows, args.repeat)
+            bulk_seconds = measure(engine, save_bulk, rows, args.repeat)
+            print(f"{count:>8,} {orm_seconds:>10.3f} {bulk_seconds:>10.3f} {orm_seconds / bulk_seconds:>8.2f}x")
+    finally:
+        engine.dispose()
+        if schema:
+            with create_engine(args.database_url).begin() as conn:
+                conn.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+
+
+if __name__ == "__main__":
+    main()
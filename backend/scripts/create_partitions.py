@@ -0,0 +1,53 @@
+# backend/scripts/create_partitions.py
+"""
+Create upcoming yearly partitions for market_data and exchange_rates.
+
+The tables have no DEFAULT partition (migration 005), so inserts dated
+past the last yearly partition fail. The background worker does this at
+startup; run it by hand (or from cron) on deployments without a worker,
+or to create partitions further ahead. It is idempotent and does
+nothing on SQLite or unpartitioned tables.
+
+Usage:
+    cd backend
+    python -m scripts.create_partitions
+    python -m scripts.create_partitions --years-ahead 5
+"""
+
+import argparse
+import logging
+
+from app.database import engine
+from app.utils.partitioning import (
+    PARTITIONED_TABLES,
+    PARTITION_YEARS_AHEAD,
+    ensure_future_partitions,
+)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def create_partitions(years_ahead: int = PARTITION_YEARS_AHEAD) -> None:
+    """Ensure partitions exist through the current year + years_ahead."""
+    with engine.begin() as conn:
+        for table_name in PARTITIONED_TABLES:
+            partitions = ensure_future_partitions(conn, table_name, years_ahead)
+            if partitions:
+                logger.info(f"{table_name}: partitions ready through {partitions[-1]}")
+            else:
+                logger.info(f"{table_name}: not partitioned, skipped")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--years-ahead", type=int, default=PARTITION_YEARS_AHEAD,
+        help=f"Years beyond the current one to create (default: {PARTITION_YEARS_AHEAD})",
+    )
+    args = parser.parse_args()
+    create_partitions(args.years_ahead)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# backend/scripts/rebuild_positions.py
+"""
+Rebuild the portfolio_positions ledger from the transactions table.
+
+The ledger is updated on every transaction write made through the
+application. Run this after transactions were inserted or edited
+directly in the database, or to repair a ledger that drifted.
+
+Usage:
+    cd backend
+    python -m scripts.rebuild_positions
+    python -m scripts.rebuild_positions --portfolio-id 3 --portfolio-id 7
+"""
+
+import argparse
+import logging
+
+from app.database import SessionLocal
+from app.services.position_ledger import rebuild_positions
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def rebuild(portfolio_ids: list[int] | None = None) -> int:
+    """Rebuild rows for portfolio_ids (default: all portfolios); returns rows written."""
+    with SessionLocal() as db:
+        if portfolio_ids is None:
+            rows = rebuild_positions(db)
+        else:
+            rows = sum(rebuild_positions(db, portfolio_id) for portfolio_id in portfolio_ids)
+        db.commit()
+        return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--portfolio-id", type=int, action="append", dest="portfolio_ids",
+        help="Only rebuild this portfolio (repeatable; default: all portfolios)",
+    )
+    args = parser.parse_args()
+
+    rows = rebuild(args.portfolio_ids)
+    logger.info(f"Wrote {rows} positions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# backend/scripts/rebuild_price_store.py
+"""
+Rebuild the local columnar price store from the database.
+
+The store (PRICE_STORE_DIR) is a read-optimized copy of market_data that
+MarketDataSyncService keeps up to date after each sync. Run this to
+populate it for the first time, after changing PRICE_STORE_DIR, or after
+market_data was modified outside a sync.
+
+Usage:
+    cd backend
+    python -m scripts.rebuild_price_store
+    python -m scripts.rebuild_price_store --asset-id 12 --asset-id 40
+    python -m scripts.rebuild_price_store --dir /tmp/prices
+"""
+
+import argparse
+import logging
+import sys
+
+from app.config import settings
+from app.database import SessionLocal
+from app.services.market_data.price_store import ColumnarPriceStore
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def rebuild_price_store(store_dir: str, asset_ids: list[int] | None = None) -> int:
+    """Rewrite store files for asset_ids (default: all assets); returns rows written."""
+    store = ColumnarPriceStore(store_dir)
+    with SessionLocal() as db:
+        return store.rebuild(db, asset_ids)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--dir", default=settings.price_store_dir,
+        help="Store directory (default: PRICE_STORE_DIR)",
+    )
+    parser.add_argument(
+        "--asset-id", type=int, action="append", dest="asset_ids",
+        help="Only rebuild this asset (repeatable; default: all assets)",
+    )
+    args = parser.parse_args()
+
+    if not args.dir:
+        logger.error("No store directory: set PRICE_STORE_DIR or pass --dir")
+        sys.exit(1)
+
+    rows = rebuild_price_store(args.dir, args.asset_ids)
+    logger.info(f"Wrote {rows} prices to {args.dir}")
+
+
+if __name__ == "__main__":
+    main()
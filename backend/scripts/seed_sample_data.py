@@ -28,6 +28,8 @@ sys.path.insert(0, str(backend_dir))
 from app.database import SessionLocal
 from app.models import User, Portfolio, Asset, Transaction, TransactionType, AssetClass
 from app.models import MarketData, ExchangeRate
+from app.services.position_ledger import record_transactions
+from app.services.transaction_writer import transaction_fingerprint
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -129,7 +131,10 @@ def seed():
                 fee_currency="EUR"
             )
 
+            for txn in (t1, t2):
+                txn.fingerprint = transaction_fingerprint(txn)
             db.add_all([t1, t2])
+            record_transactions(db, [t1, t2])
             db.commit()
             logger.info("✅ Created Sample Transactions")
 
@@ -4,17 +4,20 @@ Pytest configuration and fixtures.
 
 This module provides shared fixtures for all tests:
 - Database session fixtures (in-memory SQLite)
+- PostgreSQL engine fixture (only when TEST_POSTGRES_URL is set)
 - Mock provider fixtures
 - Sample data factories
 """
 
+import importlib.util
 import os
 from datetime import date, timedelta
 from decimal import Decimal
+from pathlib import Path
 from typing import Iterator
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
@@ -67,6 +70,42 @@ def db(db_engine) -> Iterator[Session]:
         session.close()
 
 
+# Throwaway PostgreSQL database for tests that need the real thing (COPY,
+# partitioning, pg_trgm); its tables are dropped and recreated per test
+POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+
+PARTITION_MIGRATION_PATH = (
+    Path(__file__).resolve().parents[1] / "alembic" / "versions" / "005_partition_time_series.py"
+)
+
+
+@pytest.fixture
+def pg_engine():
+    """PostgreSQL engine with the 005 migration applied on a fresh schema."""
+    from alembic.migration import MigrationContext
+    from alembic.operations import Operations
+
+    engine = create_engine(POSTGRES_URL)
+    with engine.begin() as conn:
+        # The assets trigram indexes need the extension (migration 011)
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+    spec = importlib.util.spec_from_file_location("migration_005", PARTITION_MIGRATION_PATH)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+
+    with engine.begin() as conn:
+        with Operations.context(MigrationContext.configure(conn)):
+            migration.upgrade()
+
+    yield engine
+
+    Base.metadata.drop_all(engine)
+    engine.dispose()
+
+
 # =============================================================================
 # MOCK MARKET DATA PROVIDER
 # =============================================================================
@@ -380,6 +419,21 @@ def reset_rate_limiter():
     yield
 
 
+@pytest.fixture(autouse=True)
+def reset_auth_cache():
+    """
+    Clear the auth cache before each test.
+
+    Each test gets a fresh database that reuses user and portfolio ids,
+    so cached rows from a previous test must not be served.
+    """
+    from app.dependencies import get_auth_cache
+
+    get_auth_cache().clear()
+
+    yield
+
+
 # =============================================================================
 # AUTHENTICATION FIXTURES
 # =============================================================================
@@ -5,6 +5,7 @@ Integration tests for Asset API endpoints.
 These tests verify full HTTP request/response cycles for:
 - POST /assets/ (Create)
 - GET /assets/ (List with filters and pagination)
+- GET /assets/search (Ranked type-ahead search)
 - GET /assets/{id} (Read)
 - PATCH /assets/{id} (Update)
 - DELETE /assets/{id} (Soft delete/deactivate)
@@ -490,6 +491,45 @@ class TestListAssets:
         assert response.status_code == 401
 
 
+# =============================================================================
+# TEST: GET /assets/search (Search)
+# =============================================================================
+
+class TestSearchAssets:
+    """Tests for GET /assets/search endpoint."""
+
+    def test_search_ranks_matches(self, client: TestClient, test_db: Session):
+        """Should return active matches, exact ticker first."""
+        user = seed_user(test_db)
+        headers = get_auth_headers(user)
+        seed_asset(test_db, "AAPL", "NASDAQ", "USD", name="Apple Inc.")
+        seed_asset(test_db, "APLE", "NYSE", "USD", name="Apple Hospitality REIT")
+        seed_asset(test_db, "APPL", "XETRA", "EUR", name="Old Listing", is_active=False)
+        seed_asset(test_db, "IWDA", "XETRA", "EUR", name="iShares MSCI World", isin="IE00B4L5Y983")
+
+        response = client.get("/assets/search", params={"q": "apple"}, headers=headers)
+        assert response.status_code == 200
+        assert [a["ticker"] for a in response.json()] == ["AAPL", "APLE"]
+
+        response = client.get("/assets/search", params={"q": "aapl"}, headers=headers)
+        assert [a["ticker"] for a in response.json()] == ["AAPL"]
+
+        response = client.get("/assets/search", params={"q": "IE00B4"}, headers=headers)
+        assert [a["ticker"] for a in response.json()] == ["IWDA"]
+
+    def test_search_validates_params(self, client: TestClient, test_db: Session):
+        """Should reject an empty query and out-of-range limits."""
+        headers = get_auth_headers(seed_user(test_db))
+
+        assert client.get("/assets/search", params={"q": ""}, headers=headers).status_code == 422
+        assert client.get("/assets/search", params={"q": "a", "limit": 500}, headers=headers).status_code == 422
+
+    def test_search_unauthorized(self, client: TestClient):
+        """Should return 401 without authentication."""
+        response = client.get("/assets/search", params={"q": "aapl"})
+        assert response.status_code == 401
+
+
 # =============================================================================
 # TEST: GET /assets/{id} (Read)
 # =============================================================================
@@ -284,6 +284,56 @@ class TestLoginEndpoint:
         assert response.status_code == 403
 
 
+# =============================================================================
+# TEST: PASSWORD HASHING POOL
+# =============================================================================
+
+
+class TestPasswordHashingPool:
+    """Tests that password endpoints run bcrypt on the dedicated pool."""
+
+    def test_login_and_change_password_use_pool(
+        self, client: TestClient, test_db: Session
+    ):
+        """Login and password change should be counted by the pool metrics."""
+        user = create_user(test_db, email="test@example.com", password="password123")
+
+        def completed() -> int:
+            return client.get("/health").json()["metrics"]["password_pool"]["completed"]
+
+        before = completed()
+        login = client.post(
+            "/auth/login",
+            json={"email": "test@example.com", "password": "password123"},
+        )
+        change = client.post(
+            "/users/me/password",
+            json={"current_password": "password123", "new_password": "newpassword123"},
+            headers=get_auth_headers(user),
+        )
+        relogin = client.post(
+            "/auth/login",
+            json={"email": "test@example.com", "password": "newpassword123"},
+        )
+
+        assert (login.status_code, change.status_code, relogin.status_code) == (200, 200, 200)
+        assert completed() - before == 4  # verify, verify + hash, verify
+        pool = client.get("/health").json()["metrics"]["password_pool"]
+        assert (pool["queued"], pool["active"]) == (0, 0)
+
+    def test_change_password_wrong_current(self, client: TestClient, test_db: Session):
+        """Wrong current password should still be rejected."""
+        user = create_user(test_db)
+
+        response = client.post(
+            "/users/me/password",
+            json={"current_password": "wrongpassword", "new_password": "newpassword123"},
+            headers=get_auth_headers(user),
+        )
+
+        assert response.status_code == 401
+
+
 # =============================================================================
 # TEST: POST /auth/refresh
 # =============================================================================
@@ -481,6 +531,33 @@ class TestMeEndpoint:
         assert data["id"] == user.id
         assert "hashed_password" not in data  # Should not expose password
 
+    def test_me_rejects_user_deactivated_after_caching(
+        self, client: TestClient, test_db: Session
+    ):
+        """Deactivating a user should take effect despite the auth cache."""
+        user = create_user(test_db)
+        headers = get_auth_headers(user)
+        assert client.get("/auth/me", headers=headers).status_code == 200
+
+        user.is_active = False
+        test_db.commit()
+        response = client.get("/auth/me", headers=headers)
+
+        assert response.status_code == 401
+        auth_cache = client.get("/health").json()["metrics"]["auth_cache"]
+        assert (auth_cache["user_hits"], auth_cache["user_misses"]) == (0, 2)
+
+    def test_me_served_from_auth_cache(self, client: TestClient, test_db: Session):
+        """Repeated requests should reuse the cached user."""
+        user = create_user(test_db)
+        headers = get_auth_headers(user)
+
+        for _ in range(3):
+            assert client.get("/auth/me", headers=headers).json()["id"] == user.id
+
+        auth_cache = client.get("/health").json()["metrics"]["auth_cache"]
+        assert (auth_cache["user_hits"], auth_cache["user_misses"]) == (2, 1)
+
     def test_me_with_invalid_token(self, client: TestClient):
         """Invalid token should return 401."""
         response = client.get(
@@ -675,6 +752,27 @@ class TestOwnershipVerification:
 
         assert response.status_code == 403
 
+    def test_cached_portfolio_rechecks_owner_and_delete(
+        self, client: TestClient, test_db: Session
+    ):
+        """Cached portfolios should still be owner-checked and dropped on delete."""
+        owner = create_user(test_db, email="owner@example.com", password="password123")
+        other_user = create_user(
+            test_db, email="other@example.com", password="password123"
+        )
+        create_response = client.post(
+            "/portfolios/",
+            json={"name": "Owner Portfolio", "currency": "USD"},
+            headers=get_auth_headers(owner),
+        )
+        portfolio_id = create_response.json()["id"]
+
+        assert client.get(f"/portfolios/{portfolio_id}", headers=get_auth_headers(owner)).status_code == 200
+        assert client.get(f"/portfolios/{portfolio_id}", headers=get_auth_headers(other_user)).status_code == 403
+
+        assert client.delete(f"/portfolios/{portfolio_id}", headers=get_auth_headers(owner)).status_code == 204
+        assert client.get(f"/portfolios/{portfolio_id}", headers=get_auth_headers(owner)).status_code == 404
+
     def test_access_nonexistent_portfolio_404(
         self, client: TestClient, test_db: Session
     ):
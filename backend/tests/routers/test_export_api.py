@@ -0,0 +1,298 @@
+# backend/tests/routers/test_export_api.py
+"""
+API layer tests for the streaming export endpoints.
+
+These tests consume the StreamingResponse through FastAPI's TestClient:
+- Every format (csv, parquet, arrow) decodes to the expected rows
+- Content-Type and Content-Disposition headers
+- The request's database session stays open until the body is sent
+- Ownership and format validation
+"""
+
+import csv
+import io
+import os
+from datetime import date, datetime
+from decimal import Decimal
+
+import pyarrow as pa
+import pyarrow.ipc
+import pyarrow.parquet
+import pytest
+
+# Set required environment variables BEFORE importing app modules
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("APP_NAME", "Test App")
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.database import get_db
+from app.models import (
+    Asset,
+    AssetClass,
+    Base,
+    MarketData,
+    Portfolio,
+    Transaction,
+    TransactionType,
+    User,
+)
+from app.services import export_service as export_service_module
+from app.services.auth.jwt_handler import JWTHandler
+
+
+# =============================================================================
+# TEST DATABASE SETUP
+# =============================================================================
+
+@pytest.fixture(scope="function")
+def test_engine():
+    """Create an in-memory SQLite database engine for API tests."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    yield engine
+    Base.metadata.drop_all(engine)
+
+
+@pytest.fixture(scope="function")
+def test_db(test_engine) -> Session:
+    """Session for seeding data."""
+    session = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)()
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.close()
+
+
+@pytest.fixture(scope="function")
+def session_log() -> dict:
+    """Open / closed state of the request sessions handed out by get_db."""
+    return {"open": 0, "closed": 0}
+
+
+@pytest.fixture(scope="function")
+def client(test_engine, session_log: dict) -> TestClient:
+    """
+    TestClient whose get_db opens and closes a session per request, like
+    the real dependency, so streaming after the session closed is visible.
+    """
+    RequestSession = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+
+    def override_get_db():
+        db = RequestSession()
+        session_log["open"] += 1
+        try:
+            yield db
+        finally:
+            db.close()
+            session_log["closed"] += 1
+
+    app.dependency_overrides[get_db] = override_get_db
+
+    with TestClient(app) as c:
+        yield c
+
+    app.dependency_overrides.clear()
+
+
+# =============================================================================
+# FACTORY FUNCTIONS
+# =============================================================================
+
+def seed_user(db: Session, email: str = "export_test@example.com") -> User:
+    """Create a verified test user."""
+    user = User(email=email, hashed_password="hashed", is_email_verified=True, is_active=True)
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+def get_auth_headers(user: User) -> dict[str, str]:
+    """Get authorization headers with JWT token for a user."""
+    token = JWTHandler().create_access_token(user_id=user.id, email=user.email)
+    return {"Authorization": f"Bearer {token}"}
+
+
+def seed_portfolio(db: Session, user: User) -> tuple[Portfolio, Asset]:
+    """Portfolio holding AAPL, bought on five days, with a price for each day."""
+    portfolio = Portfolio(user_id=user.id, name="Export Portfolio", currency="USD")
+    asset = Asset(
+        ticker="AAPL", exchange="NASDAQ", name="Apple Inc.",
+        currency="USD", asset_class=AssetClass.STOCK, is_active=True,
+    )
+    db.add_all([portfolio, asset])
+    db.flush()
+
+    for day in range(2, 7):
+        db.add(Transaction(
+            portfolio_id=portfolio.id,
+            asset_id=asset.id,
+            transaction_type=TransactionType.BUY,
+            date=datetime(2024, 1, day),
+            quantity=Decimal("1"),
+            price_per_share=Decimal("100.12345678"),
+            currency="USD",
+            fee=Decimal("0"),
+            fee_currency="USD",
+            exchange_rate=Decimal("1"),
+        ))
+        db.add(MarketData(
+            asset_id=asset.id,
+            date=date(2024, 1, day),
+            close_price=Decimal("110"),
+            provider="test",
+            is_synthetic=False,
+        ))
+    db.commit()
+    return portfolio, asset
+
+
+def read_table(content: bytes, export_format: str) -> pa.Table:
+    """Decode an export body into a pyarrow Table."""
+    if export_format == "parquet":
+        return pyarrow.parquet.read_table(pa.BufferReader(content))
+    if export_format == "arrow":
+        return pyarrow.ipc.open_stream(content).read_all()
+    rows = list(csv.reader(io.StringIO(content.decode("utf-8"))))
+    return pa.table({name: [row[i] for row in rows[1:]] for i, name in enumerate(rows[0])})
+
+
+# =============================================================================
+# TEST: EXPORT ENDPOINTS
+# =============================================================================
+
+FORMATS = ["csv", "parquet", "arrow"]
+
+
+class TestExportEndpoints:
+    """Tests for GET /portfolios/{id}/export/*."""
+
+    @pytest.fixture(autouse=True)
+    def small_batches(self, monkeypatch):
+        """Several batches per export, so the body arrives in several chunks."""
+        monkeypatch.setattr(export_service_module, "EXPORT_BATCH_ROWS", 2)
+
+    @pytest.mark.parametrize("export_format", FORMATS)
+    def test_transactions(self, client: TestClient, test_db: Session, export_format: str):
+        """Every transaction arrives, oldest first, with a download filename."""
+        user = seed_user(test_db)
+        portfolio, _ = seed_portfolio(test_db, user)
+
+        response = client.get(
+            f"/portfolios/{portfolio.id}/export/transactions?format={export_format}",
+            headers=get_auth_headers(user),
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == export_service_module.EXPORT_MEDIA_TYPES[export_format]
+        extension = export_service_module.EXPORT_FILE_EXTENSIONS[export_format]
+        assert response.headers["content-disposition"] == (
+            f'attachment; filename="portfolio_{portfolio.id}_transactions.{extension}"'
+        )
+
+        table = read_table(response.content, export_format)
+        assert table.num_rows == 5
+        assert [str(v) for v in table.column("ticker").to_pylist()] == ["AAPL"] * 5
+        assert str(table.column("price_per_share").to_pylist()[0]) == "100.12345678"
+
+    @pytest.mark.parametrize("export_format", FORMATS)
+    def test_holdings(self, client: TestClient, test_db: Session, export_format: str):
+        """Holdings are valued on the requested date."""
+        user = seed_user(test_db)
+        portfolio, _ = seed_portfolio(test_db, user)
+
+        response = client.get(
+            f"/portfolios/{portfolio.id}/export/holdings?date=2024-01-06&format={export_format}",
+            headers=get_auth_headers(user),
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-disposition"].endswith(
+            f'holdings.{export_service_module.EXPORT_FILE_EXTENSIONS[export_format]}"'
+        )
+        table = read_table(response.content, export_format)
+        assert table.num_rows == 1
+        assert Decimal(str(table.column("quantity")[0])) == Decimal("5")
+
+    @pytest.mark.parametrize("export_format", FORMATS)
+    def test_history(self, client: TestClient, test_db: Session, export_format: str):
+        """One row per day, calculated while the body streams."""
+        user = seed_user(test_db)
+        portfolio, _ = seed_portfolio(test_db, user)
+
+        response = client.get(
+            f"/portfolios/{portfolio.id}/export/history"
+            f"?from_date=2024-01-02&to_date=2024-01-06&format={export_format}",
+            headers=get_auth_headers(user),
+        )
+
+        assert response.status_code == 200
+        table = read_table(response.content, export_format)
+        assert [str(d) for d in table.column("date").to_pylist()] == [
+            "2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05", "2024-01-06",
+        ]
+
+    def test_session_stays_open_while_streaming(
+            self, client: TestClient, test_db: Session, test_engine, session_log: dict
+    ):
+        """No query may run on the request session after get_db closed it."""
+        user = seed_user(test_db)
+        portfolio, _ = seed_portfolio(test_db, user)
+        while_open: list[str] = []
+        after_close: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if "FROM transactions" not in statement:
+                return
+            if session_log["closed"] < session_log["open"]:
+                while_open.append(statement)
+            else:
+                after_close.append(statement)
+
+        event.listen(test_engine, "before_cursor_execute", record)
+        try:
+            response = client.get(
+                f"/portfolios/{portfolio.id}/export/transactions",
+                headers=get_auth_headers(user),
+            )
+        finally:
+            event.remove(test_engine, "before_cursor_execute", record)
+
+        assert response.status_code == 200
+        assert len(response.content.decode("utf-8").splitlines()) == 6  # Header + 5 rows
+        assert session_log["closed"] == session_log["open"] == 1
+        assert while_open
+        assert after_close == []
+
+    def test_other_users_portfolio_is_forbidden(self, client: TestClient, test_db: Session):
+        owner = seed_user(test_db)
+        other = seed_user(test_db, email="other@example.com")
+        portfolio, _ = seed_portfolio(test_db, owner)
+
+        response = client.get(
+            f"/portfolios/{portfolio.id}/export/transactions",
+            headers=get_auth_headers(other),
+        )
+
+        assert response.status_code == 403
+
+    def test_unknown_format_is_rejected(self, client: TestClient, test_db: Session):
+        user = seed_user(test_db)
+        portfolio, _ = seed_portfolio(test_db, user)
+
+        response = client.get(
+            f"/portfolios/{portfolio.id}/export/transactions?format=xlsx",
+            headers=get_auth_headers(user),
+        )
+
+        assert response.status_code == 422
@@ -0,0 +1,267 @@
+# backend/tests/routers/test_query_counts.py
+"""
+Query-count regression tests for the valuation, history and analytics endpoints.
+
+Each endpoint runs several calculations over the same portfolio. They share
+one request-scoped PortfolioDataContext, so the portfolio, its transactions,
+their assets and overlapping price/FX windows are loaded once per request.
+These tests pin the number of SQL statements per request so a change that
+reintroduces repeated loads (or an N+1 over holdings or dates) fails loudly.
+
+The seeded portfolio is sized so that a per-holding or per-day query
+pattern would blow far past the limits below.
+"""
+
+import os
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("APP_NAME", "Test App")
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.database import get_db
+from app.models import (
+    Base,
+    User,
+    Portfolio,
+    Asset,
+    AssetClass,
+    Transaction,
+    TransactionType,
+    MarketData,
+    ExchangeRate,
+)
+from app.services.analytics.service import AnalyticsService
+
+START = date(2024, 1, 2)
+END = date(2024, 3, 29)
+ASSET_COUNT = 6
+
+# Upper bounds on SQL statements per request (auth and ownership checks included).
+# A per-holding lookup would add at least ASSET_COUNT statements per valuation
+# and a per-day lookup ~90, so either regression overshoots these bounds.
+MAX_VALUATION_QUERIES = 12
+MAX_HISTORY_QUERIES = 10
+MAX_ANALYTICS_QUERIES = 16
+
+
+# =============================================================================
+# TEST DATABASE SETUP
+# =============================================================================
+
+@pytest.fixture(scope="function")
+def test_engine():
+    """Create an in-memory SQLite database engine for API tests."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    yield engine
+    Base.metadata.drop_all(engine)
+
+
+@pytest.fixture(scope="function")
+def test_db(test_engine) -> Session:
+    """Create a database session for API tests."""
+    TestingSessionLocal = sessionmaker(
+        autocommit=False, autoflush=False, bind=test_engine
+    )
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.close()
+
+
+@pytest.fixture(scope="function")
+def client(test_db: Session) -> TestClient:
+    """Create TestClient with database dependency override."""
+
+    def override_get_db():
+        try:
+            yield test_db
+        finally:
+            pass
+
+    app.dependency_overrides[get_db] = override_get_db
+    AnalyticsService.clear_all_cache()
+
+    with TestClient(app) as c:
+        yield c
+
+    app.dependency_overrides.clear()
+    AnalyticsService.clear_all_cache()
+
+
+@pytest.fixture
+def query_counter(test_engine):
+    """Collect SQL statements executed against the test engine."""
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(test_engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(test_engine, "before_cursor_execute", record)
+
+
+# =============================================================================
+# SEED DATA
+# =============================================================================
+
+def _auth_headers(user: User) -> dict[str, str]:
+    from app.services.auth.jwt_handler import JWTHandler
+    token = JWTHandler.create_access_token(user_id=user.id, email=user.email)
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _seed_portfolio(db: Session) -> tuple[Portfolio, dict[str, str]]:
+    """
+    USD portfolio tracking cash, with USD and EUR assets, trades spread
+    over the quarter, daily prices and daily EUR/USD rates.
+    """
+    user = User(email="queries@example.com", hashed_password="hashed", is_email_verified=True)
+    db.add(user)
+    db.flush()
+
+    portfolio = Portfolio(user_id=user.id, name="Query Count", currency="USD")
+    db.add(portfolio)
+    db.flush()
+
+    assets = [
+        Asset(
+            ticker=f"QC{i}",
+            exchange="XETRA" if i % 2 else "NASDAQ",
+            name=f"Query Count {i}",
+            currency="EUR" if i % 2 else "USD",
+            asset_class=AssetClass.STOCK,
+            is_active=True,
+        )
+        for i in range(ASSET_COUNT)
+    ]
+    db.add_all(assets)
+    db.flush()
+
+    def txn(asset, txn_type, txn_date, quantity, price, currency):
+        return Transaction(
+            portfolio_id=portfolio.id,
+            asset_id=asset.id if asset else None,
+            transaction_type=txn_type,
+            date=datetime.combine(txn_date, datetime.min.time()),
+            quantity=Decimal(quantity),
+            price_per_share=Decimal(price),
+            currency=currency,
+            fee=Decimal("1"),
+            fee_currency=currency,
+            exchange_rate=Decimal("1"),
+        )
+
+    db.add(txn(None, TransactionType.DEPOSIT, START, "100000", "1", "USD"))
+    for i, asset in enumerate(assets):
+        db.add(txn(asset, TransactionType.BUY, START + timedelta(days=i), "10", "100", asset.currency))
+        db.add(txn(asset, TransactionType.BUY, START + timedelta(days=20 + i), "5", "105", asset.currency))
+    db.add(txn(assets[0], TransactionType.SELL, START + timedelta(days=40), "3", "110", "USD"))
+
+    day = START - timedelta(days=10)
+    while day <= END:
+        for i, asset in enumerate(assets):
+            price = Decimal(100 + i + (day - START).days % 7)
+            db.add(MarketData(
+                asset_id=asset.id, date=day,
+                open_price=price, high_price=price, low_price=price,
+                close_price=price, adjusted_close=price,
+                volume=1000, provider="test", is_synthetic=False,
+            ))
+        db.add(ExchangeRate(
+            base_currency="EUR", quote_currency="USD", date=day,
+            rate=Decimal("1.08"), provider="test",
+        ))
+        day += timedelta(days=1)
+
+    db.commit()
+    return portfolio, _auth_headers(user)
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+class TestEndpointQueryCounts:
+    """SQL statements per request stay bounded."""
+
+    def test_valuation_query_count(self, client, test_db, query_counter):
+        portfolio, headers = _seed_portfolio(test_db)
+        test_db.expire_all()
+        query_counter.clear()
+
+        response = client.get(
+            f"/portfolios/{portfolio.id}/valuation",
+            params={"date": END.isoformat()},
+            headers=headers,
+        )
+
+        assert response.status_code == 200
+        assert len(response.json()["holdings"]) == ASSET_COUNT
+        assert len(query_counter) <= MAX_VALUATION_QUERIES, query_counter
+
+    def test_valuation_loads_transactions_once(self, client, test_db, query_counter):
+        """Today's and yesterday's valuation share one transaction load."""
+        portfolio, headers = _seed_portfolio(test_db)
+        test_db.expire_all()
+        query_counter.clear()
+
+        client.get(
+            f"/portfolios/{portfolio.id}/valuation",
+            params={"date": END.isoformat()},
+            headers=headers,
+        )
+
+        transaction_loads = [s for s in query_counter if "FROM transactions" in s]
+        assert len(transaction_loads) == 1
+
+    def test_history_query_count(self, client, test_db, query_counter):
+        portfolio, headers = _seed_portfolio(test_db)
+        test_db.expire_all()
+        query_counter.clear()
+
+        response = client.get(
+            f"/portfolios/{portfolio.id}/valuation/history",
+            params={"from_date": START.isoformat(), "to_date": END.isoformat()},
+            headers=headers,
+        )
+
+        assert response.status_code == 200
+        assert response.json()["total_points"] == (END - START).days + 1
+        assert len(query_counter) <= MAX_HISTORY_QUERIES, query_counter
+
+    def test_analytics_query_count(self, client, test_db, query_counter):
+        portfolio, headers = _seed_portfolio(test_db)
+        test_db.expire_all()
+        query_counter.clear()
+
+        response = client.get(
+            f"/portfolios/{portfolio.id}/analytics",
+            params={"from_date": START.isoformat(), "to_date": END.isoformat()},
+            headers=headers,
+        )
+
+        assert response.status_code == 200
+        assert len(query_counter) <= MAX_ANALYTICS_QUERIES, query_counter
+
+        transaction_loads = [
+            s for s in query_counter
+            if "FROM transactions" in s and "min(transactions.date)" not in s
+        ]
+        assert len(transaction_loads) == 1
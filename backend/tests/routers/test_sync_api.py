@@ -3,11 +3,14 @@
 API layer tests for market data sync endpoints.
 
 Tests:
-- POST /portfolios/{id}/sync - Sync portfolio market data
+- POST /portfolios/{id}/sync - Queue portfolio market data sync
+- GET /portfolios/{id}/sync/jobs/{job_id} - Get sync job
 - GET /portfolios/{id}/sync/status - Get sync status
+- POST /portfolios/{id}/sync/full - Queue full re-sync
 
 These tests verify the HTTP layer using FastAPI's TestClient with
-mocked sync service to avoid actual Yahoo Finance calls.
+mocked sync service to avoid actual Yahoo Finance calls. Queued jobs
+are run in-process with SyncJobQueue.run_job() to simulate a worker.
 """
 
 import os
@@ -21,14 +24,15 @@ os.environ.setdefault("APP_NAME", "Test App")
 os.environ.setdefault("JWT_SECRET_KEY", "test-secret-key-at-least-32-chars-long")
 
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, select
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.main import app
 from app.database import get_db
-from app.models import Base, User, Portfolio, SyncStatus, SyncStatusEnum
+from app.models import Base, User, Portfolio, SyncJob, SyncStatus, SyncStatusEnum
 from app.services.auth.jwt_handler import JWTHandler
+from app.services.market_data.job_queue import SyncJobQueue
 from app.services.market_data.sync_service import SyncResult
 from app.dependencies import get_sync_service
 
@@ -141,6 +145,15 @@ def get_auth_headers(user: User) -> dict[str, str]:
     return {"Authorization": f"Bearer {token}"}
 
 
+def run_worker_once(db: Session, sync_service) -> SyncJob | None:
+    """Claim and run one queued job, as app.worker would."""
+    queue = SyncJobQueue()
+    job = queue.claim_next(db, "test-worker")
+    if job is None:
+        return None
+    return queue.run_job(db, job, sync_service)
+
+
 # =============================================================================
 # TEST: POST /portfolios/{id}/sync
 # =============================================================================
@@ -148,25 +161,50 @@ def get_auth_headers(user: User) -> dict[str, str]:
 class TestSyncPortfolio:
     """Tests for POST /portfolios/{id}/sync endpoint."""
 
-    def test_sync_portfolio_success(self, client: TestClient, test_db: Session, mock_sync_service):
-        """Should sync portfolio and return success response."""
+    def test_sync_portfolio_queues_job(self, client: TestClient, test_db: Session, mock_sync_service):
+        """Should queue a job and return 202 without running the sync."""
         user = seed_user(test_db)
         portfolio = seed_portfolio(test_db, user)
         headers = get_auth_headers(user)
 
         response = client.post(f"/portfolios/{portfolio.id}/sync", headers=headers)
 
-        assert response.status_code == 200
+        assert response.status_code == 202
         data = response.json()
-        assert data["success"] is True
+        assert data["job_id"] > 0
         assert data["portfolio_id"] == portfolio.id
-        assert data["status"] == "completed"
-        assert data["assets_synced"] == 3
-        assert data["prices_fetched"] == 750
-        mock_sync_service.sync_portfolio.assert_called_once()
+        assert data["job_type"] == "SYNC"
+        assert data["status"] == "QUEUED"
+        assert data["result"] is None
+        assert data["status_url"] == f"/portfolios/{portfolio.id}/sync/jobs/{data['job_id']}"
+        mock_sync_service.sync_portfolio.assert_not_called()
+
+    def test_sync_portfolio_marks_status_pending(self, client: TestClient, test_db: Session):
+        """Queued sync should be visible as PENDING in sync status."""
+        user = seed_user(test_db)
+        portfolio = seed_portfolio(test_db, user)
+        headers = get_auth_headers(user)
+
+        client.post(f"/portfolios/{portfolio.id}/sync", headers=headers)
+        response = client.get(f"/portfolios/{portfolio.id}/sync/status", headers=headers)
+
+        data = response.json()
+        assert data["status"] == "PENDING"
+        assert data["latest_job"]["status"] == "QUEUED"
+
+    def test_sync_portfolio_coalesces_requests(self, client: TestClient, test_db: Session):
+        """Repeated requests while a job is waiting should return the same job."""
+        user = seed_user(test_db)
+        portfolio = seed_portfolio(test_db, user)
+        headers = get_auth_headers(user)
+
+        first = client.post(f"/portfolios/{portfolio.id}/sync", headers=headers).json()
+        second = client.post(f"/portfolios/{portfolio.id}/sync", headers=headers).json()
+
+        assert second["job_id"] == first["job_id"]
 
     def test_sync_portfolio_with_force_refresh(self, client: TestClient, test_db: Session, mock_sync_service):
-        """Should pass force_refresh flag to service."""
+        """Should pass force_refresh flag through the job to the service."""
         user = seed_user(test_db)
         portfolio = seed_portfolio(test_db, user)
         headers = get_auth_headers(user)
@@ -177,12 +215,37 @@ class TestSyncPortfolio:
             headers=headers
         )
 
-        assert response.status_code == 200
+        assert response.status_code == 202
+        assert response.json()["force"] is True
+
+        run_worker_once(test_db, mock_sync_service)
+
         call_kwargs = mock_sync_service.sync_portfolio.call_args.kwargs
         assert call_kwargs["force"] is True
 
-    def test_sync_portfolio_partial_success(self, client: TestClient, test_db: Session, mock_sync_service):
-        """Should return partial success when some assets fail."""
+    def test_sync_job_reports_result(self, client: TestClient, test_db: Session, mock_sync_service):
+        """Job endpoint should expose sync statistics once the worker is done."""
+        user = seed_user(test_db)
+        portfolio = seed_portfolio(test_db, user)
+        headers = get_auth_headers(user)
+
+        job = client.post(f"/portfolios/{portfolio.id}/sync", headers=headers).json()
+        run_worker_once(test_db, mock_sync_service)
+
+        response = client.get(job["status_url"], headers=headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "SUCCEEDED"
+        assert data["attempts"] == 1
+        assert data["finished_at"] is not None
+        assert data["result"]["success"] is True
+        assert data["result"]["status"] == "completed"
+        assert data["result"]["assets_synced"] == 3
+        assert data["result"]["prices_fetched"] == 750
+
+    def test_sync_job_partial_success(self, client: TestClient, test_db: Session, mock_sync_service):
+        """Should report partial success when some assets fail."""
         user = seed_user(test_db)
         portfolio = seed_portfolio(test_db, user)
         headers = get_auth_headers(user)
@@ -201,14 +264,38 @@ class TestSyncPortfolio:
             error=None,
         )
 
-        response = client.post(f"/portfolios/{portfolio.id}/sync", headers=headers)
+        job = client.post(f"/portfolios/{portfolio.id}/sync", headers=headers).json()
+        run_worker_once(test_db, mock_sync_service)
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["success"] is True  # partial is still success
-        assert data["status"] == "partial"
-        assert data["assets_failed"] == 1
-        assert len(data["warnings"]) == 1
+        data = client.get(job["status_url"], headers=headers).json()
+        assert data["status"] == "SUCCEEDED"
+        assert data["result"]["success"] is True  # partial is still success
+        assert data["result"]["status"] == "partial"
+        assert data["result"]["assets_failed"] == 1
+        assert len(data["result"]["warnings"]) == 1
+
+    def test_sync_job_not_found(self, client: TestClient, test_db: Session):
+        """Should return 404 for an unknown job."""
+        user = seed_user(test_db)
+        portfolio = seed_portfolio(test_db, user)
+        headers = get_auth_headers(user)
+
+        response = client.get(f"/portfolios/{portfolio.id}/sync/jobs/99999", headers=headers)
+
+        assert response.status_code == 404
+
+    def test_sync_job_scoped_to_portfolio(self, client: TestClient, test_db: Session):
+        """A job should not be readable through another portfolio's URL."""
+        user = seed_user(test_db)
+        portfolio = seed_portfolio(test_db, user)
+        other = seed_portfolio(test_db, user, name="Other")
+        headers = get_auth_headers(user)
+
+        job = client.post(f"/portfolios/{portfolio.id}/sync", headers=headers).json()
+
+        response = client.get(f"/portfolios/{other.id}/sync/jobs/{job['job_id']}", headers=headers)
+
+        assert response.status_code == 404
 
     def test_sync_portfolio_requires_auth(self, client: TestClient, test_db: Session):
         """Should return 401 when not authenticated."""
@@ -336,3 +423,61 @@ class TestGetSyncStatus:
         response = client.get(f"/portfolios/{portfolio.id}/sync/status", headers=headers)
 
         assert response.status_code == 403
+
+
+# =============================================================================
+# TEST: POST /portfolios/{id}/sync/full
+# =============================================================================
+
+class TestFullResync:
+    """Tests for POST /portfolios/{id}/sync/full endpoint."""
+
+    def test_full_resync_queues_forced_job(self, client: TestClient, test_db: Session, mock_sync_service):
+        """Should queue a FULL_RESYNC job that forces a re-fetch."""
+        user = seed_user(test_db)
+        portfolio = seed_portfolio(test_db, user)
+        headers = get_auth_headers(user)
+
+        response = client.post(f"/portfolios/{portfolio.id}/sync/full", headers=headers)
+
+        assert response.status_code == 202
+        data = response.json()
+        assert data["job_type"] == "FULL_RESYNC"
+        assert data["force"] is True
+
+        run_worker_once(test_db, mock_sync_service)
+
+        assert mock_sync_service.sync_portfolio.call_args.kwargs["force"] is True
+        sync_status = test_db.scalar(
+            select(SyncStatus).where(SyncStatus.portfolio_id == portfolio.id)
+        )
+        assert sync_status.last_full_sync is not None
+
+    def test_full_resync_cooldown(self, client: TestClient, test_db: Session):
+        """Should return 429 within an hour of the last full re-sync."""
+        user = seed_user(test_db)
+        portfolio = seed_portfolio(test_db, user)
+        headers = get_auth_headers(user)
+
+        test_db.add(SyncStatus(
+            portfolio_id=portfolio.id,
+            status=SyncStatusEnum.COMPLETED,
+            last_full_sync=datetime.now(timezone.utc) - timedelta(minutes=10),
+        ))
+        test_db.commit()
+
+        response = client.post(f"/portfolios/{portfolio.id}/sync/full", headers=headers)
+
+        assert response.status_code == 429
+        assert test_db.scalar(select(SyncJob)) is None
+
+    def test_full_resync_forbidden(self, client: TestClient, test_db: Session):
+        """Should return 403 when user doesn't own portfolio."""
+        user1 = seed_user(test_db, email="user1@example.com")
+        user2 = seed_user(test_db, email="user2@example.com")
+        portfolio = seed_portfolio(test_db, user1)
+        headers = get_auth_headers(user2)
+
+        response = client.post(f"/portfolios/{portfolio.id}/sync/full", headers=headers)
+
+        assert response.status_code == 403
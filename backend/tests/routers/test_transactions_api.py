@@ -45,6 +45,7 @@ from app.models import (
     Transaction,
     TransactionType,
 )
+from app.schemas.pagination import encode_keyset_cursor
 
 
 # =============================================================================
@@ -501,6 +502,77 @@ class TestCreateTransaction:
         assert response.status_code == 401
 
 
+# =============================================================================
+# TEST: POST /transactions/batch (Batch create)
+# =============================================================================
+
+class TestCreateTransactionsBatch:
+    """Tests for SELL validation in POST /transactions/batch."""
+
+    @staticmethod
+    def _txn(portfolio_id: int, transaction_type: str, date: str, quantity: str) -> dict:
+        return {
+            "portfolio_id": portfolio_id,
+            "ticker": "AAPL",
+            "exchange": "NASDAQ",
+            "transaction_type": transaction_type,
+            "date": date,
+            "quantity": quantity,
+            "price_per_share": "100",
+            "currency": "USD",
+        }
+
+    def test_batch_oversell_reports_original_index(self, client: TestClient, test_db: Session):
+        """Should replay the batch in date order and report the failing SELL by its index."""
+        user = seed_user(test_db)
+        headers = get_auth_headers(user)
+        portfolio = seed_portfolio(test_db, user, currency="USD")
+        seed_asset(test_db, "AAPL", "NASDAQ", "USD")
+
+        response = client.post(
+            "/transactions/batch",
+            json=[
+                self._txn(portfolio.id, "SELL", "2024-03-01T10:00:00Z", "8"),
+                self._txn(portfolio.id, "BUY", "2024-01-01T10:00:00Z", "10"),
+                self._txn(portfolio.id, "SELL", "2024-04-01T10:00:00Z", "5"),
+            ],
+            headers=headers,
+        )
+
+        assert response.status_code == 400
+        errors = response.json()["errors"]
+        assert [(e["index"], e["error_type"]) for e in errors] == [(2, "insufficient_quantity")]
+        assert "Only 2 shares available as of 2024-04-01" in errors[0]["message"]
+        assert test_db.query(Transaction).count() == 0
+
+    def test_backdated_sell_conflicting_with_recorded_sell(self, client: TestClient, test_db: Session):
+        """Should reject a SELL that leaves a later recorded SELL short."""
+        user = seed_user(test_db)
+        headers = get_auth_headers(user)
+        portfolio = seed_portfolio(test_db, user, currency="USD")
+        seed_asset(test_db, "AAPL", "NASDAQ", "USD")
+        recorded = client.post(
+            "/transactions/batch",
+            json=[
+                self._txn(portfolio.id, "BUY", "2024-01-01T10:00:00Z", "10"),
+                self._txn(portfolio.id, "SELL", "2024-06-01T10:00:00Z", "8"),
+            ],
+            headers=headers,
+        )
+        assert recorded.status_code == 201
+
+        response = client.post(
+            "/transactions/batch",
+            json=[self._txn(portfolio.id, "SELL", "2024-03-01T10:00:00Z", "5")],
+            headers=headers,
+        )
+
+        assert response.status_code == 400
+        error = response.json()["errors"][0]
+        assert error["index"] == 0
+        assert "already recorded on 2024-06-01" in error["message"]
+
+
 # =============================================================================
 # TEST: GET /transactions/ (List)
 # =============================================================================
@@ -643,6 +715,67 @@ class TestListTransactions:
         assert data["pagination"]["has_next"] is False
         assert data["pagination"]["has_previous"] is True
 
+    def test_list_transactions_cursor_pagination(self, client: TestClient, test_db: Session):
+        """Should walk all pages with next_cursor, newest first, without overlap."""
+        user = seed_user(test_db)
+        headers = get_auth_headers(user)
+        portfolio = seed_portfolio(test_db, user)
+        asset = seed_asset(test_db)
+        created = [seed_transaction(test_db, portfolio, asset) for _ in range(7)]
+
+        seen: list[int] = []
+        params: dict = {"limit": 3}
+        while True:
+            response = client.get("/transactions/", params=params, headers=headers)
+            assert response.status_code == 200
+            pagination = response.json()["pagination"]
+            seen += [item["id"] for item in response.json()["items"]]
+            assert pagination["total"] == 7
+            if pagination["next_cursor"] is None:
+                assert pagination["has_next"] is False
+                break
+            assert pagination["has_next"] is True
+            params = {"limit": 3, "cursor": pagination["next_cursor"]}
+
+        assert seen == [t.id for t in reversed(created)]
+
+    def test_list_transactions_only_own_portfolios(self, client: TestClient, test_db: Session):
+        """Should not include other users' transactions."""
+        user = seed_user(test_db)
+        other = seed_user(test_db, email="other@example.com")
+        asset = seed_asset(test_db)
+        seed_transaction(test_db, seed_portfolio(test_db, user), asset)
+        seed_transaction(test_db, seed_portfolio(test_db, other), asset)
+
+        response = client.get("/transactions/", headers=get_auth_headers(user))
+
+        assert response.json()["pagination"]["total"] == 1
+
+    def test_list_transactions_invalid_cursor(self, client: TestClient, test_db: Session):
+        """Should return 400 for a malformed cursor or cursor combined with skip."""
+        user = seed_user(test_db)
+        headers = get_auth_headers(user)
+
+        response = client.get("/transactions/", params={"cursor": "not-a-cursor"}, headers=headers)
+        assert response.status_code == 400
+
+        cursor = encode_keyset_cursor(datetime(2024, 1, 1), 1)
+        response = client.get("/transactions/", params={"cursor": cursor, "skip": 10}, headers=headers)
+        assert response.status_code == 400
+
+    def test_list_transactions_estimate_total_falls_back_to_exact(
+            self, client: TestClient, test_db: Session
+    ):
+        """Without planner estimates (SQLite) the exact count is returned."""
+        user = seed_user(test_db)
+        headers = get_auth_headers(user)
+        seed_transaction(test_db, seed_portfolio(test_db, user), seed_asset(test_db))
+
+        response = client.get("/transactions/", params={"estimate_total": True}, headers=headers)
+
+        assert response.json()["pagination"]["total"] == 1
+        assert response.json()["pagination"]["total_is_estimate"] is False
+
     def test_list_transactions_requires_auth(self, client: TestClient):
         """Should return 401 if not authenticated."""
         response = client.get("/transactions/")
@@ -904,3 +1037,35 @@ class TestTransactionCRUDFlow:
         # Verify deleted
         final_response = client.get(f"/transactions/{txn_id}", headers=headers)
         assert final_response.status_code == 404
+
+    def test_sell_validation_follows_updates_and_deletes(self, client: TestClient, test_db: Session):
+        """Available quantity reflects edited and deleted BUYs (position ledger)."""
+        user = seed_user(test_db)
+        headers = get_auth_headers(user)
+        portfolio = seed_portfolio(test_db, user, currency="USD")
+        seed_asset(test_db, "META", "NASDAQ", "USD")
+
+        def post(transaction_type: str, quantity: str, day: str):
+            return client.post(
+                "/transactions/",
+                json={
+                    "portfolio_id": portfolio.id,
+                    "ticker": "META",
+                    "exchange": "NASDAQ",
+                    "transaction_type": transaction_type,
+                    "date": f"{day}T10:00:00Z",
+                    "quantity": quantity,
+                    "price_per_share": "500",
+                    "currency": "USD",
+                },
+                headers=headers,
+            )
+
+        first = post("BUY", "10", "2024-06-01").json()["id"]
+        second = post("BUY", "10", "2024-07-01").json()["id"]
+
+        client.patch(f"/transactions/{first}", json={"quantity": "4"}, headers=headers)
+        client.delete(f"/transactions/{second}", headers=headers)
+
+        assert post("SELL", "5", "2024-08-01").status_code == 400
+        assert post("SELL", "4", "2024-08-01").status_code == 201
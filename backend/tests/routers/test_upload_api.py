@@ -5,6 +5,7 @@ API layer tests for file upload endpoints.
 Tests:
 - GET /upload/formats - List supported file formats
 - POST /upload/transactions - Upload transactions from file
+- POST /upload/transactions/jobs, GET /upload/jobs/{id} - Background uploads
 
 These tests verify the HTTP layer using FastAPI's TestClient with
 mocked upload service to avoid actual Yahoo Finance calls.
@@ -27,9 +28,11 @@ from sqlalchemy.pool import StaticPool
 
 from app.main import app
 from app.database import get_db
-from app.models import Base, User, Portfolio
+from app.models import Base, User, Portfolio, UploadJob, UploadJobStatus
 from app.services.auth.jwt_handler import JWTHandler
-from app.services.upload.service import UploadResult, UploadError
+from app.services.upload.job_queue import UploadJobQueue
+from app.services.upload.parsers import DateFormat
+from app.services.upload.service import UploadProgress, UploadResult, UploadError
 from app.routers.upload import get_upload_service
 
 
@@ -358,3 +361,131 @@ class TestUploadTransactions:
 
             assert response.status_code == 413
             assert "too large" in response.json()["message"].lower()
+
+
+# =============================================================================
+# TEST: BACKGROUND UPLOADS
+# =============================================================================
+
+def run_upload_worker_once(db: Session, upload_service) -> UploadJob | None:
+    """Claim and run one queued upload job, as app.worker would."""
+    queue = UploadJobQueue()
+    job = queue.claim_next(db, "test-worker")
+    if job is None:
+        return None
+    return queue.run_job(db, job, upload_service)
+
+
+class TestUploadJobs:
+    """Tests for POST /upload/transactions/jobs and GET /upload/jobs/{id}."""
+
+    def _queue(self, client: TestClient, portfolio: Portfolio, headers: dict[str, str]) -> dict:
+        response = client.post(
+            f"/upload/transactions/jobs?portfolio_id={portfolio.id}&date_format=ISO",
+            files={"file": ("transactions.csv", create_csv_file(), "text/csv")},
+            headers=headers,
+        )
+        assert response.status_code == 202
+        return response.json()
+
+    def test_queues_without_processing(self, client: TestClient, test_db: Session, mock_upload_service):
+        """Should store the file and return 202 with a QUEUED job."""
+        user = seed_user(test_db)
+        portfolio = seed_portfolio(test_db, user)
+
+        data = self._queue(client, portfolio, get_auth_headers(user))
+
+        assert data["status"] == "QUEUED"
+        assert data["status_url"] == f"/upload/jobs/{data['job_id']}"
+        mock_upload_service.process_file.assert_not_called()
+        job = test_db.get(UploadJob, data["job_id"])
+        assert job.content == create_csv_file().getvalue()
+
+    def test_worker_runs_job_and_reports_progress(self, client: TestClient, test_db: Session):
+        """Progress is visible while the job runs; the result once it finished."""
+        user = seed_user(test_db)
+        portfolio = seed_portfolio(test_db, user)
+        headers = get_auth_headers(user)
+        job_id = self._queue(client, portfolio, headers)["job_id"]
+        seen_while_running = {}
+
+        def process_file(db, file, filename, portfolio_id, content_type, date_format, progress):
+            assert file.read() == create_csv_file().getvalue()
+            result = UploadResult(filename=filename, total_rows=2)
+            result.add_error(3, "validation", "invalid_quantity", "Quantity must be positive", "quantity")
+            progress(UploadProgress(stage="parsing", rows_parsed=2, rows_validated=1, result=result))
+            seen_while_running.update(client.get(f"/upload/jobs/{job_id}", headers=headers).json())
+            return result
+
+        service = MagicMock()
+        service.process_file.side_effect = process_file
+        run_upload_worker_once(test_db, service)
+
+        assert seen_while_running["status"] == "RUNNING"
+        assert seen_while_running["total_rows"] == 2
+        assert seen_while_running["rows_validated"] == 1
+        assert seen_while_running["errors"][0]["error_type"] == "invalid_quantity"
+
+        data = client.get(f"/upload/jobs/{job_id}", headers=headers).json()
+        assert data["status"] == "FAILED"
+        assert data["error_count"] == 1
+        assert test_db.get(UploadJob, job_id).content is None
+
+    def test_successful_job(self, client: TestClient, test_db: Session, mock_upload_service):
+        """A successful upload reports the created transactions."""
+        user = seed_user(test_db)
+        portfolio = seed_portfolio(test_db, user)
+        headers = get_auth_headers(user)
+        job_id = self._queue(client, portfolio, headers)["job_id"]
+
+        run_upload_worker_once(test_db, mock_upload_service)
+
+        data = client.get(f"/upload/jobs/{job_id}", headers=headers).json()
+        assert data["status"] == "SUCCEEDED"
+        assert data["rows_inserted"] == 5
+        assert data["created_transaction_ids"] == [1, 2, 3, 4, 5]
+        test_db.refresh(portfolio)
+        assert portfolio.data_version == 1  # Analytics caches in API processes go stale
+
+    def test_get_job_forbidden_and_not_found(self, client: TestClient, test_db: Session):
+        """Only the portfolio owner can read a job."""
+        owner = seed_user(test_db)
+        other = seed_user(test_db, email="other@example.com")
+        portfolio = seed_portfolio(test_db, owner)
+        job_id = self._queue(client, portfolio, get_auth_headers(owner))["job_id"]
+
+        assert client.get(f"/upload/jobs/{job_id}", headers=get_auth_headers(other)).status_code == 403
+        assert client.get("/upload/jobs/99999", headers=get_auth_headers(owner)).status_code == 404
+
+    def test_orphaned_job_fails_instead_of_rerunning(self, test_db: Session):
+        """A job whose worker died is failed, never processed a second time."""
+        from datetime import datetime, timedelta, timezone
+
+        user = seed_user(test_db)
+        portfolio = seed_portfolio(test_db, user)
+        queue = UploadJobQueue()
+        queue.enqueue(test_db, portfolio.id, create_csv_file(), "t.csv", "text/csv", DateFormat.ISO)
+        job = queue.claim_next(test_db, "dead-worker")
+
+        assert queue.fail_stale(test_db, now=datetime.now(timezone.utc) + timedelta(days=1)) == 1
+        test_db.refresh(job)
+        assert job.status == UploadJobStatus.FAILED
+        assert queue.claim_next(test_db, "test-worker") is None
+
+    def test_job_reporting_progress_is_not_failed(self, test_db: Session):
+        """A long upload is judged on its last progress report, not its start."""
+        from datetime import datetime, timedelta, timezone
+
+        user = seed_user(test_db)
+        portfolio = seed_portfolio(test_db, user)
+        queue = UploadJobQueue()
+        queue.enqueue(test_db, portfolio.id, create_csv_file(), "t.csv", "text/csv", DateFormat.ISO)
+        job = queue.claim_next(test_db, "busy-worker")
+        job.started_at = datetime.now(timezone.utc) - timedelta(days=1)
+        test_db.commit()
+
+        queue._report_progress(test_db, job.id, UploadProgress(stage="inserting", rows_parsed=2))
+
+        assert queue.fail_stale(test_db) == 0
+        test_db.refresh(job)
+        assert job.status == UploadJobStatus.RUNNING
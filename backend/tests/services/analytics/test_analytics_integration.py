@@ -43,6 +43,8 @@ from app.models import (
     TransactionType,
     MarketData,
     ExchangeRate,
+    SyncStatus,
+    SyncStatusEnum,
 )
 from app.services.analytics import AnalyticsService, BenchmarkNotSyncedError
 from app.services.fx_rate_service import FXRateService
@@ -836,6 +838,101 @@ class TestAnalyticsCaching:
 
         assert result is not None
 
+    def test_cache_refreshed_after_sync_completes(
+            self, db: Session, analytics_service: AnalyticsService
+    ):
+        """A sync finished by another process should make cached results stale."""
+        # Arrange
+        user = create_user(db)
+        portfolio = create_portfolio(db, user, currency="USD")
+        asset = create_asset(db, "NFLX", "NASDAQ", "USD")
+
+        create_transaction(
+            db, portfolio, asset,
+            TransactionType.BUY,
+            date(2024, 1, 1),
+            Decimal("10"),
+            Decimal("100"),
+            "USD",
+        )
+        create_market_data(db, asset, date(2024, 1, 1), Decimal("100"))
+        create_market_data(db, asset, date(2024, 1, 31), Decimal("110"))
+
+        result1 = analytics_service.get_analytics(
+            db=db,
+            portfolio_id=portfolio.id,
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 31),
+        )
+
+        # Act - Worker stores new prices and completes a sync (no invalidate call)
+        create_market_data(db, asset, date(2024, 1, 15), Decimal("130"))
+        db.add(SyncStatus(
+            portfolio_id=portfolio.id,
+            status=SyncStatusEnum.COMPLETED,
+            last_sync_completed=datetime(2024, 2, 1, 12, 0),
+        ))
+        db.commit()
+
+        result2 = analytics_service.get_analytics(
+            db=db,
+            portfolio_id=portfolio.id,
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 31),
+        )
+
+        # Assert - Recomputed, not served from cache
+        assert result2 is not result1
+
+    def test_cache_refreshed_after_background_upload(
+            self, db: Session, analytics_service: AnalyticsService
+    ):
+        """Transactions imported by the upload worker should make cached results stale."""
+        # Arrange
+        user = create_user(db)
+        portfolio = create_portfolio(db, user, currency="USD")
+        asset = create_asset(db, "NFLX", "NASDAQ", "USD")
+
+        create_transaction(
+            db, portfolio, asset,
+            TransactionType.BUY,
+            date(2024, 1, 1),
+            Decimal("10"),
+            Decimal("100"),
+            "USD",
+        )
+        create_market_data(db, asset, date(2024, 1, 1), Decimal("100"))
+        create_market_data(db, asset, date(2024, 1, 31), Decimal("110"))
+
+        result1 = analytics_service.get_analytics(
+            db=db,
+            portfolio_id=portfolio.id,
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 31),
+        )
+
+        # Act - Worker commits an upload and bumps the version (no invalidate call)
+        create_transaction(
+            db, portfolio, asset,
+            TransactionType.BUY,
+            date(2024, 1, 15),
+            Decimal("5"),
+            Decimal("105"),
+            "USD",
+        )
+        portfolio.data_version += 1
+        db.commit()
+
+        result2 = analytics_service.get_analytics(
+            db=db,
+            portfolio_id=portfolio.id,
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 31),
+        )
+
+        # Assert - Recomputed, not served from cache
+        assert result2 is not result1
+
 
 # =============================================================================
 # TEST 9: MULTIPLE LIQUIDATION GAPS (GIPS-COMPLIANT HANDLING)
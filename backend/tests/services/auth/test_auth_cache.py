@@ -0,0 +1,143 @@
+# tests/services/auth/test_auth_cache.py
+"""
+Tests for the auth cache.
+
+Covers:
+- Cached users and portfolios attached to a session without a query
+- Password hashes never cached, loaded on access
+- Invalidation on ORM updates and deletes (deactivation, password change,
+  portfolio delete) and on explicit invalidate_user
+- TTL expiry and hit / miss statistics
+"""
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models import Portfolio, User
+from app.services.auth.auth_cache import AuthCache
+from tests.conftest import create_portfolio, create_user
+
+
+def _new_session(db: Session) -> Session:
+    return sessionmaker(bind=db.get_bind())()
+
+
+def _count_queries(db: Session) -> list[str]:
+    statements = []
+    event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+
+class TestAuthCacheHits:
+    """Tests for get_user() / get_portfolio() hits and misses."""
+
+    def test_hit_runs_no_query(self, db):
+        cache = AuthCache()
+        user = create_user(db, full_name="Jane Doe")
+        portfolio = create_portfolio(db, user, currency="USD")
+        cache.put_user(user)
+        cache.put_portfolio(portfolio)
+
+        other = _new_session(db)
+        statements = _count_queries(db)
+        cached_user = cache.get_user(other, user.id)
+        cached_portfolio = cache.get_portfolio(other, portfolio.id)
+
+        assert statements == []
+        assert isinstance(cached_user, User)
+        assert cached_user.full_name == "Jane Doe"
+        assert cached_user in other
+        assert (cached_portfolio.user_id, cached_portfolio.currency) == (user.id, "USD")
+        other.close()
+
+    def test_password_hash_not_cached(self, db):
+        cache = AuthCache()
+        user = create_user(db, hashed_password="secret-hash")
+        cache.put_user(user)
+
+        other = _new_session(db)
+        cached = cache.get_user(other, user.id)
+
+        assert "hashed_password" not in cached.__dict__
+        assert cached.hashed_password == "secret-hash"  # Loaded on access
+        other.close()
+
+    def test_miss_and_stats(self, db):
+        cache = AuthCache()
+        user = create_user(db)
+        cache.put_user(user)
+
+        assert cache.get_user(db, user.id) is not None
+        assert cache.get_user(db, 999) is None
+        assert cache.get_portfolio(db, 1) is None
+
+        stats = cache.stats
+        assert (stats.user_hits, stats.user_misses, stats.users_cached) == (1, 1, 1)
+        assert stats.user_hit_rate == 0.5
+        assert stats.portfolio_hit_rate == 0.0
+
+    def test_ttl_expiry(self, db):
+        cache = AuthCache(ttl_seconds=-1)
+        user = create_user(db)
+        cache.put_user(user)
+
+        assert cache.get_user(db, user.id) is None
+
+
+class TestAuthCacheInvalidation:
+    """Tests for invalidation through ORM events and explicit calls."""
+
+    def test_deactivation_and_password_change(self, db):
+        cache = AuthCache()
+        user = create_user(db)
+        cache.put_user(user)
+
+        user.is_active = False
+        db.commit()
+        assert cache.get_user(db, user.id) is None
+
+        cache.put_user(user)
+        user.hashed_password = "new-hash"
+        db.commit()
+        assert cache.get_user(db, user.id) is None
+
+    def test_recached_before_commit_is_dropped(self, db):
+        cache = AuthCache()
+        user = create_user(db)
+
+        user.is_active = False
+        db.flush()
+        cache.put_user(user)  # e.g. a concurrent request between flush and commit
+        db.commit()
+
+        assert cache.get_user(db, user.id) is None
+
+    def test_portfolio_delete(self, db):
+        cache = AuthCache()
+        user = create_user(db)
+        portfolio = create_portfolio(db, user)
+        cache.put_portfolio(portfolio)
+
+        db.delete(portfolio)
+        db.commit()
+
+        assert cache.get_portfolio(db, portfolio.id) is None
+        assert db.get(Portfolio, portfolio.id) is None
+
+    def test_invalidate_user_drops_their_portfolios(self, db):
+        cache = AuthCache()
+        user = create_user(db)
+        other_user = create_user(db, email="other@example.com")
+        portfolio = create_portfolio(db, user)
+        other_portfolio = create_portfolio(db, other_user)
+        for instance in (user, other_user):
+            cache.put_user(instance)
+        for instance in (portfolio, other_portfolio):
+            cache.put_portfolio(instance)
+
+        cache.invalidate_user(user.id)
+
+        assert cache.get_user(db, user.id) is None
+        assert cache.get_portfolio(db, portfolio.id) is None
+        assert cache.get_user(db, other_user.id) is not None
+        assert cache.get_portfolio(db, other_portfolio.id) is not None
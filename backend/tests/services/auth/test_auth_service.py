@@ -9,9 +9,11 @@ Tests:
 - Logout (single and all sessions)
 - Email verification
 - Password reset
+- Async variants running bcrypt on the password pool
 - Replay attack detection
 """
 
+import asyncio
 import os
 from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
@@ -563,6 +565,73 @@ class TestPasswordReset:
                 auth_service.refresh_tokens(db=db, refresh_token=token.refresh_token)
 
 
+# =============================================================================
+# TEST: ASYNC VARIANTS
+# =============================================================================
+
+
+class TestAsyncPasswordMethods:
+    """Tests for register_async / login_async / reset_password_async."""
+
+    def test_register_and_login(self, db: Session, auth_service: AuthService):
+        """Async register and login should hash and verify on the pool."""
+        user = asyncio.run(auth_service.register_async(
+            db=db, email="New@Example.com", password="password123",
+        ))
+        user.is_email_verified = True
+        db.commit()
+
+        tokens = asyncio.run(auth_service.login_async(
+            db=db, email="new@example.com", password="password123",
+        ))
+
+        assert user.email == "new@example.com"
+        assert PasswordService.verify_password("password123", user.hashed_password)
+        assert tokens.access_token is not None
+        assert auth_service._password_pool.stats.completed == 2
+
+    def test_login_errors(self, db: Session, auth_service: AuthService):
+        """Async login should raise the same errors as login()."""
+        create_verified_user(db, email="test@example.com", password="password123")
+        create_unverified_user(db, email="unverified@example.com", password="password123")
+
+        with pytest.raises(InvalidCredentialsError):
+            asyncio.run(auth_service.login_async(db=db, email="test@example.com", password="wrong"))
+        with pytest.raises(InvalidCredentialsError):
+            asyncio.run(auth_service.login_async(db=db, email="nobody@example.com", password="x"))
+        with pytest.raises(EmailNotVerifiedError):
+            asyncio.run(auth_service.login_async(
+                db=db, email="unverified@example.com", password="password123",
+            ))
+
+    def test_register_existing_email_skips_hashing(
+        self, db: Session, auth_service: AuthService
+    ):
+        """Duplicate registration should fail before any bcrypt work."""
+        create_verified_user(db, email="test@example.com")
+
+        with pytest.raises(UserExistsError):
+            asyncio.run(auth_service.register_async(
+                db=db, email="test@example.com", password="password123",
+            ))
+
+        assert auth_service._password_pool.stats.completed == 0
+
+    def test_reset_password(self, db: Session, auth_service: AuthService):
+        """Async reset should store the new hash and revoke sessions."""
+        user = create_verified_user(db, password="oldpassword")
+        tokens = auth_service.login(db=db, email=user.email, password="oldpassword")
+        auth_service._email_service.validate_password_reset_token.return_value = user.email
+
+        asyncio.run(auth_service.reset_password_async(
+            db=db, token="valid-token", new_password="newpassword123",
+        ))
+
+        assert PasswordService.verify_password("newpassword123", user.hashed_password)
+        with pytest.raises((TokenRevokedError, InvalidCredentialsError)):
+            auth_service.refresh_tokens(db=db, refresh_token=tokens.refresh_token)
+
+
 # =============================================================================
 # TEST: USER LOOKUP
 # =============================================================================
@@ -0,0 +1,95 @@
+# tests/services/auth/test_password_pool.py
+"""
+Tests for the password hashing pool.
+
+Tests:
+- Hash / verify round trip through the pool
+- Worker cap and queue depth accounting
+- Cancelled operations leaving the queue
+"""
+
+import asyncio
+import threading
+from unittest.mock import patch
+
+from app.services.auth.password import PasswordService
+from app.services.auth.password_pool import PasswordHashingPool
+
+
+class TestPasswordHashingPool:
+    """Tests for PasswordHashingPool."""
+
+    def test_hash_and_verify(self):
+        """Pool results should match PasswordService."""
+        pool = PasswordHashingPool(max_workers=2)
+
+        async def run():
+            hashed = await pool.hash_password("mypassword123")
+            return (
+                hashed,
+                await pool.verify_password("mypassword123", hashed),
+                await pool.verify_password("wrongpassword", hashed),
+            )
+
+        hashed, valid, invalid = asyncio.run(run())
+        pool.close()
+
+        assert PasswordService.verify_password("mypassword123", hashed)
+        assert (valid, invalid) == (True, False)
+        assert pool.stats.completed == 3
+        assert (pool.stats.queued, pool.stats.active) == (0, 0)
+
+    def test_worker_cap_and_queue_depth(self):
+        """Operations beyond max_workers should queue, not run concurrently."""
+        pool = PasswordHashingPool(max_workers=1)
+        release = threading.Event()
+        started = threading.Event()
+
+        def slow_hash(password: str) -> str:
+            started.set()
+            release.wait(timeout=5)
+            return f"hashed-{password}"
+
+        async def run():
+            with patch.object(PasswordService, "hash_password", side_effect=slow_hash):
+                tasks = [asyncio.create_task(pool.hash_password(str(i))) for i in range(3)]
+                await asyncio.sleep(0)
+                await asyncio.to_thread(started.wait, 5)
+                stats = pool.stats
+                release.set()
+                return stats, await asyncio.gather(*tasks)
+
+        stats, results = asyncio.run(run())
+        pool.close()
+
+        assert (stats.active, stats.queued) == (1, 2)
+        assert stats.peak_queued >= 2
+        assert results == ["hashed-0", "hashed-1", "hashed-2"]
+        assert pool.stats.completed == 3
+
+    def test_cancelled_operation_leaves_queue(self):
+        """A caller cancelled before its turn should not stay counted as queued."""
+        pool = PasswordHashingPool(max_workers=1)
+        release = threading.Event()
+        started = threading.Event()
+
+        def slow_hash(password: str) -> str:
+            started.set()
+            release.wait(timeout=5)
+            return password
+
+        async def run():
+            with patch.object(PasswordService, "hash_password", side_effect=slow_hash):
+                running = asyncio.create_task(pool.hash_password("a"))
+                waiting = asyncio.create_task(pool.hash_password("b"))
+                await asyncio.sleep(0)
+                await asyncio.to_thread(started.wait, 5)
+                waiting.cancel()
+                await asyncio.sleep(0)
+                queued = pool.stats.queued
+                release.set()
+                await running
+                return queued
+
+        assert asyncio.run(run()) == 0
+        pool.close()
@@ -0,0 +1,207 @@
+# backend/tests/services/test_arrow_parser.py
+"""
+Tests for the Parquet / Arrow IPC parser.
+
+Covers:
+- Typed columns (timestamps, decimals) and text columns
+- Parquet, Arrow IPC file and stream formats, chunking
+- Column-wise checks: one error per row, CSV error types
+- Date format detection
+- Upload of a Parquet file through UploadService
+"""
+
+import io
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pyarrow as pa
+import pyarrow.ipc
+import pyarrow.parquet
+import pytest
+from sqlalchemy import select
+
+from app.models import Transaction, TransactionType
+from app.services.asset_resolution import AssetResolutionService
+from app.services.upload import UploadService
+from app.services.upload.parsers import (
+    ArrowTransactionParser,
+    DateDetectionStatus,
+    DateFormat,
+    get_parser,
+)
+from tests.conftest import create_asset, create_portfolio, create_user
+
+DECIMAL = pa.decimal128(38, 8)
+
+
+def _table(rows: int = 3, **overrides) -> "pa.Table":
+    """Typed transactions table, like a Parquet export of this app."""
+    columns = {
+        "date": pa.array([datetime(2024, 1, 1 + i) for i in range(rows)], pa.timestamp("us")),
+        "transaction_type": pa.array(["BUY"] * rows),
+        "ticker": pa.array(["aapl"] * rows),
+        "exchange": pa.array(["NASDAQ"] * rows),
+        "quantity": pa.array([Decimal(i + 1) for i in range(rows)], DECIMAL),
+        "price_per_share": pa.array([Decimal("100.5")] * rows, DECIMAL),
+        "currency": pa.array(["usd"] * rows),
+        "fee": pa.array([Decimal("1")] * rows, DECIMAL),
+    }
+    columns.update(overrides)
+    return pa.table(columns)
+
+
+def _parquet(table: "pa.Table") -> io.BytesIO:
+    buffer = io.BytesIO()
+    pyarrow.parquet.write_table(table, buffer)
+    buffer.seek(0)
+    return buffer
+
+
+def _arrow(table: "pa.Table", stream: bool = False) -> io.BytesIO:
+    buffer = io.BytesIO()
+    open_writer = pyarrow.ipc.new_stream if stream else pyarrow.ipc.new_file
+    with open_writer(buffer, table.schema) as writer:
+        writer.write_table(table)
+    buffer.seek(0)
+    return buffer
+
+
+class TestTypedColumns:
+    """Typed and text columns become typed_rows."""
+
+    def test_parquet_typed_columns(self):
+        result = ArrowTransactionParser().parse(_parquet(_table()), "t.parquet")
+
+        assert result.errors == []
+        assert result.total_rows == result.success_count == 3
+        first = result.typed_rows[0]
+        assert first == {
+            "row_number": 1,
+            "date": datetime(2024, 1, 1, tzinfo=timezone.utc),
+            "transaction_type": "BUY",
+            "ticker": "AAPL",
+            "exchange": "NASDAQ",
+            "quantity": Decimal("1"),
+            "price_per_share": Decimal("100.5"),
+            "currency": "USD",
+            "fee": Decimal("1"),
+            "fee_currency": "USD",
+            "exchange_rate": Decimal("1"),
+        }
+
+    def test_text_columns_follow_csv_rules(self):
+        table = _table(
+            2,
+            date=pa.array(["1/22/2021", "12/31/2021"]),
+            transaction_type=pa.array(["Kauf", " sell "]),
+            quantity=pa.array(["1.5", "2"]),
+            price_per_share=pa.array([0.1, 3.0]),
+            fee=pa.array(["", None]),
+        )
+
+        result = ArrowTransactionParser().parse(_parquet(table), "t.parquet", DateFormat.US)
+
+        assert result.errors == []
+        assert [row["date"].date() for row in result.typed_rows] == [date(2021, 1, 22), date(2021, 12, 31)]
+        assert [row["transaction_type"] for row in result.typed_rows] == ["BUY", "SELL"]
+        assert [row["quantity"] for row in result.typed_rows] == [Decimal("1.5"), Decimal("2")]
+        assert result.typed_rows[0]["price_per_share"] == Decimal("0.1")
+        assert [row["fee"] for row in result.typed_rows] == [Decimal("0"), Decimal("0")]
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_arrow_ipc_in_chunks(self, stream):
+        chunks = list(ArrowTransactionParser().iter_chunks(
+            _arrow(_table(5), stream=stream), "t.arrow", chunk_rows=2,
+        ))
+
+        assert [chunk.total_rows for chunk in chunks] == [2, 2, 1]
+        assert [row["row_number"] for chunk in chunks for row in chunk.typed_rows] == [1, 2, 3, 4, 5]
+
+    def test_registered_for_parquet(self):
+        assert isinstance(get_parser("history.parquet"), ArrowTransactionParser)
+
+
+class TestColumnChecks:
+    """Invalid rows become ParseErrors, one per row, in row order."""
+
+    def test_first_failing_check_per_row(self):
+        future = datetime.now() + timedelta(days=30)
+        table = _table(
+            6,
+            date=pa.array(
+                [datetime(2024, 1, 1), None, datetime(2024, 1, 3), future, datetime(2024, 1, 5), datetime(2024, 1, 6)],
+                pa.timestamp("us"),
+            ),
+            transaction_type=pa.array(["BUY", "BUY", "HOLD", "BUY", "BUY", "SELL"]),
+            quantity=pa.array(["1", "1", "1", "1", "-2", "x"]),
+        )
+
+        result = ArrowTransactionParser().parse(_parquet(table), "t.parquet")
+
+        assert [row["row_number"] for row in result.typed_rows] == [1]
+        assert [(e.row_number, e.error_type, e.field) for e in result.errors] == [
+            (2, "missing_value", "date"),
+            (3, "invalid_transaction_type", "transaction_type"),
+            (4, "invalid_date", "date"),
+            (5, "invalid_quantity", "quantity"),
+            (6, "invalid_number", "quantity"),
+        ]
+        assert result.errors[1].message.startswith("Invalid transaction type: 'HOLD'")
+        assert result.errors[4].raw_data["quantity"] == "x"
+
+    def test_missing_columns(self):
+        table = _table().drop_columns(["exchange"])
+
+        result = ArrowTransactionParser().parse(_parquet(table), "t.parquet")
+
+        assert result.typed_rows == []
+        assert result.errors[0].error_type == "missing_columns"
+        assert "exchange" in result.errors[0].message
+
+    def test_unreadable_file(self):
+        result = ArrowTransactionParser().parse(io.BytesIO(b"not arrow"), "t.arrow")
+
+        assert [e.error_type for e in result.errors] == ["file_read_error"]
+
+
+class TestDetectDateFormat:
+    """Tests for ArrowTransactionParser.detect_date_format()."""
+
+    def test_typed_dates_are_iso(self):
+        detection = ArrowTransactionParser().detect_date_format(_parquet(_table()), "t.parquet")
+
+        assert detection.status == DateDetectionStatus.UNAMBIGUOUS
+        assert detection.detected_format == DateFormat.ISO
+
+    def test_text_dates_are_analyzed(self):
+        table = _table(2, date=pa.array(["1/22/2021", "2/3/2021"]))
+
+        detection = ArrowTransactionParser().detect_date_format(_parquet(table), "t.parquet")
+
+        assert detection.status == DateDetectionStatus.UNAMBIGUOUS
+        assert detection.detected_format == DateFormat.US
+
+
+class TestUpload:
+    """Parquet rows reach the bulk insert path through UploadService."""
+
+    def test_parquet_upload_creates_transactions(self, db):
+        user = create_user(db)
+        portfolio = create_portfolio(db, user, currency="USD")
+        asset = create_asset(db, ticker="AAPL", exchange="NASDAQ", currency="USD")
+        table = _table(3, transaction_type=pa.array(["BUY", "BUY", "SELL"]))
+
+        result = UploadService(asset_service=AssetResolutionService(provider=MagicMock())).process_file(
+            db=db, file=_parquet(table), filename="history.parquet", portfolio_id=portfolio.id,
+        )
+
+        assert result.success is True
+        assert result.created_count == 3
+        transactions = db.scalars(
+            select(Transaction).where(Transaction.portfolio_id == portfolio.id).order_by(Transaction.date)
+        ).all()
+        assert [t.asset_id for t in transactions] == [asset.id] * 3
+        assert transactions[2].transaction_type == TransactionType.SELL
+        assert transactions[2].quantity == Decimal("3")
+        assert transactions[0].fee_currency == "USD"
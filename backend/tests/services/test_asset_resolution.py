@@ -159,6 +159,60 @@ class TestResolveAsset:
 
 # =============================================================================
 # CACHING TESTS
+class TestPersistentCache:
+    """Tests for the asset_info_cache table behind the in-memory cache."""
+
+    def test_new_service_reuses_persisted_answers(self, db, mock_provider):
+        """A restarted service should not ask the provider again."""
+        mock_provider.add_response("MSFT", "NASDAQ", create_asset_info(ticker="MSFT", exchange="NASDAQ", name="Microsoft"))
+        first = AssetResolutionService(provider=mock_provider)
+        result = first.resolve_assets_batch(db, [("MSFT", "NASDAQ"), ("TYPO", "NASDAQ")])
+        assert mock_provider.batch_call_count == 1
+        db.delete(result.resolved[("MSFT", "NASDAQ")])
+        db.commit()
+
+        restarted = AssetResolutionService(provider=mock_provider)
+        result = restarted.resolve_assets_batch(db, [("MSFT", "NASDAQ"), ("TYPO", "NASDAQ")])
+
+        assert mock_provider.batch_call_count == 1
+        assert result.resolved[("MSFT", "NASDAQ")].name == "Microsoft"
+        assert result.not_found == [("TYPO", "NASDAQ")]
+        with pytest.raises(AssetNotFoundError):
+            restarted.resolve_asset(db, "TYPO", "NASDAQ")
+        assert mock_provider.single_call_count == 0
+
+    def test_not_found_expires_sooner(self, db, mock_provider):
+        """Not found answers should use the shorter TTL."""
+        from app.models import AssetInfoCache
+        from app.services.constants import ASSET_CACHE_TTL_SECONDS, ASSET_NOT_FOUND_CACHE_TTL_SECONDS
+
+        mock_provider.add_response("MSFT", "NASDAQ", create_asset_info(ticker="MSFT", exchange="NASDAQ"))
+        AssetResolutionService(provider=mock_provider).resolve_assets_batch(
+            db, [("MSFT", "NASDAQ"), ("TYPO", "NASDAQ")]
+        )
+
+        rows = {row.ticker: row for row in db.query(AssetInfoCache).all()}
+        assert rows["TYPO"].info is None
+        assert rows["MSFT"].info["asset_class"] == "STOCK"
+        assert (rows["TYPO"].expires_at - rows["TYPO"].fetched_at).total_seconds() == ASSET_NOT_FOUND_CACHE_TTL_SECONDS
+        assert (rows["MSFT"].expires_at - rows["MSFT"].fetched_at).total_seconds() == ASSET_CACHE_TTL_SECONDS
+
+    def test_expired_and_transient_failures_are_refetched(self, db, mock_provider):
+        """Expired entries and provider errors should reach the provider again."""
+        from app.models import AssetInfoCache
+
+        mock_provider.add_error("FLAKY", "NYSE", ProviderUnavailableError(provider="mock", reason="timeout"))
+        service = AssetResolutionService(provider=mock_provider)
+        service.resolve_assets_batch(db, [("FLAKY", "NYSE"), ("TYPO", "NYSE")])
+        db.query(AssetInfoCache).update({"expires_at": AssetInfoCache.fetched_at})
+        db.commit()
+
+        AssetResolutionService(provider=mock_provider).resolve_assets_batch(db, [("FLAKY", "NYSE"), ("TYPO", "NYSE")])
+
+        assert mock_provider.batch_call_count == 2
+        assert [row.ticker for row in db.query(AssetInfoCache).all()] == ["TYPO"]
+
+
 # =============================================================================
 
 class TestCaching:
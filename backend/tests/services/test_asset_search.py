@@ -0,0 +1,154 @@
+# backend/tests/services/test_asset_search.py
+"""
+Tests for the ranked asset search.
+
+Covers:
+- Ranking (exact, ticker prefix, ISIN prefix, name) with the prefix index
+- Multi-word and punctuated queries, inactive assets, limits
+- Prefix index rebuild when assets change
+- PostgreSQL trigram query (compiled, and executed against real rows when
+  TEST_POSTGRES_URL is set; CI runs it in .github/workflows/backend-postgres.yml)
+"""
+
+import os
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.models import Asset, Base
+from app.services.asset_search import AssetSearchService
+from tests.conftest import create_asset
+
+POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+
+
+def _tickers(assets: list[Asset]) -> list[str]:
+    return [asset.ticker for asset in assets]
+
+
+class TestPrefixIndexSearch:
+    """Tests for AssetSearchService.search() on SQLite."""
+
+    def test_ranking(self, db):
+        create_asset(db, ticker="APPLX", name="Some Fund")
+        create_asset(db, ticker="MSFT", name="Microsoft Corporation").isin = "US5949181045"
+        db.commit()
+        create_asset(db, ticker="APP", name="AppLovin Corporation")
+        create_asset(db, ticker="AAPL", name="Apple Inc.")
+
+        assert _tickers(AssetSearchService().search(db, "app")) == ["APP", "APPLX", "AAPL"]
+        assert _tickers(AssetSearchService().search(db, "US594")) == ["MSFT"]
+        assert _tickers(AssetSearchService().search(db, "us5949181045")) == ["MSFT"]
+
+    def test_words_and_punctuation(self, db):
+        create_asset(db, ticker="KO", name="Coca-Cola Company")
+        create_asset(db, ticker="BRK.B", name="Berkshire Hathaway Inc.")
+        create_asset(db, ticker="COKE", name="Coca-Cola Consolidated")
+
+        service = AssetSearchService()
+
+        assert _tickers(service.search(db, "cola comp")) == ["KO"]
+        assert _tickers(service.search(db, "brk.b")) == ["BRK.B"]
+        assert _tickers(service.search(db, "  ")) == []
+
+    def test_inactive_excluded_and_limit(self, db):
+        for i in range(5):
+            create_asset(db, ticker=f"TKR{i}", name=f"Ticker {i}")
+        db.get(Asset, 1).is_active = False
+        db.commit()
+
+        assert _tickers(AssetSearchService().search(db, "tkr", limit=3)) == ["TKR1", "TKR2", "TKR3"]
+
+    def test_index_follows_table_changes(self, db):
+        service = AssetSearchService()
+        asset = create_asset(db, ticker="NVDA", name="NVIDIA Corporation")
+        assert _tickers(service.search(db, "nvidia")) == ["NVDA"]
+
+        create_asset(db, ticker="NVDL", name="GraniteShares NVIDIA Long")
+        asset.name = "Renamed"
+        db.commit()
+
+        assert _tickers(service.search(db, "nvidia")) == ["NVDL"]
+
+
+class TestTrigramQuery:
+    """Tests for the PostgreSQL query (compiled, not executed)."""
+
+    @staticmethod
+    def _sql(query: str) -> str:
+        statement = AssetSearchService.build_trigram_query(query, 10)
+        return str(statement.compile(dialect=postgresql.dialect(paramstyle="named"), compile_kwargs={"literal_binds": True}))
+
+    def test_substring_and_fuzzy_match(self):
+        sql = self._sql("micro_soft")
+
+        assert "assets.name %> 'micro_soft'" in sql
+        assert "assets.ticker ILIKE '%micro\\_soft%'" in sql
+        assert "similarity(assets.ticker, 'micro_soft')" in sql
+        assert "LIMIT 10" in sql
+
+    def test_short_query_is_prefix_only(self):
+        sql = self._sql("ap")
+
+        assert "%>" not in sql
+        assert "'%ap" not in sql
+        assert "ILIKE 'ap%" in sql
+
+
+# =============================================================================
+# POSTGRESQL: TRIGRAM QUERY AGAINST REAL ROWS
+# =============================================================================
+
+@pytest.fixture
+def pg_db():
+    """Session on a fresh PostgreSQL schema with pg_trgm and its GIN indexes."""
+    engine = create_engine(POSTGRES_URL)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as db:
+        yield db
+
+    Base.metadata.drop_all(engine)
+    engine.dispose()
+
+
+@pytest.mark.skipif(POSTGRES_URL is None, reason="TEST_POSTGRES_URL not set")
+class TestTrigramSearch:
+    """Tests for AssetSearchService.search() on PostgreSQL (build_trigram_query executed)."""
+
+    def test_ranking(self, pg_db):
+        create_asset(pg_db, ticker="APPLX", name="Some Fund")
+        create_asset(pg_db, ticker="MSFT", name="Microsoft Corporation").isin = "US5949181045"
+        pg_db.commit()
+        create_asset(pg_db, ticker="APP", name="AppLovin Corporation")
+        create_asset(pg_db, ticker="AAPL", name="Apple Inc.")
+
+        service = AssetSearchService()
+
+        assert _tickers(service.search(pg_db, "app")) == ["APP", "APPLX", "AAPL"]
+        assert _tickers(service.search(pg_db, "US594")) == ["MSFT"]
+        assert _tickers(service.search(pg_db, "us5949181045")) == ["MSFT"]
+
+    def test_fuzzy_name_match(self, pg_db):
+        create_asset(pg_db, ticker="MSFT", name="Microsoft Corporation")
+        create_asset(pg_db, ticker="AAPL", name="Apple Inc.")
+
+        assert _tickers(AssetSearchService().search(pg_db, "micrsoft")) == ["MSFT"]
+
+    def test_like_wildcards_are_literal(self, pg_db):
+        create_asset(pg_db, ticker="AB_C", name="Underscore Holdings")
+        create_asset(pg_db, ticker="ABXC", name="Other Holdings")
+
+        assert _tickers(AssetSearchService().search(pg_db, "ab_")) == ["AB_C"]
+
+    def test_inactive_excluded_and_limit(self, pg_db):
+        for i in range(5):
+            create_asset(pg_db, ticker=f"TKR{i}", name=f"Ticker {i}")
+        create_asset(pg_db, ticker="TKR9", name="Ticker 9", is_active=False)
+
+        assert _tickers(AssetSearchService().search(pg_db, "tkr", limit=3)) == ["TKR0", "TKR1", "TKR2"]
@@ -0,0 +1,373 @@
+# tests/services/test_composite_provider.py
+"""
+Tests for hedged requests and fallback across market data providers.
+
+This module tests:
+- LatencyHistogram percentiles
+- ReplayMarketDataProvider record/replay round trip
+- CompositeMarketDataProvider fallback, hedging and circuit breaker handling
+"""
+
+import threading
+import time
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from app.models import AssetClass
+from app.services.exceptions import ProviderUnavailableError, TickerNotFoundError
+from app.services.latency_histogram import LatencyHistogram
+from app.services.market_data.base import (
+    AssetInfo,
+    BatchResult,
+    HistoricalPricesResult,
+    MarketDataProvider,
+    OHLCVData,
+)
+from app.services.market_data.composite import CompositeMarketDataProvider
+from app.services.market_data.replay import ReplayMarketDataProvider
+
+
+START = date(2024, 1, 2)
+END = date(2024, 1, 5)
+
+
+def make_prices(ticker: str = "NVDA", exchange: str = "NASDAQ", close: str = "100") -> HistoricalPricesResult:
+    price = Decimal(close)
+    return HistoricalPricesResult(
+        ticker=ticker,
+        exchange=exchange,
+        prices=[
+            OHLCVData(date=date(2024, 1, d), open=price, high=price, low=price, close=price, volume=10)
+            for d in (2, 3, 4)
+        ],
+        from_date=START,
+        to_date=END,
+    )
+
+
+class FakeProvider(MarketDataProvider):
+    """Provider with configurable latency and behaviour."""
+
+    RATE_LIMIT_PER_SECOND = None
+
+    def __init__(self, name, delay=0.0, error=None, result=None):
+        self._name = name
+        self.delay = delay
+        self.error = error
+        self.result = result if result is not None else make_prices(close="100")
+        self.calls = 0
+        self.release = threading.Event()
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def _answer(self, value):
+        self.calls += 1
+        if self.delay:
+            self.release.wait(self.delay)
+        if self.error is not None:
+            raise self.error
+        return value
+
+    def get_asset_info(self, ticker, exchange):
+        return self._execute_with_retry(
+            self._answer,
+            AssetInfo(ticker=ticker, exchange=exchange, name=self._name,
+                      asset_class=AssetClass.STOCK, currency="USD"),
+        )
+
+    def get_asset_info_batch(self, tickers):
+        result = BatchResult()
+        for ticker, exchange in tickers:
+            try:
+                result.successful[(ticker, exchange)] = self.get_asset_info(ticker, exchange)
+            except Exception as e:
+                result.failed[(ticker, exchange)] = e
+        return result
+
+    def get_historical_prices(self, ticker, exchange, start_date, end_date):
+        return self._execute_with_retry(self._answer, self.result)
+
+
+def composite(*providers, **kwargs) -> CompositeMarketDataProvider:
+    kwargs.setdefault("hedge_min_delay", 0.0)
+    kwargs.setdefault("hedge_default_delay", 0.05)
+    return CompositeMarketDataProvider(list(providers), **kwargs)
+
+
+# =============================================================================
+# TEST: LATENCY HISTOGRAM
+# =============================================================================
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram."""
+
+    def test_empty_histogram_has_no_percentile(self):
+        assert LatencyHistogram(name="test").percentile(0.95) is None
+
+    def test_percentile_uses_bucket_upper_bound(self):
+        histogram = LatencyHistogram(name="test", buckets=(0.1, 0.5, 1.0))
+        for _ in range(90):
+            histogram.record(0.05)
+        for _ in range(10):
+            histogram.record(0.8)
+
+        assert histogram.percentile(0.5) == 0.1
+        assert histogram.percentile(0.95) == 0.8  # Capped at observed max
+        assert histogram.stats.count == 100
+
+    def test_overflow_reports_max(self):
+        histogram = LatencyHistogram(name="test", buckets=(0.1,))
+        histogram.record(3.0)
+
+        assert histogram.percentile(0.99) == 3.0
+
+    def test_errors_counted_separately(self):
+        histogram = LatencyHistogram(name="test")
+        histogram.record_error()
+
+        stats = histogram.stats
+        assert stats.errors == 1
+        assert stats.count == 0
+
+    def test_rejects_unsorted_buckets(self):
+        with pytest.raises(ValueError):
+            LatencyHistogram(name="test", buckets=(1.0, 0.5))
+
+
+# =============================================================================
+# TEST: REPLAY PROVIDER
+# =============================================================================
+
+class TestReplayProvider:
+    """Tests for ReplayMarketDataProvider."""
+
+    def test_round_trip_prices(self, tmp_path):
+        provider = ReplayMarketDataProvider(tmp_path)
+        provider.save_prices(make_prices(close="123.45"))
+
+        result = provider.get_historical_prices("nvda", "nasdaq", date(2024, 1, 3), END)
+
+        assert [p.date for p in result.prices] == [date(2024, 1, 3), date(2024, 1, 4)]
+        assert result.prices[0].close == Decimal("123.45")
+        assert result.prices[0].volume == 10
+
+    def test_save_merges_existing_rows(self, tmp_path):
+        provider = ReplayMarketDataProvider(tmp_path)
+        provider.save_prices(make_prices(close="100"))
+        newer = HistoricalPricesResult(
+            ticker="NVDA",
+            exchange="NASDAQ",
+            prices=[OHLCVData(date=date(2024, 1, 4), open=Decimal("1"), high=Decimal("1"),
+                              low=Decimal("1"), close=Decimal("101"))],
+        )
+        provider.save_prices(newer)
+
+        result = provider.get_historical_prices("NVDA", "NASDAQ", START, END)
+
+        assert [p.close for p in result.prices] == [Decimal("100"), Decimal("100"), Decimal("101")]
+
+    def test_fx_symbol_without_exchange(self, tmp_path):
+        provider = ReplayMarketDataProvider(tmp_path)
+        provider.save_prices(make_prices(ticker="USDEUR=X", exchange=""))
+
+        assert provider.get_historical_prices("USDEUR=X", "", START, END).days_fetched == 3
+
+    def test_unknown_ticker_not_found(self, tmp_path):
+        with pytest.raises(TickerNotFoundError):
+            ReplayMarketDataProvider(tmp_path).get_historical_prices("NOPE", "NYSE", START, END)
+
+    def test_round_trip_asset_info(self, tmp_path):
+        provider = ReplayMarketDataProvider(tmp_path)
+        provider.save_asset_info(AssetInfo(
+            ticker="NVDA", exchange="NASDAQ", name="NVIDIA Corporation",
+            asset_class=AssetClass.STOCK, currency="USD", sector="Technology",
+        ))
+
+        info = provider.get_asset_info("NVDA", "NASDAQ")
+
+        assert info.name == "NVIDIA Corporation"
+        assert info.asset_class == AssetClass.STOCK
+
+
+# =============================================================================
+# TEST: COMPOSITE FALLBACK
+# =============================================================================
+
+class TestCompositeFallback:
+    """Tests for ordered fallback."""
+
+    def test_uses_primary_name(self):
+        provider = composite(FakeProvider("yahoo"), FakeProvider("replay"))
+
+        assert provider.name == "yahoo"
+
+    def test_primary_answer_returned(self):
+        primary = FakeProvider("yahoo", result=make_prices(close="100"))
+        backup = FakeProvider("replay", result=make_prices(close="200"))
+
+        result = composite(primary, backup).get_historical_prices("NVDA", "NASDAQ", START, END)
+
+        assert result.prices[0].close == Decimal("100")
+        assert result.provider == "yahoo"
+        assert backup.calls == 0
+
+    def test_falls_back_on_provider_error(self):
+        primary = FakeProvider("yahoo", error=ProviderUnavailableError("yahoo", "down"))
+        primary.MAX_RETRY_ATTEMPTS = 1
+        backup = FakeProvider("replay", result=make_prices(close="200"))
+        provider = composite(primary, backup)
+
+        result = provider.get_historical_prices("NVDA", "NASDAQ", START, END)
+
+        assert result.prices[0].close == Decimal("200")
+        assert result.provider == "replay"  # Stored under the provider that answered
+        assert provider.stats.fallbacks == 1
+
+    def test_empty_answer_falls_back(self):
+        """An empty result is only returned if nobody has rows."""
+        empty = HistoricalPricesResult(ticker="NVDA", exchange="NASDAQ")
+        primary = FakeProvider("yahoo", result=empty)
+        backup = FakeProvider("replay", result=make_prices(close="200"))
+
+        result = composite(primary, backup).get_historical_prices("NVDA", "NASDAQ", START, END)
+
+        assert result.days_fetched == 3
+
+    def test_all_empty_returns_first_answer(self):
+        empty = HistoricalPricesResult(ticker="NVDA", exchange="NASDAQ")
+        provider = composite(FakeProvider("yahoo", result=empty), FakeProvider("replay", error=TickerNotFoundError("NVDA", "NASDAQ", "replay")))
+
+        assert provider.get_historical_prices("NVDA", "NASDAQ", START, END) is empty
+
+    def test_provider_error_preferred_over_not_found(self):
+        """Primary down + backup unaware of ticker = retryable failure."""
+        primary = FakeProvider("yahoo", error=ProviderUnavailableError("yahoo", "down"))
+        primary.MAX_RETRY_ATTEMPTS = 1
+        backup = FakeProvider("replay", error=TickerNotFoundError("NVDA", "NASDAQ", "replay"))
+
+        with pytest.raises(ProviderUnavailableError):
+            composite(primary, backup).get_historical_prices("NVDA", "NASDAQ", START, END)
+
+    def test_not_found_everywhere(self):
+        provider = composite(
+            FakeProvider("yahoo", error=TickerNotFoundError("NOPE", "NYSE", "yahoo")),
+            FakeProvider("replay", error=TickerNotFoundError("NOPE", "NYSE", "replay")),
+        )
+
+        with pytest.raises(TickerNotFoundError):
+            provider.get_asset_info("NOPE", "NYSE")
+
+    def test_skips_provider_with_open_circuit(self):
+        primary = FakeProvider("yahoo")
+        primary._get_circuit_breaker().force_open()
+        backup = FakeProvider("replay", result=make_prices(close="200"))
+        provider = composite(primary, backup)
+
+        result = provider.get_historical_prices("NVDA", "NASDAQ", START, END)
+
+        assert result.prices[0].close == Decimal("200")
+        assert primary.calls == 0
+        assert provider.stats.skipped_open == 1
+
+    def test_all_circuits_open(self):
+        primary = FakeProvider("yahoo")
+        primary._get_circuit_breaker().force_open()
+
+        with pytest.raises(ProviderUnavailableError):
+            composite(primary).get_historical_prices("NVDA", "NASDAQ", START, END)
+
+    def test_batch_retries_failed_tickers_on_next_provider(self):
+        primary = FakeProvider("yahoo")
+        original = primary.get_asset_info
+
+        def flaky(ticker, exchange):
+            if ticker == "SAP":
+                raise TickerNotFoundError(ticker, exchange, "yahoo")
+            return original(ticker, exchange)
+
+        primary.get_asset_info = flaky
+        backup = FakeProvider("replay")
+
+        result = composite(primary, backup).get_asset_info_batch(
+            [("NVDA", "NASDAQ"), ("SAP", "XETRA")]
+        )
+
+        assert result.all_successful
+        assert result.successful[("NVDA", "NASDAQ")].name == "yahoo"
+        assert result.successful[("SAP", "XETRA")].name == "replay"
+
+
+# =============================================================================
+# TEST: HEDGING
+# =============================================================================
+
+class TestHedging:
+    """Tests for hedged requests."""
+
+    def test_slow_primary_is_hedged(self):
+        primary = FakeProvider("yahoo", delay=5.0, result=make_prices(close="100"))
+        backup = FakeProvider("replay", result=make_prices(close="200"))
+        provider = composite(primary, backup)
+
+        started = time.monotonic()
+        result = provider.get_historical_prices("NVDA", "NASDAQ", START, END)
+        elapsed = time.monotonic() - started
+        primary.release.set()
+
+        assert result.prices[0].close == Decimal("200")
+        assert elapsed < 2.0
+        stats = provider.stats
+        assert stats.hedges_sent == 1
+        assert stats.hedges_won == 1
+
+    def test_fast_primary_not_hedged(self):
+        primary = FakeProvider("yahoo")
+        backup = FakeProvider("replay")
+        provider = composite(primary, backup, hedge_default_delay=1.0)
+
+        provider.get_historical_prices("NVDA", "NASDAQ", START, END)
+
+        assert backup.calls == 0
+        assert provider.stats.hedges_sent == 0
+
+    def test_hedging_disabled_waits_for_primary(self):
+        primary = FakeProvider("yahoo", delay=0.2, result=make_prices(close="100"))
+        backup = FakeProvider("replay", result=make_prices(close="200"))
+
+        result = composite(primary, backup, hedging=False).get_historical_prices(
+            "NVDA", "NASDAQ", START, END
+        )
+
+        assert result.prices[0].close == Decimal("100")
+        assert backup.calls == 0
+
+    def test_hedge_delay_follows_latency_percentile(self):
+        primary = FakeProvider("yahoo")
+        provider = composite(primary, FakeProvider("replay"),
+                             hedge_min_samples=10, hedge_max_delay=10.0)
+        histogram = provider._latency["yahoo"]
+
+        assert provider._hedge_delay(primary) == 0.05  # Default until enough samples
+
+        for _ in range(100):
+            histogram.record(0.4)
+
+        assert provider._hedge_delay(primary) == pytest.approx(0.4)
+
+    def test_latency_recorded_per_provider(self):
+        primary = FakeProvider("yahoo")
+        provider = composite(primary, FakeProvider("replay"))
+
+        provider.get_historical_prices("NVDA", "NASDAQ", START, END)
+
+        stats = provider.latency_stats
+        assert stats["yahoo"].count == 1
+        assert stats["replay"].count == 0
+
+    def test_duplicate_provider_names_rejected(self):
+        with pytest.raises(ValueError):
+            composite(FakeProvider("yahoo"), FakeProvider("yahoo"))
@@ -0,0 +1,110 @@
+# backend/tests/services/test_csv_parser.py
+"""
+Tests for the streaming CSV parser.
+
+Covers:
+- Chunked parsing (row numbers, chunk sizes, parse() equivalence)
+- Incremental decoding across block boundaries (UTF-8, BOM, Latin-1)
+- Quoted fields spanning lines
+- Header errors
+"""
+
+import io
+from unittest.mock import patch
+
+from app.services.upload.parsers import DateFormat
+from app.services.upload.parsers.csv_parser import CSVTransactionParser
+
+HEADER = "date,ticker,exchange,transaction_type,quantity,price_per_share,currency\n"
+
+
+def _csv(rows: int, ticker: str = "AAPL") -> bytes:
+    lines = [HEADER] + [
+        f"2024-01-{(i % 28) + 1:02d},{ticker},NASDAQ,BUY,{i + 1},100.50,USD\n"
+        for i in range(rows)
+    ]
+    return "".join(lines).encode("utf-8")
+
+
+class TestIterChunks:
+    """Tests for CSVTransactionParser.iter_chunks()."""
+
+    def test_chunks_have_requested_size_and_row_numbers(self):
+        parser = CSVTransactionParser()
+
+        chunks = list(parser.iter_chunks(io.BytesIO(_csv(25)), "t.csv", DateFormat.ISO, chunk_rows=10))
+
+        assert [chunk.total_rows for chunk in chunks] == [10, 10, 5]
+        assert [row.row_number for row in chunks[0].rows] == list(range(2, 12))
+        assert chunks[-1].rows[-1].row_number == 26
+        assert chunks[-1].rows[-1].quantity == "25"
+
+    def test_parse_matches_chunks(self):
+        content = _csv(30) + b"not-a-date,AAPL,NASDAQ,BUY,1,1,USD\n"
+        parser = CSVTransactionParser()
+
+        result = parser.parse(io.BytesIO(content), "t.csv")
+        chunks = list(parser.iter_chunks(io.BytesIO(content), "t.csv", chunk_rows=7))
+
+        assert result.total_rows == sum(chunk.total_rows for chunk in chunks) == 31
+        assert [row.row_number for row in result.rows] == [
+            row.row_number for chunk in chunks for row in chunk.rows
+        ]
+        assert [error.row_number for error in result.errors] == [32]
+
+    def test_missing_columns_stops_parsing(self):
+        chunks = list(CSVTransactionParser().iter_chunks(io.BytesIO(b"date,ticker\n2024-01-01,AAPL\n"), "t.csv"))
+
+        assert len(chunks) == 1
+        assert chunks[0].errors[0].error_type == "missing_columns"
+        assert chunks[0].total_rows == 0
+
+
+class TestIncrementalDecoding:
+    """Blocks are decoded incrementally, whatever their boundaries."""
+
+    def test_multibyte_characters_split_across_blocks(self):
+        content = _csv(40, ticker="ÄÖÜ€")
+
+        with patch("app.services.upload.parsers.csv_parser.UPLOAD_READ_BLOCK_BYTES", 7):
+            result = CSVTransactionParser().parse(io.BytesIO(content), "t.csv")
+
+        assert result.total_rows == 40
+        assert not result.errors
+        assert {row.ticker for row in result.rows} == {"ÄÖÜ€"}
+
+    def test_utf8_bom_is_stripped(self):
+        result = CSVTransactionParser().parse(io.BytesIO(b"\xef\xbb\xbf" + _csv(2)), "t.csv")
+
+        assert result.total_rows == 2
+        assert not result.errors
+
+    def test_latin1_file(self):
+        content = (HEADER + "2024-01-01,CAFÉ,NASDAQ,BUY,1,10,USD\n").encode("latin-1")
+
+        result = CSVTransactionParser().parse(io.BytesIO(content), "t.csv")
+
+        assert result.rows[0].ticker == "CAFÉ"
+
+    def test_latin1_after_first_block(self):
+        content = _csv(20) + "2024-01-01,CAFÉ,NASDAQ,BUY,1,10,USD\n".encode("latin-1")
+
+        with patch("app.services.upload.parsers.csv_parser.UPLOAD_READ_BLOCK_BYTES", 64):
+            result = CSVTransactionParser().parse(io.BytesIO(content), "t.csv")
+
+        assert result.total_rows == 21
+        assert result.rows[-1].ticker == "CAFÉ"
+
+    def test_quoted_field_spans_lines_and_blocks(self):
+        content = (
+            "date,ticker,exchange,transaction_type,quantity,price_per_share,currency,notes\n"
+            '2024-01-01,AAPL,NASDAQ,BUY,1,10,USD,"first line\r\nsecond line"\r\n'
+            "2024-01-02,AAPL,NASDAQ,SELL,1,11,USD,\r\n"
+        ).encode("utf-8")
+
+        with patch("app.services.upload.parsers.csv_parser.UPLOAD_READ_BLOCK_BYTES", 5):
+            result = CSVTransactionParser().parse(io.BytesIO(content), "t.csv")
+
+        assert result.total_rows == 2
+        assert [row.row_number for row in result.rows] == [2, 3]
+        assert result.rows[1].transaction_type == "SELL"
@@ -0,0 +1,172 @@
+# backend/tests/services/test_export_service.py
+"""
+Tests for streaming bulk exports.
+
+Covers:
+- CSV encoding (header, exact Decimals, empty cells, batching)
+- Transaction export through the database
+- History export matching get_history()
+- Parquet / Arrow round trip
+- Format availability check
+"""
+
+import csv
+import io
+from datetime import date, datetime
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import pyarrow as pa
+import pyarrow.ipc
+import pyarrow.parquet
+import pytest
+
+from app.models import MarketData, Transaction, TransactionType
+from app.services.export_service import (
+    HISTORY_COLUMNS,
+    TRANSACTION_COLUMNS,
+    ExportColumn,
+    ExportService,
+    check_format_available,
+    encode_rows,
+)
+from app.services.exceptions import ValidationError
+from app.services.valuation import ValuationService
+from tests.conftest import create_asset, create_portfolio, create_user
+
+COLUMNS = (
+    ExportColumn("day", "date"),
+    ExportColumn("amount", "decimal"),
+    ExportColumn("label", "str"),
+)
+
+
+def _read_csv(chunks) -> list[list[str]]:
+    return list(csv.reader(io.StringIO(b"".join(chunks).decode("utf-8"))))
+
+
+def _add_transaction(db, portfolio, asset, day: date, quantity: str, price: str) -> Transaction:
+    txn = Transaction(
+        portfolio_id=portfolio.id,
+        asset_id=asset.id,
+        transaction_type=TransactionType.BUY,
+        date=datetime.combine(day, datetime.min.time()),
+        quantity=Decimal(quantity),
+        price_per_share=Decimal(price),
+        currency=asset.currency,
+        fee=Decimal("0"),
+        fee_currency=asset.currency,
+        exchange_rate=Decimal("1"),
+    )
+    db.add(txn)
+    db.commit()
+    return txn
+
+
+# =============================================================================
+# ENCODING
+# =============================================================================
+
+class TestCSVEncoding:
+    """Tests for encode_rows() with csv."""
+
+    def test_header_and_values(self):
+        rows = [(date(2024, 1, 2), Decimal("1.10000000"), "a,b"), (date(2024, 1, 3), None, None)]
+
+        assert _read_csv(encode_rows(COLUMNS, rows, "csv")) == [
+            ["day", "amount", "label"],
+            ["2024-01-02", "1.10000000", "a,b"],
+            ["2024-01-03", "", ""],
+        ]
+
+    def test_header_is_sent_before_rows_are_read(self):
+        def rows():
+            raise AssertionError("rows read before header was sent")
+            yield
+
+        assert next(encode_rows(COLUMNS, rows(), "csv")) == b"day,amount,label\n"
+
+    def test_rows_are_sent_in_batches(self):
+        rows = [(date(2024, 1, 1), Decimal(i), "x") for i in range(5)]
+
+        with patch("app.services.export_service.EXPORT_BATCH_ROWS", 2):
+            chunks = list(encode_rows(COLUMNS, rows, "csv"))
+
+        # Header + batches of 2, 2, 1
+        assert len(chunks) == 4
+        assert len(_read_csv(chunks)) == 6
+
+
+class TestArrowEncoding:
+    """Parquet / Arrow output round-trips through pyarrow."""
+
+    ROWS = [(date(2024, 1, 2), Decimal("1.5"), "a"), (date(2024, 1, 3), None, "b")]
+
+    def test_parquet_round_trip(self):
+        data = b"".join(encode_rows(COLUMNS, self.ROWS, "parquet"))
+        table = pyarrow.parquet.read_table(pa.BufferReader(data))
+
+        assert table.column_names == ["day", "amount", "label"]
+        assert table.column("amount").to_pylist() == [Decimal("1.50000000"), None]
+
+    def test_arrow_stream_round_trip(self):
+        table = pyarrow.ipc.open_stream(b"".join(encode_rows(COLUMNS, self.ROWS, "arrow"))).read_all()
+
+        assert table.column("day").to_pylist() == [date(2024, 1, 2), date(2024, 1, 3)]
+
+    def test_unavailable_without_pyarrow(self):
+        with patch.dict("sys.modules", {"pyarrow": None}):
+            with pytest.raises(ValidationError):
+                check_format_available("parquet")
+
+        check_format_available("csv")
+
+
+# =============================================================================
+# EXPORTS
+# =============================================================================
+
+class TestStreamTransactions:
+    """Tests for ExportService.stream_transactions()."""
+
+    def test_exports_portfolio_transactions_oldest_first(self, db):
+        user = create_user(db)
+        portfolio = create_portfolio(db, user)
+        other = create_portfolio(db, user, name="Other")
+        asset = create_asset(db, ticker="AAPL")
+        second = _add_transaction(db, portfolio, asset, date(2024, 2, 1), "5", "110")
+        first = _add_transaction(db, portfolio, asset, date(2024, 1, 1), "10", "100.12345678")
+        _add_transaction(db, other, asset, date(2024, 1, 15), "1", "1")
+
+        rows = _read_csv(ExportService(MagicMock()).stream_transactions(db, portfolio.id, "csv"))
+
+        assert rows[0] == [column.name for column in TRANSACTION_COLUMNS]
+        assert [int(row[0]) for row in rows[1:]] == [first.id, second.id]
+        assert rows[1][2:7] == ["BUY", "AAPL", "NASDAQ", "10.00000000", "100.12345678"]
+
+
+class TestStreamHistory:
+    """Tests for ExportService.stream_history()."""
+
+    def test_matches_get_history(self, db):
+        user = create_user(db)
+        portfolio = create_portfolio(db, user, currency="USD")
+        asset = create_asset(db, currency="USD")
+        _add_transaction(db, portfolio, asset, date(2024, 1, 1), "10", "100")
+        for day, close in [(1, "100"), (2, "102"), (3, "101")]:
+            db.add(MarketData(
+                asset_id=asset.id, date=date(2024, 1, day), close_price=Decimal(close),
+                provider="test", is_synthetic=False, no_data_available=False,
+            ))
+        db.commit()
+        valuation_service = ValuationService(fx_service=MagicMock())
+
+        chunks = ExportService(valuation_service).stream_history(
+            db, portfolio.id, date(2024, 1, 1), date(2024, 1, 3), "daily", "csv",
+        )
+        rows = _read_csv(chunks)
+        history = valuation_service.get_history(db, portfolio.id, date(2024, 1, 1), date(2024, 1, 3))
+
+        assert rows[0] == [column.name for column in HISTORY_COLUMNS]
+        assert [row[0] for row in rows[1:]] == [str(p.date) for p in history.data]
+        assert [Decimal(row[1]) for row in rows[1:]] == [p.value for p in history.data]
@@ -22,6 +22,7 @@ from sqlalchemy import select
 
 from app.models import (
     ExchangeRate,
+    ExchangeRateCoverage,
     Portfolio,
     Asset,
     Transaction,
@@ -604,6 +605,70 @@ class TestSyncRates:
         assert result.success is False
 
 
+    def test_sync_rates_records_coverage(self, db, fx_service, mock_provider):
+        """Should record the fetched range and not re-request it."""
+        mock_provider.get_historical_prices.return_value = HistoricalPricesResult(
+            ticker="USDEUR=X",
+            exchange="",
+            prices=create_mock_ohlcv_data([
+                (date(2024, 1, 15), Decimal("0.92")),
+                (date(2024, 1, 17), Decimal("0.93")),
+            ]),
+            success=True,
+        )
+
+        fx_service.sync_rates(db, "USD", "EUR", date(2024, 1, 15), date(2024, 1, 17))
+        fx_service.sync_rates(db, "USD", "EUR", date(2024, 1, 15), date(2024, 1, 17))
+
+        # Jan 16 returned nothing but is covered - no second provider call
+        assert mock_provider.get_historical_prices.call_count == 1
+
+        coverage = db.scalars(select(ExchangeRateCoverage)).all()
+        assert [(c.start_date, c.end_date) for c in coverage] == [
+            (date(2024, 1, 15), date(2024, 1, 17))
+        ]
+
+        markers = db.scalars(
+            select(ExchangeRate).where(ExchangeRate.no_data_available == True)
+        ).all()
+        assert markers == []
+
+    def test_sync_rates_skips_fx_holiday_gap(self, db, fx_service, mock_provider):
+        """Should not call the provider for a gap that is only New Year's Day."""
+        db.add_all([
+            ExchangeRateCoverage(
+                base_currency="USD", quote_currency="EUR", provider="mock_provider",
+                start_date=date(2023, 12, 1), end_date=date(2023, 12, 29),
+            ),
+            ExchangeRateCoverage(
+                base_currency="USD", quote_currency="EUR", provider="mock_provider",
+                start_date=date(2024, 1, 2), end_date=date(2024, 1, 31),
+            ),
+        ])
+        db.commit()
+
+        result = fx_service.sync_rates(
+            db, "USD", "EUR", date(2023, 12, 1), date(2024, 1, 31)
+        )
+
+        assert result.success is True
+        mock_provider.get_historical_prices.assert_not_called()
+
+    def test_sync_rates_failed_fetch_not_covered(self, db, fx_service, mock_provider):
+        """Should not record coverage when the provider fails."""
+        mock_provider.get_historical_prices.return_value = HistoricalPricesResult(
+            ticker="USDEUR=X",
+            exchange="",
+            prices=[],
+            success=False,
+            error="Symbol not found",
+        )
+
+        fx_service.sync_rates(db, "USD", "EUR", date(2024, 1, 15), date(2024, 1, 17))
+
+        assert db.scalars(select(ExchangeRateCoverage)).all() == []
+
+
 # =============================================================================
 # COVERAGE TESTS
 # =============================================================================
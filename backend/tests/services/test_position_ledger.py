@@ -0,0 +1,287 @@
+# backend/tests/services/test_position_ledger.py
+"""
+Tests for the portfolio_positions ledger.
+
+Covers:
+- Transaction deltas (BUY cost, SELL proceeds, non-position types)
+- Recording, removing and updating transactions
+- Current and as-of quantity reads
+- Rebuild from the transactions table
+- Today's valuation from the ledger matches the transaction replay
+"""
+
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models import MarketData, PortfolioPosition, Transaction, TransactionType
+from app.services.position_ledger import (
+    apply_deltas,
+    get_positions,
+    quantity_held,
+    rebuild_positions,
+    record_transactions,
+    remove_transactions,
+    transaction_delta,
+)
+from app.services.valuation import ValuationService
+from tests.conftest import create_asset, create_portfolio, create_user
+
+
+def _transaction(
+        portfolio_id: int,
+        asset_id: int | None,
+        transaction_type: TransactionType,
+        txn_date: datetime,
+        quantity: str,
+        price: str = "100",
+        fee: str = "0",
+        exchange_rate: str = "1",
+) -> Transaction:
+    return Transaction(
+        portfolio_id=portfolio_id,
+        asset_id=asset_id,
+        transaction_type=transaction_type,
+        date=txn_date,
+        quantity=Decimal(quantity),
+        price_per_share=Decimal(price),
+        currency="USD",
+        fee=Decimal(fee),
+        fee_currency="USD",
+        exchange_rate=Decimal(exchange_rate),
+    )
+
+
+def _write(db: Session, *transactions: Transaction) -> None:
+    """Insert transactions and record them, like the write endpoints."""
+    db.add_all(transactions)
+    record_transactions(db, transactions)
+    db.commit()
+
+
+def _setup(db: Session):
+    user = create_user(db)
+    portfolio = create_portfolio(db, user, currency="USD")
+    asset = create_asset(db, ticker="AAPL", currency="USD")
+    return portfolio, asset
+
+
+def _position(db: Session, portfolio_id: int, asset_id: int) -> PortfolioPosition:
+    return next(p for p in get_positions(db, portfolio_id) if p.asset_id == asset_id)
+
+
+# =============================================================================
+# DELTAS
+# =============================================================================
+
+class TestTransactionDelta:
+    """Tests for transaction_delta()."""
+
+    def test_buy_cost_includes_fee_and_broker_rate(self):
+        delta = transaction_delta(_transaction(
+            1, 2, TransactionType.BUY, datetime(2024, 1, 1), "10", "110", fee="11", exchange_rate="1.1",
+        ))
+
+        assert delta.bought_qty == Decimal("10")
+        assert delta.bought_cost_local == Decimal("1111")
+        assert delta.bought_cost_portfolio == Decimal("1010")
+        assert delta.sold_qty == Decimal("0")
+
+    def test_sell_proceeds_exclude_fee(self):
+        delta = transaction_delta(_transaction(
+            1, 2, TransactionType.SELL, datetime(2024, 1, 1), "4", "50", fee="2",
+        ))
+
+        assert delta.sold_qty == Decimal("4")
+        assert delta.sold_proceeds_portfolio == Decimal("198")
+
+    def test_no_delta_without_position(self):
+        assert transaction_delta(_transaction(1, None, TransactionType.DEPOSIT, datetime(2024, 1, 1), "100")) is None
+        assert transaction_delta(_transaction(1, 2, TransactionType.DIVIDEND, datetime(2024, 1, 1), "5")) is None
+
+
+# =============================================================================
+# WRITES
+# =============================================================================
+
+class TestLedgerWrites:
+    """Ledger rows follow inserts, updates and deletes."""
+
+    def test_record_creates_then_accumulates(self, db):
+        portfolio, asset = _setup(db)
+
+        _write(db, _transaction(portfolio.id, asset.id, TransactionType.BUY, datetime(2024, 1, 1), "10"))
+        _write(
+            db,
+            _transaction(portfolio.id, asset.id, TransactionType.BUY, datetime(2024, 2, 1), "5", "120"),
+            _transaction(portfolio.id, asset.id, TransactionType.SELL, datetime(2024, 3, 1), "3", "130"),
+        )
+
+        position = _position(db, portfolio.id, asset.id)
+        assert position.quantity == Decimal("12")
+        assert position.total_bought_qty == Decimal("15")
+        assert position.total_sold_qty == Decimal("3")
+        assert position.total_bought_cost_local == Decimal("1600")
+        assert position.total_sold_proceeds_portfolio == Decimal("390")
+
+    def test_remove_reverses_record(self, db):
+        portfolio, asset = _setup(db)
+        buy = _transaction(portfolio.id, asset.id, TransactionType.BUY, datetime(2024, 1, 1), "10")
+        sell = _transaction(portfolio.id, asset.id, TransactionType.SELL, datetime(2024, 2, 1), "4")
+        _write(db, buy, sell)
+
+        remove_transactions(db, [sell])
+        db.delete(sell)
+        db.commit()
+
+        assert quantity_held(db, portfolio.id, asset.id) == (Decimal("10"), Decimal("10"), Decimal("0"))
+
+    def test_update_swaps_old_amounts_for_new(self, db):
+        portfolio, asset = _setup(db)
+        buy = _transaction(portfolio.id, asset.id, TransactionType.BUY, datetime(2024, 1, 1), "10")
+        _write(db, buy)
+
+        before = transaction_delta(buy)
+        buy.quantity = Decimal("7")
+        apply_deltas(db, [-before, transaction_delta(buy)])
+        db.commit()
+
+        position = _position(db, portfolio.id, asset.id)
+        assert position.quantity == Decimal("7")
+        assert position.total_bought_cost_local == Decimal("700")
+
+    def test_batch_upserts_new_and_existing_positions_in_one_statement(self, db):
+        portfolio, asset = _setup(db)
+        other = create_asset(db, ticker="MSFT", currency="USD")
+        _write(db, _transaction(portfolio.id, asset.id, TransactionType.BUY, datetime(2024, 1, 1), "10"))
+
+        statements: list[str] = []
+        event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+        record_transactions(db, [
+            _transaction(portfolio.id, asset.id, TransactionType.SELL, datetime(2024, 2, 1), "4"),
+            _transaction(portfolio.id, other.id, TransactionType.BUY, datetime(2024, 2, 1), "3"),
+        ])
+        db.commit()
+
+        assert len([s for s in statements if "portfolio_positions" in s]) == 1
+        assert _position(db, portfolio.id, asset.id).quantity == Decimal("6")
+        assert _position(db, portfolio.id, other.id).quantity == Decimal("3")
+
+    def test_rebuild_matches_recorded_rows(self, db):
+        portfolio, asset = _setup(db)
+        other = create_asset(db, ticker="MSFT", currency="USD")
+        _write(
+            db,
+            _transaction(portfolio.id, asset.id, TransactionType.BUY, datetime(2024, 1, 1), "10", fee="1"),
+            _transaction(portfolio.id, other.id, TransactionType.BUY, datetime(2024, 1, 2), "2", "300"),
+            _transaction(portfolio.id, asset.id, TransactionType.SELL, datetime(2024, 2, 1), "4", "110"),
+        )
+        recorded = {
+            p.asset_id: (p.quantity, p.total_bought_cost_local, p.total_sold_proceeds_portfolio)
+            for p in get_positions(db, portfolio.id)
+        }
+
+        assert rebuild_positions(db, portfolio.id) == 2
+        db.commit()
+
+        rebuilt = {
+            p.asset_id: (p.quantity, p.total_bought_cost_local, p.total_sold_proceeds_portfolio)
+            for p in get_positions(db, portfolio.id)
+        }
+        assert rebuilt == recorded
+
+
+# =============================================================================
+# READS
+# =============================================================================
+
+class TestQuantityHeld:
+    """Tests for quantity_held()."""
+
+    def test_no_position(self, db):
+        portfolio, asset = _setup(db)
+
+        assert quantity_held(db, portfolio.id, asset.id) == (Decimal("0"), Decimal("0"), Decimal("0"))
+
+    def test_as_of_takes_later_transactions_back_out(self, db):
+        portfolio, asset = _setup(db)
+        _write(
+            db,
+            _transaction(portfolio.id, asset.id, TransactionType.BUY, datetime(2024, 1, 1), "10"),
+            _transaction(portfolio.id, asset.id, TransactionType.SELL, datetime(2024, 2, 1), "4"),
+            _transaction(portfolio.id, asset.id, TransactionType.BUY, datetime(2024, 3, 1), "6"),
+        )
+
+        assert quantity_held(db, portfolio.id, asset.id)[0] == Decimal("12")
+        assert quantity_held(db, portfolio.id, asset.id, as_of=datetime(2024, 2, 15))[0] == Decimal("6")
+        assert quantity_held(db, portfolio.id, asset.id, as_of=datetime(2024, 1, 1)) == (
+            Decimal("10"), Decimal("10"), Decimal("0"),
+        )
+
+
+# =============================================================================
+# VALUATION FAST PATH
+# =============================================================================
+
+class TestLedgerValuation:
+    """Today's valuation reads the ledger and matches the replay."""
+
+    def _seed(self, db: Session):
+        portfolio, asset = _setup(db)
+        start = date.today() - timedelta(days=30)
+        _write(
+            db,
+            _transaction(portfolio.id, asset.id, TransactionType.BUY,
+                         datetime.combine(start, datetime.min.time()), "10", "100", fee="2"),
+            _transaction(portfolio.id, asset.id, TransactionType.SELL,
+                         datetime.combine(start + timedelta(days=10), datetime.min.time()), "4", "120", fee="1"),
+        )
+        for offset in range(6):
+            db.add(MarketData(
+                asset_id=asset.id, date=date.today() - timedelta(days=offset),
+                close_price=Decimal("130"), provider="test",
+                is_synthetic=False, no_data_available=False,
+            ))
+        db.commit()
+        return portfolio
+
+    def test_matches_transaction_replay(self, db):
+        portfolio = self._seed(db)
+        service = ValuationService(fx_service=MagicMock())
+
+        with patch(
+                "app.services.valuation.service.get_positions", wraps=get_positions,
+        ) as ledger_read:
+            from_ledger = service.get_valuation(db, portfolio.id)
+        with patch.object(ValuationService, "_ledger_holdings", return_value=None):
+            replayed = service.get_valuation(db, portfolio.id)
+
+        ledger_read.assert_called_once()
+        assert from_ledger.holdings[0].quantity == replayed.holdings[0].quantity == Decimal("6")
+        assert from_ledger.total_value == replayed.total_value
+        assert from_ledger.total_cost_basis == replayed.total_cost_basis
+        assert from_ledger.total_realized_pnl == replayed.total_realized_pnl
+        assert from_ledger.total_net_invested == replayed.total_net_invested
+
+    def test_cash_tracking_portfolio_replays(self, db):
+        portfolio = self._seed(db)
+        _write(db, _transaction(portfolio.id, None, TransactionType.DEPOSIT, datetime(2024, 1, 1), "5000", "1"))
+        service = ValuationService(fx_service=MagicMock())
+
+        with patch("app.services.valuation.service.get_positions") as ledger_read:
+            valuation = service.get_valuation(db, portfolio.id)
+
+        ledger_read.assert_not_called()
+        assert valuation.tracks_cash is True
+
+    def test_past_date_replays(self, db):
+        portfolio = self._seed(db)
+        service = ValuationService(fx_service=MagicMock())
+
+        with patch("app.services.valuation.service.get_positions") as ledger_read:
+            service.get_valuation(db, portfolio.id, date.today() - timedelta(days=1))
+
+        ledger_read.assert_not_called()
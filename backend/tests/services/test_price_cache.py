@@ -0,0 +1,228 @@
+# backend/tests/services/test_price_cache.py
+"""
+Tests for the process-wide price series cache.
+
+Covers:
+- Gap computation against the covered range
+- Merging loaded ranges, version mismatches
+- LRU eviction by estimated byte size
+- price_version bumps
+- PortfolioDataContext reading through the cache
+"""
+
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event, update
+from sqlalchemy.orm import Session
+
+from app.models import MarketData
+from app.services.market_data.price_cache import (
+    PRICE_CACHE_ROW_BYTES,
+    PriceSeriesCache,
+    bump_price_versions,
+)
+from app.services.portfolio_context import PortfolioDataContext
+from tests.conftest import create_asset
+
+
+def _rows(start: date, days: int, close: str = "100"):
+    return [(start + timedelta(days=i), (Decimal(close), False, None)) for i in range(days)]
+
+
+def _add_prices(db: Session, asset_id: int, start: date, closes: list[str]):
+    for i, close in enumerate(closes):
+        db.add(MarketData(
+            asset_id=asset_id,
+            date=start + timedelta(days=i),
+            close_price=Decimal(close),
+            provider="test",
+            is_synthetic=False,
+            no_data_available=False,
+        ))
+    db.commit()
+
+
+@pytest.fixture
+def cache() -> PriceSeriesCache:
+    return PriceSeriesCache(max_bytes=1024 * 1024)
+
+
+# =============================================================================
+# SERIES
+# =============================================================================
+
+class TestMissing:
+    """Tests for PriceSeries.missing()."""
+
+    @pytest.fixture
+    def series(self, cache):
+        return cache.merge(1, 0, None, [(date(2024, 3, 1), date(2024, 3, 31))], [])
+
+    def test_covered_window_has_no_gaps(self, series):
+        assert series.missing(date(2024, 3, 5), date(2024, 3, 20)) == []
+
+    def test_overlapping_window_loads_edges(self, series):
+        assert series.missing(date(2024, 2, 20), date(2024, 4, 2)) == [
+            (date(2024, 2, 20), date(2024, 2, 29)),
+            (date(2024, 4, 1), date(2024, 4, 2)),
+        ]
+
+    def test_disjoint_window_loads_span_between(self, series):
+        assert series.missing(date(2024, 6, 1), date(2024, 6, 30)) == [
+            (date(2024, 3, 1), date(2024, 6, 30)),
+        ]
+
+
+class TestMerge:
+    """Tests for PriceSeriesCache.merge() and get()."""
+
+    def test_merge_extends_cached_series(self, cache):
+        first = cache.merge(1, 0, None, [(date(2024, 1, 1), date(2024, 1, 10))], _rows(date(2024, 1, 1), 10))
+        gaps = first.missing(date(2024, 1, 5), date(2024, 1, 20))
+
+        merged = cache.merge(1, 0, first, gaps, _rows(date(2024, 1, 11), 10, close="200"))
+
+        assert (merged.start, merged.end) == (date(2024, 1, 1), date(2024, 1, 20))
+        assert len(merged.window(date(2024, 1, 1), date(2024, 1, 31))) == 20
+        assert cache.get(1, 0) is merged
+
+    def test_window_bounds_are_inclusive(self, cache):
+        series = cache.merge(1, 0, None, [(date(2024, 1, 1), date(2024, 1, 10))], _rows(date(2024, 1, 1), 10))
+
+        window = series.window(date(2024, 1, 3), date(2024, 1, 5))
+
+        assert [d for d, _ in window] == [date(2024, 1, 3), date(2024, 1, 4), date(2024, 1, 5)]
+
+    def test_other_version_misses(self, cache):
+        cache.merge(1, 0, None, [(date(2024, 1, 1), date(2024, 1, 10))], _rows(date(2024, 1, 1), 10))
+
+        assert cache.get(1, 1) is None
+
+    def test_base_at_other_version_is_discarded(self, cache):
+        stale = cache.merge(1, 0, None, [(date(2024, 1, 1), date(2024, 1, 10))], _rows(date(2024, 1, 1), 10))
+
+        fresh = cache.merge(1, 1, stale, [(date(2024, 2, 1), date(2024, 2, 5))], _rows(date(2024, 2, 1), 5))
+
+        assert (fresh.start, fresh.end) == (date(2024, 2, 1), date(2024, 2, 5))
+        assert len(fresh.dates) == 5
+
+
+class TestEviction:
+    """Tests for byte-size LRU eviction."""
+
+    def test_least_recently_used_is_evicted(self):
+        # Room for two 9-row series (10 rows' worth each, counting overhead)
+        cache = PriceSeriesCache(max_bytes=PRICE_CACHE_ROW_BYTES * 20)
+        window = [(date(2024, 1, 1), date(2024, 1, 9))]
+        cache.merge(1, 0, None, window, _rows(date(2024, 1, 1), 9))
+        cache.merge(2, 0, None, window, _rows(date(2024, 1, 1), 9))
+        cache.get(1, 0)
+
+        cache.merge(3, 0, None, window, _rows(date(2024, 1, 1), 9))
+
+        assert cache.get(1, 0) is not None
+        assert cache.get(2, 0) is None
+        assert cache.get(3, 0) is not None
+        assert cache.size_bytes <= cache.max_bytes
+
+    def test_series_larger_than_budget_is_returned_but_not_kept(self):
+        cache = PriceSeriesCache(max_bytes=PRICE_CACHE_ROW_BYTES * 5)
+
+        series = cache.merge(1, 0, None, [(date(2024, 1, 1), date(2024, 1, 31))], _rows(date(2024, 1, 1), 31))
+
+        assert len(series.dates) == 31
+        assert len(cache) == 0
+        assert cache.size_bytes == 0
+
+
+# =============================================================================
+# VERSION BUMPS
+# =============================================================================
+
+class TestBumpPriceVersions:
+    """Tests for bump_price_versions()."""
+
+    def test_increments_only_given_assets(self, db):
+        bumped = create_asset(db, ticker="BUMPED")
+        untouched = create_asset(db, ticker="UNTOUCHED")
+        updated_at = bumped.updated_at
+
+        bump_price_versions(db, [bumped.id])
+        bump_price_versions(db, [bumped.id])
+        db.commit()
+        db.refresh(bumped)
+        db.refresh(untouched)
+
+        assert bumped.price_version == 2
+        assert untouched.price_version == 0
+        assert bumped.updated_at == updated_at
+
+
+# =============================================================================
+# PORTFOLIO DATA CONTEXT
+# =============================================================================
+
+class TestContextReadsCache:
+    """PortfolioDataContext only queries windows the cache does not cover."""
+
+    @pytest.fixture
+    def price_queries(self, db_engine):
+        queried: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if "FROM market_data" in statement:
+                queried.append(statement)
+
+        event.listen(db_engine, "before_cursor_execute", record)
+        yield queried
+        event.remove(db_engine, "before_cursor_execute", record)
+
+    def test_second_request_is_served_from_cache(self, db, cache, price_queries):
+        asset = create_asset(db)
+        _add_prices(db, asset.id, date(2024, 1, 1), ["10", "11", "12"])
+
+        first = PortfolioDataContext(db, portfolio_id=0, price_cache=cache)
+        first.get_prices({asset.id}, date(2024, 1, 1), date(2024, 1, 3))
+        second = PortfolioDataContext(db, portfolio_id=0, price_cache=cache)
+        prices = second.get_prices({asset.id}, date(2024, 1, 2), date(2024, 1, 3))
+
+        assert prices == {
+            (asset.id, date(2024, 1, 2)): (Decimal("11"), False, None),
+            (asset.id, date(2024, 1, 3)): (Decimal("12"), False, None),
+        }
+        assert len(price_queries) == 1
+
+    def test_only_uncovered_window_is_queried(self, db, cache, price_queries):
+        asset = create_asset(db)
+        _add_prices(db, asset.id, date(2024, 1, 1), ["10", "11", "12", "13"])
+
+        PortfolioDataContext(db, portfolio_id=0, price_cache=cache).get_prices(
+            {asset.id}, date(2024, 1, 1), date(2024, 1, 2)
+        )
+        prices = PortfolioDataContext(db, portfolio_id=0, price_cache=cache).get_prices(
+            {asset.id}, date(2024, 1, 1), date(2024, 1, 4)
+        )
+
+        assert len(prices) == 4
+        assert len(price_queries) == 2
+        assert cache.get(asset.id, 0).end == date(2024, 1, 4)
+
+    def test_version_bump_reloads(self, db, cache, price_queries):
+        asset = create_asset(db)
+        _add_prices(db, asset.id, date(2024, 1, 1), ["10"])
+        PortfolioDataContext(db, portfolio_id=0, price_cache=cache).get_prices(
+            {asset.id}, date(2024, 1, 1), date(2024, 1, 1)
+        )
+
+        db.execute(update(MarketData).where(MarketData.asset_id == asset.id).values(close_price=Decimal("20")))
+        bump_price_versions(db, [asset.id])
+        db.commit()
+
+        prices = PortfolioDataContext(db, portfolio_id=0, price_cache=cache).get_prices(
+            {asset.id}, date(2024, 1, 1), date(2024, 1, 1)
+        )
+
+        assert prices[(asset.id, date(2024, 1, 1))][0] == Decimal("20")
+        assert len(price_queries) == 2
@@ -0,0 +1,195 @@
+# backend/tests/services/test_price_store.py
+"""
+Tests for the memory-mapped columnar price store.
+
+Covers:
+- Write / read round trip (exact Decimals, synthetic flags, window bounds)
+- Atomic replacement picked up by an existing reader
+- Invalid, missing, empty or stale (price_version) files fall back to the database
+- Rebuild from market_data
+- PortfolioDataContext reading prices from the store
+- Sync refresh failure handling
+"""
+
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models import MarketData
+from app.services.market_data.price_cache import bump_price_versions
+from app.services.market_data.price_store import ColumnarPriceStore
+from app.services.market_data.sync_service import MarketDataSyncService
+from app.services.portfolio_context import PortfolioDataContext
+from tests.conftest import create_asset
+
+
+@pytest.fixture
+def store(tmp_path) -> ColumnarPriceStore:
+    return ColumnarPriceStore(tmp_path / "prices")
+
+
+def _add_prices(db: Session, asset_id: int, start: date, closes: list[str], no_data_on: int | None = None):
+    for i, close in enumerate(closes):
+        db.add(MarketData(
+            asset_id=asset_id,
+            date=start + timedelta(days=i),
+            close_price=None if i == no_data_on else Decimal(close),
+            provider="test",
+            is_synthetic=False,
+            no_data_available=i == no_data_on,
+        ))
+    db.commit()
+
+
+# =============================================================================
+# READ / WRITE
+# =============================================================================
+
+class TestReadWrite:
+    """Tests for write_asset() and read_window()."""
+
+    def test_round_trip_is_exact(self, store):
+        store.write_asset(1, [
+            (date(2024, 1, 3), Decimal("101.12345678"), True, 7),
+            (date(2024, 1, 2), Decimal("9999999999.99999999"), False, None),
+        ], 1)
+
+        assert store.read_window(1, date(2024, 1, 1), date(2024, 1, 31), 1) == [
+            (date(2024, 1, 2), (Decimal("9999999999.99999999"), False, None)),
+            (date(2024, 1, 3), (Decimal("101.12345678"), True, 7)),
+        ]
+
+    def test_window_bounds_are_inclusive(self, store):
+        store.write_asset(1, [
+            (date(2024, 1, day), Decimal(day), False, None) for day in range(1, 11)
+        ], 1)
+
+        rows = store.read_window(1, date(2024, 1, 3), date(2024, 1, 5), 1)
+
+        assert [row[0] for row in rows] == [date(2024, 1, 3), date(2024, 1, 4), date(2024, 1, 5)]
+
+    def test_rows_without_close_are_skipped(self, store):
+        assert store.write_asset(1, [(date(2024, 1, 2), None, False, None)], 1) == 0
+        assert store.read_window(1, date(2024, 1, 1), date(2024, 1, 31), 1) is None
+        assert not (store.root / "1.prices").exists()
+
+    def test_other_price_version_returns_none(self, store):
+        store.write_asset(1, [(date(2024, 1, 2), Decimal("100"), False, None)], 1)
+
+        assert store.read_window(1, date(2024, 1, 1), date(2024, 1, 31), 2) is None
+
+    def test_unknown_asset_returns_none(self, store):
+        assert store.read_window(99, date(2024, 1, 1), date(2024, 1, 31), 1) is None
+
+    def test_replacement_is_visible_to_existing_reader(self, store):
+        store.write_asset(1, [(date(2024, 1, 2), Decimal("100"), False, None)], 1)
+        store.read_window(1, date(2024, 1, 1), date(2024, 1, 31), 1)
+
+        store.write_asset(1, [(date(2024, 1, 2), Decimal("200"), False, None)], 1)
+
+        assert store.read_window(1, date(2024, 1, 1), date(2024, 1, 31), 1) == [
+            (date(2024, 1, 2), (Decimal("200.00000000"), False, None)),
+        ]
+
+    def test_removed_asset_returns_none(self, store):
+        store.write_asset(1, [(date(2024, 1, 2), Decimal("100"), False, None)], 1)
+        store.remove_asset(1)
+
+        assert store.read_window(1, date(2024, 1, 1), date(2024, 1, 31), 1) is None
+
+    def test_corrupt_file_is_ignored(self, store):
+        (store.root / "1.prices").write_bytes(b"not a price file")
+
+        assert store.read_window(1, date(2024, 1, 1), date(2024, 1, 31), 1) is None
+
+
+# =============================================================================
+# REBUILD
+# =============================================================================
+
+class TestRebuild:
+    """Tests for rebuild() from market_data."""
+
+    def test_rebuild_copies_prices_without_no_data_markers(self, db, store):
+        asset = create_asset(db)
+        _add_prices(db, asset.id, date(2024, 1, 1), ["10", "11", "12"], no_data_on=1)
+
+        assert store.rebuild(db) == 2
+        assert store.read_window(asset.id, date(2024, 1, 1), date(2024, 1, 31), asset.price_version) == [
+            (date(2024, 1, 1), (Decimal("10.00000000"), False, None)),
+            (date(2024, 1, 3), (Decimal("12.00000000"), False, None)),
+        ]
+
+    def test_asset_without_prices_has_no_file(self, db, store):
+        asset = create_asset(db)
+        store.write_asset(asset.id, [(date(2024, 1, 2), Decimal("100"), False, None)], 0)
+
+        store.rebuild(db, [asset.id])
+
+        assert store.read_window(asset.id, date(2024, 1, 1), date(2024, 1, 31), asset.price_version) is None
+
+    def test_price_write_after_rebuild_falls_back_to_database(self, db, store):
+        asset = create_asset(db)
+        _add_prices(db, asset.id, date(2024, 1, 1), ["10"])
+        store.rebuild(db, [asset.id])
+
+        bump_price_versions(db, [asset.id])  # e.g. a sync in a process without the store
+        db.commit()
+        db.refresh(asset)
+
+        assert store.read_window(asset.id, date(2024, 1, 1), date(2024, 1, 31), asset.price_version) is None
+
+
+# =============================================================================
+# PORTFOLIO DATA CONTEXT
+# =============================================================================
+
+class TestContextReadsStore:
+    """PortfolioDataContext serves stored assets without querying market_data."""
+
+    def test_stored_assets_skip_the_database(self, db, db_engine, store):
+        stored = create_asset(db, ticker="STORED")
+        unstored = create_asset(db, ticker="UNSTORED")
+        _add_prices(db, stored.id, date(2024, 1, 1), ["10", "11"])
+        _add_prices(db, unstored.id, date(2024, 1, 1), ["20", "21"])
+        store.rebuild(db, [stored.id])
+
+        queried: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            queried.append(statement)
+
+        event.listen(db_engine, "before_cursor_execute", record)
+        try:
+            context = PortfolioDataContext(db, portfolio_id=0, price_store=store)
+            prices = context.get_prices({stored.id, unstored.id}, date(2024, 1, 1), date(2024, 1, 2))
+        finally:
+            event.remove(db_engine, "before_cursor_execute", record)
+
+        assert prices[(stored.id, date(2024, 1, 2))] == (Decimal("11.00000000"), False, None)
+        assert prices[(unstored.id, date(2024, 1, 2))][0] == Decimal("21")
+
+        price_queries = [s for s in queried if "FROM market_data" in s]
+        assert len(price_queries) == 1
+
+
+# =============================================================================
+# SYNC REFRESH
+# =============================================================================
+
+class TestSyncRefresh:
+    """MarketDataSyncService keeps the store in step with the database."""
+
+    def test_failed_refresh_drops_assets(self, db):
+        store = MagicMock(spec=ColumnarPriceStore)
+        store.rebuild.side_effect = OSError("disk full")
+        service = MarketDataSyncService(provider=MagicMock(), fx_service=MagicMock(), price_store=store)
+
+        service._refresh_price_store(db, [1, 2])
+
+        store.rebuild.assert_called_once_with(db, [1, 2])
+        assert [c.args for c in store.remove_asset.call_args_list] == [(1,), (2,)]
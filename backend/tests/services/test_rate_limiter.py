@@ -0,0 +1,209 @@
+# tests/services/test_rate_limiter.py
+"""
+Tests for the adaptive token-bucket rate limiter and its use in
+MarketDataProvider._execute_with_retry.
+"""
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from app.services import rate_limiter as rate_limiter_module
+from app.services.exceptions import RateLimitError
+from app.services.market_data.yahoo import YahooFinanceProvider
+from app.services.rate_limiter import TokenBucket
+
+
+class FakeClock:
+    """Deterministic replacement for time.monotonic/time.sleep."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    """Patch the limiter's clock."""
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limiter_module.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(rate_limiter_module.time, "sleep", fake.sleep)
+    return fake
+
+
+class TestTokenBucketInit:
+    """Tests for token bucket configuration."""
+
+    def test_starts_full_at_max_rate(self, clock):
+        bucket = TokenBucket(name="test", max_rate=2.0, capacity=5)
+
+        stats = bucket.stats
+        assert stats.current_rate == 2.0
+        assert stats.tokens_available == 5
+        assert stats.queue_depth == 0
+
+    @pytest.mark.parametrize("kwargs", [
+        {"max_rate": 0},
+        {"capacity": 0},
+        {"min_rate": 5.0, "max_rate": 2.0},
+        {"backoff_factor": 1.0},
+    ])
+    def test_invalid_config(self, kwargs):
+        with pytest.raises(ValueError):
+            TokenBucket(name="test", **kwargs)
+
+
+class TestTokenBucketPacing:
+    """Tests for acquire()."""
+
+    def test_burst_does_not_wait(self, clock):
+        bucket = TokenBucket(name="test", max_rate=2.0, capacity=3)
+
+        waits = [bucket.acquire() for _ in range(3)]
+
+        assert waits == [0.0, 0.0, 0.0]
+        assert clock.sleeps == []
+
+    def test_paces_after_burst(self, clock):
+        """Once the burst is spent, requests are spaced at 1/rate."""
+        bucket = TokenBucket(name="test", max_rate=2.0, capacity=1)
+
+        bucket.acquire()
+        wait = bucket.acquire()
+
+        assert wait == pytest.approx(0.5)
+        assert clock.sleeps == [pytest.approx(0.5)]
+
+    def test_refills_while_idle(self, clock):
+        bucket = TokenBucket(name="test", max_rate=2.0, capacity=2)
+        bucket.acquire()
+        bucket.acquire()
+
+        clock.now += 10  # Idle long enough to refill (capped at capacity)
+
+        assert bucket.stats.tokens_available == 2
+
+    def test_queue_depth_counts_waiting_callers(self):
+        """Concurrent callers waiting for a token are visible as queue depth."""
+        bucket = TokenBucket(name="test", max_rate=50.0, capacity=1)
+        bucket.acquire()
+        started = threading.Barrier(3)
+        depths = []
+
+        def worker():
+            started.wait()
+            bucket.acquire()
+
+        threads = [threading.Thread(target=worker) for _ in range(2)]
+        for t in threads:
+            t.start()
+        started.wait()
+        for _ in range(50):
+            depths.append(bucket.stats.queue_depth)
+            if depths[-1] == 2:
+                break
+            threading.Event().wait(0.001)
+        for t in threads:
+            t.join()
+
+        assert max(depths) >= 1
+        assert bucket.stats.queue_depth == 0
+        assert bucket.stats.total_acquired == 3
+
+
+class TestTokenBucketAdaptation:
+    """Tests for throttled() / succeeded()."""
+
+    def test_throttle_halves_rate_and_drains_burst(self, clock):
+        bucket = TokenBucket(name="test", max_rate=2.0, capacity=5)
+
+        bucket.throttled()
+
+        stats = bucket.stats
+        assert stats.current_rate == 1.0
+        assert stats.tokens_available <= 0
+        assert stats.throttle_events == 1
+
+    def test_throttle_respects_min_rate(self, clock):
+        bucket = TokenBucket(name="test", max_rate=2.0, min_rate=0.5)
+
+        for _ in range(5):
+            bucket.throttled()
+
+        assert bucket.rate == 0.5
+
+    def test_recovers_gradually(self, clock):
+        bucket = TokenBucket(
+            name="test", max_rate=2.0, recovery_step=0.25, recovery_interval=5.0
+        )
+        bucket.throttled()  # 1.0/s
+
+        bucket.succeeded()  # Too soon after throttle
+        assert bucket.rate == 1.0
+
+        clock.now += 5
+        bucket.succeeded()
+        bucket.succeeded()  # Same interval - no second step
+        assert bucket.rate == 1.25
+
+        for _ in range(10):
+            clock.now += 5
+            bucket.succeeded()
+        assert bucket.rate == 2.0  # Capped at max_rate
+
+    def test_reset_restores_max_rate(self, clock):
+        bucket = TokenBucket(name="test", max_rate=2.0)
+        bucket.throttled()
+
+        bucket.reset()
+
+        assert bucket.rate == 2.0
+
+
+class TestProviderPacing:
+    """Tests for pacing inside MarketDataProvider._execute_with_retry."""
+
+    def test_execute_takes_token(self, clock):
+        provider = YahooFinanceProvider()
+
+        provider._execute_with_retry(Mock(return_value="ok"))
+
+        assert provider.circuit_breaker_stats.rate_limiter.total_acquired == 1
+
+    def test_rate_limit_error_slows_provider(self, clock, monkeypatch):
+        provider = YahooFinanceProvider()
+        monkeypatch.setattr(provider, "MAX_RETRY_ATTEMPTS", 1)
+        func = Mock(side_effect=RateLimitError(provider="yahoo"))
+
+        with pytest.raises(RateLimitError):
+            provider._execute_with_retry(func)
+
+        pacing = provider.circuit_breaker_stats.rate_limiter
+        assert pacing.throttle_events == 1
+        assert pacing.current_rate < pacing.max_rate
+
+    def test_stats_shared_across_services(self, clock):
+        """Services holding the same provider draw from one bucket."""
+        provider = YahooFinanceProvider()
+        limiter = provider._get_rate_limiter()
+
+        provider._execute_with_retry(Mock(return_value=1))
+        provider._execute_with_retry(Mock(return_value=2))
+
+        assert provider._get_rate_limiter() is limiter
+        assert limiter.stats.total_acquired == 2
+
+    def test_pacing_can_be_disabled(self):
+        provider = YahooFinanceProvider()
+        provider.RATE_LIMIT_PER_SECOND = None
+
+        assert provider._execute_with_retry(Mock(return_value="ok")) == "ok"
+        assert provider.circuit_breaker_stats.rate_limiter is None
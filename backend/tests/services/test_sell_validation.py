@@ -0,0 +1,142 @@
+# backend/tests/services/test_sell_validation.py
+"""
+Tests for batch SELL validation.
+
+Covers:
+- Oversells within the batch, against the ledger and at past dates
+- Backdated SELLs that leave an already recorded SELL short
+- Timezone-aware batch dates against naive stored dates
+- Query count independent of the number of SELLs
+"""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models import Transaction, TransactionType
+from app.services.position_ledger import record_transactions
+from app.services.sell_validation import SellShortfall, find_sell_shortfalls
+from tests.conftest import create_asset, create_portfolio, create_user
+
+BUY = TransactionType.BUY
+SELL = TransactionType.SELL
+
+
+def _setup(db: Session):
+    user = create_user(db)
+    portfolio = create_portfolio(db, user, currency="USD")
+    asset = create_asset(db, ticker="AAPL", currency="USD")
+    return portfolio, asset
+
+
+def _record(db: Session, portfolio_id: int, asset_id: int, *events: tuple) -> None:
+    """Insert (type, date, quantity) transactions and record them in the ledger."""
+    transactions = [
+        Transaction(
+            portfolio_id=portfolio_id,
+            asset_id=asset_id,
+            transaction_type=transaction_type,
+            date=txn_date,
+            quantity=Decimal(quantity),
+            price_per_share=Decimal("100"),
+            currency="USD",
+            fee=Decimal("0"),
+            fee_currency="USD",
+            exchange_rate=Decimal("1"),
+        )
+        for transaction_type, txn_date, quantity in events
+    ]
+    db.add_all(transactions)
+    record_transactions(db, transactions)
+    db.commit()
+
+
+def _row(portfolio_id: int, asset_id: int, transaction_type: TransactionType, txn_date: datetime, quantity: str):
+    return {
+        "portfolio_id": portfolio_id,
+        "asset_id": asset_id,
+        "transaction_type": transaction_type,
+        "date": txn_date,
+        "quantity": Decimal(quantity),
+    }
+
+
+class TestFindSellShortfalls:
+    """Tests for find_sell_shortfalls()."""
+
+    def test_no_sells_runs_no_queries(self, db):
+        statements = []
+        event.listen(db.bind, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        assert find_sell_shortfalls(db, [_row(1, 1, BUY, datetime(2024, 1, 1), "5")]) == []
+        assert statements == []
+
+    def test_batch_replayed_in_date_order(self, db):
+        portfolio, asset = _setup(db)
+        _record(db, portfolio.id, asset.id, (BUY, datetime(2024, 1, 1), "10"))
+
+        rows = [
+            _row(portfolio.id, asset.id, SELL, datetime(2024, 3, 1), "15"),  # after the BUY below
+            _row(portfolio.id, asset.id, BUY, datetime(2024, 2, 1), "5"),
+            _row(portfolio.id, asset.id, SELL, datetime(2024, 4, 1), "1"),   # nothing left
+        ]
+
+        assert find_sell_shortfalls(db, rows) == [SellShortfall(position=2, available=Decimal("0"))]
+
+    def test_sell_before_recorded_buy(self, db):
+        portfolio, asset = _setup(db)
+        _record(db, portfolio.id, asset.id, (BUY, datetime(2024, 6, 1), "10"))
+
+        rows = [_row(portfolio.id, asset.id, SELL, datetime(2024, 1, 1), "5")]
+
+        assert find_sell_shortfalls(db, rows) == [SellShortfall(position=0, available=Decimal("0"))]
+
+    def test_backdated_sell_leaves_recorded_sell_short(self, db):
+        portfolio, asset = _setup(db)
+        _record(
+            db, portfolio.id, asset.id,
+            (BUY, datetime(2024, 1, 1), "10"),
+            (SELL, datetime(2024, 6, 1), "8"),
+        )
+
+        rows = [_row(portfolio.id, asset.id, SELL, datetime(2024, 3, 1), "5")]
+
+        assert find_sell_shortfalls(db, rows) == [SellShortfall(
+            position=0,
+            available=Decimal("5"),
+            recorded_sell_date=datetime(2024, 6, 1),
+            recorded_sell_quantity=Decimal("8"),
+        )]
+
+    def test_covered_sells_and_other_positions(self, db):
+        portfolio, asset = _setup(db)
+        other = create_asset(db, ticker="MSFT", currency="USD")
+        _record(db, portfolio.id, asset.id, (BUY, datetime(2024, 1, 1), "10"))
+
+        rows = [
+            _row(portfolio.id, asset.id, SELL, datetime(2024, 1, 1), "10"),  # same timestamp counts
+            _row(portfolio.id, other.id, BUY, datetime(2024, 1, 1), "1"),
+        ]
+
+        assert find_sell_shortfalls(db, rows) == []
+
+    def test_aware_batch_dates(self, db):
+        portfolio, asset = _setup(db)
+        _record(db, portfolio.id, asset.id, (BUY, datetime(2024, 1, 1, 12), "10"))
+
+        rows = [_row(portfolio.id, asset.id, SELL, datetime(2024, 1, 1, 11, tzinfo=timezone.utc), "1")]
+
+        assert find_sell_shortfalls(db, rows) == [SellShortfall(position=0, available=Decimal("0"))]
+
+    def test_query_count_independent_of_sells(self, db):
+        portfolio, asset = _setup(db)
+        _record(db, portfolio.id, asset.id, (BUY, datetime(2024, 1, 1), "100"))
+        rows = [_row(portfolio.id, asset.id, SELL, datetime(2024, 2, day), "1") for day in range(1, 29)]
+
+        statements = []
+        event.listen(db.bind, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        assert find_sell_shortfalls(db, rows) == []
+
+        assert len(statements) == 2
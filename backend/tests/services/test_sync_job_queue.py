@@ -0,0 +1,287 @@
+# backend/tests/services/test_sync_job_queue.py
+"""
+Tests for the SyncJobQueue.
+
+This module tests:
+- Enqueuing and coalescing jobs per portfolio
+- Claiming jobs (SQLite fallback for FOR UPDATE SKIP LOCKED)
+- Running jobs and recording results
+- Retry and stale-job recovery
+"""
+
+import time
+from datetime import datetime, timezone, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import select
+
+from app.models import (
+    SyncJob,
+    SyncJobStatus,
+    SyncJobType,
+    SyncStatus,
+    SyncStatusEnum,
+)
+from app.services.market_data.job_queue import SyncJobQueue, ORPHANED_SYNC_ERROR
+from app.services.market_data.sync_service import SyncResult
+from tests.conftest import create_user, create_portfolio
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+@pytest.fixture
+def queue() -> SyncJobQueue:
+    """Queue with deterministic retry settings."""
+    return SyncJobQueue(max_attempts=2, stale_after=timedelta(minutes=30))
+
+
+@pytest.fixture
+def portfolio(db):
+    user = create_user(db)
+    return create_portfolio(db, user)
+
+
+@pytest.fixture
+def sync_service(portfolio) -> MagicMock:
+    """Sync service stub returning a completed result."""
+    service = MagicMock()
+    service.sync_portfolio.return_value = SyncResult(
+        portfolio_id=portfolio.id,
+        status="completed",
+        sync_started=datetime.now(timezone.utc),
+        sync_completed=datetime.now(timezone.utc),
+        assets_synced=2,
+        prices_fetched=120,
+        warnings=["Carried AAA at cost before 2024-01-02"],
+    )
+    return service
+
+
+def _get_status(db, portfolio_id: int) -> SyncStatus | None:
+    return db.scalar(select(SyncStatus).where(SyncStatus.portfolio_id == portfolio_id))
+
+
+# =============================================================================
+# TEST: ENQUEUE
+# =============================================================================
+
+class TestEnqueue:
+    """Tests for SyncJobQueue.enqueue()."""
+
+    def test_enqueue_creates_queued_job_and_pending_status(self, db, queue, portfolio):
+        """Should insert a QUEUED job and mark the portfolio PENDING."""
+        job = queue.enqueue(db, portfolio.id)
+
+        assert job.id is not None
+        assert job.status == SyncJobStatus.QUEUED
+        assert job.job_type == SyncJobType.SYNC
+        assert job.force is False
+        assert _get_status(db, portfolio.id).status == SyncStatusEnum.PENDING
+
+    def test_enqueue_coalesces_with_waiting_job(self, db, queue, portfolio):
+        """Repeated requests should return the same waiting job."""
+        first = queue.enqueue(db, portfolio.id)
+        second = queue.enqueue(db, portfolio.id)
+
+        assert second.id == first.id
+        assert len(db.scalars(select(SyncJob)).all()) == 1
+
+    def test_full_resync_upgrades_waiting_job(self, db, queue, portfolio):
+        """A full re-sync request should upgrade a waiting plain sync."""
+        first = queue.enqueue(db, portfolio.id)
+        second = queue.enqueue(db, portfolio.id, job_type=SyncJobType.FULL_RESYNC)
+
+        assert second.id == first.id
+        assert second.job_type == SyncJobType.FULL_RESYNC
+        assert second.force is True
+
+    def test_enqueue_keeps_in_progress_status(self, db, queue, portfolio):
+        """Queuing behind a running sync should not hide IN_PROGRESS."""
+        db.add(SyncStatus(portfolio_id=portfolio.id, status=SyncStatusEnum.IN_PROGRESS))
+        db.commit()
+
+        queue.enqueue(db, portfolio.id)
+
+        assert _get_status(db, portfolio.id).status == SyncStatusEnum.IN_PROGRESS
+
+
+# =============================================================================
+# TEST: CLAIM
+# =============================================================================
+
+class TestClaimNext:
+    """Tests for SyncJobQueue.claim_next()."""
+
+    def test_claim_returns_none_when_empty(self, db, queue):
+        """Should return None when nothing is queued."""
+        assert queue.claim_next(db, "worker-1") is None
+
+    def test_claim_marks_job_running(self, db, queue, portfolio):
+        """Claimed job should be RUNNING with worker and attempt recorded."""
+        queued = queue.enqueue(db, portfolio.id)
+
+        job = queue.claim_next(db, "worker-1")
+
+        assert job.id == queued.id
+        assert job.status == SyncJobStatus.RUNNING
+        assert job.worker_id == "worker-1"
+        assert job.attempts == 1
+        assert job.started_at is not None
+
+    def test_claimed_job_not_claimed_twice(self, db, queue, portfolio):
+        """A second worker should not get an already claimed job."""
+        queue.enqueue(db, portfolio.id)
+
+        assert queue.claim_next(db, "worker-1") is not None
+        assert queue.claim_next(db, "worker-2") is None
+
+    def test_claim_skips_portfolio_with_running_job(self, db, queue, portfolio):
+        """A job queued behind a running one waits until it finishes."""
+        queue.enqueue(db, portfolio.id)
+        queue.claim_next(db, "worker-1")
+        queue.enqueue(db, portfolio.id)
+
+        assert queue.claim_next(db, "worker-2") is None
+
+    def test_claim_oldest_first(self, db, queue):
+        """Jobs should be claimed in creation order across portfolios."""
+        user = create_user(db)
+        p1 = create_portfolio(db, user, name="First")
+        p2 = create_portfolio(db, user, name="Second")
+        first = queue.enqueue(db, p1.id)
+        queue.enqueue(db, p2.id)
+
+        assert queue.claim_next(db, "worker-1").id == first.id
+
+
+# =============================================================================
+# TEST: RUN
+# =============================================================================
+
+class TestRunJob:
+    """Tests for SyncJobQueue.run_job()."""
+
+    def test_run_job_records_result(self, db, queue, portfolio, sync_service):
+        """Successful sync should store SUCCEEDED with a result summary."""
+        queue.enqueue(db, portfolio.id, force=True)
+        job = queue.claim_next(db, "worker-1")
+
+        job = queue.run_job(db, job, sync_service)
+
+        assert job.status == SyncJobStatus.SUCCEEDED
+        assert job.finished_at is not None
+        assert job.result["prices_fetched"] == 120
+        assert job.result["warnings"] == ["Carried AAA at cost before 2024-01-02"]
+        assert sync_service.sync_portfolio.call_args.kwargs["force"] is True
+
+    def test_failed_sync_marks_job_failed(self, db, queue, portfolio, sync_service):
+        """A sync that reports failure should finish as FAILED without retry."""
+        sync_service.sync_portfolio.return_value = SyncResult(
+            portfolio_id=portfolio.id,
+            status="failed",
+            sync_started=datetime.now(timezone.utc),
+            error="Provider unavailable",
+        )
+        queue.enqueue(db, portfolio.id)
+        job = queue.claim_next(db, "worker-1")
+
+        job = queue.run_job(db, job, sync_service)
+
+        assert job.status == SyncJobStatus.FAILED
+        assert job.error == "Provider unavailable"
+        assert job.attempts == 1
+
+    def test_full_resync_sets_last_full_sync(self, db, queue, portfolio, sync_service):
+        """Finishing a full re-sync should start the cooldown."""
+        db.add(SyncStatus(portfolio_id=portfolio.id, status=SyncStatusEnum.COMPLETED))
+        db.commit()
+        queue.enqueue(db, portfolio.id, job_type=SyncJobType.FULL_RESYNC)
+        job = queue.claim_next(db, "worker-1")
+
+        queue.run_job(db, job, sync_service)
+
+        db.expire_all()
+        assert _get_status(db, portfolio.id).last_full_sync is not None
+
+    def test_exception_requeues_until_attempts_exhausted(self, db, queue, portfolio, sync_service):
+        """Unexpected errors should be retried, then fail the job."""
+        sync_service.sync_portfolio.side_effect = RuntimeError("connection reset")
+        queue.enqueue(db, portfolio.id)
+
+        job = queue.run_job(db, queue.claim_next(db, "worker-1"), sync_service)
+        assert job.status == SyncJobStatus.QUEUED
+        assert job.error == "connection reset"
+
+        job = queue.run_job(db, queue.claim_next(db, "worker-1"), sync_service)
+        assert job.status == SyncJobStatus.FAILED
+        assert job.attempts == 2
+
+
+# =============================================================================
+# TEST: STALE RECOVERY
+# =============================================================================
+
+class TestRequeueStale:
+    """Tests for SyncJobQueue.requeue_stale()."""
+
+    def test_requeues_orphaned_job_and_releases_status(self, db, queue, portfolio):
+        """Jobs abandoned by a dead worker should be retried."""
+        queue.enqueue(db, portfolio.id)
+        job = queue.claim_next(db, "worker-1")
+        status = _get_status(db, portfolio.id)
+        status.status = SyncStatusEnum.IN_PROGRESS
+        db.commit()
+
+        recovered = queue.requeue_stale(
+            db, now=datetime.now(timezone.utc) + timedelta(hours=1)
+        )
+
+        db.refresh(job)
+        assert recovered == 1
+        assert job.status == SyncJobStatus.QUEUED
+        assert job.error == ORPHANED_SYNC_ERROR
+        assert _get_status(db, portfolio.id).status == SyncStatusEnum.FAILED
+
+    def test_recent_running_job_left_alone(self, db, queue, portfolio):
+        """Jobs within the stale window should not be touched."""
+        queue.enqueue(db, portfolio.id)
+        job = queue.claim_next(db, "worker-1")
+
+        assert queue.requeue_stale(db) == 0
+        db.refresh(job)
+        assert job.status == SyncJobStatus.RUNNING
+
+    def test_recent_heartbeat_keeps_long_job_running(self, db, queue, portfolio):
+        """A job running past the stale window should survive while it heartbeats."""
+        queue.enqueue(db, portfolio.id)
+        job = queue.claim_next(db, "worker-1")
+        now = datetime.now(timezone.utc)
+        job.started_at = now - timedelta(hours=2)
+        job.heartbeat_at = now - timedelta(minutes=1)
+        db.commit()
+
+        assert queue.requeue_stale(db, now=now) == 0
+        db.refresh(job)
+        assert job.status == SyncJobStatus.RUNNING
+
+        assert queue.requeue_stale(db, now=now + timedelta(hours=1)) == 1
+        db.refresh(job)
+        assert job.status == SyncJobStatus.QUEUED
+
+    def test_run_job_refreshes_heartbeat(self, db, portfolio, sync_service):
+        """The running worker should keep moving heartbeat_at forward."""
+        queue = SyncJobQueue(heartbeat_interval=0.01)
+        result = sync_service.sync_portfolio.return_value
+        sync_service.sync_portfolio.side_effect = lambda **kwargs: time.sleep(0.2) or result
+        queue.enqueue(db, portfolio.id)
+        job = queue.claim_next(db, "worker-1")
+        claimed_at = job.heartbeat_at
+
+        queue.run_job(db, job, sync_service)
+
+        db.refresh(job)
+        assert job.status == SyncJobStatus.SUCCEEDED
+        assert job.heartbeat_at > claimed_at
@@ -8,16 +8,20 @@ This module tests:
 - Staleness detection
 - Partial success handling
 - Status management
+- COPY bulk load into partitioned market_data (PostgreSQL, TEST_POSTGRES_URL)
 """
 
 from datetime import date, datetime, timezone, timedelta
 from decimal import Decimal
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
 
 from app.models import (
+    AssetCoverage,
     Transaction,
     TransactionType,
     MarketData,
@@ -29,10 +33,12 @@ from app.services.market_data.base import (
     OHLCVData,
     HistoricalPricesResult,
 )
+from app.services.market_data import sync_service as sync_service_module
 from app.services.market_data.sync_service import (
     MarketDataSyncService,
 )
-from tests.conftest import create_user, create_portfolio, create_asset
+from app.services.constants import MARKET_DATA_COPY_THRESHOLD
+from tests.conftest import POSTGRES_URL, create_user, create_portfolio, create_asset
 
 
 # =============================================================================
@@ -569,6 +575,105 @@ class TestPriceStorage:
         assert stored.close_price == Decimal("193.00")
         assert stored.volume == 5000000
 
+    def test_large_batch_uses_upsert_on_sqlite(self, db, sync_service, monkeypatch):
+        """Above the COPY threshold SQLite still takes the upsert path."""
+        asset = create_asset(db, ticker="BULK", exchange="NYSE")
+        monkeypatch.setattr(sync_service_module, "MARKET_DATA_COPY_THRESHOLD", 2)
+        sync_service._copy_prices_batch = MagicMock()
+
+        stored = sync_service._store_prices_batch(
+            db, [(asset.id, create_ohlcv_data(date(2024, 1, 2), num_days=5), "mock")]
+        )
+
+        assert stored == 5
+        sync_service._copy_prices_batch.assert_not_called()
+
+    def test_large_batch_uses_copy_on_postgres(self, db, sync_service, monkeypatch):
+        """Batches at the threshold go through COPY when supported."""
+        monkeypatch.setattr(sync_service_module, "MARKET_DATA_COPY_THRESHOLD", 5)
+        monkeypatch.setattr(sync_service_module, "supports_copy", lambda db: True)
+        sync_service._copy_prices_batch = MagicMock(return_value=5)
+        batch = [(1, create_ohlcv_data(date(2024, 1, 2), num_days=5), "mock")]
+
+        assert sync_service._store_prices_batch(db, batch) == 5
+        sync_service._copy_prices_batch.assert_called_once()
+        assert sync_service._copy_prices_batch.call_args.args[1] is batch
+
+        sync_service._copy_prices_batch.reset_mock()
+        sync_service._store_prices_batch(db, [(1, batch[0][1][:4], "mock")])  # Below threshold
+        sync_service._copy_prices_batch.assert_not_called()
+
+
+@pytest.mark.skipif(POSTGRES_URL is None, reason="TEST_POSTGRES_URL not set")
+class TestCopyPriceStorage:
+    """_store_prices_batch through COPY into the partitioned market_data table."""
+
+    def test_copy_loads_and_merges_prices(self, pg_engine, sync_service, monkeypatch):
+        copy_calls = MagicMock(wraps=sync_service_module.copy_into_staging)
+        monkeypatch.setattr(sync_service_module, "copy_into_staging", copy_calls)
+
+        with Session(pg_engine) as db:
+            full = create_asset(db, ticker="FULL", exchange="NYSE")
+            sparse = create_asset(db, ticker="SPARSE", exchange="NYSE")
+            full_prices = create_ohlcv_data(date(2014, 1, 1), num_days=MARKET_DATA_COPY_THRESHOLD // 2)
+            # OHLCVData requires OHLC; the COPY path only reads the attributes
+            sparse_prices = [
+                SimpleNamespace(
+                    date=p.date, open=None, high=None, low=None,
+                    close=Decimal("50"), volume=None, adjusted_close=None,
+                )
+                for p in create_ohlcv_data(date(2014, 1, 1), num_days=MARKET_DATA_COPY_THRESHOLD // 2)
+            ]
+            db.add(MarketData(
+                asset_id=full.id,
+                date=full_prices[0].date,
+                close_price=Decimal("1"),
+                provider="old",
+                is_synthetic=False,
+            ))
+            db.commit()
+            versions = {full.id: full.price_version, sparse.id: sparse.price_version}
+
+            stored = sync_service._store_prices_batch(db, [
+                (full.id, full_prices, "yahoo"),
+                (sparse.id, sparse_prices, "fallback"),
+            ])
+
+            copy_calls.assert_called_once()
+            assert stored == MARKET_DATA_COPY_THRESHOLD
+            counts = dict(db.execute(
+                select(MarketData.asset_id, func.count()).group_by(MarketData.asset_id)
+            ).all())
+            assert counts == {full.id: len(full_prices), sparse.id: len(sparse_prices)}
+
+            # Existing row updated in place
+            merged = db.scalar(select(MarketData).where(
+                MarketData.asset_id == full.id, MarketData.date == full_prices[0].date,
+            ))
+            assert merged.close_price == full_prices[0].close
+            assert merged.open_price == full_prices[0].open
+            assert merged.volume == full_prices[0].volume
+            assert merged.provider == "yahoo"
+
+            # Missing values arrive as NULL, not empty strings or zeros
+            sparse_row = db.scalar(select(MarketData).where(
+                MarketData.asset_id == sparse.id, MarketData.date == sparse_prices[-1].date,
+            ))
+            assert sparse_row.close_price == Decimal("50")
+            assert sparse_row.open_price is None
+            assert sparse_row.high_price is None
+            assert sparse_row.low_price is None
+            assert sparse_row.volume is None
+            assert sparse_row.adjusted_close is None
+            assert sparse_row.provider == "fallback"
+            assert sparse_row.is_synthetic is False
+            assert sparse_row.no_data_available is False
+
+            db.refresh(full)
+            db.refresh(sparse)
+            assert full.price_version == versions[full.id] + 1
+            assert sparse.price_version == versions[sparse.id] + 1
+
 
 # =============================================================================
 # COVERAGE SUMMARY TESTS
@@ -725,3 +830,133 @@ class TestConcurrentSyncPrevention:
 
         assert result.status in ["completed", "partial"]
         assert result.status != "already_running"
+
+
+# =============================================================================
+# COVERAGE INTERVAL TESTS
+# =============================================================================
+
+class TestCoverageIntervals:
+    """Tests for fetched-range tracking in asset_coverage."""
+
+    def test_missing_ranges_without_coverage(self, db, sync_service):
+        """Should request the whole range when nothing was fetched yet."""
+        asset = create_asset(db, ticker="COV1", exchange="XETRA")
+
+        ranges = sync_service._get_missing_date_ranges(
+            db, asset.id, date(2024, 1, 1), date(2024, 1, 31)
+        )
+
+        assert ranges == [(date(2024, 1, 1), date(2024, 1, 31))]
+
+    def test_missing_ranges_subtract_coverage(self, db, sync_service):
+        """Should only request dates outside recorded intervals."""
+        asset = create_asset(db, ticker="COV2", exchange="XETRA")
+        sync_service._record_coverage(
+            db, asset.id, [(date(2024, 1, 1), date(2024, 1, 19))]
+        )
+
+        ranges = sync_service._get_missing_date_ranges(
+            db, asset.id, date(2024, 1, 1), date(2024, 1, 31)
+        )
+
+        assert ranges == [(date(2024, 1, 22), date(2024, 1, 31))]
+
+    def test_missing_ranges_skip_exchange_holidays(self, db, sync_service):
+        """Should not request a gap that only contains exchange holidays."""
+        asset = create_asset(db, ticker="COV4", exchange="XETRA")
+        # Covered up to Maundy Thursday and from the Tuesday after Easter
+        sync_service._record_coverage(
+            db, asset.id,
+            [(date(2024, 3, 1), date(2024, 3, 28)), (date(2024, 4, 2), date(2024, 4, 30))],
+            exchange="XETRA",
+        )
+
+        ranges = sync_service._get_missing_date_ranges(
+            db, asset.id, date(2024, 3, 1), date(2024, 4, 30), exchange="XETRA"
+        )
+        rows = db.scalars(
+            select(AssetCoverage).where(AssetCoverage.asset_id == asset.id)
+        ).all()
+
+        assert ranges == []
+        assert len(rows) == 1  # Good Friday / Easter Monday bridged
+
+    def test_record_coverage_merges_intervals(self, db, sync_service):
+        """Should keep a single row for adjacent fetches."""
+        asset = create_asset(db, ticker="COV3", exchange="XETRA")
+        sync_service._record_coverage(db, asset.id, [(date(2024, 1, 1), date(2024, 1, 5))])
+        sync_service._record_coverage(db, asset.id, [(date(2024, 1, 8), date(2024, 1, 12))])
+        db.commit()
+
+        rows = db.scalars(
+            select(AssetCoverage).where(AssetCoverage.asset_id == asset.id)
+        ).all()
+
+        assert len(rows) == 1
+        assert rows[0].start_date == date(2024, 1, 1)
+        assert rows[0].end_date == date(2024, 1, 12)
+        assert rows[0].provider == "mock"
+
+    def test_sync_records_coverage_without_markers(
+            self, db, mock_provider_and_service, portfolio_with_transactions
+    ):
+        """Should record coverage and skip the provider on the next sync."""
+        mock_provider, sync_service = mock_provider_and_service
+        portfolio = portfolio_with_transactions["portfolio"]
+
+        mock_provider.get_historical_prices.return_value = HistoricalPricesResult(
+            ticker="TEST",
+            exchange="TEST",
+            prices=create_ohlcv_data(date(2024, 3, 1), num_days=3),
+            success=True,
+        )
+
+        sync_service.sync_portfolio(db, portfolio.id)
+        first_call_count = mock_provider.get_historical_prices.call_count
+
+        # No per-day placeholder rows are written for dates without data
+        markers = db.scalars(
+            select(MarketData).where(MarketData.no_data_available == True)
+        ).all()
+        assert markers == []
+
+        coverage = db.scalars(select(AssetCoverage)).all()
+        assert len(coverage) == 2
+
+        # Reset status so the second sync is not blocked, then re-sync
+        db.execute(
+            SyncStatus.__table__.update().values(status=SyncStatusEnum.COMPLETED)
+        )
+        db.commit()
+        sync_service.sync_portfolio(db, portfolio.id)
+
+        assert mock_provider.get_historical_prices.call_count == first_call_count
+
+    def test_fallback_answer_recorded_under_its_provider(
+            self, db, mock_provider_and_service, portfolio_with_transactions
+    ):
+        """Rows and coverage from a composite's fallback keep the fallback's name."""
+        mock_provider, sync_service = mock_provider_and_service
+        portfolio = portfolio_with_transactions["portfolio"]
+
+        mock_provider.get_historical_prices.return_value = HistoricalPricesResult(
+            ticker="TEST",
+            exchange="TEST",
+            prices=create_ohlcv_data(date(2024, 3, 1), num_days=3),
+            success=True,
+            provider="replay",
+        )
+
+        sync_service.sync_portfolio(db, portfolio.id)
+
+        providers = set(db.scalars(
+            select(MarketData.provider).where(MarketData.is_synthetic == False)
+        ).all())
+        coverage = db.scalars(select(AssetCoverage)).all()
+        assert providers == {"replay"}
+        assert {row.provider for row in coverage} == {"replay"}
+        # The primary has not covered anything, so it is asked again next time
+        assert sync_service._get_coverage_intervals(
+            db, portfolio_with_transactions["assets"][0].id, date(2024, 1, 1), date(2024, 12, 31)
+        ) == []
@@ -0,0 +1,138 @@
+# backend/tests/services/test_transaction_records.py
+"""
+Tests for the TransactionRecord read model.
+
+Covers:
+- Row conversion (date normalization, fee default)
+- Immutability and slots
+- load_transaction_records filtering and ordering
+"""
+
+import dataclasses
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models import Transaction, TransactionType
+from app.services.transaction_records import (
+    TRANSACTION_RECORD_COLUMNS,
+    TransactionRecord,
+    load_transaction_records,
+)
+from tests.conftest import create_asset, create_portfolio, create_user
+
+
+def _row(txn_date=datetime(2024, 3, 15, 14, 30), fee=Decimal("1.5")):
+    return (
+        7, 3, TransactionType.BUY, txn_date,
+        Decimal("10"), Decimal("100"), fee, "USD", Decimal("1.1"),
+    )
+
+
+def _add_transaction(
+        db: Session,
+        portfolio_id: int,
+        asset_id: int | None,
+        transaction_type: TransactionType,
+        txn_date: datetime,
+        quantity: str = "10",
+) -> Transaction:
+    txn = Transaction(
+        portfolio_id=portfolio_id,
+        asset_id=asset_id,
+        transaction_type=transaction_type,
+        date=txn_date,
+        quantity=Decimal(quantity),
+        price_per_share=Decimal("100"),
+        currency="USD",
+        fee=Decimal("0"),
+        fee_currency="USD",
+        exchange_rate=Decimal("1"),
+    )
+    db.add(txn)
+    db.commit()
+    return txn
+
+
+# =============================================================================
+# TRANSACTION RECORD
+# =============================================================================
+
+class TestTransactionRecord:
+    """Tests for TransactionRecord.from_row()."""
+
+    def test_from_row_normalizes_datetime_to_date(self):
+        record = TransactionRecord.from_row(_row())
+
+        assert record.date == date(2024, 3, 15)
+        assert type(record.date) is date
+
+    def test_from_row_keeps_plain_date(self):
+        record = TransactionRecord.from_row(_row(txn_date=date(2024, 3, 15)))
+
+        assert record.date == date(2024, 3, 15)
+
+    def test_from_row_defaults_missing_fee_to_zero(self):
+        record = TransactionRecord.from_row(_row(fee=None))
+
+        assert record.fee == Decimal("0")
+
+    def test_from_row_maps_columns_in_order(self):
+        record = TransactionRecord.from_row(_row())
+
+        assert record.id == 7
+        assert record.asset_id == 3
+        assert record.transaction_type == TransactionType.BUY
+        assert record.quantity == Decimal("10")
+        assert record.price_per_share == Decimal("100")
+        assert record.fee == Decimal("1.5")
+        assert record.currency == "USD"
+        assert record.exchange_rate == Decimal("1.1")
+        assert len(TRANSACTION_RECORD_COLUMNS) == len(dataclasses.fields(TransactionRecord))
+
+    def test_record_is_immutable(self):
+        record = TransactionRecord.from_row(_row())
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            record.quantity = Decimal("1")
+
+    def test_record_uses_slots(self):
+        record = TransactionRecord.from_row(_row())
+
+        assert not hasattr(record, "__dict__")
+
+
+# =============================================================================
+# LOADING
+# =============================================================================
+
+class TestLoadTransactionRecords:
+    """Tests for load_transaction_records()."""
+
+    def test_filters_and_orders_by_date_then_id(self, db: Session):
+        user = create_user(db)
+        portfolio = create_portfolio(db, user)
+        other = create_portfolio(db, user, name="Other")
+        asset = create_asset(db)
+
+        late = _add_transaction(db, portfolio.id, asset.id, TransactionType.SELL, datetime(2024, 2, 1))
+        first = _add_transaction(db, portfolio.id, asset.id, TransactionType.BUY, datetime(2024, 1, 1))
+        second = _add_transaction(db, portfolio.id, None, TransactionType.DEPOSIT, datetime(2024, 1, 1))
+        _add_transaction(db, other.id, asset.id, TransactionType.BUY, datetime(2024, 1, 1))
+        _add_transaction(db, portfolio.id, asset.id, TransactionType.BUY, datetime(2024, 6, 1))
+
+        records = load_transaction_records(
+            db,
+            Transaction.portfolio_id == portfolio.id,
+            Transaction.date <= datetime(2024, 3, 1),
+        )
+
+        assert [r.id for r in records] == [first.id, second.id, late.id]
+        assert all(isinstance(r, TransactionRecord) for r in records)
+        assert records[1].asset_id is None
+        assert records[2].date == date(2024, 2, 1)
+
+    def test_no_matches_returns_empty_list(self, db: Session):
+        assert load_transaction_records(db, Transaction.portfolio_id == 999) == []
@@ -0,0 +1,124 @@
+# backend/tests/services/test_transaction_writer.py
+"""
+Tests for bulk transaction inserts.
+
+Covers:
+- Ids returned in row order across several INSERT batches
+- Position ledger updated in the same database transaction
+- Rollback leaves neither transactions nor ledger rows behind
+- Fingerprints and skipping already recorded rows
+"""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.models import PortfolioPosition, Transaction, TransactionType
+from app.services.position_ledger import quantity_held
+from app.services.transaction_writer import (
+    insert_transactions,
+    split_new_transactions,
+    transaction_fingerprint,
+)
+from tests.conftest import create_asset, create_portfolio, create_user
+
+
+def _rows(portfolio_id: int, asset_id: int, count: int) -> list[dict]:
+    return [
+        {
+            "portfolio_id": portfolio_id,
+            "asset_id": asset_id,
+            "transaction_type": TransactionType.BUY,
+            "date": datetime(2024, 1, 1 + (i % 28)),
+            "quantity": Decimal(i + 1),
+            "price_per_share": Decimal("10"),
+            "currency": "USD",
+            "fee": Decimal("0"),
+            "fee_currency": "USD",
+            "exchange_rate": Decimal("1"),
+            "row_number": i + 2,  # extra keys are ignored
+        }
+        for i in range(count)
+    ]
+
+
+def _setup(db: Session):
+    portfolio = create_portfolio(db, create_user(db), currency="USD")
+    asset = create_asset(db, ticker="AAPL", currency="USD")
+    return portfolio, asset
+
+
+class TestInsertTransactions:
+    """Tests for insert_transactions()."""
+
+    def test_ids_follow_row_order_across_batches(self, db):
+        portfolio, asset = _setup(db)
+
+        ids = insert_transactions(db, _rows(portfolio.id, asset.id, 7), batch_size=3)
+        db.commit()
+
+        assert len(ids) == len(set(ids)) == 7
+        quantities = dict(db.execute(
+            select(Transaction.id, Transaction.quantity).where(Transaction.id.in_(ids))
+        ).all())
+        assert [quantities[txn_id] for txn_id in ids] == [Decimal(i) for i in range(1, 8)]
+
+    def test_records_ledger(self, db):
+        portfolio, asset = _setup(db)
+
+        insert_transactions(db, _rows(portfolio.id, asset.id, 4))
+        db.commit()
+
+        assert quantity_held(db, portfolio.id, asset.id)[0] == Decimal("10")
+
+    def test_rollback_discards_all_batches(self, db):
+        portfolio, asset = _setup(db)
+
+        insert_transactions(db, _rows(portfolio.id, asset.id, 5), batch_size=2)
+        db.rollback()
+
+        assert db.scalar(select(func.count()).select_from(Transaction)) == 0
+        assert db.scalar(select(func.count()).select_from(PortfolioPosition)) == 0
+
+
+class TestFingerprints:
+    """Tests for transaction_fingerprint() and split_new_transactions()."""
+
+    def test_fingerprint_ignores_representation(self):
+        row = _rows(1, 2, 1)[0]
+        same = {
+            **row,
+            "date": row["date"].replace(tzinfo=timezone.utc),
+            "quantity": Decimal("1.00000000"),
+            "price_per_share": Decimal("10.000000001"),  # rounds to the stored scale
+            "fee": None,
+        }
+
+        assert transaction_fingerprint(SimpleNamespace(**row)) == transaction_fingerprint(SimpleNamespace(**same))
+        assert transaction_fingerprint(SimpleNamespace(**row)) != transaction_fingerprint(
+            SimpleNamespace(**{**row, "quantity": Decimal("2")})
+        )
+
+    def test_stored_fingerprint_matches_read_back_row(self, db):
+        portfolio, asset = _setup(db)
+        [txn_id] = insert_transactions(db, _rows(portfolio.id, asset.id, 1))
+        db.commit()
+
+        txn = db.get(Transaction, txn_id)
+        assert txn.fingerprint == transaction_fingerprint(txn)
+
+    def test_split_matches_recorded_rows_by_count(self, db):
+        portfolio, asset = _setup(db)
+        [row] = _rows(portfolio.id, asset.id, 1)
+        insert_transactions(db, [dict(row)])
+        db.commit()
+
+        new_rows, skipped_rows = split_new_transactions(
+            db, [dict(row), dict(row), *_rows(portfolio.id, asset.id, 3)[1:]], batch_size=2,
+        )
+
+        assert len(skipped_rows) == 1
+        assert [r["quantity"] for r in new_rows] == [Decimal("1"), Decimal("2"), Decimal("3")]
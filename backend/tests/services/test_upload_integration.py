@@ -346,6 +346,33 @@ class TestStandardCSVImport:
         assert transactions[1].fee == Decimal("10.00")
 
 
+    def test_reupload_skips_recorded_rows(
+            self, db: Session, upload_service: UploadService
+    ):
+        """Uploading an export again only adds the rows that are new."""
+        user = create_user(db, email="reupload@test.com")
+        portfolio = create_portfolio(db, user)
+        create_asset(db, ticker="NVDA", exchange="NASDAQ", currency="USD")
+        buy = {"ticker": "NVDA", "exchange": "NASDAQ", "date": "2024-01-10", "quantity": "100", "price": "500.00"}
+        later = {**buy, "date": "2024-02-10", "quantity": "5"}
+
+        first = upload_service.process_file(
+            db=db, file=create_csv_content([buy, buy]), filename="jan.csv",
+            portfolio_id=portfolio.id, date_format=DateFormat.ISO,
+        )
+        second = upload_service.process_file(
+            db=db, file=create_csv_content([buy, buy, later]), filename="feb.csv",
+            portfolio_id=portfolio.id, date_format=DateFormat.ISO,
+        )
+
+        # Identical trades are matched by count, not collapsed
+        assert (first.created_count, first.skipped_count) == (2, 0)
+        assert (second.created_count, second.skipped_count) == (1, 2)
+        assert len(db.scalars(
+            select(Transaction).where(Transaction.portfolio_id == portfolio.id)
+        ).all()) == 3
+
+
 # =============================================================================
 # TEST 8: ASSET RESOLUTION
 # =============================================================================
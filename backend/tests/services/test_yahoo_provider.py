@@ -13,7 +13,8 @@ This module tests:
 Note: These tests mock the yfinance library to avoid actual API calls.
 """
 
-from unittest.mock import MagicMock, patch
+import threading
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
 
@@ -484,6 +485,65 @@ class TestGetAssetInfoBatch:
         # Should only process once
         assert result.success_count == 1
 
+    @patch('app.services.market_data.yahoo.yf')
+    def test_batch_fetch_reads_info_concurrently(self, mock_yf):
+        """Per-symbol info requests should overlap instead of running in turn."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        class SlowTicker:
+            @property
+            def info(self):
+                barrier.wait()  # Only passes once both lookups are in flight
+                return {"quoteType": "EQUITY", "shortName": "X", "currency": "USD", "regularMarketPrice": 1.0}
+
+        mock_yf.Tickers.return_value = MagicMock(tickers={"AAPL": SlowTicker(), "NVDA": SlowTicker()})
+
+        result = YahooFinanceProvider().get_asset_info_batch([("AAPL", "NASDAQ"), ("NVDA", "NASDAQ")])
+
+        assert result.success_count == 2
+
+    @patch('app.services.market_data.yahoo.yf')
+    def test_batch_fetch_rate_limit_retries_only_that_symbol(self, mock_yf):
+        """A rate-limited symbol is paced and retried on its own."""
+        apple, apple_info = MagicMock(), PropertyMock(
+            return_value={"quoteType": "EQUITY", "shortName": "Apple", "currency": "USD"}
+        )
+        limited, limited_info = MagicMock(), PropertyMock(side_effect=[
+            Exception("Too Many Requests"),
+            {"quoteType": "EQUITY", "shortName": "NVIDIA", "currency": "USD"},
+        ])
+        type(apple).info = apple_info
+        type(limited).info = limited_info
+        mock_yf.Tickers.return_value = MagicMock(tickers={"AAPL": apple, "NVDA": limited})
+        provider = YahooFinanceProvider()
+        provider._get_rate_limiter().acquire = MagicMock(return_value=0.0)
+
+        result = provider.get_asset_info_batch([("AAPL", "NASDAQ"), ("NVDA", "NASDAQ")])
+
+        assert result.success_count == 2
+        assert apple_info.call_count == 1
+        assert limited_info.call_count == 2
+        assert provider.circuit_breaker_stats.rate_limiter.throttle_events == 1
+
+    @patch('app.services.market_data.yahoo.yf')
+    def test_batch_fetch_persistent_rate_limit_fails_only_that_symbol(self, mock_yf):
+        """A symbol that stays rate limited is recorded as failed; the rest are kept."""
+        limited, limited_info = MagicMock(), PropertyMock(side_effect=Exception("Too Many Requests"))
+        type(limited).info = limited_info
+        mock_yf.Tickers.return_value = MagicMock(tickers={
+            "AAPL": MagicMock(info={"quoteType": "EQUITY", "shortName": "Apple", "currency": "USD"}),
+            "NVDA": limited,
+        })
+        provider = YahooFinanceProvider()
+        provider._get_rate_limiter().acquire = MagicMock(return_value=0.0)
+
+        result = provider.get_asset_info_batch([("AAPL", "NASDAQ"), ("NVDA", "NASDAQ")])
+
+        assert ("AAPL", "NASDAQ") in result.successful
+        assert isinstance(result.failed[("NVDA", "NASDAQ")], RateLimitError)
+        assert limited_info.call_count == provider.MAX_RETRY_ATTEMPTS
+        assert mock_yf.Tickers.call_count == 1  # The batch itself is not retried
+
 
 # =============================================================================
 # HEALTH CHECK TESTS
@@ -0,0 +1,75 @@
+# tests/utils/test_bulk_load.py
+"""
+Tests for COPY bulk load helpers.
+"""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from app.utils.bulk_load import CsvRowStream, format_csv_value, supports_copy
+
+
+class TestFormatCsvValue:
+    """Tests for format_csv_value function."""
+
+    @pytest.mark.parametrize("value,expected", [
+        (None, ""),
+        (True, "t"),
+        (False, "f"),
+        (42, "42"),
+        (Decimal("193.12345678"), "193.12345678"),
+        (date(2024, 1, 2), "2024-01-02"),
+        ("yahoo", "yahoo"),
+    ])
+    def test_plain_values(self, value, expected):
+        assert format_csv_value(value) == expected
+
+    def test_empty_string_is_quoted(self):
+        """Empty string must stay distinct from NULL."""
+        assert format_csv_value("") == '""'
+
+    def test_special_characters_are_quoted(self):
+        assert format_csv_value('a,"b"') == '"a,""b"""'
+
+
+class TestCsvRowStream:
+    """Tests for CsvRowStream."""
+
+    def test_read_all(self):
+        stream = CsvRowStream([(1, date(2024, 1, 2), None), (2, date(2024, 1, 3), Decimal("1.5"))])
+
+        assert stream.read() == "1,2024-01-02,\n2,2024-01-03,1.5\n"
+        assert stream.read() == ""
+        assert stream.rows_written == 2
+
+    def test_chunked_reads_reassemble(self):
+        rows = [(i, f"row{i}") for i in range(100)]
+        stream = CsvRowStream(rows)
+
+        chunks = []
+        while chunk := stream.read(7):
+            assert len(chunk) <= 7
+            chunks.append(chunk)
+
+        assert "".join(chunks) == "".join(f"{i},row{i}\n" for i in range(100))
+
+    def test_rows_consumed_lazily(self):
+        consumed = []
+
+        def rows():
+            for i in range(1000):
+                consumed.append(i)
+                yield (i,)
+
+        CsvRowStream(rows()).read(10)
+
+        assert len(consumed) < 10
+
+
+class TestSupportsCopy:
+    """Tests for supports_copy function."""
+
+    def test_sqlite_does_not_support_copy(self, db):
+        assert supports_copy(db) is False
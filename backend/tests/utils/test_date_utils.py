@@ -0,0 +1,85 @@
+# tests/utils/test_date_utils.py
+"""
+Tests for date range arithmetic helpers.
+"""
+
+from datetime import date
+
+from app.utils.date_utils import merge_date_ranges, subtract_date_ranges
+
+
+class TestMergeDateRanges:
+    """Tests for merge_date_ranges function."""
+
+    def test_merges_overlapping_ranges(self):
+        """Should merge overlapping ranges into one."""
+        merged = merge_date_ranges([
+            (date(2024, 1, 2), date(2024, 1, 10)),
+            (date(2024, 1, 5), date(2024, 1, 15)),
+        ])
+        assert merged == [(date(2024, 1, 2), date(2024, 1, 15))]
+
+    def test_bridges_weekend(self):
+        """Should merge ranges separated only by a weekend."""
+        # Fri Jan 5 and Mon Jan 8
+        merged = merge_date_ranges([
+            (date(2024, 1, 8), date(2024, 1, 12)),
+            (date(2024, 1, 1), date(2024, 1, 5)),
+        ])
+        assert merged == [(date(2024, 1, 1), date(2024, 1, 12))]
+
+    def test_keeps_ranges_with_business_day_gap(self):
+        """Should not merge ranges with a weekday between them."""
+        merged = merge_date_ranges([
+            (date(2024, 1, 1), date(2024, 1, 3)),
+            (date(2024, 1, 5), date(2024, 1, 10)),
+        ])
+        assert len(merged) == 2
+
+    def test_empty(self):
+        """Should handle empty input."""
+        assert merge_date_ranges([]) == []
+
+
+class TestSubtractDateRanges:
+    """Tests for subtract_date_ranges function."""
+
+    def test_nothing_covered(self):
+        """Should return the full range trimmed to business days."""
+        # Sat Jan 6 to Sun Jan 14
+        missing = subtract_date_ranges(date(2024, 1, 6), date(2024, 1, 14), [])
+        assert missing == [(date(2024, 1, 8), date(2024, 1, 12))]
+
+    def test_fully_covered(self):
+        """Should return nothing when a single interval covers the range."""
+        missing = subtract_date_ranges(
+            date(2024, 1, 1), date(2024, 1, 31),
+            [(date(2023, 12, 1), date(2024, 2, 29))],
+        )
+        assert missing == []
+
+    def test_gaps_between_intervals(self):
+        """Should return the head, middle and tail gaps."""
+        missing = subtract_date_ranges(
+            date(2024, 1, 1), date(2024, 1, 31),
+            [
+                (date(2024, 1, 3), date(2024, 1, 10)),
+                (date(2024, 1, 16), date(2024, 1, 26)),
+            ],
+        )
+        assert missing == [
+            (date(2024, 1, 1), date(2024, 1, 2)),
+            (date(2024, 1, 11), date(2024, 1, 15)),
+            (date(2024, 1, 29), date(2024, 1, 31)),
+        ]
+
+    def test_weekend_only_gap_dropped(self):
+        """Should ignore gaps that contain only weekend days."""
+        missing = subtract_date_ranges(
+            date(2024, 1, 1), date(2024, 1, 12),
+            [
+                (date(2024, 1, 1), date(2024, 1, 5)),
+                (date(2024, 1, 8), date(2024, 1, 12)),
+            ],
+        )
+        assert missing == []
@@ -0,0 +1,156 @@
+# tests/utils/test_partitioning.py
+"""
+Tests for yearly range partitioning helpers.
+
+The partition pruning tests need a real PostgreSQL database: set
+TEST_POSTGRES_URL to a throwaway database (its market_data / exchange_rates
+tables are dropped and recreated) to run them, e.g.
+
+    TEST_POSTGRES_URL=postgresql://user:pw@localhost/partition_test pytest tests/utils/test_partitioning.py
+
+CI runs them against a PostgreSQL service (.github/workflows/backend-postgres.yml).
+"""
+
+from datetime import date
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine, event, insert, text
+from sqlalchemy.orm import Session
+
+from app.models import Asset, AssetClass, Base, MarketData
+from app.services.portfolio_context import PortfolioDataContext
+from app.services.valuation.service import ValuationService
+from app.utils.partitioning import (
+    ensure_future_partitions,
+    is_partitioned,
+    year_partition_ddl,
+    year_partition_name,
+)
+from tests.conftest import POSTGRES_URL
+
+
+class TestPartitionNames:
+    """Tests for partition naming and DDL."""
+
+    def test_year_partition_name(self):
+        assert year_partition_name("market_data", 2024) == "market_data_y2024"
+
+    def test_year_partition_ddl_covers_calendar_year(self):
+        ddl = year_partition_ddl("exchange_rates", 2024)
+
+        assert ddl == (
+            "CREATE TABLE IF NOT EXISTS exchange_rates_y2024 PARTITION OF exchange_rates "
+            "FOR VALUES FROM ('2024-01-01') TO ('2025-01-01')"
+        )
+
+
+class TestEnsureFuturePartitions:
+    """Tests for ensure_future_partitions off PostgreSQL."""
+
+    def test_noop_on_sqlite(self):
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+
+        with engine.begin() as conn:
+            assert is_partitioned(conn, "market_data") is False
+            assert ensure_future_partitions(conn, "market_data") == []
+
+
+# =============================================================================
+# POSTGRESQL: MIGRATION AND PARTITION PRUNING
+# =============================================================================
+
+def _seed_prices(engine) -> int:
+    """One asset with a price on the first of every month, 2022-2025."""
+    with Session(engine) as db:
+        asset = Asset(
+            ticker="PART", exchange="NYSE", name="Partitioned",
+            currency="USD", asset_class=AssetClass.STOCK, is_active=True,
+        )
+        db.add(asset)
+        db.flush()
+        db.execute(insert(MarketData), [
+            {
+                "asset_id": asset.id,
+                "date": date(year, month, 1),
+                "close_price": Decimal("100"),
+                "provider": "test",
+                "is_synthetic": False,
+                "no_data_available": False,
+            }
+            for year in range(2022, 2026)
+            for month in range(1, 13)
+        ])
+        db.commit()
+        return asset.id
+
+
+def _explain(engine, fetch) -> str:
+    """Run fetch(db), capture its SQL, and return the EXPLAIN plan text."""
+    captured: list[tuple[str, object]] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "FROM market_data" in statement:
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        with Session(engine) as db:
+            fetch(db)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert len(captured) == 1
+    statement, parameters = captured[0]
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(f"EXPLAIN {statement}", parameters).all()
+    return "\n".join(row[0] for row in rows)
+
+
+@pytest.mark.skipif(POSTGRES_URL is None, reason="TEST_POSTGRES_URL not set")
+class TestPartitionPruning:
+    """_fetch_prices_batch reads only the partitions its window overlaps."""
+
+    def test_tables_are_partitioned(self, pg_engine):
+        with pg_engine.connect() as conn:
+            assert is_partitioned(conn, "market_data")
+            assert is_partitioned(conn, "exchange_rates")
+
+    def test_history_fetch_prunes_other_years(self, pg_engine):
+        asset_id = _seed_prices(pg_engine)
+        history_calc = ValuationService(fx_service=MagicMock())._history_calc
+
+        plan = _explain(pg_engine, lambda db: history_calc._fetch_prices_batch(
+            PortfolioDataContext(db, portfolio_id=0), [asset_id],
+            date(2024, 6, 1), date(2024, 9, 30),
+        ))
+
+        assert "market_data_y2024" in plan
+        for pruned in ("market_data_historic", "market_data_y2022", "market_data_y2023", "market_data_y2025"):
+            assert pruned not in plan
+
+    def test_valuation_fetch_prunes_other_years(self, pg_engine):
+        asset_id = _seed_prices(pg_engine)
+        service = ValuationService(fx_service=MagicMock())
+
+        plan = _explain(pg_engine, lambda db: service._fetch_prices_batch(
+            PortfolioDataContext(db, portfolio_id=0), {asset_id}, date(2023, 7, 14),
+        ))
+
+        assert "market_data_y2023" in plan
+        assert "market_data_y2022" not in plan
+        assert "market_data_y2024" not in plan
+
+    def test_future_partitions_are_created(self, pg_engine):
+        with pg_engine.begin() as conn:
+            created = ensure_future_partitions(
+                conn, "market_data", years_ahead=3, today=date(2030, 2, 1)
+            )
+            exists = conn.execute(
+                text("SELECT to_regclass('market_data_y2033') IS NOT NULL")
+            ).scalar()
+
+        assert created == [f"market_data_y{year}" for year in range(2030, 2034)]
+        assert exists
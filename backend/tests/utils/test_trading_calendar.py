@@ -0,0 +1,104 @@
+# tests/utils/test_trading_calendar.py
+"""
+Tests for offline exchange trading calendars.
+"""
+
+from datetime import date
+
+import pytest
+
+from app.utils.trading_calendar import (
+    get_fx_calendar,
+    get_trading_calendar,
+    max_lookback_days,
+)
+
+
+class TestHolidayRules:
+    """Tests for per-exchange holiday rules."""
+
+    def test_nyse_2024(self):
+        """Should match the published NYSE 2024 holiday list."""
+        calendar = get_trading_calendar("NASDAQ")
+        assert calendar.holidays(2024) == {
+            date(2024, 1, 1), date(2024, 1, 15), date(2024, 2, 19),
+            date(2024, 3, 29), date(2024, 5, 27), date(2024, 6, 19),
+            date(2024, 7, 4), date(2024, 9, 2), date(2024, 11, 28),
+            date(2024, 12, 25),
+        }
+
+    def test_nyse_weekend_observance(self):
+        """Should observe Sunday holidays on Monday, skip Saturday New Year."""
+        calendar = get_trading_calendar("NYSE")
+        holidays = calendar.holidays(2022)
+        assert date(2022, 6, 20) in holidays   # Juneteenth (Sunday)
+        assert date(2022, 12, 26) in holidays  # Christmas (Sunday)
+        assert date(2021, 12, 31) not in calendar.holidays(2021)  # New Year 2022 is Saturday
+
+    def test_xetra_2024(self):
+        """Should match the Xetra 2024 closure days."""
+        calendar = get_trading_calendar("XETRA")
+        assert calendar.holidays(2024) == {
+            date(2024, 1, 1), date(2024, 3, 29), date(2024, 4, 1),
+            date(2024, 5, 1), date(2024, 12, 24), date(2024, 12, 25),
+            date(2024, 12, 26), date(2024, 12, 31),
+        }
+
+    def test_lse_substitute_days(self):
+        """Should apply bank holiday substitutes and special closures."""
+        calendar = get_trading_calendar("LSE")
+        assert {date(2021, 12, 27), date(2021, 12, 28)} <= calendar.holidays(2021)
+        assert {
+            date(2022, 1, 3), date(2022, 6, 2), date(2022, 6, 3),
+            date(2022, 9, 19), date(2022, 12, 26), date(2022, 12, 27),
+        } <= calendar.holidays(2022)
+
+    def test_euronext_2024(self):
+        """Should match the Euronext 2024 closure days."""
+        calendar = get_trading_calendar("EPA")
+        assert calendar.holidays(2024) == {
+            date(2024, 1, 1), date(2024, 3, 29), date(2024, 4, 1),
+            date(2024, 5, 1), date(2024, 12, 25), date(2024, 12, 26),
+        }
+
+
+class TestTradingCalendar:
+    """Tests for calendar lookups."""
+
+    @pytest.mark.parametrize("exchange", [None, "", "UNKNOWN"])
+    def test_unknown_exchange_is_weekdays(self, exchange):
+        """Should fall back to a weekday-only calendar."""
+        calendar = get_trading_calendar(exchange)
+        assert calendar.code == "WEEKDAYS"
+        assert calendar.is_trading_day(date(2024, 12, 25))
+        assert not calendar.is_trading_day(date(2024, 12, 28))
+
+    def test_exchange_code_case_insensitive(self):
+        """Should resolve exchange codes regardless of case."""
+        assert get_trading_calendar("xetra").code == "XETR"
+
+    def test_trading_days_skip_holidays(self):
+        """Should exclude weekends and holidays."""
+        calendar = get_trading_calendar("XETRA")
+        days = calendar.trading_days(date(2024, 3, 28), date(2024, 4, 2))
+        assert days == [date(2024, 3, 28), date(2024, 4, 2)]
+
+    def test_previous_and_next_trading_day(self):
+        """Should step over Easter closures."""
+        calendar = get_trading_calendar("LSE")
+        assert calendar.previous_trading_day(date(2024, 4, 2)) == date(2024, 3, 28)
+        assert calendar.next_trading_day(date(2024, 3, 28)) == date(2024, 4, 2)
+
+    def test_lookback_days(self):
+        """Should measure the distance to the previous session."""
+        nyse = get_trading_calendar("NYSE")
+        # Markets closed Sep 11-14, 2001: Monday Sep 17 falls back to Sep 10
+        assert nyse.lookback_days(date(2001, 9, 17)) == 7
+        assert max_lookback_days(date(2001, 9, 17)) == 7
+
+    def test_fx_calendar(self):
+        """Should only close FX on New Year's Day and Christmas."""
+        fx = get_fx_calendar()
+        assert not fx.is_trading_day(date(2024, 1, 1))
+        assert not fx.is_trading_day(date(2024, 12, 25))
+        assert fx.is_trading_day(date(2024, 3, 29))  # Good Friday
@@ -9,7 +9,11 @@ import {
   TooltipProvider,
   TooltipTrigger,
 } from "@/components/ui/tooltip";
-import { useSyncStatus, useTriggerSync } from "@/hooks/use-portfolios";
+import {
+  useSyncStatus,
+  useTriggerSync,
+  useSyncCompletionEffect,
+} from "@/hooks/use-portfolios";
 import { formatDate } from "@/lib/utils";
 import type { SyncStatus as SyncStatusType } from "@/types/api";
 
@@ -53,6 +57,7 @@ function getStatusVariant(
 export function SyncStatus({ portfolioId, compact = false }: SyncStatusProps) {
   const { data: syncStatus, isLoading } = useSyncStatus(portfolioId);
   const triggerSync = useTriggerSync();
+  useSyncCompletionEffect(portfolioId);
 
   const isSyncing =
     syncStatus?.status === "IN_PROGRESS" || syncStatus?.status === "PENDING";
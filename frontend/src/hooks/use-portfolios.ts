@@ -1,5 +1,6 @@
 "use client";
 
+import { useEffect, useRef } from "react";
 import { useQuery, useMutation, useQueryClient } from "@tanstack/react-query";
 import {
   getPortfolios,
@@ -141,13 +142,52 @@ export function useSyncStatus(id: number) {
     queryFn: () => getSyncStatus(id),
     enabled: !!id,
     refetchInterval: (query) => {
-      // Poll every 2 seconds if sync is in progress
+      // Poll every 2 seconds if sync is queued or in progress
       const status = query.state.data?.status;
       return status === "IN_PROGRESS" || status === "PENDING" ? 2000 : false;
     },
   });
 }
 
+/**
+ * Refresh market-data dependent queries when a queued sync finishes
+ */
+export function useSyncCompletionEffect(id: number) {
+  const queryClient = useQueryClient();
+  const { data } = useSyncStatus(id);
+  const job = data?.latest_job;
+  const finishedJobId =
+    job && (job.status === "SUCCEEDED" || job.status === "FAILED") ? job.job_id : null;
+  const seenJobId = useRef<number | null>(null);
+
+  useEffect(() => {
+    if (finishedJobId === null || !job) return;
+    if (seenJobId.current === null) {
+      // First load: job finished before this page was opened
+      seenJobId.current = finishedJobId;
+      return;
+    }
+    if (seenJobId.current === finishedJobId) return;
+    seenJobId.current = finishedJobId;
+
+    queryClient.invalidateQueries({ queryKey: portfolioKeys.detail(id) });
+
+    const result = job.result;
+    if (job.status === "FAILED" || result?.status === "failed") {
+      toast.error(result?.error || job.error || "Market data sync failed");
+    } else if (result?.status === "partial") {
+      toast.warning("Market data sync completed with some failures");
+    } else {
+      toast.success("Market data synced successfully");
+    }
+
+    // Show warnings if any (e.g., synthetic prices created)
+    result?.warnings.forEach((warning: string) => {
+      toast.info(warning, { duration: 5000 });
+    });
+  }, [finishedJobId, job, id, queryClient]);
+}
+
 // -----------------------------------------------------------------------------
 // Mutations
 // -----------------------------------------------------------------------------
@@ -210,40 +250,19 @@ export function useDeletePortfolio() {
 
 /**
  * Hook to trigger market data sync
+ *
+ * The backend queues the sync and returns 202 with a job; progress is
+ * picked up by useSyncStatus, which polls while the status is PENDING
+ * or IN_PROGRESS.
  */
 export function useTriggerSync() {
   const queryClient = useQueryClient();
 
   return useMutation({
-    mutationFn: (id: number) => {
-      // Show loading toast when sync starts
-      const toastId = toast.loading("Syncing market data...");
-      return triggerSync(id).finally(() => {
-        // Dismiss loading toast when done (success or error)
-        toast.dismiss(toastId);
-      });
-    },
-    onSuccess: (data, id) => {
+    mutationFn: (id: number) => triggerSync(id),
+    onSuccess: (_, id) => {
       queryClient.invalidateQueries({ queryKey: portfolioKeys.syncStatus(id) });
-      queryClient.invalidateQueries({ queryKey: portfolioKeys.valuation(id) });
-      queryClient.invalidateQueries({ queryKey: portfolioKeys.detail(id) });
-
-      // Show toast based on response status (backend returns lowercase)
-      if (data.status === "completed") {
-        toast.success("Market data synced successfully");
-      } else if (data.status === "partial") {
-        toast.warning("Market data sync completed with some failures");
-      } else if (data.status === "failed") {
-        const errorMessage = data.error || "Market data sync failed";
-        toast.error(errorMessage);
-      }
-
-      // Show warnings if any (e.g., synthetic prices created)
-      if (data.warnings && data.warnings.length > 0) {
-        data.warnings.forEach((warning: string) => {
-          toast.info(warning, { duration: 5000 });
-        });
-      }
+      toast.info("Market data sync started");
     },
     onError: (error: Error) => {
       toast.error(error.message || "Failed to sync market data");
@@ -259,19 +278,9 @@ export function useFullResync() {
 
   return useMutation({
     mutationFn: (id: number) => triggerFullResync(id),
-    onSuccess: (data, id) => {
-      // Invalidate all portfolio-related queries since prices may have changed
+    onSuccess: (_, id) => {
       queryClient.invalidateQueries({ queryKey: portfolioKeys.syncStatus(id) });
-      queryClient.invalidateQueries({ queryKey: portfolioKeys.detail(id) });
-      queryClient.invalidateQueries({ queryKey: portfolioKeys.valuation(id) });
-      toast.success(`Full re-sync completed: ${data.prices_fetched} prices fetched`);
-
-      // Show warnings if any (e.g., synthetic prices created)
-      if (data.warnings && data.warnings.length > 0) {
-        data.warnings.forEach((warning: string) => {
-          toast.info(warning, { duration: 5000 });
-        });
-      }
+      toast.info("Full re-sync started");
     },
     onError: (error: Error) => {
       toast.error(error.message || "Failed to perform full re-sync");
@@ -630,20 +630,24 @@ export interface SyncStatusResponse {
   is_stale: boolean;
   staleness_reason: string | null;
   last_error: string | null;
+  latest_job: SyncJobResponse | null;
 }
 
-export interface FullResyncResponse {
-  success: boolean;
+export type SyncJobStatus = "QUEUED" | "RUNNING" | "SUCCEEDED" | "FAILED";
+
+export interface SyncJobResponse {
+  job_id: number;
   portfolio_id: number;
-  status: string;
-  assets_synced: number;
-  assets_failed: number;
-  prices_fetched: number;
-  fx_pairs_synced: number;
-  fx_rates_fetched: number;
-  warnings: string[];
+  job_type: "SYNC" | "FULL_RESYNC";
+  status: SyncJobStatus;
+  force: boolean;
+  attempts: number;
+  created_at: string;
+  started_at: string | null;
+  finished_at: string | null;
+  result: SyncTriggerResponse | null;
   error: string | null;
-  next_full_resync_available: string | null;
+  status_url: string;
 }
 
 // -----------------------------------------------------------------------------
@@ -668,6 +672,7 @@ export interface PortfolioSettingsResponse extends PortfolioSettings {
   warning?: string | null;
 }
 
+// Result of a finished sync job (SyncJobResponse.result)
 export interface SyncTriggerResponse {
   success: boolean;
   portfolio_id: number;